@@ -79,6 +79,38 @@
         });
     }
 
+    // Excerpt mode: "Read more" links carry data-entry-content pointing at the
+    // /entry/<id> fragment. Without JS they simply open the original post.
+    function expandEntry(link) {
+        const wrapper = link.closest('.read-more');
+        const excerpt = wrapper && wrapper.previousElementSibling;
+        if (!excerpt || !excerpt.classList.contains('excerpt')) return false;
+        link.setAttribute('aria-busy', 'true');
+        fetch(link.getAttribute('data-entry-content'), { credentials: 'omit' })
+            .then(function(response) {
+                if (!response.ok) throw new Error('HTTP ' + response.status);
+                return response.text();
+            })
+            .then(function(html) {
+                const content = document.createElement('div');
+                content.className = 'content';
+                content.innerHTML = html;
+                excerpt.replaceWith(content);
+                wrapper.remove();
+            })
+            .catch(function() {
+                // Fall back to the original post
+                window.location.href = link.href;
+            });
+        return true;
+    }
+
+    document.addEventListener('click', function(e) {
+        const link = e.target.closest && e.target.closest('a[data-entry-content]');
+        if (!link || e.ctrlKey || e.metaKey || e.shiftKey || e.button !== 0) return;
+        if (expandEntry(link)) e.preventDefault();
+    });
+
     document.addEventListener('keydown', function(e) {
         // Ignore if typing in input/textarea (unless in modal)
         if (!isHelpOpen() && (e.target.tagName === 'INPUT' || e.target.tagName === 'TEXTAREA')) return;
@@ -106,6 +138,10 @@
                 select(articles.length - 1);
             }
         }
+        if (e.key === 'o' && current >= 0) {
+            const link = articles[current].querySelector('a[data-entry-content]');
+            if (link && expandEntry(link)) e.preventDefault();
+        }
         if (e.key === '?') {
             e.preventDefault();
             openHelp();
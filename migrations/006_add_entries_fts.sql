@@ -0,0 +1,25 @@
+-- Migration: Add FTS5 full-text index for keyword search
+-- Keyword search previously ran LIKE '%word%' over every entry's full HTML content.
+-- entries_fts holds each entry's title and text-only body keyed by entries.id (rowid).
+-- Rows are written by _upsert_entry (which strips HTML) and removed by the trigger below
+-- when entries are deleted (retention cleanup, feed removal).
+
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    title,
+    body,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS entries_fts_delete AFTER DELETE ON entries BEGIN
+    DELETE FROM entries_fts WHERE rowid = old.id;
+END;
+
+-- Backfill existing entries. Their content is still HTML here, so markup is indexed
+-- too until the entry is re-fetched or an admin reindex rewrites it as plain text.
+INSERT INTO entries_fts (rowid, title, body)
+SELECT id, COALESCE(title, ''), COALESCE(content, '')
+FROM entries
+WHERE id NOT IN (SELECT rowid FROM entries_fts);
+
+INSERT INTO applied_migrations (migration_name) VALUES ('006_add_entries_fts.sql')
+ON CONFLICT(migration_name) DO NOTHING;
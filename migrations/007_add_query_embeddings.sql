@@ -0,0 +1,19 @@
+-- Migration: Add persistent cache of search query embeddings
+-- Every /search request used to call Workers AI to embed the query text.
+-- query_embeddings is the shared second level behind each isolate's in-memory LRU
+-- (see src/embedding_cache.py). Keyed by model so a model change never serves stale
+-- vectors; rows older than EMBEDDING_CACHE_TTL_SECONDS are ignored on read and
+-- pruned by the scheduled cron.
+
+CREATE TABLE IF NOT EXISTS query_embeddings (
+    model TEXT NOT NULL,
+    query_key TEXT NOT NULL,
+    embedding TEXT NOT NULL,  -- base64 packed float32
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (model, query_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_query_embeddings_created ON query_embeddings(created_at);
+
+INSERT INTO applied_migrations (migration_name) VALUES ('007_add_query_embeddings.sql')
+ON CONFLICT(migration_name) DO NOTHING;
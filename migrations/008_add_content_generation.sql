@@ -0,0 +1,17 @@
+-- Migration: Add content generation counter for cacheable search pages
+-- /search responses are cached at the edge under canonical URLs that carry the
+-- current generation (/search?q=<canonical query>&g=<generation>). Ingest and
+-- retention bump the counter whenever entries change, so the next search redirects
+-- to a new URL and never serves results computed against older content.
+
+CREATE TABLE IF NOT EXISTS content_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO content_generation (id, generation) VALUES (1, 0)
+ON CONFLICT(id) DO NOTHING;
+
+INSERT INTO applied_migrations (migration_name) VALUES ('008_add_content_generation.sql')
+ON CONFLICT(migration_name) DO NOTHING;
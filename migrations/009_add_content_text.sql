@@ -0,0 +1,12 @@
+-- Migration: Store each entry's extracted plain text
+-- Embeddings, the entries_fts index and search snippets all need an entry's prose
+-- without markup. content_text holds it, extracted once at ingest by
+-- extract_entry_text() in src/utils.py (tags, code blocks and feed boilerplate removed),
+-- instead of each consumer re-deriving it from the sanitized HTML in content.
+-- Existing rows stay NULL until they are re-fetched; an admin reindex backfills them,
+-- since the extraction cannot be expressed in SQL.
+
+ALTER TABLE entries ADD COLUMN content_text TEXT;
+
+INSERT INTO applied_migrations (migration_name) VALUES ('009_add_content_text.sql')
+ON CONFLICT(migration_name) DO NOTHING;
@@ -0,0 +1,25 @@
+-- Migration: Track admin reindex runs as resumable background jobs
+-- POST /admin/reindex used to embed every entry inside a single request. It now
+-- records a job here and works through entries in id order, one batch per queue
+-- message. last_entry_id is the cursor: a batch that fails or times out is retried
+-- from it, and the scheduler re-enqueues running jobs that have stopped advancing.
+-- GET /admin/reindex/status reads the latest row so the admin UI can poll progress.
+
+CREATE TABLE IF NOT EXISTS reindex_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    status TEXT NOT NULL DEFAULT 'running',  -- running | completed
+    last_entry_id INTEGER NOT NULL DEFAULT 0,
+    entries_total INTEGER NOT NULL DEFAULT 0,
+    entries_indexed INTEGER NOT NULL DEFAULT 0,
+    entries_failed INTEGER NOT NULL DEFAULT 0,
+    batches INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    admin_id INTEGER,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reindex_jobs_status ON reindex_jobs(status, updated_at);
+
+INSERT INTO applied_migrations (migration_name) VALUES ('010_add_reindex_jobs.sql')
+ON CONFLICT(migration_name) DO NOTHING;
@@ -0,0 +1,14 @@
+-- Migration: Record which entries are in the search index, and with which model
+-- _upsert_entry and reindex batches set embedding_model and indexed_at after a
+-- successful Vectorize upsert. The cron sweeper embeds entries whose
+-- embedding_model is NULL (never indexed, or indexing failed) or differs from the
+-- current EMBEDDING_MODEL, up to INDEX_SWEEP_LIMIT per run. Model upgrades and
+-- recovery from indexing outages are therefore incremental; no full reindex needed.
+-- Existing rows start NULL and are picked up by the sweeper over the next cron runs.
+
+ALTER TABLE entries ADD COLUMN embedding_model TEXT;
+ALTER TABLE entries ADD COLUMN indexed_at TEXT;
+CREATE INDEX IF NOT EXISTS idx_entries_embedding_model ON entries(embedding_model, id);
+
+INSERT INTO applied_migrations (migration_name) VALUES ('011_add_embedding_model.sql')
+ON CONFLICT(migration_name) DO NOTHING;
@@ -0,0 +1,19 @@
+-- Migration: Vector index in D1 for instances without Vectorize
+-- Used by src/vector_index.py when SEARCH_INDEX_BACKEND is "d1" and there is no
+-- SEARCH_INDEX binding (lite mode). One row per entry: the L2-normalized
+-- embedding quantized to int8 (base64) with its scale, plus the same display
+-- metadata Vectorize stores. seq is AUTOINCREMENT so every write gets a new,
+-- never reused value; COUNT(*) and MAX(seq) tell each isolate when its
+-- in-memory matrix is stale.
+
+CREATE TABLE IF NOT EXISTS entry_vectors (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    scale REAL NOT NULL,
+    vector TEXT NOT NULL,
+    metadata TEXT,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO applied_migrations (migration_name) VALUES ('012_add_entry_vectors.sql')
+ON CONFLICT(migration_name) DO NOTHING;
@@ -0,0 +1,21 @@
+-- Migration: Incremental retention
+-- Feed processing marks a feed here when it stores entries. The cron enforces
+-- RETENTION_MAX_ENTRIES_PER_FEED only for marked feeds, then clears the marks it
+-- has seen, so the per-feed ROW_NUMBER() scan covers recent churn instead of the
+-- whole archive. idx_entries_feed_published serves that scan per feed.
+-- Every existing feed starts marked, so the first run checks them all.
+-- After lowering RETENTION_MAX_ENTRIES_PER_FEED, re-run this migration to apply
+-- the new cap to feeds that have no new entries.
+
+CREATE TABLE IF NOT EXISTS retention_dirty_feeds (
+    feed_id INTEGER PRIMARY KEY,
+    marked_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO retention_dirty_feeds (feed_id) SELECT id FROM feeds WHERE true
+ON CONFLICT(feed_id) DO NOTHING;
+
+CREATE INDEX IF NOT EXISTS idx_entries_feed_published ON entries(feed_id, published_at DESC);
+
+INSERT INTO applied_migrations (migration_name) VALUES ('013_add_retention_dirty_feeds.sql')
+ON CONFLICT(migration_name) DO NOTHING;
@@ -0,0 +1,12 @@
+-- Migration: Archive tier for old entry content
+-- The cron moves the HTML of entries older than ARCHIVE_AFTER_DAYS into
+-- zlib-compressed objects in the ARCHIVE R2 bucket (see src/content_archive.py),
+-- then sets content to NULL and content_archived_at to the time of the move.
+-- Metadata and content_text stay in D1 for search, snippets and feeds.
+-- idx_entries_archive serves the cron's "oldest unarchived entries" query.
+
+ALTER TABLE entries ADD COLUMN content_archived_at TEXT;
+CREATE INDEX IF NOT EXISTS idx_entries_archive ON entries(content_archived_at, published_at);
+
+INSERT INTO applied_migrations (migration_name) VALUES ('014_add_content_archive.sql')
+ON CONFLICT(migration_name) DO NOTHING;
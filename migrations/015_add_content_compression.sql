@@ -0,0 +1,13 @@
+-- Migration: Index entries whose content can still be compressed
+-- With CONTENT_COMPRESSION enabled, entries.content holds "z1:" + base64 zlib data
+-- (see src/content_codec.py); no schema change is needed since the column stays TEXT.
+-- The cron compresses rows written before the setting was enabled, in chunks, with
+-- the query below. The partial index holds only plain rows long enough to be worth
+-- compressing (CONTENT_COMPRESSION_MIN_CHARS), so once the backlog is done the
+-- query reads nothing instead of scanning every entry's content.
+
+CREATE INDEX IF NOT EXISTS idx_entries_uncompressed ON entries(id)
+WHERE length(content) >= 1024 AND substr(content, 1, 3) <> 'z1:';
+
+INSERT INTO applied_migrations (migration_name) VALUES ('015_add_content_compression.sql')
+ON CONFLICT(migration_name) DO NOTHING;
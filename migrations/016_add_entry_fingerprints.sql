@@ -0,0 +1,38 @@
+-- Migration: Cross-feed duplicate entries
+-- When a post appears in two feeds (an author's blog and an aggregator that
+-- republishes it), ingest stores the second copy as a link to the first instead
+-- of a second copy of its content (see src/entry_fingerprint.py):
+--   url_hash           hash of the normalized entry link
+--   content_hash       fingerprint of the extracted text (NULL for short texts)
+--   canonical_entry_id the entry this one duplicates; NULL for canonical entries
+-- Duplicates keep their own row (feed, guid, title, link) with content and
+-- content_text NULL, and are never embedded or keyword-indexed. Render paths show
+-- the canonical entry once, listing every feed that carried it.
+-- Existing entries get hashes when they are next re-fetched.
+
+ALTER TABLE entries ADD COLUMN url_hash TEXT;
+ALTER TABLE entries ADD COLUMN content_hash TEXT;
+ALTER TABLE entries ADD COLUMN canonical_entry_id INTEGER;
+
+CREATE INDEX IF NOT EXISTS idx_entries_url_hash ON entries(url_hash)
+WHERE url_hash IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_entries_content_hash ON entries(content_hash)
+WHERE content_hash IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_entries_canonical ON entries(canonical_entry_id)
+WHERE canonical_entry_id IS NOT NULL;
+
+-- When a canonical entry is deleted (retention, feed removal), its oldest
+-- duplicate takes over its content and the others are relinked to it.
+CREATE TRIGGER IF NOT EXISTS entries_promote_duplicate AFTER DELETE ON entries
+WHEN EXISTS (SELECT 1 FROM entries WHERE canonical_entry_id = old.id)
+BEGIN
+    UPDATE entries
+    SET canonical_entry_id = (SELECT MIN(id) FROM entries WHERE canonical_entry_id = old.id)
+    WHERE canonical_entry_id = old.id;
+    UPDATE entries
+    SET canonical_entry_id = NULL, content = old.content, content_text = old.content_text
+    WHERE canonical_entry_id = id;
+END;
+
+INSERT INTO applied_migrations (migration_name) VALUES ('016_add_entry_fingerprints.sql')
+ON CONFLICT(migration_name) DO NOTHING;
@@ -0,0 +1,14 @@
+-- Migration: Back off entries whose embedding keeps failing
+-- The cron sweeper embeds up to INDEX_SWEEP_LIMIT unindexed entries per run,
+-- newest first. An entry that can never be embedded was retried on every run and,
+-- with enough of them, the newest failures took the whole sweep and older
+-- entries were never reached. A failed index attempt now increments
+-- index_attempts and sets index_retry_after 2^attempts hours ahead (capped at
+-- INDEX_RETRY_MAX_HOURS); the sweeper skips the entry until then, and retries it
+-- in a batch of its own. A successful index resets both.
+
+ALTER TABLE entries ADD COLUMN index_attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE entries ADD COLUMN index_retry_after TEXT;
+
+INSERT INTO applied_migrations (migration_name) VALUES ('017_add_index_backoff.sql')
+ON CONFLICT(migration_name) DO NOTHING;
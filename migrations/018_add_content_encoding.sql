@@ -0,0 +1,17 @@
+-- Migration: Mark entries whose content was tried and would not compress
+-- idx_entries_uncompressed (migration 015) holds every plain row of at least 1 KB,
+-- including rows zlib can't shrink (already-compressed or very short-lined HTML).
+-- The cron left those plain and in the index, so once CONTENT_COMPRESSION_LIMIT
+-- of them sat at the lowest ids every run re-read the same rows and the rest of the
+-- backlog was never reached. The cron now sets content_encoding = 'identity' on
+-- such rows, and the index excludes them. Ingest clears the mark when it rewrites
+-- an entry's content, so new content is tried again.
+
+ALTER TABLE entries ADD COLUMN content_encoding TEXT;
+
+DROP INDEX IF EXISTS idx_entries_uncompressed;
+CREATE INDEX IF NOT EXISTS idx_entries_uncompressed ON entries(id)
+WHERE length(content) >= 1024 AND substr(content, 1, 3) <> 'z1:' AND content_encoding IS NULL;
+
+INSERT INTO applied_migrations (migration_name) VALUES ('018_add_content_encoding.sql')
+ON CONFLICT(migration_name) DO NOTHING;
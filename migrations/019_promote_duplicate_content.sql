@@ -0,0 +1,33 @@
+-- Migration: Hand a deleted canonical entry's full state to the promoted duplicate
+-- entries_promote_duplicate (migration 016) copied content and content_text only:
+--   - an archived canonical entry (content NULL, migration 014) left its heir with
+--     neither content nor content_archived_at, so its body was lost. The trigger now
+--     copies content_archived_at, and the code that deletes entries copies the archive
+--     object to the heir's key first (PlanetCF._hand_down_archived_content).
+--   - the heir had never been keyword-indexed or embedded. entries_fts_promote indexes
+--     it when it stops being a duplicate, and its embedding_model is reset so the cron
+--     sweeper embeds it on its next run.
+
+DROP TRIGGER IF EXISTS entries_promote_duplicate;
+CREATE TRIGGER entries_promote_duplicate AFTER DELETE ON entries
+WHEN EXISTS (SELECT 1 FROM entries WHERE canonical_entry_id = old.id)
+BEGIN
+    UPDATE entries
+    SET canonical_entry_id = (SELECT MIN(id) FROM entries WHERE canonical_entry_id = old.id)
+    WHERE canonical_entry_id = old.id;
+    UPDATE entries
+    SET canonical_entry_id = NULL, content = old.content, content_text = old.content_text,
+        content_archived_at = old.content_archived_at, content_encoding = old.content_encoding,
+        embedding_model = NULL, indexed_at = NULL, index_attempts = 0, index_retry_after = NULL
+    WHERE canonical_entry_id = id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS entries_fts_promote AFTER UPDATE OF canonical_entry_id ON entries
+WHEN old.canonical_entry_id IS NOT NULL AND new.canonical_entry_id IS NULL
+BEGIN
+    INSERT OR REPLACE INTO entries_fts (rowid, title, body)
+    VALUES (new.id, COALESCE(new.title, ''), COALESCE(new.content_text, ''));
+END;
+
+INSERT INTO applied_migrations (migration_name) VALUES ('019_promote_duplicate_content.sql')
+ON CONFLICT(migration_name) DO NOTHING;
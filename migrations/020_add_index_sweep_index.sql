@@ -0,0 +1,13 @@
+-- Migration: Index the cron index sweep's candidates
+-- The sweep (PlanetCF._sweep_unindexed_entries) selects entries without a vector
+-- from the current EMBEDDING_MODEL. Written as "embedding_model IS NULL OR
+-- embedding_model != ?", the query read all of entries on every hourly run, even
+-- with nothing left to embed. It now reads three ranges of this index (IS NULL,
+-- < model, > model). The index leaves out duplicates and untitled entries, which
+-- are never embedded, so a finished sweep reads nothing.
+
+CREATE INDEX IF NOT EXISTS idx_entries_index_sweep ON entries(embedding_model, id)
+WHERE title IS NOT NULL AND canonical_entry_id IS NULL;
+
+INSERT INTO applied_migrations (migration_name) VALUES ('020_add_index_sweep_index.sql')
+ON CONFLICT(migration_name) DO NOTHING;
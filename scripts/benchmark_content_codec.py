@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Content compression benchmark: stored size and CPU of content_codec.py.
+
+Generates synthetic entry HTML of realistic shape (paragraphs, links, inline
+code, a code block) at several sizes and reports, per size and zlib level,
+the stored size relative to plain HTML (base64 overhead included) and the
+median time to encode and to decode one entry. It then times the homepage
+read pattern -- fetching 50 full rows from an in-memory SQLite database
+built from migrations/ and decoding their content -- with plain and with
+compressed rows. SQLite stands in for D1; D1 also bills and transfers the
+bytes read, which the size column shows.
+
+Usage:
+    python scripts/benchmark_content_codec.py
+    python scripts/benchmark_content_codec.py --sizes 2000 50000 --levels 1 6 9
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import content_codec  # noqa: E402
+from content_codec import decode_content, encode_content  # noqa: E402
+
+WORDS = [
+    "cloudflare",
+    "workers",
+    "python",
+    "edge",
+    "compute",
+    "durable",
+    "objects",
+    "storage",
+    "queue",
+    "error",
+    "handling",
+    "latency",
+    "cache",
+    "request",
+    "response",
+    "database",
+    "index",
+    "search",
+    "vector",
+    "embedding",
+    "deploy",
+    "release",
+    "performance",
+    "memory",
+    "isolate",
+    "startup",
+    "template",
+    "render",
+    "feed",
+    "entry",
+    "author",
+    "planet",
+    "blog",
+    "post",
+]
+
+HOMEPAGE_ROWS = 50
+
+
+def synthetic_html(target_chars: int, rng: random.Random) -> str:
+    """Entry HTML of about target_chars characters."""
+    parts: list[str] = []
+    size = 0
+    while size < target_chars:
+        words = rng.choices(WORDS, k=rng.randint(30, 80))
+        link = f'<a href="https://example.com/{rng.choice(WORDS)}/{rng.randint(1, 9999)}">'
+        words[rng.randrange(len(words))] = f"{link}{rng.choice(WORDS)}</a>"
+        words[rng.randrange(len(words))] = f"<code>{rng.choice(WORDS)}()</code>"
+        if rng.random() < 0.2:
+            block = "\n".join(f"    {rng.choice(WORDS)} = {rng.randint(0, 99)}" for _ in range(6))
+            part = f"<pre><code>{block}</code></pre>\n"
+        else:
+            part = f"<p>{' '.join(words)}.</p>\n"
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)
+
+
+def median_us(func, samples: int) -> float:
+    """Median wall time of func() in microseconds."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(timings)
+
+
+def codec_table(sizes: list[int], levels: list[int], samples: int) -> None:
+    """Print stored size and encode/decode time per entry size and level."""
+    rng = random.Random(42)
+    print(
+        f"{'chars':>7} {'level':>5} {'stored':>8} {'ratio':>6} {'encode us':>10} {'decode us':>10}"
+    )
+    for size in sizes:
+        html = synthetic_html(size, rng)
+        for level in levels:
+            content_codec.CONTENT_COMPRESSION_LEVEL = level
+            stored = encode_content(html)
+            encode = median_us(lambda html=html: encode_content(html), samples)
+            decode = median_us(lambda stored=stored: decode_content(stored), samples)
+            ratio = len(stored) / len(html)
+            print(
+                f"{len(html):>7} {level:>5} {len(stored):>8} {ratio:>6.2f} "
+                f"{encode:>10.1f} {decode:>10.1f}"
+            )
+
+
+def homepage_read_ms(size: int, compress: bool, samples: int) -> tuple[float, int]:
+    """Median ms to read HOMEPAGE_ROWS full rows and decode their content."""
+    rng = random.Random(7)
+    conn = sqlite3.connect(":memory:")
+    for sql_file in sorted((PROJECT_ROOT / "migrations").glob("*.sql")):
+        conn.executescript(sql_file.read_text())
+    conn.execute("INSERT INTO feeds (id, url, title) VALUES (1, 'https://example.com/feed', 'Ex')")
+    rows = []
+    for entry_id in range(1, HOMEPAGE_ROWS * 4 + 1):
+        html = synthetic_html(size, rng)
+        rows.append((entry_id, f"guid-{entry_id}", encode_content(html, compress=compress)))
+    conn.executemany(
+        "INSERT INTO entries (id, feed_id, guid, title, content, published_at) "
+        "VALUES (?, 1, ?, 'Title', ?, '2026-01-01')",
+        rows,
+    )
+    conn.commit()
+    stored = conn.execute(
+        "SELECT SUM(length(content)) FROM (SELECT content FROM entries ORDER BY id LIMIT ?)",
+        (HOMEPAGE_ROWS,),
+    ).fetchone()[0]
+
+    def read() -> None:
+        for row in conn.execute("SELECT * FROM entries ORDER BY id LIMIT ?", (HOMEPAGE_ROWS,)):
+            decode_content(row[6])
+
+    elapsed = median_us(read, samples) / 1000
+    conn.close()
+    return elapsed, stored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2_000, 10_000, 50_000])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--samples", type=int, default=21, help="Samples per measurement")
+    args = parser.parse_args()
+
+    codec_table(args.sizes, args.levels, args.samples)
+
+    default_level = content_codec.CONTENT_COMPRESSION_LEVEL = 6
+    print(f"\nHomepage read: {HOMEPAGE_ROWS} full rows, level {default_level}")
+    print(f"{'chars':>7} {'plain ms':>9} {'plain KB':>9} {'z1 ms':>9} {'z1 KB':>9}")
+    for size in args.sizes:
+        plain_ms, plain_bytes = homepage_read_ms(size, False, args.samples)
+        z_ms, z_bytes = homepage_read_ms(size, True, args.samples)
+        print(
+            f"{size:>7} {plain_ms:>9.2f} {plain_bytes / 1024:>9.0f} "
+            f"{z_ms:>9.2f} {z_bytes / 1024:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Wide event emission benchmark: per-event overhead of emit_event().
+
+Builds realistic RequestEvent and FeedFetchEvent instances (a homepage hit,
+a search, a feed fetch with spans and D1 stats) and reports the median time
+per event for:
+
+- asdict: the previous path -- dataclasses.asdict() (a recursive deep copy)
+  and json.dumps() of every field, before sampling, for every event
+- dropped: emit_event() deciding to drop the event (sampling fields only)
+- kept: emit_event() flattening and serializing a kept event
+- blended: mean of emit_event() at the default 10% sample rate
+
+plus the size of each serialized event (spans and d1_* fields included in
+both). Log output is disabled, so the
+numbers are the cost of deciding and serializing, not of writing logs.
+
+Usage:
+    python scripts/benchmark_event_emit.py
+    python scripts/benchmark_event_emit.py --samples 5001
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from types import ModuleType
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# utils imports the Workers SDK's Response, which event emission never uses
+_workers = ModuleType("workers")
+_workers.Response = object
+sys.modules.setdefault("workers", _workers)
+
+import observability  # noqa: E402
+from observability import (  # noqa: E402
+    FeedFetchEvent,
+    RequestEvent,
+    emit_event,
+    event_to_dict,
+    should_sample,
+)
+
+
+def homepage_event() -> RequestEvent:
+    event = RequestEvent(method="GET", path="/", route="/", wall_time_ms=42.0)
+    event.cache_status = "hit"
+    event.content_type = "html"
+    return event
+
+
+def search_event() -> RequestEvent:
+    event = RequestEvent(method="GET", path="/search", route="/search", wall_time_ms=180.0)
+    event.search_query = "python workers"
+    event.search_query_length = 14
+    event.search_embedding_ms = 35.0
+    event.search_vectorize_ms = 60.0
+    event.search_d1_ms = 20.0
+    event.search_results_total = 12
+    event.search_semantic_matches = 9
+    event.search_keyword_matches = 5
+    return event
+
+
+def feed_fetch_event() -> FeedFetchEvent:
+    event = FeedFetchEvent(feed_id=7, feed_url="https://example.com/feed.xml", wall_time_ms=900.0)
+    with event.trace.span("http"):
+        pass
+    with event.trace.span("parse", bytes=48_000):
+        pass
+    for _ in range(20):
+        with event.trace.span("upsert"):
+            with event.trace.span("write"):
+                pass
+            event.d1.record("INSERT INTO entries (feed_id, guid) VALUES (?, ?)", 1.2, None)
+    event.entries_found = event.entries_added = 20
+    return event
+
+
+EVENTS = {
+    "homepage": homepage_event,
+    "search": search_event,
+    "feed_fetch": feed_fetch_event,
+}
+
+
+def asdict_emit(event) -> None:
+    """The previous emit path: deep copy every field, serialize, then sample."""
+    event_dict = asdict(event)
+    event_dict.pop("trace", None)
+    event_dict.pop("d1", None)
+    should_sample(event_dict)
+    json.dumps(event_dict)
+
+
+def timings_us(func, samples: int) -> list[float]:
+    """Wall time of each of samples calls to func(), in microseconds."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def median_us(func, samples: int) -> float:
+    """Median wall time of func() in microseconds."""
+    return statistics.median(timings_us(func, samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=2001, help="Samples per measurement")
+    args = parser.parse_args()
+
+    observability.logger.disabled = True
+    print(
+        f"{'event':>10} {'asdict us':>10} {'dropped us':>11} {'kept us':>8} "
+        f"{'blended us':>11} {'asdict B':>9} {'kept B':>7}"
+    )
+    for name, build in EVENTS.items():
+        event = build()
+        before = median_us(lambda event=event: asdict_emit(event), args.samples)
+        dropped = median_us(lambda event=event: emit_event(event, sample_rate=0.0), args.samples)
+        kept = median_us(lambda event=event: emit_event(event, force=True), args.samples)
+        blended = statistics.mean(timings_us(lambda event=event: emit_event(event), args.samples))
+        compact = event_to_dict(event)
+        full = asdict(event)
+        full.pop("trace", None)
+        full.pop("d1", None)
+        full.update({key: value for key, value in compact.items() if key not in full})
+        old_bytes = len(json.dumps(full))
+        new_bytes = len(json.dumps(compact, separators=(",", ":")))
+        print(
+            f"{name:>10} {before:>10.1f} {dropped:>11.1f} {kept:>8.1f} "
+            f"{blended:>11.1f} {old_bytes:>9} {new_bytes:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
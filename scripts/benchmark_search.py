@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Keyword search benchmark: LIKE scans vs the entries_fts FTS5 index.
+
+Builds an in-memory SQLite database from migrations/ (the same schema D1
+runs), fills it with synthetic entries of realistic size, and times the SQL
+that SearchQueryBuilder produces for each strategy -- build() (LIKE over
+title and full HTML content) and build_fts() (MATCH against entries_fts).
+SQLite here is a stand-in for D1, which runs the same engine, so absolute
+numbers differ from production but the scaling does not.
+
+Usage:
+    python scripts/benchmark_search.py
+    python scripts/benchmark_search.py --sizes 10000 100000 --samples 5
+"""
+
+import argparse
+import itertools
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from search_query import SearchQueryBuilder  # noqa: E402
+
+BASE_VOCABULARY = [
+    "cloudflare",
+    "workers",
+    "python",
+    "edge",
+    "compute",
+    "durable",
+    "objects",
+    "storage",
+    "queue",
+    "error",
+    "handling",
+    "latency",
+    "cache",
+    "request",
+    "response",
+    "database",
+    "index",
+    "search",
+    "vector",
+    "embedding",
+    "deploy",
+    "release",
+    "performance",
+    "memory",
+    "isolate",
+    "startup",
+    "template",
+    "render",
+    "feed",
+    "entry",
+    "author",
+    "planet",
+    "blog",
+    "post",
+    "network",
+    "routing",
+    "security",
+    "token",
+    "session",
+    "cookie",
+    "header",
+    "stream",
+    "batch",
+    "retry",
+    "timeout",
+]
+
+# Word frequencies follow a Zipf distribution, as in natural text: a few words
+# appear in nearly every post and the long tail appears in a handful.
+VOCABULARY = BASE_VOCABULARY + [f"term{i}" for i in range(20_000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+# Representative /search queries, from very common to absent
+QUERIES = [
+    "cloudflare",  # in almost every entry: LIKE's best case (stops after LIMIT matches)
+    "routing",  # moderately common
+    "term2000",  # rare long-tail word
+    "durable storage",  # multi-word
+    '"error handling"',  # phrase
+    "zeitgeist",  # no matches: LIKE scans everything
+]
+
+PARAGRAPHS_PER_ENTRY = 6
+WORDS_PER_PARAGRAPH = 40
+
+
+def build_database(size: int, seed: int = 42) -> sqlite3.Connection:
+    """Create a migrated database with `size` synthetic entries, all FTS-indexed."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(":memory:")
+    for sql_file in sorted((PROJECT_ROOT / "migrations").glob("*.sql")):
+        conn.executescript(sql_file.read_text())
+    conn.execute("INSERT INTO feeds (id, url, title) VALUES (1, 'https://example.com/feed', 'Ex')")
+
+    entries = []
+    fts_rows = []
+    for entry_id in range(1, size + 1):
+        title = " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=6)).title()
+        paragraphs = [
+            " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=WORDS_PER_PARAGRAPH))
+            for _ in range(PARAGRAPHS_PER_ENTRY)
+        ]
+        content = "".join(f'<p class="body">{p}</p>\n' for p in paragraphs)
+        published = f"2026-01-01T00:00:{entry_id % 60:02d}Z"
+        entries.append((entry_id, f"guid-{entry_id}", title, content, published))
+        fts_rows.append((entry_id, title, " ".join(paragraphs)))
+
+    conn.executemany(
+        "INSERT INTO entries (id, feed_id, guid, title, content, published_at) "
+        "VALUES (?, 1, ?, ?, ?, ?)",
+        entries,
+    )
+    conn.executemany(
+        "INSERT OR REPLACE INTO entries_fts (rowid, title, body) VALUES (?, ?, ?)", fts_rows
+    )
+    conn.commit()
+    return conn
+
+
+def query_ms(conn: sqlite3.Connection, sql: str, params: tuple, samples: int) -> float:
+    """Median wall time of executing and fetching a query."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--samples", type=int, default=5, help="Samples per measurement")
+    parser.add_argument("--limit", type=int, default=50, help="Result limit (SEARCH_TOP_K)")
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'query':<26} {'LIKE ms':>10} {'FTS ms':>10} {'speedup':>8}")
+    for size in args.sizes:
+        conn = build_database(size)
+        for raw_query in QUERIES:
+            builder = SearchQueryBuilder.from_raw_query(raw_query)
+            like = builder.build(limit=args.limit)
+            fts = builder.build_fts(limit=args.limit)
+            like_ms = query_ms(conn, like.sql, like.params, args.samples)
+            fts_ms = query_ms(conn, fts.sql, fts.params, args.samples)
+            speedup = like_ms / fts_ms if fts_ms else float("inf")
+            print(f"{size:>8} {raw_query:<26} {like_ms:>10.2f} {fts_ms:>10.2f} {speedup:>7.1f}x")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
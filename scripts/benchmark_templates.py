@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for template loading: embedded source vs precompiled.
+
+A fresh isolate pays for Jinja2 lexing, parsing and code generation the first
+time each template is rendered. This script measures that first-render load
+for every theme/template pair twice -- once through EmbeddedLoader (source)
+and once through PrecompiledLoader (src/compiled_templates/) -- using a
+brand-new Environment per sample so nothing is served from Jinja's template
+cache. Rendering itself runs the same generated code on both paths, so only
+get_template() is timed.
+
+Usage:
+    python scripts/benchmark_templates.py
+    python scripts/benchmark_templates.py --samples 50 --theme planet-python
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from jinja2 import Environment  # noqa: E402
+
+import templates  # noqa: E402
+
+
+def first_load_ms(loader, name: str) -> float:
+    """Time get_template() on a fresh Environment (cold template cache)."""
+    env = Environment(loader=loader, autoescape=True)
+    start = time.perf_counter()
+    env.get_template(name)
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark(themes: list[str], samples: int) -> list[tuple[str, str, float, float]]:
+    """Return (theme, template, source_ms, compiled_ms) medians for each pair."""
+    rows = []
+    for theme in themes:
+        names = sorted(
+            templates._TEMPLATE_NAMES.get(theme, frozenset()) | templates._TEMPLATE_NAMES["_shared"]
+        )
+        for name in names:
+            source = [first_load_ms(templates.EmbeddedLoader(theme), name) for _ in range(samples)]
+            compiled = [
+                first_load_ms(templates.PrecompiledLoader(theme), name) for _ in range(samples)
+            ]
+            rows.append((theme, name, statistics.median(source), statistics.median(compiled)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=20, help="Samples per measurement")
+    parser.add_argument("--theme", action="append", help="Theme(s) to benchmark (default: all)")
+    args = parser.parse_args()
+
+    if not templates._precompiled_available():
+        print("Error: src/compiled_templates/ missing or built with another Jinja2 version.")
+        print("Run: python scripts/build_templates.py")
+        sys.exit(1)
+
+    themes = args.theme or [t for t in templates._TEMPLATE_NAMES if not t.startswith("_")]
+    rows = benchmark(themes, args.samples)
+
+    print(f"{'theme':<16} {'template':<22} {'source ms':>10} {'compiled ms':>12} {'saved':>8}")
+    for theme, name, source_ms, compiled_ms in rows:
+        saved = 1 - compiled_ms / source_ms if source_ms else 0.0
+        print(f"{theme:<16} {name:<22} {source_ms:>10.2f} {compiled_ms:>12.2f} {saved:>7.0%}")
+    total_source = sum(r[2] for r in rows)
+    total_compiled = sum(r[3] for r in rows)
+    print(f"{'total':<39} {total_source:>10.2f} {total_compiled:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
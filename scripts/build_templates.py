@@ -5,6 +5,11 @@ Build script to compile HTML templates into src/templates.py
 This is necessary because Cloudflare Workers Python runs in WebAssembly
 and doesn't have filesystem access for loading templates at runtime.
 
+Every template is also precompiled to Python with Jinja2 and written to
+src/compiled_templates/, so a fresh isolate imports ready-made render
+functions instead of lexing, parsing and compiling template source on first
+use. The embedded source strings remain as the fallback.
+
 CSS and JS are NOT compiled into templates.py. They are served as static
 files via Workers Static Assets from each instance's assets/static/ directory.
 
@@ -19,18 +24,25 @@ Options:
     --example <name>  Select example for template resolution
 
 After editing any file in templates/, run this script to regenerate
-src/templates.py, then deploy with `wrangler deploy`.
+src/templates.py and src/compiled_templates/, then deploy with `wrangler deploy`.
 """
 
 import argparse
+import re
+import shutil
 import sys
 from pathlib import Path
 
+import jinja2
+
 # Directories relative to this script
 PROJECT_ROOT = Path(__file__).parent.parent
 TEMPLATE_DIR = PROJECT_ROOT / "templates"
 EXAMPLES_DIR = PROJECT_ROOT / "examples"
 OUTPUT_FILE = PROJECT_ROOT / "src" / "templates.py"
+SOURCE_MODULE_DIR = PROJECT_ROOT / "src"
+SOURCE_MODULE_PREFIX = "templates_"
+COMPILED_DIR = PROJECT_ROOT / "src" / "compiled_templates"
 
 # Per-theme template directories (now under examples/)
 THEME_TEMPLATE_DIRS = ["default", "planet-python", "planet-mozilla"]
@@ -73,6 +85,86 @@ def escape_for_python(content: str) -> str:
     return content.replace('"""', r"\"\"\"")
 
 
+def source_module_name(group: str) -> str:
+    """Map a template group to its source module (e.g. planet-python -> templates_planet_python)."""
+    return SOURCE_MODULE_PREFIX + group.strip("_").replace("-", "_")
+
+
+def write_source_module(group: str, templates: dict[str, str]) -> None:
+    """Write src/templates_<group>.py holding the embedded sources for one group."""
+    module_name = source_module_name(group)
+    output = f'''# src/{module_name}.py
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Edit the template files and run: python scripts/build_templates.py
+"""Embedded template sources for the {group} group, imported on first use."""
+
+TEMPLATES = {{
+'''
+    for name, content in templates.items():
+        output += f'    "{name}": """{escape_for_python(content)}""",\n'
+    output += "}\n"
+    (SOURCE_MODULE_DIR / f"{module_name}.py").write_text(output, encoding="utf-8")
+
+
+def compiled_package_name(source_theme: str) -> str:
+    """Map a template source theme to its package under src/compiled_templates/."""
+    return source_theme.replace("-", "_")
+
+
+def compiled_module_name(template_name: str) -> str:
+    """Map a template name to its module name (e.g. admin/error.html -> admin_error_html)."""
+    return re.sub(r"[^0-9A-Za-z_]", "_", template_name)
+
+
+def build_compiled_templates(sources: dict[str, dict[str, str]]) -> int:
+    """Precompile every template source into src/compiled_templates/.
+
+    Layout: compiled_templates/<source theme>/<template module>.py, one module
+    per template in Jinja2's ModuleLoader format (defer_init), so the runtime
+    can build a Template from the module without touching the source.
+
+    Args:
+        sources: Mapping of source theme (including "_shared") to templates.
+
+    Returns:
+        Number of templates compiled.
+    """
+    # Must match the Environment options used by get_jinja_env() at runtime
+    env = jinja2.Environment(autoescape=True)
+
+    if COMPILED_DIR.exists():
+        shutil.rmtree(COMPILED_DIR)
+    COMPILED_DIR.mkdir(parents=True)
+
+    header = "# AUTO-GENERATED - DO NOT EDIT DIRECTLY\n# Run: python scripts/build_templates.py\n"
+    (COMPILED_DIR / "__init__.py").write_text(
+        f'''{header}"""Jinja2 templates precompiled to Python by scripts/build_templates.py.
+
+Compiled code is tied to the Jinja2 version that produced it; the runtime
+only uses these modules when JINJA2_VERSION matches the installed Jinja2.
+"""
+
+JINJA2_VERSION = "{jinja2.__version__}"
+''',
+        encoding="utf-8",
+    )
+
+    count = 0
+    for source_theme, templates in sources.items():
+        package_dir = COMPILED_DIR / compiled_package_name(source_theme)
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text(
+            f'{header}"""Precompiled templates for the {source_theme} theme."""\n',
+            encoding="utf-8",
+        )
+        for name, content in templates.items():
+            code = env.compile(content, name, f"{source_theme}/{name}", raw=True, defer_init=True)
+            module_path = package_dir / f"{compiled_module_name(name)}.py"
+            module_path.write_text(f"{header}{code}\n", encoding="utf-8")
+            count += 1
+    return count
+
+
 def build_templates(theme: str | None = None, example: str | None = None):
     """Generate src/templates.py from HTML template files.
 
@@ -85,8 +177,10 @@ def build_templates(theme: str | None = None, example: str | None = None):
         example: Optional example name for template resolution.
     """
 
-    # Read all templates organized by theme
+    # Read all templates organized by source group: one group per theme, plus
+    # "_admin" (admin pages, only shipped with default) and "_shared" (feeds)
     themed_templates: dict[str, dict[str, str]] = {}
+    admin_templates: dict[str, str] = {}
 
     # Read theme-specific templates from examples/<theme>/templates/
     for theme_name in THEME_TEMPLATE_DIRS:
@@ -108,7 +202,7 @@ def build_templates(theme: str | None = None, example: str | None = None):
             for template_file in ADMIN_TEMPLATE_FILES:
                 template_path = theme_dir / template_file
                 if template_path.exists():
-                    themed_templates[theme_name][template_file] = read_template(template_path)
+                    admin_templates[template_file] = read_template(template_path)
 
     # Read shared templates (no theme variations)
     shared_templates: dict[str, str] = {}
@@ -117,6 +211,14 @@ def build_templates(theme: str | None = None, example: str | None = None):
         if template_path.exists():
             shared_templates[template_file] = read_template(template_path)
 
+    groups = {**themed_templates, "_admin": admin_templates, "_shared": shared_templates}
+
+    # Write one source module per group so the runtime imports only what it uses
+    for stale in SOURCE_MODULE_DIR.glob(f"{SOURCE_MODULE_PREFIX}*.py"):
+        stale.unlink()
+    for group, templates in groups.items():
+        write_source_module(group, templates)
+
     # Generate Python code
     output = '''# src/templates.py
 # AUTO-GENERATED - DO NOT EDIT DIRECTLY
@@ -129,41 +231,73 @@ This module provides:
 - Embedded templates for Workers environment compatibility
 - Per-theme template support with fallback chain
 - Helper functions for common rendering patterns
+
+Template sources live in one generated module per group (templates_<group>.py)
+and are imported on first use, so an isolate only holds its own theme's
+sources; admin templates load when /admin is first rendered.
 """
 
-from jinja2 import BaseLoader, Environment, TemplateNotFound
+import importlib
+import importlib.util
+import re
+from collections.abc import Iterator, Mapping
+
+import jinja2
+from jinja2 import BaseLoader, ChoiceLoader, Environment, TemplateNotFound
 
 # =============================================================================
 # Embedded Templates (for Workers environment)
 # =============================================================================
 # Structure:
-#   _EMBEDDED_TEMPLATES[theme_name][template_name] = template_content
-#   _EMBEDDED_TEMPLATES["_shared"][template_name] = shared_template_content
+#   _EMBEDDED_TEMPLATES[group][template_name] = template_content
+# where group is a theme name, "_admin" or "_shared". Only the small name
+# manifest below is loaded eagerly; sources are imported per group on access.
 
-_EMBEDDED_TEMPLATES = {
+# Source module per template group
+_TEMPLATE_SOURCE_MODULES: dict[str, str] = {
 '''
+    for group in groups:
+        output += f'    "{group}": "{source_module_name(group)}",\n'
+    output += """}
 
-    # Add themed templates
-    for theme_name, templates in themed_templates.items():
-        output += f'    "{theme_name}": {{\n'
-        for name, content in templates.items():
-            escaped = escape_for_python(content)
-            output += f'        "{name}": """{escaped}""",\n'
-        output += "    },\n"
+# Template names per group, used to route lookups without importing sources
+_TEMPLATE_NAMES: dict[str, frozenset[str]] = {
+"""
+    for group, templates in groups.items():
+        output += f'    "{group}": frozenset(\n        {{\n'
+        for name in templates:
+            output += f'            "{name}",\n'
+        output += "        }\n    ),\n"
+    output += '''}
 
-    # Add shared templates
-    output += '    "_shared": {\n'
-    for name, content in shared_templates.items():
-        escaped = escape_for_python(content)
-        output += f'        "{name}": """{escaped}""",\n'
-    output += "    },\n"
 
-    output += """}
+class _LazyTemplateSources(Mapping):
+    """Read-only mapping of group -> {template name: source}, imported on access."""
+
+    def __getitem__(self, group: str) -> dict[str, str]:
+        return importlib.import_module(_TEMPLATE_SOURCE_MODULES[group]).TEMPLATES
+
+    def __contains__(self, group: object) -> bool:
+        return group in _TEMPLATE_SOURCE_MODULES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_TEMPLATE_SOURCE_MODULES)
+
+    def __len__(self) -> int:
+        return len(_TEMPLATE_SOURCE_MODULES)
+
+
+_EMBEDDED_TEMPLATES = _LazyTemplateSources()
+
+
+def _template_group(theme: str, name: str) -> str | None:
+    """Find the group providing a template: theme, then default, _admin, _shared."""
+    for group in (theme, "default", "_admin", "_shared"):
+        if name in _TEMPLATE_NAMES.get(group, ()):
+            return group
+    return None
 
-"""
 
-    # Add the rest of the module (loader, environment, helpers)
-    output += '''
 # =============================================================================
 # Template Loader and Environment
 # =============================================================================
@@ -177,7 +311,7 @@ class EmbeddedLoader(BaseLoader):
 
         Args:
             theme: Theme name to use for template lookup.
-                   Falls back to "default" then "_shared".
+                   Falls back to "default", then "_admin" and "_shared".
         """
         self.theme = theme
 
@@ -187,28 +321,55 @@ class EmbeddedLoader(BaseLoader):
         Lookup order:
           1. _EMBEDDED_TEMPLATES[theme][template]
           2. _EMBEDDED_TEMPLATES["default"][template]
-          3. _EMBEDDED_TEMPLATES["_shared"][template]
+          3. _EMBEDDED_TEMPLATES["_admin"][template]
+          4. _EMBEDDED_TEMPLATES["_shared"][template]
+
+        Only the group that provides the template has its sources imported.
         """
-        # Try theme-specific template
-        if self.theme in _EMBEDDED_TEMPLATES and template in _EMBEDDED_TEMPLATES[self.theme]:
-            source = _EMBEDDED_TEMPLATES[self.theme][template]
-            return source, f"{self.theme}/{template}", lambda: True
+        group = _template_group(self.theme, template)
+        if group is None:
+            raise TemplateNotFound(template)
+        source = _EMBEDDED_TEMPLATES[group][template]
+        return source, f"{group}/{template}", lambda: True
+
+
+class PrecompiledLoader(BaseLoader):
+    """Jinja2 loader for templates precompiled by scripts/build_templates.py.
 
-        # Fall back to default theme
-        if (
-            self.theme != "default"
-            and "default" in _EMBEDDED_TEMPLATES
-            and template in _EMBEDDED_TEMPLATES["default"]
-        ):
-            source = _EMBEDDED_TEMPLATES["default"][template]
-            return source, f"default/{template}", lambda: True
+    Follows the same fallback chain as EmbeddedLoader, but builds each Template
+    from its generated module in compiled_templates/ instead of lexing, parsing
+    and compiling the source in the isolate. Each load executes a fresh module
+    namespace, since Jinja binds the environment into the module globals.
+    """
 
-        # Fall back to shared templates
-        if "_shared" in _EMBEDDED_TEMPLATES and template in _EMBEDDED_TEMPLATES["_shared"]:
-            source = _EMBEDDED_TEMPLATES["_shared"][template]
-            return source, f"_shared/{template}", lambda: True
+    has_source_access = False
 
-        raise TemplateNotFound(template)
+    def __init__(self, theme: str = "default"):
+        self.theme = theme
+
+    def load(self, environment, name, globals=None):
+        group = _template_group(self.theme, name)
+        if group is None:
+            raise TemplateNotFound(name)
+        package = group.replace("-", "_")
+        module_name = re.sub(r"[^0-9A-Za-z_]", "_", name)
+        spec = importlib.util.find_spec(f"compiled_templates.{package}.{module_name}")
+        if spec is None or spec.loader is None:
+            raise TemplateNotFound(name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return environment.template_class.from_module_dict(
+            environment, module.__dict__, globals or {}
+        )
+
+
+def _precompiled_available() -> bool:
+    """Check that compiled_templates/ exists and matches the installed Jinja2."""
+    try:
+        from compiled_templates import JINJA2_VERSION
+    except ImportError:
+        return False
+    return jinja2.__version__ == JINJA2_VERSION
 
 
 # Cache of Jinja2 environments per theme
@@ -221,11 +382,17 @@ def get_jinja_env(theme: str = "default") -> Environment:
     Args:
         theme: Theme name (e.g., "planet-python", "planet-mozilla", "default")
 
+    Precompiled templates are preferred; embedded source is the fallback when
+    a template has no compiled module or was compiled by another Jinja2 version.
+
     Returns:
         Configured Jinja2 Environment with theme-aware template loader.
     """
     if theme not in _jinja_envs:
-        _jinja_envs[theme] = Environment(loader=EmbeddedLoader(theme), autoescape=True)
+        loader: BaseLoader = EmbeddedLoader(theme)
+        if _precompiled_available():
+            loader = ChoiceLoader([PrecompiledLoader(theme), loader])
+        _jinja_envs[theme] = Environment(loader=loader, autoescape=True)
     return _jinja_envs[theme]
 
 
@@ -307,12 +474,16 @@ THEME_LOGOS = {
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     OUTPUT_FILE.write_text(output, encoding="utf-8")
 
+    compiled_count = build_compiled_templates(groups)
+
     # Count templates
-    total_templates = sum(len(t) for t in themed_templates.values()) + len(shared_templates)
+    total_templates = sum(len(t) for t in groups.values())
 
     print(f"Generated {OUTPUT_FILE}")
+    print(f"Generated {COMPILED_DIR} ({compiled_count} precompiled templates)")
     print(f"  - {len(themed_templates)} themes: {', '.join(themed_templates.keys())}")
     print(f"  - {total_templates} total templates")
+    print(f"  - {len(admin_templates)} admin templates")
     print(f"  - {len(shared_templates)} shared templates")
 
 
@@ -63,20 +63,26 @@ def check_templates_generated() -> list[str]:
     content = templates_py.read_text()
 
     # Check for per-theme structure (not flat structure)
-    if "_EMBEDDED_TEMPLATES = {" not in content:
+    if "_TEMPLATE_SOURCE_MODULES: dict[str, str] = {" not in content:
         errors.append(
-            "templates.py missing _EMBEDDED_TEMPLATES dict. "
+            "templates.py missing _TEMPLATE_SOURCE_MODULES manifest. "
             "Run 'python scripts/build_templates.py' to regenerate."
         )
         return errors
 
-    # Check each expected theme exists
+    # Check each expected theme exists and has its generated source module
     for theme in EXPECTED_THEMES:
+        module_file = f"templates_{theme.replace('-', '_')}.py"
         if f'"{theme}":' not in content:
             errors.append(
                 f"Theme '{theme}' not found in templates.py. "
                 "Run 'python scripts/build_templates.py' to regenerate."
             )
+        elif not (PROJECT_ROOT / "src" / module_file).exists():
+            errors.append(
+                f"src/{module_file} not found for theme '{theme}'. "
+                "Run 'python scripts/build_templates.py' to regenerate."
+            )
 
     # Check for theme parameter in render_template
     if "def render_template(name: str, theme: str" not in content:
@@ -85,6 +91,14 @@ def check_templates_generated() -> list[str]:
             "Run 'python scripts/build_templates.py' to regenerate."
         )
 
+    # Precompiled templates are optional at runtime (source is the fallback),
+    # but a deploy without them pays Jinja compilation on every cold start
+    if not (PROJECT_ROOT / "src" / "compiled_templates" / "__init__.py").exists():
+        errors.append(
+            "src/compiled_templates/ not found. "
+            "Run 'python scripts/build_templates.py' to regenerate."
+        )
+
     return errors
 
 
@@ -0,0 +1,9 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+"""Jinja2 templates precompiled to Python by scripts/build_templates.py.
+
+Compiled code is tied to the Jinja2 version that produced it; the runtime
+only uses these modules when JINJA2_VERSION matches the installed Jinja2.
+"""
+
+JINJA2_VERSION = "3.1.6"
@@ -0,0 +1,86 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/dashboard.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_admin = resolve('admin')
+    l_0_feeds = resolve('feeds')
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Admin - '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n    <link rel="icon" href="/static/favicon.ico" sizes="32x32">\n    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">\n    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">\n    <link rel="stylesheet" href="/static/style.css">\n    <style>\n        /* Admin-specific overrides */\n        body { max-width: 1000px; margin: 0 auto; padding: 0; }\n        header { display: flex; justify-content: space-between; align-items: center; text-align: left; }\n        header h1 { margin: 0; }\n        header h1::before { display: none; }\n        .header-actions { display: flex; align-items: center; gap: 0.75rem; }\n        .user-info { display: flex; align-items: center; gap: 0.5rem; font-size: 0.875rem; }\n        .admin-content { padding: 1rem 1.5rem; }\n        .section { margin-bottom: 1.5rem; padding: 1rem; background: var(--bg-tertiary); border-radius: 8px; }\n        .section h2 { margin-top: 0; margin-bottom: 1rem; font-size: 1.125rem; }\n        .add-form { display: flex; gap: 0.5rem; flex-wrap: wrap; }\n        .add-form input[type="url"] { flex: 1; min-width: 200px; padding: 0.5rem; border: 1px solid var(--border-light); border-radius: 4px; font-size: 0.875rem; }\n        .add-form input[type="text"] { width: 200px; padding: 0.5rem; border: 1px solid var(--border-light); border-radius: 4px; font-size: 0.875rem; }\n        .add-form input[type="file"] { padding: 0.5rem; font-size: 0.875rem; }\n        .feed-list { list-style: none; padding: 0; margin: 0; }\n        .feed-item { display: flex; justify-content: space-between; align-items: center; padding: 0.75rem; background: var(--bg-primary); border: 1px solid var(--border-light); margin-bottom: 0.5rem; border-radius: 4px; }\n        .feed-info { flex: 1; }\n        .feed-title { font-weight: bold; font-size: 0.9rem; display: flex; align-items: center; gap: 0.5rem; }\n        .feed-title-text { cursor: pointer; }\n        .feed-title-text:hover { text-decoration: underline; text-decoration-style: dotted; }\n        .feed-title-input { font-weight: bold; font-size: 0.9rem; padding: 0.125rem 0.25rem; border: 1px solid var(--accent); border-radius: 3px; width: 200px; }\n        .feed-title-input:focus { outline: none; box-shadow: 0 0 0 2px rgba(0, 113, 227, 0.2); }\n        .feed-title-actions { display: none; gap: 0.25rem; }\n        .feed-title-actions button { padding: 0.125rem 0.5rem; font-size: 0.75rem; }\n        .feed-title.editing .feed-title-text { display: none; }\n        .feed-title.editing .feed-title-input { display: inline-block; }\n        .feed-title.editing .feed-title-actions { display: flex; }\n        .feed-title .feed-title-input { display: none; }\n        .feed-url { color: var(--text-muted); font-size: 0.8rem; word-break: break-all; }\n        .feed-status { font-size: 0.75rem; margin-top: 0.25rem; }\n        .feed-status.healthy { color: var(--success); }\n        .feed-status.failing { color: var(--error); }\n        .feed-status.disabled { color: var(--text-muted); }\n        .feed-actions { display: flex; gap: 0.5rem; align-items: center; }\n        .toggle { position: relative; display: inline-block; width: 44px; height: 22px; }\n        .toggle input { opacity: 0; width: 0; height: 0; }\n        .toggle-slider { position: absolute; cursor: pointer; inset: 0; background: var(--border-medium); border-radius: 22px; transition: 0.3s; }\n        .toggle-slider:before { position: absolute; content: ""; height: 16px; width: 16px; left: 3px; bottom: 3px; background: white; border-radius: 50%; transition: 0.3s; }\n        .toggle input:checked + .toggle-slider { background: var(--success); }\n        .toggle input:checked + .toggle-slider:before { transform: translateX(22px); }\n        .tabs { display: flex; gap: 0.25rem; margin-bottom: 1rem; border-bottom: 2px solid var(--border-light); }\n        .tab { padding: 0.5rem 1rem; cursor: pointer; border: none; background: none; font-size: 0.875rem; border-bottom: 2px solid transparent; margin-bottom: -2px; color: var(--text-secondary); }\n        .tab:hover { color: var(--text-primary); }\n        .tab.active { border-bottom-color: var(--accent); color: var(--accent); font-weight: 600; }\n        .tab-content { display: none; }\n        .tab-content.active { display: block; }\n        .dlq-item, .audit-item { padding: 0.75rem; background: var(--bg-primary); border: 1px solid var(--border-light); margin-bottom: 0.5rem; border-radius: 4px; }\n        .dlq-item { border-left: 3px solid var(--error); }\n        .audit-item { border-left: 3px solid var(--text-muted); }\n        .audit-action { font-weight: bold; color: var(--text-secondary); font-size: 0.9rem; }\n        .audit-time { color: var(--text-muted); font-size: 0.75rem; }\n        .audit-details { font-size: 0.8rem; color: var(--text-muted); margin-top: 0.25rem; }\n        .empty-state { color: var(--text-muted); font-style: italic; padding: 1rem; text-align: center; }\n        #dlq-list, #audit-list { max-height: 400px; overflow-y: auto; }\n    </style>\n</head>\n<body>\n    <header>\n        <h1><a href="/">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a> <span style="color: var(--text-muted); font-weight: normal; font-size: 0.875rem;">Admin</span></h1>\n        <div class="header-actions">\n            <form action="/admin/regenerate" method="POST" style="margin: 0;">\n                <button type="submit" class="btn" title="Re-fetch all feeds now">Refresh Feeds</button>\n            </form>\n            <button id="reindex-btn" class="btn" title="Rebuild search index" onclick="rebuildSearchIndex()">Reindex</button>\n            <div class="user-info">\n                <span>'
+    yield escape((environment.getattr((undefined(name='admin') if l_0_admin is missing else l_0_admin), 'display_name') or environment.getattr((undefined(name='admin') if l_0_admin is missing else l_0_admin), 'github_username')))
+    yield '</span>\n                <form action="/admin/logout" method="POST" style="margin: 0;">\n                    <button type="submit" class="btn btn-danger btn-sm">Logout</button>\n                </form>\n            </div>\n        </div>\n    </header>\n\n    <div class="admin-content">\n\n    <div class="tabs">\n        <button class="tab active" data-tab="feeds">Feeds</button>\n        <button class="tab" data-tab="import">Import OPML</button>\n        <button class="tab" data-tab="dlq">Failed Feeds</button>\n        <button class="tab" data-tab="audit">Audit Log</button>\n    </div>\n\n    <div id="feeds" class="tab-content active">\n        <div class="section">\n            <h2>Add Feed</h2>\n            <form action="/admin/feeds" method="POST" class="add-form">\n                <input type="url" name="url" placeholder="https://example.com/feed.xml" required>\n                <input type="text" name="title" placeholder="Feed title (optional)">\n                <button type="submit" class="btn btn-success">Add Feed</button>\n            </form>\n        </div>\n\n        <div class="section">\n            <h2>Feeds ('
+    yield escape(t_1((undefined(name='feeds') if l_0_feeds is missing else l_0_feeds)))
+    yield ')</h2>\n            '
+    if (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        pass
+        yield '\n            <ul class="feed-list">\n                '
+        for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+            _loop_vars = {}
+            pass
+            yield '\n                <li class="feed-item" data-feed-id="'
+            yield escape(environment.getattr(l_1_feed, 'id'))
+            yield '">\n                    <div class="feed-info">\n                        <div class="feed-title" data-feed-id="'
+            yield escape(environment.getattr(l_1_feed, 'id'))
+            yield '">\n                            <span class="feed-title-text">'
+            yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+            yield '</span>\n                            <input type="text" class="feed-title-input" value="'
+            yield escape((environment.getattr(l_1_feed, 'title') or ''))
+            yield '" placeholder="Enter feed title">\n                            <div class="feed-title-actions">\n                                <button type="button" class="btn btn-success btn-sm save-title-btn">Save</button>\n                                <button type="button" class="btn btn-sm cancel-title-btn">Cancel</button>\n                            </div>\n                        </div>\n                        <div class="feed-url">'
+            yield escape(environment.getattr(l_1_feed, 'url'))
+            yield '</div>\n                        <div class="feed-status '
+            if (not environment.getattr(l_1_feed, 'is_active')):
+                pass
+                yield 'disabled'
+            elif (environment.getattr(l_1_feed, 'consecutive_failures') >= 3):
+                pass
+                yield 'failing'
+            else:
+                pass
+                yield 'healthy'
+            yield '">\n                            '
+            if (not environment.getattr(l_1_feed, 'is_active')):
+                pass
+                yield '\n                                Disabled\n                            '
+            elif (environment.getattr(l_1_feed, 'consecutive_failures') >= 3):
+                pass
+                yield '\n                                Failing ('
+                yield escape(environment.getattr(l_1_feed, 'consecutive_failures'))
+                yield ' errors)\n                            '
+            else:
+                pass
+                yield '\n                                Healthy\n                            '
+            yield '\n                        </div>\n                    </div>\n                    <div class="feed-actions">\n                        <label class="toggle" title="Enable/Disable feed">\n                            <input type="checkbox" class="feed-toggle" data-feed-id="'
+            yield escape(environment.getattr(l_1_feed, 'id'))
+            yield '" '
+            if environment.getattr(l_1_feed, 'is_active'):
+                pass
+                yield 'checked'
+            yield '>\n                            <span class="toggle-slider"></span>\n                        </label>\n                        <form action="/admin/feeds/'
+            yield escape(environment.getattr(l_1_feed, 'id'))
+            yield '" method="POST" style="margin: 0;">\n                            <input type="hidden" name="_method" value="DELETE">\n                            <button type="submit" class="btn btn-danger btn-sm" onclick="return confirm(\'Delete this feed?\')">Delete</button>\n                        </form>\n                    </div>\n                </li>\n                '
+        l_1_feed = missing
+        yield '\n            </ul>\n            '
+    else:
+        pass
+        yield '\n            <p class="empty-state">No feeds yet. Add one above!</p>\n            '
+    yield '\n        </div>\n    </div>\n\n    <div id="import" class="tab-content">\n        <div class="section">\n            <h2>Import OPML</h2>\n            <p style="margin-bottom: 1rem; color: #666;">Upload an OPML file to import multiple feeds at once.</p>\n            <form action="/admin/import-opml" method="POST" enctype="multipart/form-data" class="add-form">\n                <input type="file" name="opml" accept=".opml,.xml" required>\n                <button type="submit" class="btn btn-success">Import Feeds</button>\n            </form>\n        </div>\n    </div>\n\n    <div id="dlq" class="tab-content">\n        <div class="section">\n            <h2>Failed Feeds (Dead Letter Queue)</h2>\n            <p style="margin-bottom: 1rem; color: #666;">Feeds that have failed 3 or more times consecutively.</p>\n            <div id="dlq-list">\n                <p class="empty-state">Loading...</p>\n            </div>\n        </div>\n    </div>\n\n    <div id="audit" class="tab-content">\n        <div class="section">\n            <h2>Audit Log</h2>\n            <p style="margin-bottom: 1rem; color: #666;">Recent admin actions.</p>\n            <div id="audit-list">\n                <p class="empty-state">Loading...</p>\n            </div>\n        </div>\n    </div>\n\n    </div><!-- .admin-content -->\n\n    <script src="/static/admin.js"></script>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '6=21&70=23&77=25&105=27&106=29&108=32&109=36&111=38&112=40&113=42&119=44&120=46&121=56&123=59&124=62&132=68&135=74'
@@ -0,0 +1,34 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/error.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_title = resolve('title')
+    l_0_message = resolve('message')
+    l_0_back_url = resolve('back_url')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Error - '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' Admin</title>\n    <link rel="icon" href="/static/favicon.ico" sizes="32x32">\n    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">\n    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">\n    <style>\n        * { box-sizing: border-box; margin: 0; padding: 0; }\n        body {\n            font-family: system-ui, -apple-system, sans-serif;\n            min-height: 100vh;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n        }\n        .error-card {\n            background: white;\n            padding: 3rem;\n            border-radius: 12px;\n            box-shadow: 0 10px 40px rgba(0,0,0,0.2);\n            text-align: center;\n            max-width: 500px;\n            width: 90%;\n        }\n        .icon { font-size: 3rem; margin-bottom: 1rem; }\n        h1 { color: #333; margin-bottom: 0.5rem; font-size: 1.5rem; }\n        .error-message {\n            color: #666;\n            margin-bottom: 2rem;\n            line-height: 1.5;\n        }\n        .actions {\n            display: flex;\n            gap: 1rem;\n            justify-content: center;\n            flex-wrap: wrap;\n        }\n        .btn {\n            display: inline-flex;\n            align-items: center;\n            gap: 0.5rem;\n            padding: 0.875rem 1.5rem;\n            border-radius: 8px;\n            text-decoration: none;\n            font-weight: 500;\n            font-size: 1rem;\n            transition: background 0.2s, transform 0.1s;\n        }\n        .btn:hover { transform: translateY(-1px); }\n        .btn-primary {\n            background: #667eea;\n            color: white;\n        }\n        .btn-primary:hover { background: #5a6fd6; }\n        .btn-secondary {\n            background: #f0f0f0;\n            color: #333;\n        }\n        .btn-secondary:hover { background: #e0e0e0; }\n        .footer { margin-top: 2rem; color: #999; font-size: 0.875rem; }\n        .footer a { color: #667eea; text-decoration: none; }\n    </style>\n</head>\n<body>\n    <div class="error-card">\n        <div class="icon">&#9888;</div>\n        <h1>'
+    yield escape(((undefined(name='title') if l_0_title is missing else l_0_title) or 'Something went wrong'))
+    yield '</h1>\n        <p class="error-message">'
+    yield escape((undefined(name='message') if l_0_message is missing else l_0_message))
+    yield '</p>\n\n        <div class="actions">\n            '
+    if (undefined(name='back_url') if l_0_back_url is missing else l_0_back_url):
+        pass
+        yield '\n            <a href="'
+        yield escape((undefined(name='back_url') if l_0_back_url is missing else l_0_back_url))
+        yield '" class="btn btn-primary">&#8592; Go Back</a>\n            '
+    yield '\n            <a href="/admin" class="btn btn-secondary">Admin Dashboard</a>\n        </div>\n\n        <p class="footer">\n            <a href="/">&#8592; Back to '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a>\n        </p>\n    </div>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '6=16&71=18&72=20&75=22&76=25&82=28'
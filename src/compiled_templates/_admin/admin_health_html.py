@@ -0,0 +1,87 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/health.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_total_feeds = resolve('total_feeds')
+    l_0_healthy_count = resolve('healthy_count')
+    l_0_warning_count = resolve('warning_count')
+    l_0_failing_count = resolve('failing_count')
+    l_0_inactive_count = resolve('inactive_count')
+    l_0_feeds = resolve('feeds')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Feed Health - '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n    <link rel="icon" href="/static/favicon.ico" sizes="32x32">\n    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">\n    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">\n    <link rel="stylesheet" href="/static/style.css">\n    <style>\n        body { max-width: 1200px; margin: 0 auto; padding: 0; }\n        header { display: flex; justify-content: space-between; align-items: center; text-align: left; padding: 1rem 1.5rem; }\n        header h1 { margin: 0; font-size: 1.5rem; }\n        header h1::before { display: none; }\n        .header-actions { display: flex; gap: 0.75rem; }\n        .health-content { padding: 1rem 1.5rem; }\n        .summary-cards { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; margin-bottom: 1.5rem; }\n        .summary-card { padding: 1rem; background: var(--bg-tertiary); border-radius: 8px; text-align: center; }\n        .summary-card .count { font-size: 2rem; font-weight: bold; }\n        .summary-card .label { font-size: 0.875rem; color: var(--text-muted); }\n        .summary-card.healthy .count { color: var(--success); }\n        .summary-card.warning .count { color: #f59e0b; }\n        .summary-card.failing .count { color: var(--error); }\n        .summary-card.inactive .count { color: var(--text-muted); }\n        .health-table { width: 100%; border-collapse: collapse; background: var(--bg-primary); border-radius: 8px; overflow: hidden; }\n        .health-table th, .health-table td { padding: 0.75rem 1rem; text-align: left; border-bottom: 1px solid var(--border-light); }\n        .health-table th { background: var(--bg-tertiary); font-weight: 600; font-size: 0.875rem; }\n        .health-table tr:last-child td { border-bottom: none; }\n        .health-table tr:hover { background: var(--bg-secondary); }\n        .status-badge { padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; }\n        .status-badge.healthy { background: #d1fae5; color: #065f46; }\n        .status-badge.warning { background: #fef3c7; color: #92400e; }\n        .status-badge.failing { background: #fee2e2; color: #991b1b; }\n        .status-badge.inactive { background: #e5e7eb; color: #6b7280; }\n        .feed-title { font-weight: 600; }\n        .feed-url { font-size: 0.75rem; color: var(--text-muted); word-break: break-all; max-width: 300px; }\n        .error-text { font-size: 0.75rem; color: var(--error); max-width: 200px; word-break: break-word; }\n        .time-ago { font-size: 0.875rem; color: var(--text-muted); }\n        .actions-cell { white-space: nowrap; }\n        .actions-cell form { display: inline; }\n        .btn-sm { padding: 0.25rem 0.5rem; font-size: 0.75rem; }\n        .table-responsive { overflow-x: auto; }\n        @media (max-width: 768px) {\n            .feed-url { max-width: 150px; }\n            .health-table th, .health-table td { padding: 0.5rem; font-size: 0.875rem; }\n        }\n    </style>\n</head>\n<body>\n    <header>\n        <h1><a href="/">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a> <span style="color: var(--text-muted); font-weight: normal; font-size: 0.875rem;">Feed Health</span></h1>\n        <div class="header-actions">\n            <a href="/admin" class="btn">Back to Dashboard</a>\n        </div>\n    </header>\n\n    <div class="health-content">\n        <div class="summary-cards">\n            <div class="summary-card">\n                <div class="count">'
+    yield escape((undefined(name='total_feeds') if l_0_total_feeds is missing else l_0_total_feeds))
+    yield '</div>\n                <div class="label">Total Feeds</div>\n            </div>\n            <div class="summary-card healthy">\n                <div class="count">'
+    yield escape((undefined(name='healthy_count') if l_0_healthy_count is missing else l_0_healthy_count))
+    yield '</div>\n                <div class="label">Healthy</div>\n            </div>\n            <div class="summary-card warning">\n                <div class="count">'
+    yield escape((undefined(name='warning_count') if l_0_warning_count is missing else l_0_warning_count))
+    yield '</div>\n                <div class="label">Warning</div>\n            </div>\n            <div class="summary-card failing">\n                <div class="count">'
+    yield escape((undefined(name='failing_count') if l_0_failing_count is missing else l_0_failing_count))
+    yield '</div>\n                <div class="label">Failing</div>\n            </div>\n            <div class="summary-card inactive">\n                <div class="count">'
+    yield escape((undefined(name='inactive_count') if l_0_inactive_count is missing else l_0_inactive_count))
+    yield '</div>\n                <div class="label">Inactive</div>\n            </div>\n        </div>\n\n        <div class="table-responsive">\n            <table class="health-table">\n                <thead>\n                    <tr>\n                        <th>Status</th>\n                        <th>Feed</th>\n                        <th>Last Fetch</th>\n                        <th>Last Entry</th>\n                        <th>Failures</th>\n                        <th>Entries</th>\n                        <th>Actions</th>\n                    </tr>\n                </thead>\n                <tbody>\n                    '
+    t_1 = 1
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n                    <tr>\n                        <td>\n                            <span class="status-badge '
+        yield escape(environment.getattr(l_1_feed, 'health_status'))
+        yield '">'
+        yield escape(environment.getattr(l_1_feed, 'health_status'))
+        yield '</span>\n                        </td>\n                        <td>\n                            <div class="feed-title">'
+        yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+        yield '</div>\n                            <div class="feed-url">'
+        yield escape(environment.getattr(l_1_feed, 'url'))
+        yield '</div>\n                            '
+        if (environment.getattr(l_1_feed, 'fetch_error') and (environment.getattr(l_1_feed, 'health_status') == 'failing')):
+            pass
+            yield '\n                            <div class="error-text">'
+            yield escape(environment.getattr(l_1_feed, 'fetch_error'))
+            yield '</div>\n                            '
+        yield '\n                        </td>\n                        <td class="time-ago">'
+        yield escape((environment.getattr(l_1_feed, 'last_fetch_at') or 'Never'))
+        yield '</td>\n                        <td class="time-ago">'
+        yield escape((environment.getattr(l_1_feed, 'last_entry_at') or 'Never'))
+        yield '</td>\n                        <td>'
+        yield escape((environment.getattr(l_1_feed, 'consecutive_failures') or 0))
+        yield '</td>\n                        <td>'
+        yield escape((environment.getattr(l_1_feed, 'entry_count') or 0))
+        yield '</td>\n                        <td class="actions-cell">\n                            '
+        if (environment.getattr(l_1_feed, 'health_status') == 'failing'):
+            pass
+            yield '\n                            <form action="/admin/dlq/'
+            yield escape(environment.getattr(l_1_feed, 'id'))
+            yield '/retry" method="POST" style="display: inline;">\n                                <button type="submit" class="btn btn-sm">Retry</button>\n                            </form>\n                            '
+        yield '\n                            '
+        if environment.getattr(l_1_feed, 'is_active'):
+            pass
+            yield '\n                            <form action="/admin/feeds/'
+            yield escape(environment.getattr(l_1_feed, 'id'))
+            yield '" method="POST" style="display: inline;">\n                                <input type="hidden" name="_method" value="PUT">\n                                <input type="hidden" name="is_active" value="0">\n                                <button type="submit" class="btn btn-sm btn-danger" onclick="return confirm(\'Deactivate this feed?\')">Deactivate</button>\n                            </form>\n                            '
+        else:
+            pass
+            yield '\n                            <form action="/admin/feeds/'
+            yield escape(environment.getattr(l_1_feed, 'id'))
+            yield '" method="POST" style="display: inline;">\n                                <input type="hidden" name="_method" value="PUT">\n                                <input type="hidden" name="is_active" value="1">\n                                <button type="submit" class="btn btn-sm btn-success">Activate</button>\n                            </form>\n                            '
+        yield '\n                        </td>\n                    </tr>\n                    '
+        t_1 = 0
+    l_1_feed = missing
+    if t_1:
+        pass
+        yield '\n                    <tr>\n                        <td colspan="7" style="text-align: center; color: var(--text-muted); padding: 2rem;">\n                            No feeds configured yet.\n                        </td>\n                    </tr>\n                    '
+    yield '\n                </tbody>\n            </table>\n        </div>\n    </div>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '6=19&52=21&61=23&65=25&69=27&73=29&77=31&96=34&99=38&102=42&103=44&104=46&105=49&108=52&109=54&110=56&111=58&113=60&114=63&118=66&119=69&125=74'
@@ -0,0 +1,23 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/login.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Admin Login - '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n    <link rel="icon" href="/static/favicon.ico" sizes="32x32">\n    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">\n    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">\n    <style>\n        * { box-sizing: border-box; margin: 0; padding: 0; }\n        body {\n            font-family: system-ui, -apple-system, sans-serif;\n            min-height: 100vh;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n        }\n        .login-card {\n            background: white;\n            padding: 3rem;\n            border-radius: 12px;\n            box-shadow: 0 10px 40px rgba(0,0,0,0.2);\n            text-align: center;\n            max-width: 400px;\n            width: 90%;\n        }\n        .logo { font-size: 3rem; margin-bottom: 1rem; }\n        h1 { color: #333; margin-bottom: 0.5rem; font-size: 1.5rem; }\n        .subtitle { color: #666; margin-bottom: 2rem; }\n        .github-btn {\n            display: inline-flex;\n            align-items: center;\n            gap: 0.75rem;\n            background: #24292e;\n            color: white;\n            padding: 0.875rem 1.5rem;\n            border-radius: 8px;\n            text-decoration: none;\n            font-weight: 500;\n            font-size: 1rem;\n            transition: background 0.2s;\n        }\n        .github-btn:hover { background: #1b1f23; }\n        .github-btn svg { width: 20px; height: 20px; fill: currentColor; }\n        .footer { margin-top: 2rem; color: #999; font-size: 0.875rem; }\n        .footer a { color: #667eea; text-decoration: none; }\n    </style>\n</head>\n<body>\n    <div class="login-card">\n        <div class="logo">&#9741;</div>\n        <h1>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' Admin</h1>\n        <p class="subtitle">Sign in to manage feeds and settings</p>\n\n        <a href="/auth/github" class="github-btn">\n            <svg viewBox="0 0 16 16">\n                <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/>\n            </svg>\n            Sign in with GitHub\n        </a>\n\n        <p class="footer">\n            <a href="/">&#8592; Back to '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a>\n        </p>\n    </div>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '6=13&54=15&65=17'
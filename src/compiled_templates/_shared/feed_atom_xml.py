@@ -0,0 +1,55 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'feed.atom.xml'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_updated_at = resolve('updated_at')
+    l_0_entries = resolve('entries')
+    try:
+        t_1 = environment.filters['e']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'e' found.")
+    pass
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">\n  <title>'
+    yield escape(t_1(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name')))
+    yield '</title>\n  <subtitle>'
+    yield escape(t_1(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'description')))
+    yield '</subtitle>\n  <link href="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '" rel="alternate"/>\n  <link href="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '/feed.atom" rel="self"/>\n  <id>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '/</id>\n  <updated>'
+    yield escape((undefined(name='updated_at') if l_0_updated_at is missing else l_0_updated_at))
+    yield '</updated>\n'
+    for l_1_entry in (undefined(name='entries') if l_0_entries is missing else l_0_entries):
+        _loop_vars = {}
+        pass
+        yield '\n  <entry>\n    <title>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'title')))
+        yield '</title>\n    <link href="'
+        yield escape(t_1(environment.getattr(l_1_entry, 'url')))
+        yield '" rel="alternate"/>\n    <id>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'guid')))
+        yield '</id>\n    <published>'
+        yield escape(environment.getattr(l_1_entry, 'published_at'))
+        yield 'Z</published>\n    <author><name>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'author')))
+        yield '</name></author>\n    <content type="html">'
+        yield escape(t_1(environment.getattr(l_1_entry, 'content')))
+        yield '</content>\n  </entry>\n'
+    l_1_entry = missing
+    yield '\n</feed>'
+
+blocks = {}
+debug_info = '3=21&4=23&5=25&6=27&7=29&8=31&9=33&11=37&12=39&13=41&14=43&15=45&16=47'
@@ -0,0 +1,58 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'feed.rss10.xml'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_entries = resolve('entries')
+    try:
+        t_1 = environment.filters['e']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'e' found.")
+    pass
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"\n         xmlns="http://purl.org/rss/1.0/"\n         xmlns:dc="http://purl.org/dc/elements/1.1/">\n  <channel rdf:about="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '">\n    <title>'
+    yield escape(t_1(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name')))
+    yield '</title>\n    <link>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '</link>\n    <description>'
+    yield escape(t_1(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'description')))
+    yield '</description>\n    <items>\n      <rdf:Seq>\n'
+    for l_1_entry in (undefined(name='entries') if l_0_entries is missing else l_0_entries):
+        _loop_vars = {}
+        pass
+        yield '\n        <rdf:li rdf:resource="'
+        yield escape(t_1(environment.getattr(l_1_entry, 'url')))
+        yield '"/>\n'
+    l_1_entry = missing
+    yield '\n      </rdf:Seq>\n    </items>\n  </channel>\n'
+    for l_1_entry in (undefined(name='entries') if l_0_entries is missing else l_0_entries):
+        _loop_vars = {}
+        pass
+        yield '\n  <item rdf:about="'
+        yield escape(t_1(environment.getattr(l_1_entry, 'url')))
+        yield '">\n    <title>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'title')))
+        yield '</title>\n    <link>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'url')))
+        yield '</link>\n    <dc:date>'
+        yield escape(environment.getattr(l_1_entry, 'published_at_iso'))
+        yield '</dc:date>\n    <dc:creator>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'author')))
+        yield '</dc:creator>\n    <description><![CDATA['
+        yield escape(environment.getattr(l_1_entry, 'content_truncated'))
+        yield ']]></description>\n  </item>\n'
+    l_1_entry = missing
+    yield '\n</rdf:RDF>'
+
+blocks = {}
+debug_info = '5=20&6=22&7=24&8=26&11=28&12=32&17=36&18=40&19=42&20=44&21=46&22=48&23=50'
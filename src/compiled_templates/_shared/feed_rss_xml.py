@@ -0,0 +1,53 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'feed.rss.xml'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_last_build_date = resolve('last_build_date')
+    l_0_entries = resolve('entries')
+    try:
+        t_1 = environment.filters['e']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'e' found.")
+    pass
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">\n  <channel>\n    <title>'
+    yield escape(t_1(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name')))
+    yield '</title>\n    <description>'
+    yield escape(t_1(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'description')))
+    yield '</description>\n    <link>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '</link>\n    <atom:link href="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '/feed.rss" rel="self" type="application/rss+xml"/>\n    <lastBuildDate>'
+    yield escape((undefined(name='last_build_date') if l_0_last_build_date is missing else l_0_last_build_date))
+    yield '</lastBuildDate>\n'
+    for l_1_entry in (undefined(name='entries') if l_0_entries is missing else l_0_entries):
+        _loop_vars = {}
+        pass
+        yield '\n    <item>\n      <title>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'title')))
+        yield '</title>\n      <link>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'url')))
+        yield '</link>\n      <guid>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'guid')))
+        yield '</guid>\n      <pubDate>'
+        yield escape(environment.getattr(l_1_entry, 'published_at'))
+        yield '</pubDate>\n      <author>'
+        yield escape(t_1(environment.getattr(l_1_entry, 'author')))
+        yield '</author>\n      <description><![CDATA['
+        yield escape(environment.getattr(l_1_entry, 'content_cdata'))
+        yield ']]></description>\n    </item>\n'
+    l_1_entry = missing
+    yield '\n  </channel>\n</rss>'
+
+blocks = {}
+debug_info = '4=21&5=23&6=25&7=27&8=29&9=31&11=35&12=37&13=39&14=41&15=43&16=45'
@@ -0,0 +1,50 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'feeds.opml'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_date_created = resolve('date_created')
+    l_0_owner_name = resolve('owner_name')
+    l_0_feeds = resolve('feeds')
+    try:
+        t_1 = environment.filters['e']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'e' found.")
+    pass
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<opml version="2.0">\n  <head>\n    <title>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' Subscriptions</title>\n    <dateCreated>'
+    yield escape((undefined(name='date_created') if l_0_date_created is missing else l_0_date_created))
+    yield '</dateCreated>\n    <ownerName>'
+    yield escape(t_1((undefined(name='owner_name') if l_0_owner_name is missing else l_0_owner_name)))
+    yield '</ownerName>\n  </head>\n  <body>\n    <outline text="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' Feeds" title="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' Feeds">\n'
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n      <outline type="rss" text="'
+        yield escape(t_1(environment.getattr(l_1_feed, 'title')))
+        yield '" title="'
+        yield escape(t_1(environment.getattr(l_1_feed, 'title')))
+        yield '" xmlUrl="'
+        yield escape(t_1(environment.getattr(l_1_feed, 'url')))
+        yield '" htmlUrl="'
+        yield escape(t_1(environment.getattr(l_1_feed, 'site_url')))
+        yield '"/>\n'
+    l_1_feed = missing
+    yield '\n    </outline>\n  </body>\n</opml>'
+
+blocks = {}
+debug_info = '4=22&5=24&6=26&9=28&10=32&11=36'
@@ -0,0 +1,44 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'foafroll.xml'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_feeds = resolve('feeds')
+    try:
+        t_1 = environment.filters['e']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'e' found.")
+    pass
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"\n         xmlns:foaf="http://xmlns.com/foaf/0.1/"\n         xmlns:rss="http://purl.org/rss/1.0/"\n         xmlns:dc="http://purl.org/dc/elements/1.1/">\n  <foaf:Group>\n    <foaf:name>'
+    yield escape(t_1(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name')))
+    yield '</foaf:name>\n    <foaf:homepage rdf:resource="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '"/>\n'
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n    <foaf:member>\n      <foaf:Agent>\n        <foaf:name>'
+        yield escape(t_1(environment.getattr(l_1_feed, 'title')))
+        yield '</foaf:name>\n        <foaf:weblog rdf:resource="'
+        yield escape(t_1(environment.getattr(l_1_feed, 'site_url')))
+        yield '"/>\n        <foaf:member_weblog>\n          <foaf:Document rdf:about="'
+        yield escape(t_1(environment.getattr(l_1_feed, 'site_url')))
+        yield '">\n            <dc:title>'
+        yield escape(t_1(environment.getattr(l_1_feed, 'title')))
+        yield '</dc:title>\n            <rss:channel rdf:resource="'
+        yield escape(t_1(environment.getattr(l_1_feed, 'url')))
+        yield '"/>\n          </foaf:Document>\n        </foaf:member_weblog>\n      </foaf:Agent>\n    </foaf:member>\n'
+    l_1_feed = missing
+    yield '\n  </foaf:Group>\n</rdf:RDF>'
+
+blocks = {}
+debug_info = '7=20&8=22&9=24&12=28&13=30&15=32&16=34&17=36'
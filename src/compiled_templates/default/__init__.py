@@ -0,0 +1,3 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+"""Precompiled templates for the default theme."""
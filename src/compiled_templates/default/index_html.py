@@ -0,0 +1,235 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_feed_links = resolve('feed_links')
+    l_0_logo = resolve('logo')
+    l_0_entries_by_date = resolve('entries_by_date')
+    l_0_is_lite_mode = resolve('is_lite_mode')
+    l_0_feeds = resolve('feeds')
+    l_0_submission = resolve('submission')
+    l_0_related_sites = resolve('related_sites')
+    l_0_footer_text = resolve('footer_text')
+    l_0_show_admin_link = resolve('show_admin_link')
+    l_0_generated_at = resolve('generated_at')
+    l_0_excerpt_mode = resolve('excerpt_mode')
+    try:
+        t_1 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n    <link rel="icon" href="/static/favicon.ico" sizes="32x32">\n    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">\n    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">\n    <link rel="stylesheet" href="/static/style.css">\n    <link rel="alternate" type="application/atom+xml" title="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' Atom Feed" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '">\n    <link rel="alternate" type="application/rss+xml" title="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' RSS Feed" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">\n</head>\n<body>\n    <header>\n        '
+    if (undefined(name='logo') if l_0_logo is missing else l_0_logo):
+        pass
+        yield '\n        <a href="/" class="logo-link">\n            <img src="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'url'))
+        yield '" alt="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'alt'))
+        yield '" width="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'width'))
+        yield '" height="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'height'))
+        yield '" class="logo">\n        </a>\n        '
+    yield '\n        <div class="header-text">\n            <h1><a href="/">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></h1>\n            <p>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'description'))
+    yield '</p>\n        </div>\n    </header>\n\n    <div class="container">\n        <main>\n            '
+    l_1_loop = missing
+    t_2 = 1
+    for (l_1_date, l_1_day_entries), l_1_loop in LoopContext(context.call(environment.getattr((undefined(name='entries_by_date') if l_0_entries_by_date is missing else l_0_entries_by_date), 'items')), undefined):
+        _loop_vars = {}
+        pass
+        yield '\n            <section class="day">\n                <h2 class="date">'
+        yield escape(l_1_date)
+        yield '</h2>\n                '
+        l_2_loop = missing
+        for l_2_entry, l_2_loop in LoopContext(l_1_day_entries, undefined):
+            _loop_vars = {}
+            pass
+            yield '\n                <article>\n                    <h3><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'title') or 'Untitled'))
+            yield '</a></h3>\n                    <p class="meta">\n                        <span class="author">'
+            yield escape(environment.getattr(l_2_entry, 'display_author'))
+            yield '</span>\n                        '
+            if environment.getattr(l_2_entry, 'published_at_display'):
+                pass
+                yield '<span class="date-sep">·</span> <time datetime="'
+                yield escape(environment.getattr(l_2_entry, 'published_at'))
+                yield '">'
+                yield escape(environment.getattr(l_2_entry, 'published_at_display'))
+                yield '</time>'
+            yield '\n                        '
+            if environment.getattr(l_2_entry, 'also_in'):
+                pass
+                yield '<span class="date-sep">·</span> <span class="also-in">also in '
+                l_3_loop = missing
+                for l_3_source, l_3_loop in LoopContext(environment.getattr(l_2_entry, 'also_in'), undefined):
+                    _loop_vars = {}
+                    pass
+                    yield '<a href="'
+                    yield escape(((environment.getattr(l_3_source, 'url') or environment.getattr(l_3_source, 'feed_site_url')) or '#'))
+                    yield '">'
+                    yield escape((environment.getattr(l_3_source, 'feed_title') or 'another feed'))
+                    yield '</a>'
+                    if (not environment.getattr(l_3_loop, 'last')):
+                        pass
+                        yield ', '
+                l_3_loop = l_3_source = missing
+                yield '</span>'
+            yield '\n                    </p>\n                    '
+            if (undefined(name='excerpt_mode') if l_0_excerpt_mode is missing else l_0_excerpt_mode):
+                pass
+                yield '\n                    <div class="content excerpt"><p>'
+                yield escape(environment.getattr(l_2_entry, 'excerpt'))
+                yield '</p></div>\n                    <p class="read-more"><a href="'
+                yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+                yield '" data-entry-content="/entry/'
+                yield escape(environment.getattr(l_2_entry, 'id'))
+                yield '">Read more</a></p>\n                    '
+            else:
+                pass
+                yield '\n                    <div class="content">'
+                yield escape(t_1(environment.getattr(l_2_entry, 'content')))
+                yield '</div>\n                    '
+            yield '\n                </article>\n                '
+        l_2_loop = l_2_entry = missing
+        yield '\n            </section>\n            '
+        t_2 = 0
+    l_1_loop = l_1_date = l_1_day_entries = missing
+    if t_2:
+        pass
+        yield '\n            <p>No entries yet.</p>\n            '
+    yield '\n        </main>\n\n        <aside class="sidebar">\n            '
+    if ((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links) and ((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'sidebar_rss') or environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'titles_only')) or environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'planet_planet'))):
+        pass
+        yield '\n            <div class="sidebar-links">\n                '
+        if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'sidebar_rss'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'sidebar_rss'))
+            yield '">RSS</a>'
+        yield '\n                '
+        if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'titles_only'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'titles_only'))
+            yield '">titles only</a>'
+        yield '\n                '
+        if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'planet_planet'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'planet_planet'))
+            yield '">Planet Planet</a>'
+        yield '\n            </div>\n            '
+    yield '\n\n            '
+    if (not (undefined(name='is_lite_mode') if l_0_is_lite_mode is missing else l_0_is_lite_mode)):
+        pass
+        yield '\n            <form action="/search" method="GET" class="search-form">\n                <label class="search-label"><strong>Search</strong></label>\n                <input type="search" name="q" placeholder="Search entries..." aria-label="Search entries">\n                <button type="submit">Search</button>\n            </form>\n            '
+    yield '\n\n            <h2>Subscriptions</h2>\n            <ul class="feeds">\n                '
+    t_3 = 1
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n                <li class="'
+        yield escape(('feed-inactive' if environment.getattr(l_1_feed, 'is_inactive') else ('healthy' if environment.getattr(l_1_feed, 'is_healthy') else 'unhealthy')))
+        yield '"'
+        if environment.getattr(l_1_feed, 'is_inactive'):
+            pass
+            yield ' title="Feed temporarily unavailable"'
+        yield '>\n                    '
+        if environment.getattr(l_1_feed, 'url'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr(l_1_feed, 'url'))
+            yield '" class="feed-icon" title="RSS Feed"><svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="currentColor"><circle cx="6.18" cy="17.82" r="2.18"/><path d="M4 4.44v2.83c7.03 0 12.73 5.7 12.73 12.73h2.83c0-8.59-6.97-15.56-15.56-15.56zm0 5.66v2.83c3.9 0 7.07 3.17 7.07 7.07h2.83c0-5.47-4.43-9.9-9.9-9.9z"/></svg></a>'
+        yield '\n                    '
+        if environment.getattr(l_1_feed, 'site_url'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr(l_1_feed, 'site_url'))
+            yield '">'
+            yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+            yield '</a>'
+        else:
+            pass
+            yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+        yield '\n                </li>\n                '
+        t_3 = 0
+    l_1_feed = missing
+    if t_3:
+        pass
+        yield '\n                <li>No feeds configured</li>\n                '
+    yield '\n            </ul>\n            '
+    if (undefined(name='submission') if l_0_submission is missing else l_0_submission):
+        pass
+        yield '\n            <p class="submission-link"><a href="'
+        yield escape(environment.getattr((undefined(name='submission') if l_0_submission is missing else l_0_submission), 'url'))
+        yield '">'
+        yield escape(environment.getattr((undefined(name='submission') if l_0_submission is missing else l_0_submission), 'text'))
+        yield '</a></p>\n            '
+    yield '\n\n            '
+    if (undefined(name='related_sites') if l_0_related_sites is missing else l_0_related_sites):
+        pass
+        yield '\n            '
+        for l_1_section in (undefined(name='related_sites') if l_0_related_sites is missing else l_0_related_sites):
+            _loop_vars = {}
+            pass
+            yield '\n            <h2 class="nav-level-one">'
+            yield escape(environment.getattr(l_1_section, 'title'))
+            yield '</h2>\n            <ul class="related-links nav-level-two">\n                '
+            for l_2_link in environment.getattr(l_1_section, 'links'):
+                _loop_vars = {}
+                pass
+                yield '\n                <li class="nav-level-three"><a href="'
+                yield escape(environment.getattr(l_2_link, 'url'))
+                yield '">'
+                yield escape(environment.getattr(l_2_link, 'name'))
+                yield '</a></li>\n                '
+            l_2_link = missing
+            yield '\n            </ul>\n            '
+        l_1_section = missing
+        yield '\n            '
+    yield '\n        </aside>\n    </div>\n\n    <footer>\n        <p><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '">Atom</a> · <a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">RSS</a> · <a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'opml') or '/feeds.opml'))
+    yield '">OPML</a></p>\n        <p>'
+    yield escape((undefined(name='footer_text') if l_0_footer_text is missing else l_0_footer_text))
+    if (undefined(name='show_admin_link') if l_0_show_admin_link is missing else l_0_show_admin_link):
+        pass
+        yield ' · <a href="/admin" style="color: #999; font-size: 0.8em;">Admin</a>'
+    yield ' · <span class="hint">Press <kbd>?</kbd> for shortcuts</span></p>\n        <p>Last updated: '
+    yield escape((undefined(name='generated_at') if l_0_generated_at is missing else l_0_generated_at))
+    yield '</p>\n    </footer>\n\n    <!-- Keyboard shortcuts help panel -->\n    <div class="shortcuts-backdrop hidden" id="shortcuts-backdrop"></div>\n    <div class="shortcuts-panel hidden" id="shortcuts-panel" role="dialog" aria-labelledby="shortcuts-title" aria-modal="true">\n        <h3 id="shortcuts-title">Keyboard Shortcuts</h3>\n        <dl>\n            <dt><kbd>j</kbd></dt>\n            <dd>Next entry</dd>\n            <dt><kbd>k</kbd></dt>\n            <dd>Previous entry</dd>\n            '
+    if (undefined(name='excerpt_mode') if l_0_excerpt_mode is missing else l_0_excerpt_mode):
+        pass
+        yield '\n            <dt><kbd>o</kbd></dt>\n            <dd>Expand entry</dd>\n            '
+    yield '\n            <dt><kbd>?</kbd></dt>\n            <dd>Toggle this help</dd>\n            <dt><kbd>Esc</kbd></dt>\n            <dd>Close help</dd>\n        </dl>\n        <button type="button" class="close-btn" id="close-shortcuts">Close</button>\n    </div>\n\n    <script src="/static/keyboard-nav.js"></script>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '6=30&11=32&12=36&16=40&18=43&22=52&23=54&29=58&31=62&32=65&34=69&36=73&37=75&38=83&40=101&41=104&42=106&44=113&55=124&57=127&58=133&59=139&63=146&73=151&74=155&75=161&76=167&82=184&83=187&86=192&87=195&88=199&90=201&91=205&100=214&101=220&102=225&114=227'
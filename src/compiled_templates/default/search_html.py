@@ -0,0 +1,80 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'search.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_error = resolve('error')
+    l_0_query = resolve('query')
+    l_0_words_truncated = resolve('words_truncated')
+    l_0_max_search_words = resolve('max_search_words')
+    l_0_results = resolve('results')
+    try:
+        t_1 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Search Results - '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n    <link rel="icon" href="/static/favicon.ico" sizes="32x32">\n    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">\n    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">\n    <link rel="stylesheet" href="/static/style.css">\n</head>\n<body>\n    <header>\n        <h1><a href="/">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></h1>\n        <p>Search Results</p>\n    </header>\n\n    <div class="container">\n        <main class="search-page">\n            '
+    if (undefined(name='error') if l_0_error is missing else l_0_error):
+        pass
+        yield '\n            <div class="search-error">\n                <p>'
+        yield escape((undefined(name='error') if l_0_error is missing else l_0_error))
+        yield '</p>\n            </div>\n            '
+    else:
+        pass
+        yield '\n            <h2>Results for "'
+        yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+        yield '"</h2>\n            '
+        if (undefined(name='words_truncated') if l_0_words_truncated is missing else l_0_words_truncated):
+            pass
+            yield '\n            <p class="search-notice">Note: Your search was limited to the first '
+            yield escape((undefined(name='max_search_words') if l_0_max_search_words is missing else l_0_max_search_words))
+            yield ' words.</p>\n            '
+        yield '\n            '
+        if (undefined(name='results') if l_0_results is missing else l_0_results):
+            pass
+            yield '\n            <ul class="search-results">\n                '
+            for l_1_entry in (undefined(name='results') if l_0_results is missing else l_0_results):
+                _loop_vars = {}
+                pass
+                yield '\n                <li>\n                    <h3><a href="'
+                yield escape((environment.getattr(l_1_entry, 'url') or '#'))
+                yield '">'
+                yield escape((environment.getattr(l_1_entry, 'title') or 'Untitled'))
+                yield '</a></h3>\n                    <p class="meta">'
+                yield escape(environment.getattr(l_1_entry, 'display_author'))
+                yield '</p>\n                    '
+                if environment.getattr(l_1_entry, 'snippet_html'):
+                    pass
+                    yield '<p class="snippet">'
+                    yield escape(t_1(environment.getattr(l_1_entry, 'snippet_html')))
+                    yield '</p>'
+                yield '\n                </li>\n                '
+            l_1_entry = missing
+            yield '\n            </ul>\n            '
+        else:
+            pass
+            yield '\n            <p>No results found for "'
+            yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+            yield '"</p>\n            '
+        yield '\n            '
+    yield '\n        </main>\n\n        <aside class="sidebar">\n            <form action="/search" method="GET" class="search-form">\n                <input type="search" name="q" placeholder="Search entries..." value="'
+    yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+    yield '" aria-label="Search entries">\n                <button type="submit">Search</button>\n            </form>\n\n            <p style="margin-top: 1rem;"><a href="/">← Back to home</a></p>\n        </aside>\n    </div>\n\n    <footer><p><a href="/">Back to '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></p></footer>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '6=24&14=26&20=28&22=31&25=36&26=38&27=41&29=44&31=47&33=51&34=55&35=57&40=68&47=72&55=74'
@@ -0,0 +1,199 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'titles.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_feed_links = resolve('feed_links')
+    l_0_logo = resolve('logo')
+    l_0_entries_by_date = resolve('entries_by_date')
+    l_0_is_lite_mode = resolve('is_lite_mode')
+    l_0_feeds = resolve('feeds')
+    l_0_submission = resolve('submission')
+    l_0_related_sites = resolve('related_sites')
+    l_0_footer_text = resolve('footer_text')
+    l_0_show_admin_link = resolve('show_admin_link')
+    l_0_generated_at = resolve('generated_at')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' - Titles Only</title>\n    <link rel="icon" href="/static/favicon.ico" sizes="32x32">\n    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">\n    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">\n    <link rel="stylesheet" href="/static/style.css">\n    <link rel="alternate" type="application/atom+xml" title="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' Atom Feed" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '">\n    <link rel="alternate" type="application/rss+xml" title="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' RSS Feed" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">\n</head>\n<body class="titles-only">\n    <header>\n        '
+    if (undefined(name='logo') if l_0_logo is missing else l_0_logo):
+        pass
+        yield '\n        <a href="/" class="logo-link">\n            <img src="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'url'))
+        yield '" alt="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'alt'))
+        yield '" width="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'width'))
+        yield '" height="'
+        yield escape(environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'height'))
+        yield '" class="logo">\n        </a>\n        '
+    yield '\n        <div class="header-text">\n            <h1><a href="/">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></h1>\n            <p>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'description'))
+    yield '</p>\n        </div>\n    </header>\n\n    <div class="container">\n        <main>\n            <p class="view-toggle"><a href="/">View full content</a></p>\n            '
+    t_1 = 1
+    for (l_1_date, l_1_day_entries) in context.call(environment.getattr((undefined(name='entries_by_date') if l_0_entries_by_date is missing else l_0_entries_by_date), 'items')):
+        l_1_namespace = resolve('namespace')
+        l_1_current_author = missing
+        _loop_vars = {}
+        pass
+        yield '\n            <section class="day">\n                <h2 class="date">'
+        yield escape(l_1_date)
+        yield '</h2>\n                '
+        l_1_current_author = context.call((undefined(name='namespace') if l_1_namespace is missing else l_1_namespace), value='', _loop_vars=_loop_vars)
+        _loop_vars['current_author'] = l_1_current_author
+        yield '\n                '
+        for l_2_entry in l_1_day_entries:
+            _loop_vars = {}
+            pass
+            yield '\n                    '
+            if (environment.getattr(l_2_entry, 'display_author') != environment.getattr((undefined(name='current_author') if l_1_current_author is missing else l_1_current_author), 'value')):
+                pass
+                yield '\n                        '
+                if not isinstance(l_1_current_author, Namespace):
+                    raise TemplateRuntimeError("cannot assign attribute on non-namespace object")
+                l_1_current_author['value'] = environment.getattr(l_2_entry, 'display_author')
+                yield '\n                <h3 class="post"><a href="'
+                yield escape(((environment.getattr(l_2_entry, 'feed_site_url') or environment.getattr(l_2_entry, 'feed_url')) or '#'))
+                yield '">'
+                yield escape((environment.getattr(l_2_entry, 'display_author') or 'Unknown'))
+                yield '</a></h3>\n                    '
+            yield '\n                <h4 class="entry-title"><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'title') or 'Untitled'))
+            yield '</a></h4>\n                <p class="entry-meta"><em>'
+            if environment.getattr(l_2_entry, 'display_author'):
+                pass
+                yield 'by '
+                yield escape(environment.getattr(l_2_entry, 'display_author'))
+                yield ' at '
+            yield escape(environment.getattr(l_2_entry, 'published_at_display'))
+            yield '</em></p>\n                '
+        l_2_entry = missing
+        yield '\n            </section>\n            '
+        t_1 = 0
+    l_1_date = l_1_day_entries = l_1_namespace = l_1_current_author = missing
+    if t_1:
+        pass
+        yield '\n            <p>No entries yet.</p>\n            '
+    yield '\n        </main>\n\n        <aside class="sidebar">\n            '
+    if ((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links) and ((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'sidebar_rss') or environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'titles_only')) or environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'planet_planet'))):
+        pass
+        yield '\n            <div class="sidebar-links">\n                '
+        if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'sidebar_rss'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'sidebar_rss'))
+            yield '">RSS</a>'
+        yield '\n                '
+        if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'titles_only'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'titles_only'))
+            yield '">titles only</a>'
+        yield '\n                '
+        if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'planet_planet'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'planet_planet'))
+            yield '">Planet Planet</a>'
+        yield '\n            </div>\n            '
+    yield '\n\n            '
+    if (not (undefined(name='is_lite_mode') if l_0_is_lite_mode is missing else l_0_is_lite_mode)):
+        pass
+        yield '\n            <form action="/search" method="GET" class="search-form">\n                <label class="search-label"><strong>Search</strong></label>\n                <input type="search" name="q" placeholder="Search entries..." aria-label="Search entries">\n                <button type="submit">Search</button>\n            </form>\n            '
+    yield '\n\n            <h2>Subscriptions</h2>\n            <ul class="feeds">\n                '
+    t_2 = 1
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n                <li class="'
+        yield escape(('healthy' if environment.getattr(l_1_feed, 'is_healthy') else 'unhealthy'))
+        yield '">\n                    '
+        if environment.getattr(l_1_feed, 'url'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr(l_1_feed, 'url'))
+            yield '" class="feed-icon" title="RSS Feed"><svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="currentColor"><circle cx="6.18" cy="17.82" r="2.18"/><path d="M4 4.44v2.83c7.03 0 12.73 5.7 12.73 12.73h2.83c0-8.59-6.97-15.56-15.56-15.56zm0 5.66v2.83c3.9 0 7.07 3.17 7.07 7.07h2.83c0-5.47-4.43-9.9-9.9-9.9z"/></svg></a>'
+        yield '\n                    '
+        if environment.getattr(l_1_feed, 'site_url'):
+            pass
+            yield '<a href="'
+            yield escape(environment.getattr(l_1_feed, 'site_url'))
+            yield '">'
+            yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+            yield '</a>'
+        else:
+            pass
+            yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+        yield '\n                </li>\n                '
+        t_2 = 0
+    l_1_feed = missing
+    if t_2:
+        pass
+        yield '\n                <li>No feeds configured</li>\n                '
+    yield '\n            </ul>\n            '
+    if (undefined(name='submission') if l_0_submission is missing else l_0_submission):
+        pass
+        yield '\n            <p class="submission-link"><a href="'
+        yield escape(environment.getattr((undefined(name='submission') if l_0_submission is missing else l_0_submission), 'url'))
+        yield '">'
+        yield escape(environment.getattr((undefined(name='submission') if l_0_submission is missing else l_0_submission), 'text'))
+        yield '</a></p>\n            '
+    yield '\n\n            '
+    if (undefined(name='related_sites') if l_0_related_sites is missing else l_0_related_sites):
+        pass
+        yield '\n            '
+        for l_1_section in (undefined(name='related_sites') if l_0_related_sites is missing else l_0_related_sites):
+            _loop_vars = {}
+            pass
+            yield '\n            <h2 class="nav-level-one">'
+            yield escape(environment.getattr(l_1_section, 'title'))
+            yield '</h2>\n            <ul class="related-links nav-level-two">\n                '
+            for l_2_link in environment.getattr(l_1_section, 'links'):
+                _loop_vars = {}
+                pass
+                yield '\n                <li class="nav-level-three"><a href="'
+                yield escape(environment.getattr(l_2_link, 'url'))
+                yield '">'
+                yield escape(environment.getattr(l_2_link, 'name'))
+                yield '</a></li>\n                '
+            l_2_link = missing
+            yield '\n            </ul>\n            '
+        l_1_section = missing
+        yield '\n            '
+    yield '\n        </aside>\n    </div>\n\n    <footer>\n        <p><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '">Atom</a> · <a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">RSS</a> · <a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'opml') or '/feeds.opml'))
+    yield '">OPML</a></p>\n        <p>'
+    yield escape((undefined(name='footer_text') if l_0_footer_text is missing else l_0_footer_text))
+    if (undefined(name='show_admin_link') if l_0_show_admin_link is missing else l_0_show_admin_link):
+        pass
+        yield ' · <a href="/admin" style="color: #999; font-size: 0.8em;">Admin</a>'
+    yield '</p>\n        <p>Last updated: '
+    yield escape((undefined(name='generated_at') if l_0_generated_at is missing else l_0_generated_at))
+    yield '</p>\n    </footer>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '6=23&11=25&12=29&16=33&18=36&22=45&23=47&30=50&32=56&33=58&34=61&35=65&36=70&37=72&39=77&40=81&49=96&51=99&52=105&53=111&57=118&67=123&68=127&69=129&70=135&76=152&77=155&80=160&81=163&82=167&84=169&85=173&94=182&95=188&96=193'
@@ -0,0 +1,209 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_feed_links = resolve('feed_links')
+    l_0_entries_by_date = resolve('entries_by_date')
+    l_0_generated_at = resolve('generated_at')
+    l_0_is_lite_mode = resolve('is_lite_mode')
+    l_0_feeds = resolve('feeds')
+    l_0_footer_text = resolve('footer_text')
+    l_0_show_admin_link = resolve('show_admin_link')
+    try:
+        t_1 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    pass
+    yield '<?xml version="1.0"?>\n<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml" lang="en">\n<head>\n    <title>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n    <meta charset="utf-8"/>\n    <meta name="viewport" content="width=device-width, initial-scale=1"/>\n    <meta name="generator" content="PlanetCF"/>\n    <meta name="description" content="Follow the pulse of the Mozilla project. Aggregated updates from the developers, designers, and volunteers building a better internet."/>\n    <meta property="og:site_name" content="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '"/>\n    <meta property="og:title" content="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '"/>\n    <meta property="og:description" content="Follow the pulse of the Mozilla project. Aggregated updates from the developers, designers, and volunteers building a better internet."/>\n    <meta property="og:image" content="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '/static/img/planet_banner.png"/>\n    <meta name="twitter:card" content="summary_large_image"/>\n    <meta name="twitter:creator" content="@mozilla"/>\n    <meta property="twitter:title" content="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '"/>\n    <meta property="twitter:image" content="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'link'))
+    yield '/static/img/planet_banner.png"/>\n    <link href="/static/style.css" rel="stylesheet" type="text/css"/>\n    <link href="/static/favicon.ico" rel="shortcut icon" type="image/png"/>\n    <link rel="alternate" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '" title="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '" type="application/atom+xml"/>\n</head>\n<body>\n    <div id="utility">\n        <p><strong>Looking For</strong></p>\n        <ul>\n            <li><a href="https://www.mozilla.org/">mozilla.org</a></li>\n            <li><a href="https://wiki.mozilla.org/">Wiki</a></li>\n            <li><a href="https://developer.mozilla.org/">Developer Center</a></li>\n            <li><a href="http://www.firefox.com/">Firefox</a></li>\n            <li><a href="http://www.getthunderbird.com/">Thunderbird</a></li>\n        </ul>\n    </div>\n    <div id="header">\n        <div id="dino">\n            <h1><a href="/" title="Back to home page">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></h1>\n        </div>\n    </div>\n    <div class="main-container">\n        <main class="main-content">\n'
+    l_1_loop = missing
+    t_2 = 1
+    for (l_1_date, l_1_day_entries), l_1_loop in LoopContext(context.call(environment.getattr((undefined(name='entries_by_date') if l_0_entries_by_date is missing else l_0_entries_by_date), 'items')), undefined):
+        l_1_date_labels = resolve('date_labels')
+        _loop_vars = {}
+        pass
+        yield '\n            <h2><time datetime="'
+        yield escape(l_1_date)
+        yield '">'
+        yield escape(environment.getitem((undefined(name='date_labels') if l_1_date_labels is missing else l_1_date_labels), l_1_date))
+        yield '</time></h2>\n'
+        l_2_loop = missing
+        for l_2_entry, l_2_loop in LoopContext(l_1_day_entries, undefined):
+            l_2_excerpt_mode = resolve('excerpt_mode')
+            _loop_vars = {}
+            pass
+            yield '\n            <article class="news">\n                <h3><a href="'
+            yield escape(((environment.getattr(l_2_entry, 'feed_site_url') or environment.getattr(l_2_entry, 'feed_url')) or '#'))
+            yield '" title="'
+            yield escape(environment.getattr(l_2_entry, 'display_author'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'display_author') or 'Unknown'))
+            yield '</a> — <a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'title') or 'Untitled'))
+            yield '</a></h3>\n                <div class="entry">\n'
+            if (undefined(name='excerpt_mode') if l_2_excerpt_mode is missing else l_2_excerpt_mode):
+                pass
+                yield '\n                    <div class="content excerpt"><p>'
+                yield escape(environment.getattr(l_2_entry, 'excerpt'))
+                yield '</p></div>\n                    <p class="read-more"><a href="'
+                yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+                yield '" data-entry-content="/entry/'
+                yield escape(environment.getattr(l_2_entry, 'id'))
+                yield '">Read more</a></p>\n'
+            else:
+                pass
+                yield '\n                    <div class="content">'
+                yield escape(t_1(environment.getattr(l_2_entry, 'content')))
+                yield '</div>\n'
+            yield '\n                </div>\n                <div class="permalink"><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">by '
+            yield escape(environment.getattr(l_2_entry, 'display_author'))
+            yield ' at <time datetime="'
+            yield escape(environment.getattr(l_2_entry, 'published_at'))
+            yield '" title="GMT">'
+            yield escape(environment.getattr(l_2_entry, 'published_at_display'))
+            yield '</time></a>'
+            if environment.getattr(l_2_entry, 'also_in'):
+                pass
+                yield ' · also in '
+                l_3_loop = missing
+                for l_3_source, l_3_loop in LoopContext(environment.getattr(l_2_entry, 'also_in'), undefined):
+                    _loop_vars = {}
+                    pass
+                    yield '<a href="'
+                    yield escape(((environment.getattr(l_3_source, 'url') or environment.getattr(l_3_source, 'feed_site_url')) or '#'))
+                    yield '">'
+                    yield escape((environment.getattr(l_3_source, 'feed_title') or 'another feed'))
+                    yield '</a>'
+                    if (not environment.getattr(l_3_loop, 'last')):
+                        pass
+                        yield ', '
+                l_3_loop = l_3_source = missing
+            yield '</div>\n            </article>\n'
+        l_2_loop = l_2_entry = l_2_excerpt_mode = missing
+        yield '\n'
+        t_2 = 0
+    l_1_loop = l_1_date = l_1_day_entries = l_1_date_labels = missing
+    if t_2:
+        pass
+        yield '\n            <p>No entries yet.</p>\n'
+    yield '\n        </main>\n        <div class="sidebar-content">\n            <div class="disclaimer">\n                <h2>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</h2>\n                <p>Collected here are the most recent blog posts from all over the Mozilla community.\n                   The content here is unfiltered and uncensored, and represents the views of individual community members.\n                   Individual posts are owned by their authors -- see original source for licensing information.</p>\n            </div>\n            <div class="feeds">\n                <h2>Subscribe to Planet</h2>\n                <p>Feeds:</p>\n                <ul>\n                    <li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '">Atom</a></li>\n                    <li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">RSS 2.0</a></li>\n                    '
+    if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss10'):
+        pass
+        yield '<li><a href="'
+        yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss10'))
+        yield '">RSS 1.0</a></li>'
+    yield '\n                </ul>\n                <p></p>\n                <p>Subscription list:</p>\n                <ul>\n                    '
+    if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'foaf'):
+        pass
+        yield '<li><a href="'
+        yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'foaf'))
+        yield '">FOAF</a></li>'
+    yield '\n                    <li class="opml"><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'opml') or '/feeds.opml'))
+    yield '">OPML</a></li>\n                </ul>\n                <p>Last update: <time datetime="'
+    yield escape((undefined(name='generated_at') if l_0_generated_at is missing else l_0_generated_at))
+    yield '" title="GMT">'
+    yield escape((undefined(name='generated_at') if l_0_generated_at is missing else l_0_generated_at))
+    yield '</time></p>\n            </div>\n            <div class="main">\n                <h2>Other Planets</h2>\n                <ul class="planets">\n                    <li><a href="https://planet.mozilla.org/projects/">Projects</a></li>\n                    <li><a href="https://planet.mozilla.org/participation/">Planet Participation</a></li>\n                    <li><a href="https://planet.mozilla.org/thunderbird/">Planet Thunderbird</a></li>\n                    <li><a href="https://quality.mozilla.org/">Planet QMO</a></li>\n                    <li><a href="https://planet.mozilla.org/ateam/">Planet Automation</a></li>\n                    <li><a href="https://planet.mozilla.org/research/">Mozilla Research</a></li>\n                </ul>\n                '
+    if (not (undefined(name='is_lite_mode') if l_0_is_lite_mode is missing else l_0_is_lite_mode)):
+        pass
+        yield '\n                <div id="sidebar">\n                    <h2>Search</h2>\n                    <form action="/search" method="GET">\n                        <input name="q" type="search" placeholder="Search..."/>\n                        <button type="submit">Search</button>\n                    </form>\n                </div>\n                '
+    yield '\n                <h2>Subscriptions</h2>\n                <ul class="subscriptions">\n'
+    t_3 = 1
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n                    <li'
+        if environment.getattr(l_1_feed, 'is_inactive'):
+            pass
+            yield ' class="feed-inactive" title="Feed temporarily unavailable"'
+        yield '>\n                        <a title="subscribe" href="'
+        yield escape(environment.getattr(l_1_feed, 'url'))
+        yield '"><img src="/static/img/feed-icon-10x10.png" alt="(feed)" width="10" height="10"/></a>\n                        <a href="'
+        yield escape(((environment.getattr(l_1_feed, 'site_url') or environment.getattr(l_1_feed, 'url')) or '#'))
+        yield '"\n                           '
+        if environment.getattr(l_1_feed, 'message'):
+            pass
+            yield 'class="'
+            yield escape(('active message' if environment.getattr(l_1_feed, 'recent_entries') else 'message'))
+            yield '" title="'
+            yield escape(environment.getattr(l_1_feed, 'message'))
+            yield '"\n                           '
+        elif environment.getattr(l_1_feed, 'recent_entries'):
+            pass
+            yield 'class="active" title="'
+            yield escape(environment.getattr(l_1_feed, 'title'))
+            yield '"\n                           '
+        else:
+            pass
+            yield 'title="'
+            yield escape(environment.getattr(l_1_feed, 'title'))
+            yield '"\n                           '
+        yield '>'
+        yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+        yield '</a>\n                        '
+        if environment.getattr(l_1_feed, 'recent_entries'):
+            pass
+            yield '\n                        <ul>\n                            '
+            for l_2_entry in environment.getattr(l_1_feed, 'recent_entries'):
+                _loop_vars = {}
+                pass
+                yield '\n                            <li><a href="'
+                yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+                yield '">'
+                yield escape(environment.getattr(l_2_entry, 'title'))
+                yield '</a></li>\n                            '
+            l_2_entry = missing
+            yield '\n                        </ul>\n                        '
+        yield '\n                    </li>\n'
+        t_3 = 0
+    l_1_feed = missing
+    if t_3:
+        pass
+        yield '\n                    <li>No feeds configured</li>\n'
+    yield '\n                </ul>\n            </div>\n            <div class="bottom"></div>\n        </div>\n    </div>\n    <div id="footer">\n        <div id="footer-content">\n            <p>'
+    yield escape((undefined(name='footer_text') if l_0_footer_text is missing else l_0_footer_text))
+    if (undefined(name='show_admin_link') if l_0_show_admin_link is missing else l_0_show_admin_link):
+        pass
+        yield ' | <a href="/admin">Admin</a>'
+    yield "</p>\n        </div>\n    </div>\n    <script>\n    // Localize UTC dates to the user's timezone\n    (function() {\n        var times = document.querySelectorAll('time[datetime]');\n        for (var i = 0; i < times.length; i++) {\n            var el = times[i];\n            var dt = el.getAttribute('datetime');\n            if (!dt) continue;\n            var d = new Date(dt.indexOf('T') === -1 && dt.indexOf('Z') === -1 ? dt + 'T00:00:00Z' : dt);\n            if (isNaN(d.getTime())) continue;\n            var parent = el.parentElement;\n            if (parent && parent.tagName === 'H2') {\n                el.textContent = d.toLocaleDateString(undefined, {weekday: 'long', year: 'numeric', month: 'long', day: 'numeric'});\n            } else {\n                el.textContent = d.toLocaleString(undefined, {year: 'numeric', month: 'short', day: 'numeric', hour: '2-digit', minute: '2-digit', timeZoneName: 'short'});\n            }\n            el.setAttribute('title', dt + ' UTC');\n        }\n    })();\n    </script>\n</body>\n</html>"
+
+blocks = {}
+debug_info = '5=26&10=28&11=30&13=32&16=34&17=36&20=38&35=42&40=46&41=51&42=56&44=61&46=71&47=74&48=76&50=83&53=86&62=119&71=121&72=123&73=125&78=131&79=137&81=139&93=143&104=148&105=152&106=156&107=158&108=160&109=167&110=175&111=178&112=180&114=183&115=187&130=200'
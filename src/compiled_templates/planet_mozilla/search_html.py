@@ -0,0 +1,88 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'search.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_error = resolve('error')
+    l_0_query = resolve('query')
+    l_0_words_truncated = resolve('words_truncated')
+    l_0_max_search_words = resolve('max_search_words')
+    l_0_results = resolve('results')
+    try:
+        t_1 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    pass
+    yield '<?xml version="1.0"?>\n<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml" lang="en">\n<head>\n    <title>Search Results - '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n    <meta charset="utf-8"/>\n    <meta name="viewport" content="width=device-width, initial-scale=1"/>\n    <link href="/static/style.css" rel="stylesheet" type="text/css"/>\n    <link href="/static/favicon.ico" rel="shortcut icon" type="image/png"/>\n</head>\n<body>\n    <div id="utility">\n        <p><strong>Looking For</strong></p>\n        <ul>\n            <li><a href="https://www.mozilla.org/">mozilla.org</a></li>\n            <li><a href="https://wiki.mozilla.org/">Wiki</a></li>\n            <li><a href="https://developer.mozilla.org/">Developer Center</a></li>\n            <li><a href="http://www.firefox.com/">Firefox</a></li>\n            <li><a href="http://www.getthunderbird.com/">Thunderbird</a></li>\n        </ul>\n    </div>\n    <div id="header">\n        <div id="dino">\n            <h1><a href="/" title="Back to home page">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></h1>\n        </div>\n    </div>\n    <div class="main-container">\n        <main class="main-content">\n            <h2>Search Results</h2>\n'
+    if (undefined(name='error') if l_0_error is missing else l_0_error):
+        pass
+        yield '\n            <div class="search-error">\n                <p>'
+        yield escape((undefined(name='error') if l_0_error is missing else l_0_error))
+        yield '</p>\n            </div>\n'
+    else:
+        pass
+        yield '\n            <h3>Results for "'
+        yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+        yield '"</h3>\n'
+        if (undefined(name='words_truncated') if l_0_words_truncated is missing else l_0_words_truncated):
+            pass
+            yield '\n            <p><em>Note: Your search was limited to the first '
+            yield escape((undefined(name='max_search_words') if l_0_max_search_words is missing else l_0_max_search_words))
+            yield ' words.</em></p>\n'
+        yield '\n'
+        if (undefined(name='results') if l_0_results is missing else l_0_results):
+            pass
+            yield '\n'
+            for l_1_entry in (undefined(name='results') if l_0_results is missing else l_0_results):
+                _loop_vars = {}
+                pass
+                yield '\n            <article class="news">\n                <h3><a href="'
+                yield escape(((environment.getattr(l_1_entry, 'feed_site_url') or environment.getattr(l_1_entry, 'feed_url')) or '#'))
+                yield '" title="'
+                yield escape(environment.getattr(l_1_entry, 'display_author'))
+                yield '">'
+                yield escape((environment.getattr(l_1_entry, 'display_author') or 'Unknown'))
+                yield '</a> — <a href="'
+                yield escape((environment.getattr(l_1_entry, 'url') or '#'))
+                yield '">'
+                yield escape((environment.getattr(l_1_entry, 'title') or 'Untitled'))
+                yield '</a></h3>\n                '
+                if environment.getattr(l_1_entry, 'snippet_html'):
+                    pass
+                    yield '<p>'
+                    yield escape(t_1(environment.getattr(l_1_entry, 'snippet_html')))
+                    yield '</p>'
+                yield '\n                <div class="permalink">by '
+                yield escape(environment.getattr(l_1_entry, 'display_author'))
+                yield ' at '
+                yield escape(environment.getattr(l_1_entry, 'published_at_display'))
+                yield '</div>\n            </article>\n'
+            l_1_entry = missing
+            yield '\n'
+        else:
+            pass
+            yield '\n            <p>No results found for "'
+            yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+            yield '"</p>\n'
+        yield '\n'
+    yield '\n        </main>\n        <div class="sidebar-content">\n            <div class="main">\n                <div id="sidebar">\n                    <h2>Search</h2>\n                    <form action="/search" method="GET">\n                        <input name="q" type="search" value="'
+    yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+    yield '" placeholder="Search..."/>\n                        <button type="submit">Search</button>\n                    </form>\n                </div>\n                <p><a href="/">Back to home</a></p>\n            </div>\n        </div>\n    </div>\n    <div id="footer">\n        <div id="footer-content">\n            <p><a href="/">Back to '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></p>\n        </div>\n    </div>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '5=24&24=26&30=28&32=31&35=36&36=38&37=41&39=44&40=47&42=51&43=61&44=67&48=76&57=80&67=82'
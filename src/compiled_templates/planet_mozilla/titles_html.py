@@ -0,0 +1,111 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'titles.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_feed_links = resolve('feed_links')
+    l_0_entries_by_date = resolve('entries_by_date')
+    l_0_feeds = resolve('feeds')
+    l_0_footer_text = resolve('footer_text')
+    l_0_show_admin_link = resolve('show_admin_link')
+    l_0_generated_at = resolve('generated_at')
+    pass
+    yield '<?xml version="1.0"?>\n<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml" lang="en">\n<head>\n    <title>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield ' - Titles Only</title>\n    <meta charset="utf-8"/>\n    <meta name="viewport" content="width=device-width, initial-scale=1"/>\n    <link href="/static/style.css" rel="stylesheet" type="text/css"/>\n    <link href="/static/favicon.ico" rel="shortcut icon" type="image/png"/>\n    <link rel="alternate" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '" title="'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '" type="application/atom+xml"/>\n</head>\n<body>\n    <div id="utility">\n        <p><strong>Looking For</strong></p>\n        <ul>\n            <li><a href="https://www.mozilla.org/">mozilla.org</a></li>\n            <li><a href="https://wiki.mozilla.org/">Wiki</a></li>\n            <li><a href="https://developer.mozilla.org/">Developer Center</a></li>\n            <li><a href="http://www.firefox.com/">Firefox</a></li>\n            <li><a href="http://www.getthunderbird.com/">Thunderbird</a></li>\n        </ul>\n    </div>\n    <div id="header">\n        <div id="dino">\n            <h1><a href="/" title="Back to home page">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</a></h1>\n        </div>\n    </div>\n    <div class="main-container">\n        <main class="main-content">\n            <p><a href="/">View full content</a></p>\n'
+    t_1 = 1
+    for (l_1_date, l_1_day_entries) in context.call(environment.getattr((undefined(name='entries_by_date') if l_0_entries_by_date is missing else l_0_entries_by_date), 'items')):
+        l_1_date_labels = resolve('date_labels')
+        _loop_vars = {}
+        pass
+        yield '\n            <h2><time datetime="'
+        yield escape(l_1_date)
+        yield '">'
+        yield escape(environment.getitem((undefined(name='date_labels') if l_1_date_labels is missing else l_1_date_labels), l_1_date))
+        yield '</time></h2>\n'
+        for l_2_entry in l_1_day_entries:
+            _loop_vars = {}
+            pass
+            yield '\n            <article class="news">\n                <h3><a href="'
+            yield escape(((environment.getattr(l_2_entry, 'feed_site_url') or environment.getattr(l_2_entry, 'feed_url')) or '#'))
+            yield '" title="'
+            yield escape(environment.getattr(l_2_entry, 'display_author'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'display_author') or 'Unknown'))
+            yield '</a> — <a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'title') or 'Untitled'))
+            yield '</a></h3>\n                <div class="permalink"><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">by '
+            yield escape(environment.getattr(l_2_entry, 'display_author'))
+            yield ' at <time datetime="'
+            yield escape(environment.getattr(l_2_entry, 'published_at'))
+            yield '" title="GMT">'
+            yield escape(environment.getattr(l_2_entry, 'published_at_display'))
+            yield '</time></a></div>\n            </article>\n'
+        l_2_entry = missing
+        yield '\n'
+        t_1 = 0
+    l_1_date = l_1_day_entries = l_1_date_labels = missing
+    if t_1:
+        pass
+        yield '\n            <p>No entries yet.</p>\n'
+    yield '\n        </main>\n        <div class="sidebar-content">\n            <div class="feeds">\n                <h2>Subscribe to Planet</h2>\n                <ul>\n                    <li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '">Atom</a></li>\n                    <li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">RSS 2.0</a></li>\n                    '
+    if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss10'):
+        pass
+        yield '<li><a href="'
+        yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss10'))
+        yield '">RSS 1.0</a></li>'
+    yield '\n                </ul>\n                <ul>\n                    '
+    if environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'foaf'):
+        pass
+        yield '<li><a href="'
+        yield escape(environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'foaf'))
+        yield '">FOAF</a></li>'
+    yield '\n                    <li class="opml"><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'opml') or '/feeds.opml'))
+    yield '">OPML</a></li>\n                </ul>\n            </div>\n            <div class="main">\n                <h2>Subscriptions</h2>\n                <ul class="subscriptions">\n'
+    t_2 = 1
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n                    <li><a href="'
+        yield escape(((environment.getattr(l_1_feed, 'site_url') or environment.getattr(l_1_feed, 'url')) or '#'))
+        yield '">'
+        yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+        yield '</a></li>\n'
+        t_2 = 0
+    l_1_feed = missing
+    if t_2:
+        pass
+        yield '\n                    <li>No feeds configured</li>\n'
+    yield '\n                </ul>\n            </div>\n        </div>\n    </div>\n    <div id="footer">\n        <div id="footer-content">\n            <p>'
+    yield escape((undefined(name='footer_text') if l_0_footer_text is missing else l_0_footer_text))
+    if (undefined(name='show_admin_link') if l_0_show_admin_link is missing else l_0_show_admin_link):
+        pass
+        yield ' | <a href="/admin">Admin</a>'
+    yield '</p>\n            <p>Last updated: '
+    yield escape((undefined(name='generated_at') if l_0_generated_at is missing else l_0_generated_at))
+    yield "</p>\n        </div>\n    </div>\n    <script>\n    // Localize UTC dates to the user's timezone\n    (function() {\n        var times = document.querySelectorAll('time[datetime]');\n        for (var i = 0; i < times.length; i++) {\n            var el = times[i];\n            var dt = el.getAttribute('datetime');\n            if (!dt) continue;\n            var d = new Date(dt.indexOf('T') === -1 && dt.indexOf('Z') === -1 ? dt + 'T00:00:00Z' : dt);\n            if (isNaN(d.getTime())) continue;\n            var parent = el.parentElement;\n            if (parent && parent.tagName === 'H2') {\n                el.textContent = d.toLocaleDateString(undefined, {weekday: 'long', year: 'numeric', month: 'long', day: 'numeric'});\n            } else {\n                el.textContent = d.toLocaleString(undefined, {year: 'numeric', month: 'short', day: 'numeric', hour: '2-digit', minute: '2-digit', timeZoneName: 'short'});\n            }\n            el.setAttribute('title', dt + ' UTC');\n        }\n    })();\n    </script>\n</body>\n</html>"
+
+blocks = {}
+debug_info = '5=19&10=21&25=25&31=28&32=33&33=37&35=41&36=51&47=67&48=69&49=71&52=77&53=83&59=86&60=90&70=100&71=105'
@@ -0,0 +1,151 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_feed_links = resolve('feed_links')
+    l_0_logo = resolve('logo')
+    l_0_generated_at = resolve('generated_at')
+    l_0_entries_by_date = resolve('entries_by_date')
+    l_0_feeds = resolve('feeds')
+    try:
+        t_1 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n<head>\n  <meta http-equiv="content-type" content="text/html; charset=utf-8" />\n  <title>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n  <link rel="stylesheet" type="text/css" href="/static/styles/screen-switcher-default.css" />\n  <link rel="stylesheet" type="text/css" href="/static/styles/netscape4.css" />\n  <link rel="stylesheet" type="text/css" media="print" href="/static/styles/print.css" />\n  <link rel="alternate stylesheet" type="text/css" href="/static/styles/largestyles.css" title="Large" />\n  <link rel="alternate stylesheet" type="text/css" href="/static/styles/defaultfonts.css" title="Default fonts" />\n  <meta name="generator" content="PlanetCF" />\n  <meta name="keywords" content="Python weblog blog blogs blogger weblogger aggregator rss" />\n  <meta name="description" content="'
+    yield escape((environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'description') or 'Recent postings from Python-related blogs.'))
+    yield '" />\n  <meta name="viewport" content="width=device-width, initial-scale=1.0" />\n  <link rel="alternate" type="application/rss+xml" title="RSS" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '" />\n  <link rel="alternate" type="application/atom+xml" title="Atom" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '" />\n  <link rel="icon" href="/static/favicon.ico" sizes="32x32" />\n  <style>\n    /* Make images responsive */\n    img {\n        border: 0;\n        height: auto;\n        max-width: 100%;\n        display: block;\n        padding-top: 5px;\n        padding-bottom: 35px;\n    }\n  </style>\n</head>\n\n<body>\n  <!-- Logo -->\n  <h1 id="logoheader">\n    <a href="/" id="logolink" accesskey="1"><img id="logo"\nsrc="'
+    yield escape((environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'url') or '/static/images/python-logo.gif'))
+    yield '" alt="'
+    yield escape((environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'alt') or 'homepage'))
+    yield '" border="0" /></a>\n  </h1>\n  <!-- Skip to Navigation -->\n  <div class="skiptonav"><a href="#left-hand-navigation" accesskey="2"><img src="/static/images/trans.gif" id="skiptonav" alt="skip to navigation" border="0" width="1" height="1" /></a></div>\n  <div class="skiptonav"><a href="#content-body" accesskey="3"><img src="/static/images/trans.gif" id="skiptocontent" alt="skip to content" border="0" width="1" height="1" /></a></div>\n\n  <div id="content-body">\n    <main id="body-main">\n\n<h1 class="pageheading">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</h1>\n\n<p>Last update: '
+    yield escape((undefined(name='generated_at') if l_0_generated_at is missing else l_0_generated_at))
+    yield '\n\n'
+    l_1_loop = missing
+    t_2 = 1
+    for (l_1_date, l_1_day_entries), l_1_loop in LoopContext(context.call(environment.getattr((undefined(name='entries_by_date') if l_0_entries_by_date is missing else l_0_entries_by_date), 'items')), undefined):
+        l_1_date_labels = resolve('date_labels')
+        l_1_namespace = resolve('namespace')
+        l_1_current_author = missing
+        _loop_vars = {}
+        pass
+        yield '\n\n\n<h2>'
+        yield escape(environment.getitem((undefined(name='date_labels') if l_1_date_labels is missing else l_1_date_labels), l_1_date))
+        yield '</h2>\n\n'
+        l_1_current_author = context.call((undefined(name='namespace') if l_1_namespace is missing else l_1_namespace), value='', _loop_vars=_loop_vars)
+        _loop_vars['current_author'] = l_1_current_author
+        yield '\n'
+        l_2_loop = missing
+        for l_2_entry, l_2_loop in LoopContext(l_1_day_entries, undefined):
+            l_2_excerpt_mode = resolve('excerpt_mode')
+            _loop_vars = {}
+            pass
+            yield '\n'
+            if (environment.getattr(l_2_entry, 'display_author') != environment.getattr((undefined(name='current_author') if l_1_current_author is missing else l_1_current_author), 'value')):
+                pass
+                yield '\n'
+                if not isinstance(l_1_current_author, Namespace):
+                    raise TemplateRuntimeError("cannot assign attribute on non-namespace object")
+                l_1_current_author['value'] = environment.getattr(l_2_entry, 'display_author')
+                yield '\n\n<hr /><h3 class="post"><a href="'
+                yield escape(((environment.getattr(l_2_entry, 'feed_site_url') or environment.getattr(l_2_entry, 'feed_url')) or '#'))
+                yield '" title="'
+                yield escape(environment.getattr(l_2_entry, 'display_author'))
+                yield '">'
+                yield escape((environment.getattr(l_2_entry, 'display_author') or 'Unknown'))
+                yield '</a></h3>\n\n'
+            yield '\n\n<h4><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'title') or 'Untitled'))
+            yield '</a></h4>\n'
+            if (undefined(name='excerpt_mode') if l_2_excerpt_mode is missing else l_2_excerpt_mode):
+                pass
+                yield '\n<p class="excerpt">\n'
+                yield escape(environment.getattr(l_2_entry, 'excerpt'))
+                yield '</p>\n<p class="read-more"><a href="'
+                yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+                yield '" data-entry-content="/entry/'
+                yield escape(environment.getattr(l_2_entry, 'id'))
+                yield '">Read more</a></p>\n'
+            else:
+                pass
+                yield '\n<p>\n'
+                yield escape(t_1(environment.getattr(l_2_entry, 'content')))
+                yield '</p>\n'
+            yield '\n<p>\n<em><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape(environment.getattr(l_2_entry, 'published_at_display'))
+            yield '</a></em>\n'
+            if environment.getattr(l_2_entry, 'also_in'):
+                pass
+                yield '<br />also in '
+                l_3_loop = missing
+                for l_3_source, l_3_loop in LoopContext(environment.getattr(l_2_entry, 'also_in'), undefined):
+                    _loop_vars = {}
+                    pass
+                    yield '<a href="'
+                    yield escape(((environment.getattr(l_3_source, 'url') or environment.getattr(l_3_source, 'feed_site_url')) or '#'))
+                    yield '">'
+                    yield escape((environment.getattr(l_3_source, 'feed_title') or 'another feed'))
+                    yield '</a>'
+                    if (not environment.getattr(l_3_loop, 'last')):
+                        pass
+                        yield ', '
+                l_3_loop = l_3_source = missing
+            yield '\n</p>\n\n'
+        l_2_loop = l_2_entry = l_2_excerpt_mode = missing
+        yield '\n'
+        t_2 = 0
+    l_1_loop = l_1_date = l_1_day_entries = l_1_date_labels = l_1_namespace = l_1_current_author = missing
+    if t_2:
+        pass
+        yield '\n<p>No entries yet.</p>\n'
+    yield '\n\n\n    </main>\n  </div>\n\n  <div id="left-hand-navigation">\n    <div id="menu">\n      <ul class="level-one">\n          <li>\n          <ul class="level-two">\n             <li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">RSS feed</a></li>\n             <li><a href="/titles">Titles Only</a></li>\n             <li><a href="http://www.planetplanet.org/">Powered by Planet!</a></li>\n          </ul></li>\n          <li>Other Python Planets\n            <ul class="level-two">\n              <li><a href="http://terri.toybox.ca/python-soc/">Python Summer of Code</a></li>\n              <li><a href="http://www.afpy.org/planet/">Planet Python Francophone</a></li>\n              <li><a href="http://planeta.python.org.ar/">Planet Python Argentina</a></li>\n              <li><a href="http://planet.python.org.br/">Planet Python Brasil</a></li>\n              <li><a href="http://pl.python.org/planeta/">Planet Python Poland</a></li>\n            </ul></li>\n          <li>Python Libraries\n          <ul class="level-two">\n            <li><a href="http://planet.laptop.org/">OLPC</a></li>\n            <li><a href="http://planet.pysoy.org/">PySoy</a></li>\n            <li><a href="http://planet.scipy.org/">SciPy</a></li>\n            <li><a href="http://planet.sympy.org/">SymPy</a></li>\n            <li><a href="http://planet.twistedmatrix.com/">Twisted</a></li>\n          </ul></li>\n          <li>Python/Web Planets\n          <ul class="level-two">\n            <li><a href="http://planet.cherrypy.org/">CherryPy</a></li>\n            <li><a href="http://www.djangoproject.com/community/">Django Community</a></li>\n            <li><a href="http://planet.plone.org/">Plone</a></li>\n            <li><a href="http://planet.turbogears.org/">Turbogears</a></li>\n          </ul></li>\n          <li>Other Languages\n          <ul class="level-two">\n            <li><a href="http://planet.haskell.org/">Haskell</a></li>\n            <li><a href="http://planet.lisp.org/">Lisp</a></li>\n            <li><a href="http://planet.parrotcode.org/">Parrot</a></li>\n            <li><a href="http://planet.perl.org/">Perl</a></li>\n            <li><a href="http://planetruby.0x42.net/">Ruby</a></li>\n          </ul></li>\n          <li>Databases\n          <ul class="level-two">\n            <li><a href="http://www.planetmysql.org/">MySQL</a></li>\n            <li><a href="http://planet.postgresql.org/">PostgreSQL</a></li>\n          </ul></li>\n          <li>Subscriptions\n          <ul class="level-two">\n<li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'opml') or '/feeds.opml'))
+    yield '">[OPML feed]</a></li>\n'
+    t_3 = 1
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n<li'
+        if environment.getattr(l_1_feed, 'is_inactive'):
+            pass
+            yield ' class="feed-inactive" title="Feed temporarily unavailable"'
+        yield '><a href="'
+        yield escape(((environment.getattr(l_1_feed, 'site_url') or environment.getattr(l_1_feed, 'url')) or '#'))
+        yield '" title="'
+        yield escape(environment.getattr(l_1_feed, 'title'))
+        yield '">'
+        yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+        yield '</a>\n</li>\n'
+        t_3 = 0
+    l_1_feed = missing
+    if t_3:
+        pass
+        yield '\n<li>No feeds configured</li>\n'
+    yield '\n\n<li>\n    <i>\n    To request addition or removal,\n    <a href="https://github.com/python/planet">open a PR or issue</a>\n    </i>\n</li>\n          </ul></li>\n      </ul>\n    </div>\n  </div>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '5=24&13=26&15=28&16=30&35=32&44=36&46=38&48=42&51=49&53=51&54=55&55=60&56=65&58=67&62=74&63=78&65=81&66=83&69=90&72=93&73=97&90=122&132=124&133=127&134=131'
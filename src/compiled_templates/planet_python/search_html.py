@@ -0,0 +1,90 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'search.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_logo = resolve('logo')
+    l_0_error = resolve('error')
+    l_0_query = resolve('query')
+    l_0_words_truncated = resolve('words_truncated')
+    l_0_max_search_words = resolve('max_search_words')
+    l_0_results = resolve('results')
+    l_0_feed_links = resolve('feed_links')
+    try:
+        t_1 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n<head>\n  <meta http-equiv="content-type" content="text/html; charset=utf-8" />\n  <title>Search Results - '
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n  <link rel="stylesheet" type="text/css" href="/static/style.css" />\n  <meta name="generator" content="PlanetCF" />\n  <meta name="viewport" content="width=device-width, initial-scale=1.0" />\n  <link rel="icon" href="/static/favicon.ico" sizes="32x32" />\n</head>\n\n<body>\n  <!-- Logo -->\n  <h1 id="logoheader">\n    <a href="/" id="logolink" accesskey="1"><img id="logo"\nsrc="'
+    yield escape((environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'url') or '/static/images/python-logo.gif'))
+    yield '" alt="'
+    yield escape((environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'alt') or 'homepage'))
+    yield '" border="0" /></a>\n  </h1>\n  <!-- Skip to Navigation -->\n  <div class="skiptonav"><a href="#left-hand-navigation" accesskey="2"><img src="/static/images/trans.gif" id="skiptonav" alt="skip to navigation" border="0" width="1" height="1" /></a></div>\n  <div class="skiptonav"><a href="#content-body" accesskey="3"><img src="/static/images/trans.gif" id="skiptocontent" alt="skip to content" border="0" width="1" height="1" /></a></div>\n\n  <div id="content-body">\n    <main id="body-main">\n\n<h1 class="pageheading">Search Results</h1>\n\n'
+    if (undefined(name='error') if l_0_error is missing else l_0_error):
+        pass
+        yield '\n<p style="color: #c00;">'
+        yield escape((undefined(name='error') if l_0_error is missing else l_0_error))
+        yield '</p>\n'
+    else:
+        pass
+        yield '\n<h2>Results for "'
+        yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+        yield '"</h2>\n'
+        if (undefined(name='words_truncated') if l_0_words_truncated is missing else l_0_words_truncated):
+            pass
+            yield '\n<p><em>Note: Your search was limited to the first '
+            yield escape((undefined(name='max_search_words') if l_0_max_search_words is missing else l_0_max_search_words))
+            yield ' words.</em></p>\n'
+        yield '\n'
+        if (undefined(name='results') if l_0_results is missing else l_0_results):
+            pass
+            yield '\n'
+            for l_1_entry in (undefined(name='results') if l_0_results is missing else l_0_results):
+                _loop_vars = {}
+                pass
+                yield '\n\n<hr /><h3 class="post"><a href="'
+                yield escape(((environment.getattr(l_1_entry, 'feed_site_url') or environment.getattr(l_1_entry, 'feed_url')) or '#'))
+                yield '" title="'
+                yield escape(environment.getattr(l_1_entry, 'display_author'))
+                yield '">'
+                yield escape((environment.getattr(l_1_entry, 'display_author') or 'Unknown'))
+                yield '</a></h3>\n\n<h4><a href="'
+                yield escape((environment.getattr(l_1_entry, 'url') or '#'))
+                yield '">'
+                yield escape((environment.getattr(l_1_entry, 'title') or 'Untitled'))
+                yield '</a></h4>\n<p>\n<em>'
+                yield escape(environment.getattr(l_1_entry, 'published_at_display'))
+                yield '</em>\n</p>\n'
+                if environment.getattr(l_1_entry, 'snippet_html'):
+                    pass
+                    yield '<p>'
+                    yield escape(t_1(environment.getattr(l_1_entry, 'snippet_html')))
+                    yield '</p>'
+                yield '\n\n'
+            l_1_entry = missing
+            yield '\n'
+        else:
+            pass
+            yield '\n<p>No results found for "'
+            yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+            yield '"</p>\n'
+        yield '\n'
+    yield '\n\n    </main>\n  </div>\n\n  <div id="left-hand-navigation">\n    <div id="menu">\n      <ul class="level-one">\n          <li>\n          <ul class="level-two">\n             <li><a href="/">Back to home</a></li>\n             <li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">RSS feed</a></li>\n          </ul></li>\n      </ul>\n      <form action="/search" method="get" style="margin: 1em;">\n        <p>\n          <input type="text" name="q" value="'
+    yield escape((undefined(name='query') if l_0_query is missing else l_0_query))
+    yield '" style="width: 10em;" />\n          <input type="submit" value="Search" />\n        </p>\n      </form>\n    </div>\n  </div>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '5=26&16=28&27=32&28=35&30=40&31=42&32=45&34=48&35=51&37=55&39=61&41=65&43=67&47=78&60=82&65=84'
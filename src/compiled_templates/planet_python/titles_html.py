@@ -0,0 +1,106 @@
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Run: python scripts/build_templates.py
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'titles.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_planet = resolve('planet')
+    l_0_feed_links = resolve('feed_links')
+    l_0_logo = resolve('logo')
+    l_0_generated_at = resolve('generated_at')
+    l_0_entries_by_date = resolve('entries_by_date')
+    l_0_feeds = resolve('feeds')
+    pass
+    yield '<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n<head>\n  <meta http-equiv="content-type" content="text/html; charset=utf-8" />\n  <title>'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</title>\n  <link rel="stylesheet" type="text/css" href="/static/styles/screen-switcher-default.css" />\n  <link rel="stylesheet" type="text/css" href="/static/styles/netscape4.css" />\n  <link rel="stylesheet" type="text/css" media="print" href="/static/styles/print.css" />\n  <link rel="alternate stylesheet" type="text/css" href="/static/styles/largestyles.css" title="Large" />\n  <link rel="alternate stylesheet" type="text/css" href="/static/styles/defaultfonts.css" title="Default fonts" />\n  <meta name="generator" content="PlanetCF" />\n  <meta name="keywords" content="Python weblog blog blogs blogger weblogger aggregator rss" />\n  <meta name="description" content="'
+    yield escape((environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'description') or 'Recent postings from Python-related blogs.'))
+    yield '" />\n  <meta name="viewport" content="width=device-width, initial-scale=1.0" />\n  <link rel="alternate" type="application/rss+xml" title="RSS" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '" />\n  <link rel="alternate" type="application/atom+xml" title="Atom" href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'atom') or '/feed.atom'))
+    yield '" />\n  <link rel="icon" href="/static/favicon.ico" sizes="32x32" />\n</head>\n\n<body>\n  <!-- Logo -->\n  <h1 id="logoheader">\n    <a href="/" id="logolink" accesskey="1"><img id="logo"\nsrc="'
+    yield escape((environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'url') or '/static/images/python-logo.gif'))
+    yield '" alt="'
+    yield escape((environment.getattr((undefined(name='logo') if l_0_logo is missing else l_0_logo), 'alt') or 'homepage'))
+    yield '" border="0" /></a>\n  </h1>\n  <!-- Skip to Navigation -->\n  <div class="skiptonav"><a href="#left-hand-navigation" accesskey="2"><img src="/static/images/trans.gif" id="skiptonav" alt="skip to navigation" border="0" width="1" height="1" /></a></div>\n  <div class="skiptonav"><a href="#content-body" accesskey="3"><img src="/static/images/trans.gif" id="skiptocontent" alt="skip to content" border="0" width="1" height="1" /></a></div>\n\n  <div id="content-body">\n    <main id="body-main">\n\n<h1 class="pageheading">'
+    yield escape(environment.getattr((undefined(name='planet') if l_0_planet is missing else l_0_planet), 'name'))
+    yield '</h1>\n\n<p>Last update: '
+    yield escape((undefined(name='generated_at') if l_0_generated_at is missing else l_0_generated_at))
+    yield '\n\n'
+    t_1 = 1
+    for (l_1_date, l_1_day_entries) in context.call(environment.getattr((undefined(name='entries_by_date') if l_0_entries_by_date is missing else l_0_entries_by_date), 'items')):
+        l_1_date_labels = resolve('date_labels')
+        l_1_namespace = resolve('namespace')
+        l_1_current_author = missing
+        _loop_vars = {}
+        pass
+        yield '\n\n\n<h2>'
+        yield escape(environment.getitem((undefined(name='date_labels') if l_1_date_labels is missing else l_1_date_labels), l_1_date))
+        yield '</h2>\n\n'
+        l_1_current_author = context.call((undefined(name='namespace') if l_1_namespace is missing else l_1_namespace), value='', _loop_vars=_loop_vars)
+        _loop_vars['current_author'] = l_1_current_author
+        yield '\n'
+        for l_2_entry in l_1_day_entries:
+            _loop_vars = {}
+            pass
+            yield '\n'
+            if (environment.getattr(l_2_entry, 'display_author') != environment.getattr((undefined(name='current_author') if l_1_current_author is missing else l_1_current_author), 'value')):
+                pass
+                yield '\n'
+                if not isinstance(l_1_current_author, Namespace):
+                    raise TemplateRuntimeError("cannot assign attribute on non-namespace object")
+                l_1_current_author['value'] = environment.getattr(l_2_entry, 'display_author')
+                yield '\n\n<hr /><h3 class="post"><a href="'
+                yield escape(((environment.getattr(l_2_entry, 'feed_site_url') or environment.getattr(l_2_entry, 'feed_url')) or '#'))
+                yield '" title="'
+                yield escape(environment.getattr(l_2_entry, 'display_author'))
+                yield '">'
+                yield escape((environment.getattr(l_2_entry, 'display_author') or 'Unknown'))
+                yield '</a></h3>\n\n'
+            yield '\n\n<h4><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape((environment.getattr(l_2_entry, 'title') or 'Untitled'))
+            yield '</a></h4>\n<p>\n<em><a href="'
+            yield escape((environment.getattr(l_2_entry, 'url') or '#'))
+            yield '">'
+            yield escape(environment.getattr(l_2_entry, 'published_at_display'))
+            yield '</a></em>\n</p>\n\n'
+        l_2_entry = missing
+        yield '\n'
+        t_1 = 0
+    l_1_date = l_1_day_entries = l_1_date_labels = l_1_namespace = l_1_current_author = missing
+    if t_1:
+        pass
+        yield '\n<p>No entries yet.</p>\n'
+    yield '\n\n\n    </main>\n  </div>\n\n  <div id="left-hand-navigation">\n    <div id="menu">\n      <ul class="level-one">\n          <li>\n          <ul class="level-two">\n             <li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'rss') or '/feed.rss'))
+    yield '">RSS feed</a></li>\n             <li><a href="/">Full content</a></li>\n             <li><a href="http://www.planetplanet.org/">Powered by Planet!</a></li>\n          </ul></li>\n          <li>Subscriptions\n          <ul class="level-two">\n<li><a href="'
+    yield escape((environment.getattr((undefined(name='feed_links') if l_0_feed_links is missing else l_0_feed_links), 'opml') or '/feeds.opml'))
+    yield '">[OPML feed]</a></li>\n'
+    t_2 = 1
+    for l_1_feed in (undefined(name='feeds') if l_0_feeds is missing else l_0_feeds):
+        _loop_vars = {}
+        pass
+        yield '\n<li><a href="'
+        yield escape(((environment.getattr(l_1_feed, 'site_url') or environment.getattr(l_1_feed, 'url')) or '#'))
+        yield '" title="'
+        yield escape(environment.getattr(l_1_feed, 'title'))
+        yield '">'
+        yield escape((environment.getattr(l_1_feed, 'title') or 'Untitled'))
+        yield '</a>\n</li>\n'
+        t_2 = 0
+    l_1_feed = missing
+    if t_2:
+        pass
+        yield '\n<li>No feeds configured</li>\n'
+    yield '\n          </ul></li>\n      </ul>\n    </div>\n  </div>\n</body>\n</html>'
+
+blocks = {}
+debug_info = '5=18&13=20&15=22&16=24&24=26&33=30&35=32&37=35&40=42&42=44&43=47&44=51&45=56&47=58&51=65&53=69&70=81&76=83&77=86&78=90'
@@ -26,19 +26,38 @@ MAX_SEARCH_QUERY_LENGTH = 1000  # Max search query length
 MAX_SEARCH_WORDS = 10  # Max words in multi-word search
 MAX_OPML_FEEDS = 100  # Max feeds per OPML import
 REINDEX_COOLDOWN_SECONDS = 300  # 5 minute cooldown between reindex
+REINDEX_BATCH_SIZE = 50  # Entries per reindex batch: one AI call, one Vectorize upsert
+REINDEX_STALE_SECONDS = 600  # Running reindex job with no progress this long is resumed by cron
+DEFAULT_INDEX_SWEEP_LIMIT = 200  # Unindexed or outdated-model entries embedded per cron run
+INDEX_RETRY_MAX_HOURS = 168  # Longest backoff before re-embedding an entry that failed
 
 # Content display defaults
 DEFAULT_CONTENT_DAYS = 7  # Days of entries to display on homepage
+DEFAULT_EXCERPT_LENGTH = 400  # Max characters of plain text shown per entry in excerpt mode
 
 # Retention policy defaults
 DEFAULT_RETENTION_DAYS = 90
 DEFAULT_MAX_ENTRIES_PER_FEED = 100
+DEFAULT_RETENTION_TIME_BUDGET_MS = 10000  # Deletion time per cron run; the rest waits a run
+RETENTION_DELETE_CHUNK_SIZE = 500  # IDs per deleteByIds (Vectorize max 1000) and per D1 DELETE
+DEFAULT_ARCHIVE_AFTER_DAYS = 30  # Entry HTML older than this moves to the ARCHIVE bucket
+DEFAULT_ARCHIVE_LIMIT = 200  # Entries archived per cron run
+
+# Compressed entry content in D1 (see content_codec.py)
+DEFAULT_CONTENT_COMPRESSION = False
+DEFAULT_CONTENT_COMPRESSION_LIMIT = 500  # Existing rows the cron compresses per run
 AUDIT_RETENTION_DAYS = 90  # Auto-delete audit log entries older than this
 
 # Search defaults
 DEFAULT_EMBEDDING_MAX_CHARS = 2000
 DEFAULT_SEARCH_SCORE_THRESHOLD = 0.3
 DEFAULT_SEARCH_TOP_K = 50
+DEFAULT_SEARCH_SEMANTIC_TIMEOUT_MS = 3000  # Embedding + Vectorize + hydration budget
+DEFAULT_SEARCH_KEYWORD_TIMEOUT_MS = 2000  # D1 keyword query budget
+DEFAULT_EMBEDDING_CACHE_TTL_SECONDS = 7 * 24 * 3600  # Query embeddings kept in D1
+DEFAULT_SEARCH_CACHE_SECONDS = 300  # Edge cache lifetime of a generation-stamped results page
+SEARCH_REDIRECT_CACHE_SECONDS = 60  # Edge cache lifetime of the redirect to the canonical URL
+QUERY_EMBEDDING_LRU_SIZE = 256  # Query embeddings kept in memory per isolate (~3 KB each)
 
 # Feed failure thresholds
 DEFAULT_FEED_AUTO_DEACTIVATE_THRESHOLD = 10
@@ -119,10 +138,23 @@ def get_planet_config(env: Any) -> dict[str, str]:
 # Registry of integer config values: (env_key, default_value)
 _INT_CONFIG_REGISTRY: dict[str, tuple[str, int]] = {
     "content_days": ("CONTENT_DAYS", DEFAULT_CONTENT_DAYS),
+    "excerpt_length": ("EXCERPT_LENGTH", DEFAULT_EXCERPT_LENGTH),
     "retention_days": ("RETENTION_DAYS", DEFAULT_RETENTION_DAYS),
     "max_entries_per_feed": ("RETENTION_MAX_ENTRIES_PER_FEED", DEFAULT_MAX_ENTRIES_PER_FEED),
+    "retention_time_budget_ms": ("RETENTION_TIME_BUDGET_MS", DEFAULT_RETENTION_TIME_BUDGET_MS),
+    "archive_after_days": ("ARCHIVE_AFTER_DAYS", DEFAULT_ARCHIVE_AFTER_DAYS),
+    "archive_limit": ("ARCHIVE_LIMIT", DEFAULT_ARCHIVE_LIMIT),
+    "content_compression_limit": ("CONTENT_COMPRESSION_LIMIT", DEFAULT_CONTENT_COMPRESSION_LIMIT),
     "embedding_max_chars": ("EMBEDDING_MAX_CHARS", DEFAULT_EMBEDDING_MAX_CHARS),
     "search_top_k": ("SEARCH_TOP_K", DEFAULT_SEARCH_TOP_K),
+    "search_semantic_timeout_ms": (
+        "SEARCH_SEMANTIC_TIMEOUT_MS",
+        DEFAULT_SEARCH_SEMANTIC_TIMEOUT_MS,
+    ),
+    "search_keyword_timeout_ms": ("SEARCH_KEYWORD_TIMEOUT_MS", DEFAULT_SEARCH_KEYWORD_TIMEOUT_MS),
+    "embedding_cache_ttl": ("EMBEDDING_CACHE_TTL_SECONDS", DEFAULT_EMBEDDING_CACHE_TTL_SECONDS),
+    "index_sweep_limit": ("INDEX_SWEEP_LIMIT", DEFAULT_INDEX_SWEEP_LIMIT),
+    "search_cache_seconds": ("SEARCH_CACHE_SECONDS", DEFAULT_SEARCH_CACHE_SECONDS),
     "feed_auto_deactivate_threshold": (
         "FEED_AUTO_DEACTIVATE_THRESHOLD",
         DEFAULT_FEED_AUTO_DEACTIVATE_THRESHOLD,
@@ -151,11 +183,49 @@ def get_max_entries_per_feed(env: Any) -> int:
     return _get_int_config(env, "max_entries_per_feed")
 
 
+def get_retention_time_budget_ms(env: Any) -> int:
+    """Get the retention deletion time budget per cron run in milliseconds."""
+    return _get_int_config(env, "retention_time_budget_ms")
+
+
+def get_archive_after_days(env: Any) -> int:
+    """Get the entry age in days after which content moves to the archive (0 disables)."""
+    return _get_int_config(env, "archive_after_days")
+
+
+def get_archive_limit(env: Any) -> int:
+    """Get max entries the cron archives per run."""
+    return _get_int_config(env, "archive_limit")
+
+
+def get_content_compression_enabled(env: Any) -> bool:
+    """Check if entry content is stored compressed in D1."""
+    val = getattr(env, "CONTENT_COMPRESSION", None)
+    if val is None:
+        return DEFAULT_CONTENT_COMPRESSION
+    return str(val).lower() in ("true", "1", "yes")
+
+
+def get_content_compression_limit(env: Any) -> int:
+    """Get max existing entries the cron compresses per run."""
+    return _get_int_config(env, "content_compression_limit")
+
+
 def get_embedding_max_chars(env: Any) -> int:
     """Get maximum characters to embed per entry."""
     return _get_int_config(env, "embedding_max_chars")
 
 
+def get_embedding_cache_ttl_seconds(env: Any) -> int:
+    """Get how long cached query embeddings stay valid in D1."""
+    return _get_int_config(env, "embedding_cache_ttl")
+
+
+def get_index_sweep_limit(env: Any) -> int:
+    """Get max entries the cron sweeper embeds per run (0 disables it)."""
+    return _get_int_config(env, "index_sweep_limit")
+
+
 def get_search_score_threshold(env: Any) -> float:
     """Get minimum similarity score for search results."""
     return float(
@@ -168,6 +238,21 @@ def get_search_top_k(env: Any) -> int:
     return _get_int_config(env, "search_top_k")
 
 
+def get_search_cache_seconds(env: Any) -> int:
+    """Get the edge cache lifetime of search result pages in seconds."""
+    return _get_int_config(env, "search_cache_seconds")
+
+
+def get_search_semantic_timeout_ms(env: Any) -> int:
+    """Get the semantic search branch timeout in milliseconds."""
+    return _get_int_config(env, "search_semantic_timeout_ms")
+
+
+def get_search_keyword_timeout_ms(env: Any) -> int:
+    """Get the keyword search branch timeout in milliseconds."""
+    return _get_int_config(env, "search_keyword_timeout_ms")
+
+
 def get_feed_auto_deactivate_threshold(env: Any) -> int:
     """Get consecutive failures before auto-deactivating a feed."""
     return _get_int_config(env, "feed_auto_deactivate_threshold")
@@ -193,6 +278,11 @@ def get_content_days(env: Any) -> int:
     return _get_int_config(env, "content_days")
 
 
+def get_excerpt_length(env: Any) -> int:
+    """Get max plain-text characters per entry when excerpt mode is on."""
+    return _get_int_config(env, "excerpt_length")
+
+
 def get_feed_recovery_enabled(env: Any) -> bool:
     """Check if automatic feed recovery is enabled."""
     val = getattr(env, "FEED_RECOVERY_ENABLED", None)
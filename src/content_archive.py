@@ -0,0 +1,72 @@
+# src/content_archive.py
+"""Archive tier for old entry content.
+
+The cron moves the sanitized HTML of entries older than ARCHIVE_AFTER_DAYS
+out of D1 into zlib-compressed objects in the ARCHIVE R2 bucket, one per
+entry. D1 keeps the row, its metadata and content_text, so search, snippets
+and feeds are unaffected. entries.content becomes NULL and
+content_archived_at records the move (migrations/014_add_content_archive.sql).
+Render paths call PlanetCF._restore_archived_content(), which reads the
+object back for the few archived rows a page actually shows.
+
+FileArchiveStore is a local-filesystem stand-in for the R2 binding (get
+returns an object with arrayBuffer(), like R2), so tests and scripts run
+outside Workers go through SafeR2 exactly as production does.
+"""
+
+import zlib
+from pathlib import Path
+
+#: zlib level 6 is zlib's default: most of level 9's ratio on HTML, at a fraction of the CPU
+ARCHIVE_COMPRESSION_LEVEL = 6
+
+
+def archive_key(entry_id: int) -> str:
+    """Object key for an entry's archived content."""
+    return f"entries/{entry_id}.html.z"
+
+
+def compress_content(html: str) -> bytes:
+    """Compress entry HTML for the archive."""
+    return zlib.compress(html.encode("utf-8"), ARCHIVE_COMPRESSION_LEVEL)
+
+
+def decompress_content(blob: bytes) -> str:
+    """Inverse of compress_content()."""
+    return zlib.decompress(blob).decode("utf-8")
+
+
+class _FileObject:
+    """Minimal R2ObjectBody: just the body accessor SafeR2 uses."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def arrayBuffer(self) -> bytes:  # noqa: N802 - R2 API name
+        return self._body
+
+
+class FileArchiveStore:
+    """Archive store backed by a local directory (stand-in for the R2 bucket)."""
+
+    def __init__(self, root: str | Path) -> None:
+        """Store objects under root, creating it if needed."""
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._root / key.replace("/", "__")
+
+    async def get(self, key: str) -> _FileObject | None:
+        """Return the object, or None if it doesn't exist."""
+        path = self._path(key)
+        return _FileObject(path.read_bytes()) if path.exists() else None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Write an object, replacing any existing one."""
+        self._path(key).write_bytes(data)
+
+    async def delete(self, keys: list[str]) -> None:
+        """Delete objects; missing keys are ignored, as in R2."""
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
@@ -0,0 +1,92 @@
+# src/content_codec.py
+"""Compressed storage format for entries.content in D1.
+
+With CONTENT_COMPRESSION enabled, _upsert_entry stores an entry's sanitized
+HTML as a version marker followed by base64-encoded zlib data
+("z1:eJzN..."), and the cron rewrites existing rows the same way in chunks
+(PlanetCF._compress_stored_content). Base64 keeps the column TEXT, so SQL
+that never looks inside content (and every row written before) is
+unaffected. Compressed HTML is typically a third of the original size even
+after base64's 4/3 overhead, which shrinks D1 storage and the bytes every
+homepage and feed query reads.
+
+Reading is transparent: entry_row_from_js() returns an EntryRow, which
+decodes content the first time it is accessed, so rows whose content is
+never rendered (excerpts built from a summary, titles-only pages, search
+results) never pay for decompression. Content shorter than
+CONTENT_COMPRESSION_MIN_CHARS, or that would not get smaller, stays plain.
+
+SQL must not inspect content directly: LIKE and substr() see base64 for
+compressed rows. Plain-text consumers use content_text, which is never
+compressed.
+"""
+
+import base64
+import zlib
+from typing import Any
+
+#: Prefix of compressed values. Bump the version if the encoding changes;
+#: decode_content() must keep reading every version ever written.
+CONTENT_CODEC_MARKER = "z1:"
+
+#: zlib's default level: most of level 9's ratio on HTML, at a fraction of the CPU
+CONTENT_COMPRESSION_LEVEL = 6
+
+#: Below this, zlib's header and base64 padding outweigh the savings
+CONTENT_COMPRESSION_MIN_CHARS = 1024
+
+
+def is_compressed(value: str | None) -> bool:
+    """Check whether a stored content value is in the compressed format."""
+    return bool(value) and value.startswith(CONTENT_CODEC_MARKER)
+
+
+def encode_content(html: str, compress: bool = True) -> str:
+    """Return the value to store in entries.content for the given HTML.
+
+    Compresses when asked to and worthwhile. HTML that happens to begin with
+    the marker is always compressed, so decode_content() can't misread it.
+    """
+    if not html:
+        return html
+    forced = html.startswith(CONTENT_CODEC_MARKER)
+    if not forced and (not compress or len(html) < CONTENT_COMPRESSION_MIN_CHARS):
+        return html
+    raw = html.encode("utf-8")
+    encoded = CONTENT_CODEC_MARKER + base64.b64encode(
+        zlib.compress(raw, CONTENT_COMPRESSION_LEVEL)
+    ).decode("ascii")
+    if not forced and len(encoded) >= len(raw):
+        return html
+    return encoded
+
+
+def decode_content(value: str | None) -> str | None:
+    """Inverse of encode_content(); plain values are returned unchanged."""
+    if value is None or not is_compressed(value):
+        return value
+    packed = base64.b64decode(value[len(CONTENT_CODEC_MARKER) :])
+    return zlib.decompress(packed).decode("utf-8")
+
+
+class EntryRow(dict):
+    """Entry row dict that decompresses content on first access.
+
+    Item access and get() return the decoded HTML and keep it, so later reads
+    are free. Bulk copies ({**row}, dict(row), json.dumps) see the stored
+    value; use them only on rows without content, as the search paths do.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: object) -> Any:
+        value = dict.__getitem__(self, key)
+        if key == "content" and is_compressed(value):
+            value = decode_content(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key: object, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        return self[key]
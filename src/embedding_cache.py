@@ -0,0 +1,74 @@
+# src/embedding_cache.py
+"""Query embedding cache for search.
+
+A handful of queries (product and conference names) make up most /search
+traffic, and each one used to cost a Workers AI call. Query embeddings are
+cached in two levels, both keyed by (model, normalized query):
+
+1. EmbeddingLRU: a bounded in-isolate LRU, free to read.
+2. The query_embeddings D1 table (migrations/007_add_query_embeddings.sql),
+   shared by all isolates and expired by TTL.
+
+Vectors are stored as packed float32 (the model's native precision), which
+is 3 KB per 768-dim embedding in memory and 4 KB base64-encoded in D1.
+"""
+
+import base64
+from array import array
+from collections import OrderedDict
+
+#: Workers AI model used for both entry and query embeddings
+EMBEDDING_MODEL = "@cf/baai/bge-base-en-v1.5"
+
+
+def normalize_query_key(query: str) -> str:
+    """Normalize a query for cache lookup: lowercase, whitespace collapsed.
+
+    bge-base-en-v1.5 is an uncased model, so case variants share one
+    embedding. The normalized key is also the text sent to the model, so a
+    cached vector is always the embedding of its key.
+    """
+    return " ".join(query.lower().split())
+
+
+def encode_embedding(vector: list[float]) -> str:
+    """Pack an embedding as base64 float32 for storage in D1."""
+    return base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+
+
+def decode_embedding(encoded: str) -> list[float]:
+    """Unpack an embedding stored by encode_embedding()."""
+    vector = array("f")
+    vector.frombytes(base64.b64decode(encoded))
+    return vector.tolist()
+
+
+class EmbeddingLRU:
+    """Bounded least-recently-used map of (model, query key) -> embedding."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Create an empty cache holding at most max_entries embeddings."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], array] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model: str, key: str) -> list[float] | None:
+        """Return the cached embedding and mark it most recently used."""
+        vector = self._entries.get((model, key))
+        if vector is None:
+            return None
+        self._entries.move_to_end((model, key))
+        return vector.tolist()
+
+    def put(self, model: str, key: str, vector: list[float]) -> None:
+        """Cache an embedding, evicting the least recently used if full."""
+        self._entries[(model, key)] = array("f", vector)
+        self._entries.move_to_end((model, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached embedding."""
+        self._entries.clear()
@@ -0,0 +1,76 @@
+# src/entry_fingerprint.py
+"""Fingerprints for spotting the same post in more than one feed.
+
+Planets often carry both an author's blog and an aggregator or company blog
+that republishes its posts. _upsert_entry computes two keys per entry and
+looks for an entry from another feed that shares either one:
+
+- url_hash: the entry link with the scheme, a leading "www.", the fragment,
+  tracking parameters and a trailing slash removed, so http/https and
+  utm-tagged copies of one link agree.
+- content_hash: the extracted text (content_text) lowercased with whitespace
+  collapsed. Texts shorter than DUPLICATE_MIN_TEXT_CHARS get no fingerprint,
+  since short teasers ("New post: ...") collide across unrelated posts.
+
+A match is stored as a link to the canonical entry (entries.canonical_entry_id,
+migrations/016_add_entry_fingerprints.sql) without its content, so the copy is
+not stored, embedded or indexed twice, and render paths show the canonical
+entry once with every feed that carried it.
+"""
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+#: Shorter extracted texts get no content fingerprint
+DUPLICATE_MIN_TEXT_CHARS = 200
+
+#: Hex digits kept from each SHA-256 (64 bits: no accidental collisions at planet scale)
+_HASH_HEX_CHARS = 16
+
+#: Query parameters that only track where a click came from
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref"})
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:_HASH_HEX_CHARS]
+
+
+def normalize_entry_url(url: str | None) -> str | None:
+    """Reduce an entry link to the part that identifies the post.
+
+    Returns None for empty or non-http(s) links.
+    """
+    if not url:
+        return None
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return None
+    host = parts.hostname.lower().removeprefix("www.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+        )
+    )
+    path = parts.path.rstrip("/")
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def url_hash(url: str | None) -> str | None:
+    """Hash of normalize_entry_url(url), or None if the link can't be normalized."""
+    normalized = normalize_entry_url(url)
+    return _digest(normalized) if normalized else None
+
+
+def content_hash(text: str | None) -> str | None:
+    """Fingerprint of an entry's extracted text, or None if it is too short."""
+    normalized = " ".join((text or "").lower().split())
+    if len(normalized) < DUPLICATE_MIN_TEXT_CHARS:
+        return None
+    return _digest(normalized)
@@ -0,0 +1,93 @@
+# src/import_timing.py
+"""Per-module import timing for isolate startup.
+
+Under Pyodide every module imported by main.py adds to the cold-start TTFB of
+the first request an isolate serves. ImportTimer wraps builtins.__import__
+while main.py's imports run and records the self time of each newly loaded
+module (time spent in that module's own body, excluding nested imports), so
+the first RequestEvent of an isolate can report where startup time went.
+
+Uses only the standard library so it can be installed before anything else.
+
+Usage:
+    _import_timer = ImportTimer()
+    _import_timer.start()
+    import heavy_module
+    _import_timer.stop()
+    _import_timer.consume()  # {"heavy_module": 12.3, ...} once, then None
+"""
+
+import builtins
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+#: Number of slowest modules reported on the startup RequestEvent
+DEFAULT_TOP_MODULES = 10
+
+
+class ImportTimer:
+    """Record self time per module for imports made while installed."""
+
+    def __init__(self) -> None:
+        """Initialize an idle timer with no recorded imports."""
+        self.timings: dict[str, float] = {}
+        self.total_ms: float = 0
+        self._original_import: Callable[..., Any] | None = None
+        self._child_ms: list[float] = []
+        self._start_time: float = 0
+        self._consumed = False
+
+    def start(self) -> None:
+        """Install the timing hook and start the wall clock."""
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import  # ty: ignore[invalid-assignment]
+        self._start_time = time.perf_counter()
+
+    def stop(self) -> None:
+        """Restore the original import hook and record total elapsed time."""
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import  # ty: ignore[invalid-assignment]
+        self._original_import = None
+        self.total_ms = round((time.perf_counter() - self._start_time) * 1000, 2)
+
+    def consume(self, limit: int = DEFAULT_TOP_MODULES) -> dict[str, float] | None:
+        """Return the slowest modules (ms, descending) the first time only.
+
+        Subsequent calls return None, so only the first request of an isolate
+        carries the startup breakdown.
+        """
+        if self._consumed:
+            return None
+        self._consumed = True
+        slowest = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+        return {name: round(ms, 2) for name, ms in slowest[:limit]}
+
+    def _timed_import(
+        self,
+        name: str,
+        globals: dict[str, Any] | None = None,
+        locals: dict[str, Any] | None = None,
+        fromlist: tuple[str, ...] = (),
+        level: int = 0,
+    ) -> Any:
+        original = self._original_import or builtins.__import__
+        # Relative imports and already-loaded modules are attributed to the
+        # importing module's own time.
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        self._child_ms.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            nested_ms = self._child_ms.pop()
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed_ms - nested_ms
+            if self._child_ms:
+                self._child_ms[-1] += elapsed_ms
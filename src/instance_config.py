@@ -26,6 +26,8 @@ from wrappers import SafeEnv
 DEFAULTS = {
     # Instance mode (full or lite) - used by is_lite_mode()
     "INSTANCE_MODE": "full",
+    # Vector index for semantic search (vectorize or d1) - used by has_d1_search_index()
+    "SEARCH_INDEX_BACKEND": "vectorize",
 }
 
 
@@ -74,3 +76,19 @@ def is_lite_mode(env: SafeEnv) -> bool:
     """
     mode = _get_env(env, "INSTANCE_MODE", "full").lower()
     return mode == "lite"
+
+
+def has_d1_search_index(env: SafeEnv) -> bool:
+    """Check if semantic search is served from the D1 vector index.
+
+    With SEARCH_INDEX_BACKEND set to "d1" (see src/vector_index.py), lite
+    mode keeps /search: vectors live in D1 instead of Vectorize, and only
+    the Workers AI binding is needed to embed entries and queries.
+
+    Args:
+        env: SafeEnv wrapper around Worker environment bindings
+
+    Returns:
+        True if SEARCH_INDEX_BACKEND is "d1".
+    """
+    return _get_env(env, "SEARCH_INDEX_BACKEND", "vectorize").lower() == "d1"
@@ -0,0 +1,99 @@
+# src/isolate.py
+"""Lifecycle of the current Worker isolate: identity, age and invocations.
+
+Cold starts are the main source of tail latency under Pyodide, but a single
+event can't tell whether it ran in a fresh isolate. IsolateLifecycle gives
+every isolate a random ID when its first invocation starts, counts the
+requests, queue batches and cron runs it has served, and keeps the one-off
+initialization timings (database auto-init, schema drift check), so events
+can be correlated with cold starts and an isolate_summary event can report
+each isolate's life every ISOLATE_SUMMARY_INTERVAL_SECONDS.
+
+Nothing is initialized at import time: with python_dedicated_snapshot the
+state of imported modules is captured in the snapshot that every isolate
+restores, so an ID or start time taken at import would be shared by all
+of them.
+
+Uses only the standard library.
+
+Usage:
+    _isolate = IsolateLifecycle()
+    ordinal = _isolate.invoke("request")  # 1 for the isolate's first request
+    _isolate.record_init("db_init_ms", 12.3)
+    summary = _isolate.summary_due()  # isolate_summary dict, or None
+"""
+
+import secrets
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+#: Minimum interval between isolate_summary events from one isolate
+ISOLATE_SUMMARY_INTERVAL_SECONDS = 300
+
+#: Invocation kinds counted per isolate
+INVOCATION_KINDS = ("request", "queue", "scheduled")
+
+
+def _iso(epoch_seconds: float) -> str:
+    return datetime.fromtimestamp(epoch_seconds, UTC).isoformat().replace("+00:00", "Z")
+
+
+class IsolateLifecycle:
+    """Identity, age, invocation counts and init timings of this isolate."""
+
+    def __init__(self) -> None:
+        """Initialize an isolate that has not served anything yet."""
+        self.isolate_id = ""
+        self.started_at = ""
+        self.invocations: dict[str, int] = dict.fromkeys(INVOCATION_KINDS, 0)
+        self.init_ms: dict[str, float] = {}
+        self._started = 0.0
+        self._last_summary = 0.0
+
+    def invoke(self, kind: str, now: float | None = None) -> int:
+        """Count an invocation of kind and return its ordinal (1 for the first).
+
+        The first invocation of any kind starts the isolate's lifecycle.
+        """
+        now = time.time() if now is None else now
+        if not self.isolate_id:
+            self.isolate_id = secrets.token_hex(8)
+            self._started = self._last_summary = now
+            self.started_at = _iso(now)
+        self.invocations[kind] = self.invocations.get(kind, 0) + 1
+        return self.invocations[kind]
+
+    @property
+    def cold(self) -> bool:
+        """Whether the current invocation is the isolate's first."""
+        return sum(self.invocations.values()) == 1
+
+    def age_s(self, now: float | None = None) -> float:
+        """Seconds since the isolate's first invocation."""
+        if not self.isolate_id:
+            return 0.0
+        return round((time.time() if now is None else now) - self._started, 3)
+
+    def record_init(self, name: str, ms: float) -> float:
+        """Keep a one-off initialization timing; returns it rounded."""
+        self.init_ms[name] = round(ms, 2)
+        return self.init_ms[name]
+
+    def summary_due(self, now: float | None = None) -> dict[str, Any] | None:
+        """Return an isolate_summary event if ISOLATE_SUMMARY_INTERVAL_SECONDS have passed."""
+        now = time.time() if now is None else now
+        if not self.isolate_id or now - self._last_summary < ISOLATE_SUMMARY_INTERVAL_SECONDS:
+            return None
+        self._last_summary = now
+        return {
+            "event_type": "isolate_summary",
+            "timestamp": _iso(now),
+            "isolate_id": self.isolate_id,
+            "isolate_started_at": self.started_at,
+            "isolate_age_s": self.age_s(now),
+            "isolate_requests": self.invocations.get("request", 0),
+            "isolate_queue_batches": self.invocations.get("queue", 0),
+            "isolate_cron_runs": self.invocations.get("scheduled", 0),
+            "isolate_init_ms": dict(self.init_ms),
+        }
@@ -0,0 +1,225 @@
+# src/latency.py
+"""Rolling latency histograms per event type and route, kept in the isolate.
+
+Tail sampling needs to know what "slow" means right now. Fixed thresholds
+(1s for a request) keep every event on a bad day and nothing on a good one.
+LatencyHistograms records the wall_time_ms of every event emit_event() sees,
+so should_sample() can keep events above the live p99 and sample those
+between p95 and p99, and a latency_summary event can report the
+distributions every SUMMARY_INTERVAL_SECONDS.
+
+Buckets are log-linear, as in HDR histograms: SUB_BUCKETS per doubling from
+MIN_MS to MAX_MS, so a reported quantile is within 9% of the true value and
+every histogram is the same fixed-size list of counts. A histogram covers
+the current and the previous WINDOW_SECONDS window, so old traffic ages out
+without storing samples.
+
+Uses only the standard library; memory is bounded by MAX_KEYS histograms
+(plus one per event type).
+"""
+
+import math
+import time
+from typing import Any
+
+#: Buckets per doubling of latency (2^(1/8): about 9% apart)
+SUB_BUCKETS = 8
+
+#: Latencies below MIN_MS share the first bucket, above MAX_MS the last
+MIN_MS = 0.1
+MAX_MS = 600_000.0
+
+BUCKET_COUNT = math.ceil(math.log2(MAX_MS / MIN_MS) * SUB_BUCKETS) + 1
+
+#: Length of one rolling window; quantiles cover the current and previous one
+WINDOW_SECONDS = 300
+
+#: Route histograms stop being added at this many histograms per isolate
+MAX_KEYS = 64
+
+#: Minimum interval between latency_summary events from one isolate
+SUMMARY_INTERVAL_SECONDS = 300
+
+#: Latencies recorded between recomputations of a histogram's cached p95/p99
+THRESHOLD_REFRESH_RECORDS = 32
+
+
+def bucket_index(ms: float) -> int:
+    """Index of the bucket a latency falls into."""
+    if ms <= MIN_MS:
+        return 0
+    return min(int(math.log2(ms / MIN_MS) * SUB_BUCKETS), BUCKET_COUNT - 1)
+
+
+def bucket_upper_ms(index: int) -> float:
+    """Upper bound of a bucket, the value quantiles report for it."""
+    return MIN_MS * 2 ** ((index + 1) / SUB_BUCKETS)
+
+
+class LatencyHistogram:
+    """Fixed-memory rolling histogram of latencies in milliseconds."""
+
+    def __init__(self, now: float | None = None) -> None:
+        """Initialize an empty histogram whose first window starts now."""
+        self._current = [0] * BUCKET_COUNT
+        self._previous = [0] * BUCKET_COUNT
+        self._window_start = time.time() if now is None else now
+        self._current_max = 0.0
+        self._previous_max = 0.0
+        self._current_count = 0
+        self._previous_count = 0
+        self._thresholds: tuple[float, float] | None = None
+        self._records_since_thresholds = 0
+
+    def _roll(self, now: float) -> None:
+        elapsed = now - self._window_start
+        if elapsed < WINDOW_SECONDS:
+            return
+        if elapsed < 2 * WINDOW_SECONDS:
+            self._previous, self._previous_max = self._current, self._current_max
+            self._previous_count = self._current_count
+        else:
+            self._previous, self._previous_max = [0] * BUCKET_COUNT, 0.0
+            self._previous_count = 0
+        self._current, self._current_max = [0] * BUCKET_COUNT, 0.0
+        self._current_count = 0
+        self._window_start = now - elapsed % WINDOW_SECONDS
+        self._thresholds = None
+
+    def record(self, ms: float, now: float | None = None) -> None:
+        """Add one latency."""
+        self._roll(time.time() if now is None else now)
+        self._current[bucket_index(ms)] += 1
+        self._current_count += 1
+        self._current_max = max(self._current_max, ms)
+        self._records_since_thresholds += 1
+
+    def count(self) -> int:
+        """Latencies recorded in the current and previous window."""
+        return self._current_count + self._previous_count
+
+    def quantile(self, q: float) -> float | None:
+        """Latency at quantile q (0-1), or None if nothing was recorded."""
+        quantiles = self._quantiles((q,))
+        return quantiles[0] if quantiles else None
+
+    def _quantiles(self, qs: tuple[float, ...]) -> list[float] | None:
+        """Latencies at ascending quantiles qs, in one pass over the buckets."""
+        total = self.count()
+        if not total:
+            return None
+        max_ms = self.max_ms()
+        ranks = [max(1, math.ceil(q * total)) for q in qs]
+        results: list[float] = []
+        seen = 0
+        for index in range(BUCKET_COUNT):
+            seen += self._current[index] + self._previous[index]
+            while seen >= ranks[len(results)]:
+                results.append(min(bucket_upper_ms(index), max_ms))
+                if len(results) == len(ranks):
+                    return results
+        return results + [max_ms] * (len(ranks) - len(results))
+
+    def tail_thresholds(self) -> tuple[float, float] | None:
+        """(p95, p99) for sampling, cached for THRESHOLD_REFRESH_RECORDS records.
+
+        Quantiles move slowly once a histogram has enough latencies, so
+        sampling doesn't rescan the buckets for every event.
+        """
+        if self._thresholds is None or self._records_since_thresholds >= THRESHOLD_REFRESH_RECORDS:
+            quantiles = self._quantiles((0.95, 0.99))
+            if quantiles is None:
+                return None
+            self._thresholds = (quantiles[0], quantiles[1])
+            self._records_since_thresholds = 0
+        return self._thresholds
+
+    def max_ms(self) -> float:
+        """Largest latency in the current and previous window."""
+        return max(self._current_max, self._previous_max)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Count, quantiles and non-empty buckets as [upper_ms, count] pairs."""
+        return {
+            "count": self.count(),
+            "p50_ms": _round(self.quantile(0.50)),
+            "p95_ms": _round(self.quantile(0.95)),
+            "p99_ms": _round(self.quantile(0.99)),
+            "max_ms": _round(self.max_ms()),
+            "buckets": [
+                [_round(bucket_upper_ms(index)), current + previous]
+                for index, (current, previous) in enumerate(
+                    zip(self._current, self._previous, strict=True)
+                )
+                if current + previous
+            ],
+        }
+
+
+def _round(ms: float | None) -> float | None:
+    return None if ms is None else round(ms, 2)
+
+
+def _event_type(event: dict[str, Any]) -> str:
+    return str(event.get("event_type") or "unknown")
+
+
+def _key(event: dict[str, Any]) -> str:
+    """Histogram key: event_type, plus the route pattern for requests."""
+    route = event.get("route")
+    return f"{_event_type(event)} {route}" if route else _event_type(event)
+
+
+class LatencyHistograms:
+    """One LatencyHistogram per event type and route, plus summary timing."""
+
+    def __init__(self) -> None:
+        """Initialize with no histograms; the first summary is due in one interval."""
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._last_summary = time.time()
+
+    def get(self, event: dict[str, Any], min_count: int = 0) -> LatencyHistogram | None:
+        """The histogram event's latency is judged against, if there is one.
+
+        That is the route's histogram if it has at least min_count latencies,
+        else the event type's, which covers every route of that type.
+        """
+        for key in (_key(event), _event_type(event)):
+            histogram = self._histograms.get(key)
+            if histogram is not None and histogram.count() >= min_count:
+                return histogram
+        return None
+
+    def record(self, event: dict[str, Any]) -> None:
+        """Add event's wall_time_ms to its event type's and route's histograms.
+
+        Once MAX_KEYS histograms exist, new routes only count towards their
+        event type's.
+        """
+        wall_time_ms = event.get("wall_time_ms")
+        if not isinstance(wall_time_ms, int | float) or isinstance(wall_time_ms, bool):
+            return
+        event_type = _event_type(event)
+        for key in {event_type, _key(event)}:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                if key != event_type and len(self._histograms) >= MAX_KEYS:
+                    continue
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(wall_time_ms)
+
+    def summary_due(self, now: float | None = None) -> dict[str, Any] | None:
+        """Return a latency_summary event if SUMMARY_INTERVAL_SECONDS have passed."""
+        now = time.time() if now is None else now
+        if now - self._last_summary < SUMMARY_INTERVAL_SECONDS or not self._histograms:
+            return None
+        self._last_summary = now
+        return {
+            "event_type": "latency_summary",
+            "window_seconds": WINDOW_SECONDS,
+            "histograms": {
+                key: histogram.snapshot()
+                for key, histogram in sorted(self._histograms.items())
+                if histogram.count()
+            },
+        }
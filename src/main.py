@@ -12,11 +12,22 @@ import ipaddress
 import json
 import secrets
 import time
+from collections.abc import Awaitable
 from datetime import datetime, timedelta, timezone
 from typing import Any, TypeAlias
 from urllib.parse import parse_qs, urlencode, urlparse
 
-import feedparser
+from import_timing import ImportTimer
+from isolate import IsolateLifecycle
+
+# Time everything main.py pulls in; the first request of each isolate reports
+# the slowest modules on its RequestEvent (startup_import_ms/startup_imports).
+_import_timer = ImportTimer()
+_import_timer.start()
+
+# Identity and invocation counts of this isolate, started by its first invocation
+_isolate = IsolateLifecycle()
+
 from workers import Response, WorkerEntrypoint
 
 from admin import admin_error_response as _admin_error_response_fn
@@ -39,26 +50,54 @@ from config import (
     DEFAULT_QUERY_LIMIT,
     FAILURE_THRESHOLD,
     FALLBACK_ENTRIES_LIMIT,
+    INDEX_RETRY_MAX_HOURS,
     MAX_SEARCH_QUERY_LENGTH,
     MAX_SEARCH_WORDS,
+    QUERY_EMBEDDING_LRU_SIZE,
+    REINDEX_BATCH_SIZE,
     REINDEX_COOLDOWN_SECONDS,
+    REINDEX_STALE_SECONDS,
+    RETENTION_DELETE_CHUNK_SIZE,
+    SEARCH_REDIRECT_CACHE_SECONDS,
     SESSION_TTL_SECONDS,
+    get_archive_after_days,
+    get_archive_limit,
+    get_content_compression_enabled,
+    get_content_compression_limit,
     get_content_days,
+    get_embedding_cache_ttl_seconds,
     get_embedding_max_chars,
+    get_excerpt_length,
     get_feed_auto_deactivate_threshold,
     get_feed_failure_threshold,
     get_feed_recovery_enabled,
     get_feed_recovery_limit,
     get_feed_timeout,
     get_http_timeout,
+    get_index_sweep_limit,
     get_max_entries_per_feed,
     get_planet_config,
     get_retention_days,
+    get_retention_time_budget_ms,
+    get_search_cache_seconds,
+    get_search_keyword_timeout_ms,
     get_search_score_threshold,
+    get_search_semantic_timeout_ms,
     get_search_top_k,
     get_user_agent,
 )
+from content_archive import archive_key, compress_content, decompress_content
+from content_codec import CONTENT_CODEC_MARKER, encode_content
 from content_processor import EntryContentProcessor
+from embedding_cache import (
+    EMBEDDING_MODEL,
+    EmbeddingLRU,
+    decode_embedding,
+    encode_embedding,
+    normalize_query_key,
+)
+from entry_fingerprint import content_hash, url_hash
+from instance_config import has_d1_search_index
 from instance_config import is_lite_mode as check_lite_mode
 from models import BleachSanitizer
 from oauth_handler import GitHubOAuthHandler, extract_oauth_state_from_cookies
@@ -67,10 +106,12 @@ from observability import (
     RequestEvent,
     SchedulerEvent,
     Timer,
+    bind_event,
     emit_event,
+    trace_span,
 )
 from route_dispatcher import Route, RouteDispatcher, RouteMatch
-from search_query import SearchQueryBuilder
+from search_query import SearchQueryBuilder, SearchQueryResult, snippet_to_html
 from templates import (
     _EMBEDDED_TEMPLATES,
     TEMPLATE_ADMIN_DASHBOARD,
@@ -89,6 +130,7 @@ from templates import (
 )
 from utils import (
     ERROR_MESSAGE_MAX_LENGTH,
+    extract_entry_text,
     feed_response,
     format_date_label,
     format_pub_date,
@@ -98,6 +140,7 @@ from utils import (
     json_response,
     log_error,
     log_op,
+    make_excerpt,
     normalize_entry_content,
     parse_iso_datetime,
     redirect_response,
@@ -105,6 +148,7 @@ from utils import (
     truncate_error,
     validate_feed_id,
 )
+from vector_metadata import build_vector_metadata, entry_from_vector_metadata
 from wrappers import (
     SafeEnv,
     SafeFeedInfo,
@@ -117,6 +161,7 @@ from wrappers import (
     admin_row_from_js,
     audit_rows_from_d1,
     entry_bind_values,
+    entry_row_from_js,
     entry_rows_from_d1,
     feed_bind_values,
     feed_row_from_js,
@@ -125,6 +170,8 @@ from wrappers import (
 )
 from xml_sanitizer import strip_xml_control_chars
 
+_import_timer.stop()
+
 # =============================================================================
 # Type Aliases for Cloudflare Workers Runtime
 # =============================================================================
@@ -181,6 +228,13 @@ def _classify_error(exc: Exception) -> str:
     return "unknown"
 
 
+def _emit_isolate_summary() -> None:
+    """Emit this isolate's isolate_summary event if one is due."""
+    summary = _isolate.summary_due()
+    if summary is not None:
+        emit_event(summary, force=True)
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -199,6 +253,10 @@ _THEMES_WITH_RSS10: frozenset[str] = frozenset({"planet-mozilla"})
 # Themes that enable FOAF (Friend of a Friend) feed
 _THEMES_WITH_FOAF: frozenset[str] = frozenset({"planet-mozilla"})
 
+# Themes that render entry excerpts on the homepage instead of full content.
+# Full content is loaded on demand from /entry/<id>.
+_THEMES_WITH_EXCERPTS: frozenset[str] = frozenset({"planet-cloudflare"})
+
 # Cloud metadata endpoints to block (SSRF protection)
 BLOCKED_METADATA_IPS = {
     "169.254.169.254",  # AWS/GCP/Azure metadata
@@ -420,6 +478,16 @@ class Default(WorkerEntrypoint):
                         title TEXT,
                         author TEXT,
                         content TEXT,
+                        content_text TEXT,
+                        content_archived_at TEXT,
+                        content_encoding TEXT,
+                        url_hash TEXT,
+                        content_hash TEXT,
+                        canonical_entry_id INTEGER,
+                        embedding_model TEXT,
+                        indexed_at TEXT,
+                        index_attempts INTEGER NOT NULL DEFAULT 0,
+                        index_retry_after TEXT,
                         summary TEXT,
                         published_at TEXT,
                         updated_at TEXT,
@@ -431,6 +499,24 @@ class Default(WorkerEntrypoint):
                     CREATE INDEX IF NOT EXISTS idx_entries_published ON entries(published_at DESC);
                     CREATE INDEX IF NOT EXISTS idx_entries_feed ON entries(feed_id);
                     CREATE INDEX IF NOT EXISTS idx_entries_guid ON entries(feed_id, guid);
+                    CREATE INDEX IF NOT EXISTS idx_entries_embedding_model
+                        ON entries(embedding_model, id);
+                    CREATE INDEX IF NOT EXISTS idx_entries_index_sweep
+                        ON entries(embedding_model, id)
+                        WHERE title IS NOT NULL AND canonical_entry_id IS NULL;
+                    CREATE INDEX IF NOT EXISTS idx_entries_feed_published
+                        ON entries(feed_id, published_at DESC);
+                    CREATE INDEX IF NOT EXISTS idx_entries_archive
+                        ON entries(content_archived_at, published_at);
+                    CREATE INDEX IF NOT EXISTS idx_entries_uncompressed ON entries(id)
+                        WHERE length(content) >= 1024 AND substr(content, 1, 3) <> 'z1:'
+                        AND content_encoding IS NULL;
+                    CREATE INDEX IF NOT EXISTS idx_entries_url_hash ON entries(url_hash)
+                        WHERE url_hash IS NOT NULL;
+                    CREATE INDEX IF NOT EXISTS idx_entries_content_hash ON entries(content_hash)
+                        WHERE content_hash IS NOT NULL;
+                    CREATE INDEX IF NOT EXISTS idx_entries_canonical ON entries(canonical_entry_id)
+                        WHERE canonical_entry_id IS NOT NULL;
 
                     -- Admin users table
                     CREATE TABLE IF NOT EXISTS admins (
@@ -464,12 +550,70 @@ class Default(WorkerEntrypoint):
                         migration_name TEXT UNIQUE NOT NULL,
                         applied_at TEXT DEFAULT CURRENT_TIMESTAMP
                     );
+
+                    -- Search query embedding cache
+                    CREATE TABLE IF NOT EXISTS query_embeddings (
+                        model TEXT NOT NULL,
+                        query_key TEXT NOT NULL,
+                        embedding TEXT NOT NULL,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (model, query_key)
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_query_embeddings_created
+                        ON query_embeddings(created_at);
+
+                    -- Content generation counter (cache key for search pages)
+                    CREATE TABLE IF NOT EXISTS content_generation (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        generation INTEGER NOT NULL DEFAULT 0,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    );
+                    INSERT INTO content_generation (id, generation) VALUES (1, 0)
+                        ON CONFLICT(id) DO NOTHING;
+
+                    -- Background reindex jobs (progress and resume cursor)
+                    CREATE TABLE IF NOT EXISTS reindex_jobs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        status TEXT NOT NULL DEFAULT 'running',
+                        last_entry_id INTEGER NOT NULL DEFAULT 0,
+                        entries_total INTEGER NOT NULL DEFAULT 0,
+                        entries_indexed INTEGER NOT NULL DEFAULT 0,
+                        entries_failed INTEGER NOT NULL DEFAULT 0,
+                        batches INTEGER NOT NULL DEFAULT 0,
+                        last_error TEXT,
+                        admin_id INTEGER,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        completed_at TEXT
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_reindex_jobs_status
+                        ON reindex_jobs(status, updated_at);
+
+                    -- Quantized vectors for SEARCH_INDEX_BACKEND=d1 (no Vectorize)
+                    CREATE TABLE IF NOT EXISTS entry_vectors (
+                        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                        id TEXT NOT NULL UNIQUE,
+                        scale REAL NOT NULL,
+                        vector TEXT NOT NULL,
+                        metadata TEXT,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    );
+
+                    -- Feeds with new entries since the last per-feed retention cap
+                    CREATE TABLE IF NOT EXISTS retention_dirty_feeds (
+                        feed_id INTEGER PRIMARY KEY,
+                        marked_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    );
                 """)
+                await self._create_entries_fts()
+                await self.env.DB.prepare(self._PROMOTE_DUPLICATE_TRIGGER).run()
                 log_op("database_auto_init", status="completed")
             else:
                 log_op("database_auto_init", status="already_initialized")
                 # Validate existing schema has all expected columns
-                await self._check_schema_drift()
+                with Timer() as drift_timer:
+                    await self._check_schema_drift()
+                _isolate.record_init("schema_drift_ms", drift_timer.elapsed_ms)
 
             self._db_initialized = True
 
@@ -478,6 +622,124 @@ class Default(WorkerEntrypoint):
             # Mark as failed so next request retries (transient D1 errors)
             self._db_initialized = False
 
+    # Full-text index for keyword search (mirrors migrations/006_add_entries_fts.sql).
+    # Run as separate statements: the trigger body contains its own semicolon.
+    _ENTRIES_FTS_SCHEMA: tuple[str, ...] = (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+            title,
+            body,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS entries_fts_delete AFTER DELETE ON entries BEGIN
+            DELETE FROM entries_fts WHERE rowid = old.id;
+        END
+        """,
+        # A duplicate promoted to canonical (migration 019) was never keyword-indexed
+        """
+        CREATE TRIGGER IF NOT EXISTS entries_fts_promote
+        AFTER UPDATE OF canonical_entry_id ON entries
+        WHEN old.canonical_entry_id IS NOT NULL AND new.canonical_entry_id IS NULL
+        BEGIN
+            INSERT OR REPLACE INTO entries_fts (rowid, title, body)
+            VALUES (new.id, COALESCE(new.title, ''), COALESCE(new.content_text, ''));
+        END
+        """,
+    )
+
+    # Mirrors the trigger in migrations/019_promote_duplicate_content.sql; run on
+    # its own for the same reason as the FTS trigger. The heir takes over the
+    # deleted entry's content, including archived content (the object is copied
+    # by _hand_down_archived_content), and is left for the index sweep to embed.
+    _PROMOTE_DUPLICATE_TRIGGER = """
+        CREATE TRIGGER IF NOT EXISTS entries_promote_duplicate AFTER DELETE ON entries
+        WHEN EXISTS (SELECT 1 FROM entries WHERE canonical_entry_id = old.id)
+        BEGIN
+            UPDATE entries
+            SET canonical_entry_id = (
+                SELECT MIN(id) FROM entries WHERE canonical_entry_id = old.id
+            )
+            WHERE canonical_entry_id = old.id;
+            UPDATE entries
+            SET canonical_entry_id = NULL, content = old.content, content_text = old.content_text,
+                content_archived_at = old.content_archived_at,
+                content_encoding = old.content_encoding,
+                embedding_model = NULL, indexed_at = NULL,
+                index_attempts = 0, index_retry_after = NULL
+            WHERE canonical_entry_id = id;
+        END
+    """
+
+    # Tri-state like _db_initialized: None=untested, True=FTS5 works, False=use LIKE
+    _fts_available: bool | None = None
+
+    async def _create_entries_fts(self) -> None:
+        """Create the FTS5 keyword index; keyword search falls back to LIKE without it."""
+        try:
+            for statement in self._ENTRIES_FTS_SCHEMA:
+                await self.env.DB.prepare(statement).run()
+        except Exception as e:
+            log_error("fts_init_error", e)
+            self._fts_available = False
+
+    async def _index_entry_text(self, entry_id: int, title: str | None, text: str) -> None:
+        """Write an entry's title and extracted text to the entries_fts index.
+
+        Failures are logged, not raised: the entry is still served, and keyword
+        search falls back to LIKE if the index is missing altogether.
+        """
+        if self._fts_available is False:
+            return
+        try:
+            await (
+                self.env.DB.prepare("""
+                INSERT OR REPLACE INTO entries_fts (rowid, title, body) VALUES (?, ?, ?)
+            """)
+                .bind(entry_id, title or "", text)
+                .run()
+            )
+        except Exception as e:
+            log_op(
+                "fts_index_skipped",
+                entry_id=entry_id,
+                error_type=type(e).__name__,
+                error=truncate_error(e),
+            )
+
+    async def _get_content_generation(self) -> int | None:
+        """Read the content generation counter (migration 008).
+
+        Returns None if it can't be read (e.g. 008 not yet applied), in which
+        case search pages are served uncached as before.
+        """
+        try:
+            row = await self.env.DB.prepare(
+                "SELECT generation FROM content_generation WHERE id = 1"
+            ).first()
+            value = row.get("generation") if row else None
+            return int(value) if value is not None else None
+        except Exception as e:
+            log_op("content_generation_read_failed", error=truncate_error(e))
+            return None
+
+    async def _bump_content_generation(self) -> None:
+        """Advance the content generation after entries change.
+
+        Cached search pages are keyed by generation, so this moves searches
+        onto fresh URLs. Failures are logged: cached pages then simply live
+        out their SEARCH_CACHE_SECONDS.
+        """
+        try:
+            await self.env.DB.prepare("""
+                UPDATE content_generation
+                SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE id = 1
+            """).run()
+        except Exception as e:
+            log_op("content_generation_bump_failed", error=truncate_error(e))
+
     # Expected columns for each table (must match CREATE TABLE above)
     _EXPECTED_COLUMNS: dict[str, set[str]] = {
         "feeds": {
@@ -507,6 +769,16 @@ class Default(WorkerEntrypoint):
             "title",
             "author",
             "content",
+            "content_text",
+            "content_archived_at",
+            "content_encoding",
+            "url_hash",
+            "content_hash",
+            "canonical_entry_id",
+            "embedding_model",
+            "indexed_at",
+            "index_attempts",
+            "index_retry_after",
             "summary",
             "published_at",
             "updated_at",
@@ -589,7 +861,9 @@ class Default(WorkerEntrypoint):
         (_process_single_feed) uses INSERT ... ON CONFLICT for idempotent upserts,
         providing additional safety.
         """
+        _isolate.invoke("scheduled")
         await self._run_scheduler()
+        _emit_isolate_summary()
 
     async def _run_scheduler(self) -> dict[str, int]:
         """Hourly scheduler - enqueue each active feed as a separate message.
@@ -606,7 +880,9 @@ class Default(WorkerEntrypoint):
         sched_event = SchedulerEvent(
             worker_version=deployment["worker_version"],
             deployment_environment=deployment["deployment_environment"],
+            isolate_id=_isolate.isolate_id,
         )
+        bind_event(sched_event)
 
         with Timer() as total_timer:
             try:
@@ -651,130 +927,196 @@ class Default(WorkerEntrypoint):
                 sched_event.feeds_enqueued = enqueue_count
 
                 # Auto-recovery: retry a small number of disabled feeds per hour
-                if get_feed_recovery_enabled(self.env) and self.env.FEED_QUEUE is not None:
-                    recovery_limit = get_feed_recovery_limit(self.env)
-                    if recovery_limit > 0:
-                        disabled_result = (
-                            await self.env.DB.prepare("""
-                            SELECT id, url, etag, last_modified
-                            FROM feeds
-                            WHERE is_active = 0
-                            ORDER BY updated_at DESC
-                            LIMIT ?
-                        """)
-                            .bind(recovery_limit)
-                            .all()
-                        )
-                        disabled_feeds = feed_rows_from_d1(disabled_result.results)
-
-                        for feed in disabled_feeds:
-                            await (
-                                self.env.DB.prepare("""
-                                UPDATE feeds SET
-                                    is_active = 1,
-                                    consecutive_failures = 0,
-                                    fetch_error = NULL,
-                                    updated_at = CURRENT_TIMESTAMP
-                                WHERE id = ?
+                with sched_event.trace.span("recovery"):
+                    if get_feed_recovery_enabled(self.env) and self.env.FEED_QUEUE is not None:
+                        recovery_limit = get_feed_recovery_limit(self.env)
+                        if recovery_limit > 0:
+                            disabled_result = (
+                                await self.env.DB.prepare("""
+                                SELECT id, url, etag, last_modified
+                                FROM feeds
+                                WHERE is_active = 0
+                                ORDER BY updated_at DESC
+                                LIMIT ?
                             """)
-                                .bind(feed["id"])
-                                .run()
-                            )
-                            await self.env.FEED_QUEUE.send(
-                                {
-                                    "feed_id": feed["id"],
-                                    "url": feed["url"],
-                                    "etag": feed.get("etag"),
-                                    "last_modified": feed.get("last_modified"),
-                                    "scheduled_at": datetime.now(timezone.utc).isoformat(),
-                                    "correlation_id": sched_event.correlation_id,
-                                    "is_recovery_attempt": True,
-                                }
-                            )
-                            enqueue_count += 1
-                            log_op(
-                                "feed_recovery_attempt",
-                                feed_id=feed["id"],
-                                feed_url=feed["url"],
+                                .bind(recovery_limit)
+                                .all()
                             )
-
-                        sched_event.feeds_recovery_attempted = len(disabled_feeds)
+                            disabled_feeds = feed_rows_from_d1(disabled_result.results)
+
+                            for feed in disabled_feeds:
+                                await (
+                                    self.env.DB.prepare("""
+                                    UPDATE feeds SET
+                                        is_active = 1,
+                                        consecutive_failures = 0,
+                                        fetch_error = NULL,
+                                        updated_at = CURRENT_TIMESTAMP
+                                    WHERE id = ?
+                                """)
+                                    .bind(feed["id"])
+                                    .run()
+                                )
+                                await self.env.FEED_QUEUE.send(
+                                    {
+                                        "feed_id": feed["id"],
+                                        "url": feed["url"],
+                                        "etag": feed.get("etag"),
+                                        "last_modified": feed.get("last_modified"),
+                                        "scheduled_at": datetime.now(timezone.utc).isoformat(),
+                                        "correlation_id": sched_event.correlation_id,
+                                        "is_recovery_attempt": True,
+                                    }
+                                )
+                                enqueue_count += 1
+                                log_op(
+                                    "feed_recovery_attempt",
+                                    feed_id=feed["id"],
+                                    feed_url=feed["url"],
+                                )
+
+                            sched_event.feeds_recovery_attempted = len(disabled_feeds)
 
                 # Feed health summary for observability (#11, #12, #18)
                 try:
-                    health_result = (
-                        await self.env.DB.prepare("""
-                        SELECT
-                            SUM(CASE WHEN is_active = 0 THEN 1 ELSE 0 END) as disabled,
-                            SUM(CASE WHEN is_active = 0
-                                AND updated_at >= datetime('now', '-1 hour')
-                                THEN 1 ELSE 0 END) as newly_disabled,
-                            SUM(CASE WHEN consecutive_failures >= ? THEN 1 ELSE 0 END) as dlq_depth
-                        FROM feeds
-                    """)
-                        .bind(self._get_feed_failure_threshold())
-                        .first()
-                    )
-                    if health_result:
-                        health = _to_py_safe(health_result)
-                        sched_event.feeds_disabled = health.get("disabled") or 0
-                        sched_event.feeds_newly_disabled = health.get("newly_disabled") or 0
-                        sched_event.dlq_depth = health.get("dlq_depth") or 0
-
-                    # Error clustering: find error patterns affecting 2+ feeds
-                    cluster_result = await self.env.DB.prepare("""
-                        SELECT fetch_error, COUNT(*) as cnt
-                        FROM feeds
-                        WHERE fetch_error IS NOT NULL AND consecutive_failures > 0
-                        GROUP BY fetch_error
-                        HAVING COUNT(*) >= 2
-                        ORDER BY cnt DESC
-                    """).all()
-                    clusters = _to_py_safe(cluster_result.results) if cluster_result else []
-                    if clusters:
-                        sched_event.error_clusters = len(clusters)
-                        top = clusters[0] if isinstance(clusters, list) and clusters else None
-                        if top and isinstance(top, dict):
-                            sched_event.error_cluster_top = str(top.get("fetch_error", ""))[:200]
+                    with sched_event.trace.span("health"):
+                        health_result = (
+                            await self.env.DB.prepare("""
+                            SELECT
+                                SUM(CASE WHEN is_active = 0 THEN 1 ELSE 0 END) as disabled,
+                                SUM(CASE WHEN is_active = 0
+                                    AND updated_at >= datetime('now', '-1 hour')
+                                    THEN 1 ELSE 0 END) as newly_disabled,
+                                SUM(CASE WHEN consecutive_failures >= ? THEN 1 ELSE 0 END)
+                                    as dlq_depth
+                            FROM feeds
+                        """)
+                            .bind(self._get_feed_failure_threshold())
+                            .first()
+                        )
+                        if health_result:
+                            health = _to_py_safe(health_result)
+                            sched_event.feeds_disabled = health.get("disabled") or 0
+                            sched_event.feeds_newly_disabled = health.get("newly_disabled") or 0
+                            sched_event.dlq_depth = health.get("dlq_depth") or 0
+
+                        # Error clustering: find error patterns affecting 2+ feeds
+                        cluster_result = await self.env.DB.prepare("""
+                            SELECT fetch_error, COUNT(*) as cnt
+                            FROM feeds
+                            WHERE fetch_error IS NOT NULL AND consecutive_failures > 0
+                            GROUP BY fetch_error
+                            HAVING COUNT(*) >= 2
+                            ORDER BY cnt DESC
+                        """).all()
+                        clusters = _to_py_safe(cluster_result.results) if cluster_result else []
+                        if clusters:
+                            sched_event.error_clusters = len(clusters)
+                            top = clusters[0] if isinstance(clusters, list) and clusters else None
+                            if top and isinstance(top, dict):
+                                cluster_error = str(top.get("fetch_error", ""))
+                                sched_event.error_cluster_top = cluster_error[:200]
                 except Exception as e:
                     log_error("health_summary_error", e)
 
                 # Run retention policy after enqueueing feeds
                 # This ensures old entries are cleaned up once per cron cycle
-                retention_stats = await self._apply_retention_policy()
+                with sched_event.trace.span("retention"):
+                    retention_stats = await self._apply_retention_policy()
                 sched_event.retention_d1_ms = retention_stats.get("d1_ms", 0)
                 sched_event.retention_vectorize_ms = retention_stats.get("vectorize_ms", 0)
+                sched_event.retention_feeds_capped = retention_stats.get("feeds_capped", 0)
                 sched_event.retention_entries_scanned = retention_stats.get("entries_scanned", 0)
                 sched_event.retention_entries_deleted = retention_stats.get("entries_deleted", 0)
                 sched_event.retention_vectors_deleted = retention_stats.get("vectors_deleted", 0)
                 sched_event.retention_errors = retention_stats.get("errors", 0)
+                sched_event.retention_backlog = retention_stats.get("backlog", 0)
                 sched_event.retention_days = retention_stats.get("retention_days", 0)
                 sched_event.retention_max_per_feed = retention_stats.get("max_per_feed", 0)
 
+                # Embed entries missing from the index or on an older model
+                try:
+                    with sched_event.trace.span("index_sweep"):
+                        sweep_stats = await self._sweep_unindexed_entries()
+                    sched_event.index_sweep_ms = sweep_stats["ms"]
+                    sched_event.index_sweep_candidates = sweep_stats["candidates"]
+                    sched_event.index_sweep_indexed = sweep_stats["indexed"]
+                    sched_event.index_sweep_failed = sweep_stats["failed"]
+                except Exception as e:
+                    log_op("index_sweep_error", error=truncate_error(e))
+
+                # Compress entry HTML stored before CONTENT_COMPRESSION was enabled
+                try:
+                    with sched_event.trace.span("content_compress"):
+                        compress_stats = await self._compress_stored_content()
+                    sched_event.content_compress_ms = compress_stats["ms"]
+                    sched_event.content_compress_candidates = compress_stats["candidates"]
+                    sched_event.content_compress_rewritten = compress_stats["compressed"]
+                    sched_event.content_compress_bytes_saved = compress_stats["bytes_saved"]
+                except Exception as e:
+                    log_op("content_compress_error", error=truncate_error(e))
+
+                # Move old entry HTML out of D1 into the ARCHIVE bucket
+                try:
+                    with sched_event.trace.span("archive"):
+                        archive_stats = await self._archive_old_content()
+                    sched_event.archive_ms = archive_stats["ms"]
+                    sched_event.archive_candidates = archive_stats["candidates"]
+                    sched_event.archive_moved = archive_stats["archived"]
+                    sched_event.archive_failed = archive_stats["failed"]
+                except Exception as e:
+                    log_op("content_archive_error", error=truncate_error(e))
+
                 # P4: Prune old audit log entries to prevent unbounded growth.
                 # Runs once per cron cycle (not per admin action) to avoid extra DB
                 # round-trips on every admin request.
                 try:
-                    audit_cutoff = (
-                        datetime.now(timezone.utc) - timedelta(days=AUDIT_RETENTION_DAYS)
-                    ).strftime("%Y-%m-%d %H:%M:%S")
-                    await (
-                        self.env.DB.prepare("""
-                        DELETE FROM audit_log WHERE created_at < ?
-                    """)
-                        .bind(audit_cutoff)
-                        .run()
-                    )
+                    with sched_event.trace.span("audit_prune"):
+                        audit_cutoff = (
+                            datetime.now(timezone.utc) - timedelta(days=AUDIT_RETENTION_DAYS)
+                        ).strftime("%Y-%m-%d %H:%M:%S")
+                        await (
+                            self.env.DB.prepare("""
+                            DELETE FROM audit_log WHERE created_at < ?
+                        """)
+                            .bind(audit_cutoff)
+                            .run()
+                        )
                 except Exception as e:
                     log_op("audit_log_cleanup_error", error=truncate_error(e))
 
+                # Prune expired query embeddings (reads already ignore them)
+                try:
+                    with sched_event.trace.span("embedding_prune"):
+                        embedding_cutoff = (
+                            datetime.now(timezone.utc)
+                            - timedelta(seconds=get_embedding_cache_ttl_seconds(self.env))
+                        ).strftime("%Y-%m-%d %H:%M:%S")
+                        await (
+                            self.env.DB.prepare("""
+                            DELETE FROM query_embeddings WHERE created_at < ?
+                        """)
+                            .bind(embedding_cutoff)
+                            .run()
+                        )
+                except Exception as e:
+                    log_op("query_embedding_cleanup_error", error=truncate_error(e))
+
+                # Resume background reindex jobs that stopped advancing
+                try:
+                    with sched_event.trace.span("reindex_resume"):
+                        await self._resume_stale_reindex_jobs()
+                except Exception as e:
+                    log_op("reindex_resume_error", error=truncate_error(e))
+
                 # Pre-warm edge cache for main pages so the next visitor gets a cache hit
                 try:
-                    base_url = (getattr(self.env, "PLANET_URL", None) or "").rstrip("/")
-                    if base_url:
-                        warm_headers = {"User-Agent": self._get_user_agent()}
-                        for path in ("/", "/titles", "/feed.atom", "/feed.rss"):
-                            await safe_http_fetch(f"{base_url}{path}", headers=warm_headers)
+                    with sched_event.trace.span("cache_prewarm"):
+                        base_url = (getattr(self.env, "PLANET_URL", None) or "").rstrip("/")
+                        if base_url:
+                            warm_headers = {"User-Agent": self._get_user_agent()}
+                            for path in ("/", "/titles", "/feed.atom", "/feed.rss"):
+                                await safe_http_fetch(f"{base_url}{path}", headers=warm_headers)
                 except Exception:
                     log_op("cache_prewarm_failed")
 
@@ -803,6 +1145,7 @@ class Default(WorkerEntrypoint):
 
         Note: Workers Python runtime passes (batch, env, ctx) but we use self.env from __init__.
         """
+        _isolate.invoke("queue")
         batch_queue = _safe_str(getattr(batch, "queue", "")) or ""
         log_op("queue_batch_received", batch_size=len(batch.messages), queue=batch_queue)
 
@@ -830,6 +1173,12 @@ class Default(WorkerEntrypoint):
                 message.ack()  # Don't retry invalid messages
                 continue
 
+            # Reindex batches share the feed queue (see _reindex_all_entries)
+            reindex_job_id = feed_job.get("reindex_job_id")
+            if reindex_job_id:
+                await self._process_reindex_message(message, int(reindex_job_id))
+                continue
+
             # Validate required fields in queue message
             feed_id = feed_job.get("feed_id")
             feed_url = feed_job.get("url")
@@ -862,7 +1211,9 @@ class Default(WorkerEntrypoint):
                 deployment_environment=deployment["deployment_environment"],
                 # Cross-boundary correlation from scheduler
                 correlation_id=correlation_id,
+                isolate_id=_isolate.isolate_id,
             )
+            bind_event(event)
 
             feed_timeout = self._get_feed_timeout()
             with Timer() as timer:
@@ -916,6 +1267,8 @@ class Default(WorkerEntrypoint):
             # Emit wide event (sampling applied)
             emit_event(event)
 
+        _emit_isolate_summary()
+
     async def _process_single_feed(
         self, job: dict, event: FeedFetchEvent | None = None
     ) -> dict[str, Any]:
@@ -945,7 +1298,7 @@ class Default(WorkerEntrypoint):
             headers["If-Modified-Since"] = str(last_modified)
 
         # Fetch using boundary-layer safe_http_fetch
-        with Timer() as http_timer:
+        with Timer() as http_timer, trace_span(event, "http"):
             http_response = await safe_http_fetch(
                 url, headers=headers, timeout_seconds=self._get_http_timeout()
             )
@@ -997,8 +1350,12 @@ class Default(WorkerEntrypoint):
         if status_code >= 400:
             raise ValueError(f"HTTP error {status_code}")
 
-        # Parse feed with feedparser - response_text is now pure Python string
-        feed_data = feedparser.parse(response_text)
+        # Parse feed with feedparser - response_text is now pure Python string.
+        # Imported here so public read paths never load the parser.
+        import feedparser
+
+        with trace_span(event, "parse", bytes=response_size):
+            feed_data = feedparser.parse(response_text)
 
         if feed_data.bozo and not feed_data.entries:
             raise ValueError(f"Feed parse error: {feed_data.bozo_exception}")
@@ -1014,6 +1371,7 @@ class Default(WorkerEntrypoint):
         entries_list = _to_py_list(feed_data.entries)
 
         entries_added = 0
+        entries_changed = 0
         entries_found = len(entries_list)
         if event:
             event.entries_found = entries_found
@@ -1027,10 +1385,15 @@ class Default(WorkerEntrypoint):
                 log_op("entry_not_dict", entry_type=type(py_entry).__name__)
                 continue
 
-            result = await self._upsert_entry(feed_id, py_entry)
+            with trace_span(event, "upsert"):
+                result = await self._upsert_entry(feed_id, py_entry, event)
             entry_id = result.get("entry_id") if result else None
             if entry_id:
-                entries_added += 1
+                # Edited entries change what pages show; only new ones grow the feed
+                entries_changed += 1
+                entries_added += int(bool(result.get("inserted")))
+                if event and result.get("duplicate_of"):
+                    event.entries_duplicate += 1
                 # Aggregate indexing stats onto FeedFetchEvent
                 if event and result.get("indexing_stats"):
                     stats = result["indexing_stats"]
@@ -1044,18 +1407,59 @@ class Default(WorkerEntrypoint):
                     event.indexing_upsert_ms += stats.get("upsert_ms", 0)
                     if stats.get("text_truncated"):
                         event.indexing_text_truncated += 1
-            else:
+            elif not (result and result.get("unchanged")):
                 entry_title = str(py_entry.get("title", ""))[:50]
                 log_op("entry_upsert_failed", feed_id=feed_id, entry_title=entry_title)
 
         # Mark fetch as successful
         await self._update_feed_success(feed_id, new_etag, new_last_modified)
+        if entries_changed:
+            await self._bump_content_generation()
+        if entries_added:
+            await self._mark_feed_for_retention(feed_id)
 
         log_op("feed_processed", feed_url=url, entries_added=entries_added)
         return {"status": "ok", "entries_added": entries_added, "entries_found": entries_found}
 
-    async def _upsert_entry(self, feed_id: int, entry: dict[str, Any]) -> dict[str, Any]:
-        """Insert or update a single entry with sanitized content."""
+    async def _mark_feed_for_retention(self, feed_id: int) -> None:
+        """Queue a feed for the per-feed retention cap (migration 013).
+
+        Failures are logged: the feed's cap is then enforced after its next
+        successful fetch with entries.
+        """
+        try:
+            await (
+                self.env.DB.prepare("""
+                INSERT INTO retention_dirty_feeds (feed_id) VALUES (?)
+                ON CONFLICT(feed_id) DO UPDATE SET marked_at = CURRENT_TIMESTAMP
+            """)
+                .bind(feed_id)
+                .run()
+            )
+        except Exception as e:
+            log_op("retention_mark_failed", feed_id=feed_id, error=truncate_error(e))
+
+    async def _store_entry_text(self, entry_id: int, text: str) -> None:
+        """Backfill entries.content_text for an entry stored before migration 009."""
+        try:
+            await (
+                self.env.DB.prepare("UPDATE entries SET content_text = ? WHERE id = ?")
+                .bind(text, entry_id)
+                .run()
+            )
+        except Exception as e:
+            log_op("entry_text_backfill_failed", entry_id=entry_id, error=truncate_error(e))
+
+    async def _upsert_entry(
+        self, feed_id: int, entry: dict[str, Any], event: FeedFetchEvent | None = None
+    ) -> dict[str, Any]:
+        """Insert or update a single entry with sanitized content.
+
+        An entry identical to its stored row is not written again and comes
+        back with unchanged=True and no entry_id. New entries have inserted=True.
+        With an event, the sanitize, dedupe, write, fts and embed stages are
+        traced as spans under the caller's "upsert" span.
+        """
         # Use EntryContentProcessor for GUID generation, content extraction, and date parsing
         processor = EntryContentProcessor(entry, feed_id)
         processed = processor.process()
@@ -1085,46 +1489,97 @@ class Default(WorkerEntrypoint):
             except (ValueError, TypeError):
                 pass  # If date is unparseable, let COALESCE handle it in SQL
 
-        # Sanitize HTML (XSS prevention)
-        sanitized_content = self._sanitize_html(content)
+        # Sanitize HTML (XSS prevention), then extract the prose once for
+        # embeddings, the keyword index and search snippets
+        with trace_span(event, "sanitize", chars=len(content)):
+            sanitized_content = self._sanitize_html(content)
+            content_text = extract_entry_text(sanitized_content)
+
+        # A post another feed already carried is stored as a link to that entry,
+        # without content, and is neither keyword-indexed nor embedded
+        entry_url_hash = url_hash(entry.get("link"))
+        entry_content_hash = content_hash(content_text)
+        with trace_span(event, "dedupe"):
+            duplicate = await self._find_canonical_entry(
+                feed_id, guid, entry_url_hash, entry_content_hash
+            )
+        canonical_id = duplicate.get("canonical_id")
+        if canonical_id:
+            stored_content, stored_text = None, None
+        else:
+            stored_content = encode_content(
+                sanitized_content, compress=get_content_compression_enabled(self.env)
+            )
+            stored_text = content_text
 
         # Upsert to D1 - use _safe_str to convert any JsProxy/undefined to Python
         # first_seen is set on INSERT only - preserved on UPDATE to prevent spam attacks
         # where feeds retroactively add old entries that would appear as new
-        result_raw = (
-            await self.env.DB.prepare("""
-            INSERT INTO entries (
-                feed_id, guid, url, title, author, content, summary,
-                published_at, first_seen
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), CURRENT_TIMESTAMP)
-            ON CONFLICT(feed_id, guid) DO UPDATE SET
-                title = excluded.title,
-                content = excluded.content,
-                summary = excluded.summary,
-                author = excluded.author,
-                url = excluded.url,
-                updated_at = CURRENT_TIMESTAMP
-            RETURNING id
-        """)
-            .bind(
-                *entry_bind_values(
-                    feed_id,
-                    guid,
-                    entry.get("link"),
-                    title,
-                    entry.get("author"),
-                    sanitized_content,
-                    summary,
-                    published_at,
+        with trace_span(event, "write"):
+            result_raw = (
+                await self.env.DB.prepare("""
+                INSERT INTO entries (
+                    feed_id, guid, url, title, author, content, summary,
+                    published_at, first_seen, content_text,
+                    url_hash, content_hash, canonical_entry_id
+                )
+                VALUES (
+                    ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), CURRENT_TIMESTAMP, ?,
+                    ?, ?, ?
+                )
+                ON CONFLICT(feed_id, guid) DO UPDATE SET
+                    title = excluded.title,
+                    content = excluded.content,
+                    content_text = excluded.content_text,
+                    content_archived_at = NULL,
+                    content_encoding = NULL,
+                    url_hash = excluded.url_hash,
+                    content_hash = excluded.content_hash,
+                    canonical_entry_id = excluded.canonical_entry_id,
+                    summary = excluded.summary,
+                    author = excluded.author,
+                    url = excluded.url,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE entries.title IS NOT excluded.title
+                   OR entries.url IS NOT excluded.url
+                   OR entries.author IS NOT excluded.author
+                   OR entries.summary IS NOT excluded.summary
+                   OR entries.content_text IS NOT excluded.content_text
+                   OR entries.canonical_entry_id IS NOT excluded.canonical_entry_id
+                   OR (entries.content_archived_at IS NULL
+                       AND entries.content IS NOT excluded.content)
+                RETURNING id, url, author, published_at, updated_at IS NULL AS inserted,
+                    (SELECT title FROM feeds WHERE feeds.id = entries.feed_id) AS feed_title,
+                    (SELECT site_url FROM feeds WHERE feeds.id = entries.feed_id) AS feed_site_url
+            """)
+                .bind(
+                    *entry_bind_values(
+                        feed_id,
+                        guid,
+                        entry.get("link"),
+                        title,
+                        entry.get("author"),
+                        stored_content,
+                        summary,
+                        published_at,
+                    ),
+                    stored_text,
+                    entry_url_hash,
+                    entry_content_hash,
+                    canonical_id,
                 )
+                .first()
             )
-            .first()
-        )
 
-        # Convert JsProxy to Python dict
+        # Convert JsProxy to Python dict. Every full fetch re-upserts the feed's
+        # entries; the WHERE above skips the ones that haven't changed, which
+        # then return no row and need no FTS, vector or generation update.
+        # updated_at is only set by the UPDATE path, so inserted marks new entries.
         result = _to_py_safe(result_raw)
-        entry_id = result.get("id") if result else None
+        if not result:
+            return {"entry_id": None, "unchanged": True, "indexing_stats": None}
+        entry_id = result.get("id")
+        inserted = bool(result.get("inserted"))
 
         # Update feed's last_entry_at when a new entry is successfully added
         if entry_id:
@@ -1138,15 +1593,27 @@ class Default(WorkerEntrypoint):
                 .bind(published_at, feed_id)
                 .run()
             )
+            if canonical_id:
+                if duplicate.get("was_canonical") is not None:
+                    await self._demote_to_duplicate(entry_id, canonical_id)
+                return {
+                    "entry_id": entry_id,
+                    "inserted": inserted,
+                    "indexing_stats": None,
+                    "duplicate_of": canonical_id,
+                }
+            with trace_span(event, "fts"):
+                await self._index_entry_text(entry_id, title, content_text)
 
         # Index for semantic search (may fail in local dev - Vectorize not supported)
         # Capture stats for aggregation on FeedFetchEvent
         indexing_stats = None
         if entry_id and title:
             try:
-                indexing_stats = await self._index_entry_for_search(
-                    entry_id, title, sanitized_content, feed_id=feed_id
-                )
+                with trace_span(event, "embed"):
+                    indexing_stats = await self._index_entry_for_search(
+                        entry_id, title, content_text, feed_id=feed_id, display_fields=result
+                    )
             except Exception as e:
                 # Log but don't fail - entry is still usable without search
                 log_op(
@@ -1166,19 +1633,105 @@ class Default(WorkerEntrypoint):
                     "error_message": truncate_error(e),
                 }
 
-        return {"entry_id": entry_id, "indexing_stats": indexing_stats}
+        return {"entry_id": entry_id, "inserted": inserted, "indexing_stats": indexing_stats}
+
+    async def _find_canonical_entry(
+        self,
+        feed_id: int,
+        guid: str,
+        entry_url_hash: str | None,
+        entry_content_hash: str | None,
+    ) -> dict[str, Any]:
+        """Look up the entry another feed already stored for the same post.
+
+        Returns canonical_id, the oldest canonical entry from another feed with
+        the same url_hash or content_hash (None if the post is new), and
+        was_canonical: if this feed already stored the entry as a canonical
+        entry, its embedding_model ('' if not indexed), otherwise None.
+        A failed lookup is logged and treated as a new post.
+        """
+        if not entry_url_hash and not entry_content_hash:
+            return {}
+        try:
+            row = await (
+                self.env.DB.prepare("""
+                SELECT
+                    (SELECT id FROM entries
+                     WHERE canonical_entry_id IS NULL AND feed_id != ?
+                       AND (url_hash = ? OR content_hash = ?)
+                     ORDER BY id LIMIT 1) AS canonical_id,
+                    (SELECT COALESCE(embedding_model, '') FROM entries
+                     WHERE feed_id = ? AND guid = ? AND canonical_entry_id IS NULL
+                    ) AS was_canonical
+            """)
+                .bind(feed_id, entry_url_hash, entry_content_hash, feed_id, _safe_str(guid))
+                .first()
+            )
+        except Exception as e:
+            log_op("duplicate_lookup_failed", feed_id=feed_id, error=truncate_error(e))
+            return {}
+        return _to_py_safe(row) or {}
+
+    async def _demote_to_duplicate(self, entry_id: int, canonical_id: int) -> None:
+        """Clean up after a stored canonical entry turned out to be a duplicate.
+
+        Happens to entries stored before migration 016 once they are re-fetched.
+        Entries that duplicated this one are relinked to canonical_id, and its
+        keyword index row and vector are removed so searches return the post once.
+        """
+        try:
+            await (
+                self.env.DB.prepare("""
+                UPDATE entries SET canonical_entry_id = ? WHERE canonical_entry_id = ?
+            """)
+                .bind(canonical_id, entry_id)
+                .run()
+            )
+            await (
+                self.env.DB.prepare("""
+                UPDATE entries SET embedding_model = NULL, indexed_at = NULL WHERE id = ?
+            """)
+                .bind(entry_id)
+                .run()
+            )
+            if self._fts_available is not False:
+                await (
+                    self.env.DB.prepare("DELETE FROM entries_fts WHERE rowid = ?")
+                    .bind(entry_id)
+                    .run()
+                )
+            # Unconditionally: a vector can exist without embedding_model, e.g.
+            # when the upsert succeeded but marking the entry failed
+            if self.env.SEARCH_INDEX is not None:
+                await self.env.SEARCH_INDEX.deleteByIds([str(entry_id)])
+        except Exception as e:
+            log_op(
+                "duplicate_demote_failed",
+                entry_id=entry_id,
+                canonical_entry_id=canonical_id,
+                error=truncate_error(e),
+            )
 
     async def _index_entry_for_search(
-        self, entry_id: int, title: str, content: str, feed_id: int = 0, trigger: str = "feed_fetch"
+        self,
+        entry_id: int,
+        title: str,
+        content: str,
+        feed_id: int = 0,
+        trigger: str = "feed_fetch",
+        display_fields: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Generate embedding and store in Vectorize for semantic search.
 
         Args:
             entry_id: Database ID of the entry
             title: Entry title
-            content: Entry content (HTML sanitized)
+            content: Entry text from extract_entry_text() (entries.content_text)
             feed_id: Feed ID for observability (not used in event - aggregated by caller)
             trigger: What triggered indexing - "feed_fetch", "reindex", or "manual"
+            display_fields: Entry row with url, author, published_at, feed_title and
+                feed_site_url, stored as vector metadata so search can render
+                semantic matches without D1
 
         Returns:
             dict with indexing stats for aggregation on parent event:
@@ -1214,7 +1767,7 @@ class Default(WorkerEntrypoint):
                 # Generate embedding using Workers AI with cls pooling for accuracy
                 with Timer() as embedding_timer:
                     embedding_result = await self.env.AI.run(
-                        "@cf/baai/bge-base-en-v1.5",
+                        EMBEDDING_MODEL,
                         {"text": [combined_text], "pooling": "cls"},
                     )
                 stats["embedding_ms"] = embedding_timer.elapsed_ms
@@ -1239,12 +1792,15 @@ class Default(WorkerEntrypoint):
                             {
                                 "id": str(entry_id),
                                 "values": vector,
-                                "metadata": {"title": title[:200], "entry_id": entry_id},
+                                "metadata": build_vector_metadata(
+                                    entry_id, {**(display_fields or {}), "title": title}
+                                ),
                             }
                         ]
                     )
                 stats["upsert_ms"] = upsert_timer.elapsed_ms
                 stats["success"] = True
+                await self._mark_entries_indexed([entry_id])
 
             except Exception as e:
                 stats["error_type"] = type(e).__name__
@@ -1451,7 +2007,14 @@ class Default(WorkerEntrypoint):
                 Route(path="/foafroll.xml", content_type="foaf", cacheable=True),
                 Route(path="/health", content_type="health", cacheable=False),
                 Route(
-                    path="/search", content_type="search", cacheable=False, lite_mode_disabled=True
+                    path="/entry",
+                    pattern="/entry/:entry_id",
+                    content_type="entry",
+                    cacheable=True,
+                    route_name="/entry/:id",
+                ),
+                Route(
+                    path="/search", content_type="search", cacheable=True, lite_mode_disabled=True
                 ),
                 # OAuth routes
                 Route(
@@ -1511,11 +2074,29 @@ class Default(WorkerEntrypoint):
             worker_version=deployment["worker_version"],
             deployment_environment=deployment["deployment_environment"],
         )
+        bind_event(event)
+
+        event.isolate_request_ordinal = _isolate.invoke("request")
+        event.isolate_cold = _isolate.cold
+        event.isolate_id = _isolate.isolate_id
+        event.isolate_started_at = _isolate.started_at
+
+        # First request of this isolate carries the module import breakdown
+        startup_imports = _import_timer.consume()
+        if startup_imports is not None:
+            event.startup_import_ms = _import_timer.total_ms
+            event.startup_imports = startup_imports
 
         with Timer() as timer:
             try:
                 # Smart default: Auto-initialize database on first request
-                await self._ensure_database_initialized()
+                if self._db_initialized is not True:
+                    with Timer() as db_init_timer:
+                        await self._ensure_database_initialized()
+                    event.startup_db_init_ms = _isolate.record_init(
+                        "db_init_ms", db_init_timer.elapsed_ms
+                    )
+                    event.startup_schema_drift_ms = _isolate.init_ms.get("schema_drift_ms")
 
                 # Use RouteDispatcher to match path and get route metadata
                 router = self._create_router()
@@ -1527,7 +2108,11 @@ class Default(WorkerEntrypoint):
                     event.cache_status = match.cache_status
 
                     # Check lite mode for disabled routes
-                    if match.lite_mode_disabled and check_lite_mode(self.env):
+                    if (
+                        match.lite_mode_disabled
+                        and check_lite_mode(self.env)
+                        and not (match.content_type == "search" and has_d1_search_index(self.env))
+                    ):
                         response = json_error(
                             f"{match.content_type.title()} is not available in lite mode",
                             status=404,
@@ -1570,7 +2155,9 @@ class Default(WorkerEntrypoint):
                 # Skip JsProxy or other non-standard types
         except (TypeError, AttributeError):
             pass  # Size calculation failed (JsProxy or other non-standard type)
-        emit_event(event)
+        # Never sample away cold starts or the once-per-isolate startup breakdown
+        emit_event(event, force=event.isolate_cold or startup_imports is not None)
+        _emit_isolate_summary()
 
         return response
 
@@ -1597,6 +2184,8 @@ class Default(WorkerEntrypoint):
             return await self._serve_foaf()
         elif route_path == "/health":
             return await self._serve_health()
+        elif route_path == "/entry":
+            return await self._serve_entry_content(match.path_params.get("entry_id", ""))
         elif route_path == "/search":
             return await self._search_entries(request, event)
         # OAuth routes
@@ -1656,6 +2245,44 @@ class Default(WorkerEntrypoint):
         html = await self._generate_html(event=event, template=TEMPLATE_TITLES)
         return html_response(html)
 
+    async def _serve_entry_content(self, entry_id: str) -> Response:
+        """Serve one entry's full sanitized content as an HTML fragment.
+
+        In excerpt mode the homepage only carries excerpts; keyboard-nav.js
+        fetches this fragment when a reader expands an entry. Content was
+        sanitized at ingest, so it is returned as stored (minus a duplicate
+        title heading) and edge-cached like the homepage.
+        """
+        entry_id_int = validate_feed_id(entry_id)
+        if entry_id_int is None:
+            return json_error("Invalid entry ID", status=400)
+
+        result = (
+            await self.env.DB.prepare(
+                "SELECT id, title, content, content_archived_at FROM entries WHERE id = ?"
+            )
+            .bind(entry_id_int)
+            .first()
+        )
+        entry = entry_row_from_js(result)
+        if not entry:
+            return json_error("Entry not found", status=404)
+        await self._restore_archived_content([entry])
+
+        return html_response(normalize_entry_content(entry["content"], entry["title"]))
+
+    # Other feeds that carried each canonical entry (migration 016), as a JSON
+    # array read by entry_row_from_js(); an indexed lookup per rendered entry
+    _ALSO_IN_COLUMN = """(
+                    SELECT json_group_array(
+                        json_object('feed_title', df.title, 'feed_site_url', df.site_url,
+                                    'url', d.url)
+                    )
+                    FROM entries d
+                    JOIN feeds df ON d.feed_id = df.id
+                    WHERE d.canonical_entry_id = ranked.id
+                ) AS also_in"""
+
     async def _generate_html(
         self,
         trigger: str = "http",
@@ -1691,18 +2318,38 @@ class Default(WorkerEntrypoint):
             "%Y-%m-%d %H:%M:%S"
         )
 
+        # Excerpt mode never renders full content on the page, so only read the
+        # summary plus a bounded content prefix from D1 instead of e.* (content is
+        # by far the widest column). Full content is served from /entry/<id>.
+        theme = self._get_theme()
+        excerpt_mode = template == TEMPLATE_INDEX and self._use_excerpt_mode(theme)
+        excerpt_length = get_excerpt_length(self.env)
+        if excerpt_mode:
+            # 4x headroom so markup in the prefix doesn't starve the excerpt text.
+            # A prefix of compressed content can't be decoded, so those rows cut
+            # the excerpt from content_text instead.
+            entry_columns = (
+                "e.id, e.feed_id, e.guid, e.url, e.title, e.author, e.summary, "
+                "e.published_at, e.first_seen, e.created_at, e.content_archived_at, "
+                f"CASE WHEN substr(e.content, 1, 3) = '{CONTENT_CODEC_MARKER}' "
+                f"THEN substr(e.content_text, 1, {excerpt_length * 4}) "
+                f"ELSE substr(e.content, 1, {excerpt_length * 4}) END AS content"
+            )
+        else:
+            entry_columns = "e.*"
+
         # P8: The three queries below (entries, feeds, recent_entries) fetch different
         # data and are not redundant. They run sequentially because D1 does not support
         # concurrent queries from a single Worker invocation.
-        with Timer() as d1_timer:
+        with Timer() as d1_timer, trace_span(event, "d1"):
             # Query entries, grouping by published_at (actual publication date)
             # Fall back to first_seen only when published_at is missing
             entries_result = await (
                 self.env.DB.prepare(
-                    """
+                    f"""
                 WITH ranked AS (
                     SELECT
-                        e.*,
+                        {entry_columns},
                         f.title as feed_title,
                         f.site_url as feed_site_url,
                         ROW_NUMBER() OVER (
@@ -1717,8 +2364,9 @@ class Default(WorkerEntrypoint):
                     FROM entries e
                     JOIN feeds f ON e.feed_id = f.id
                     WHERE COALESCE(e.published_at, e.first_seen) >= ?
+                      AND e.canonical_entry_id IS NULL
                 )
-                SELECT * FROM ranked
+                SELECT ranked.*, {self._ALSO_IN_COLUMN} FROM ranked
                 WHERE rn_per_day <= 5 AND rn_total <= ?
                 ORDER BY COALESCE(published_at, first_seen) DESC
                 LIMIT ?
@@ -1767,6 +2415,7 @@ class Default(WorkerEntrypoint):
         # Convert D1 results to typed Python dicts
         entries = entry_rows_from_d1(entries_result.results)
         feeds = feed_rows_from_d1(feeds_result.results)
+        await self._restore_archived_content(entries)
 
         # Build recent entries per feed (max 3 per feed) for sidebar
         recent_by_feed: dict[int, list[dict[str, str]]] = {}
@@ -1794,10 +2443,10 @@ class Default(WorkerEntrypoint):
             # Query most recent entries without date filter
             fallback_result = await (
                 self.env.DB.prepare(
-                    """
+                    f"""
                 WITH ranked AS (
                     SELECT
-                        e.*,
+                        {entry_columns},
                         f.title as feed_title,
                         f.site_url as feed_site_url,
                         ROW_NUMBER() OVER (
@@ -1806,8 +2455,9 @@ class Default(WorkerEntrypoint):
                         ) as rn_total
                     FROM entries e
                     JOIN feeds f ON e.feed_id = f.id
+                    WHERE e.canonical_entry_id IS NULL
                 )
-                SELECT * FROM ranked
+                SELECT ranked.*, {self._ALSO_IN_COLUMN} FROM ranked
                 WHERE rn_total <= ?
                 ORDER BY COALESCE(published_at, first_seen) DESC
                 LIMIT ?
@@ -1823,32 +2473,42 @@ class Default(WorkerEntrypoint):
         # Group entries by published_at (actual publication date from feed)
         # Fall back to first_seen only if published_at is missing
         # This ensures entries appear under their true publication date
-        entries_by_date = {}
-        for entry in entries:
-            # Prefer published_at for accurate grouping, fall back to first_seen
-            group_date = entry.get("published_at") or entry.get("first_seen") or ""
-            date_str = group_date[:10] if group_date else "Unknown"  # YYYY-MM-DD
-
-            # Convert to absolute date label (e.g., "January 15, 2026")
-            date_label = format_date_label(date_str)
-            if date_label not in entries_by_date:
-                entries_by_date[date_label] = []
-
-            # Add display date (same as group date for consistency)
-            if date_str and date_str != "Unknown":
-                entry["published_at_display"] = format_pub_date(group_date)
-            else:
-                entry["published_at_display"] = ""
+        with trace_span(event, "prepare", entries=len(entries)):
+            entries_by_date = {}
+            for entry in entries:
+                # Prefer published_at for accurate grouping, fall back to first_seen
+                group_date = entry.get("published_at") or entry.get("first_seen") or ""
+                date_str = group_date[:10] if group_date else "Unknown"  # YYYY-MM-DD
+
+                # Convert to absolute date label (e.g., "January 15, 2026")
+                date_label = format_date_label(date_str)
+                if date_label not in entries_by_date:
+                    entries_by_date[date_label] = []
+
+                # Add display date (same as group date for consistency)
+                if date_str and date_str != "Unknown":
+                    entry["published_at_display"] = format_pub_date(group_date)
+                else:
+                    entry["published_at_display"] = ""
 
-            # Normalize content: strip duplicate title heading if present
-            entry["content"] = normalize_entry_content(entry.get("content", ""), entry.get("title"))
+                if excerpt_mode:
+                    # Prefer the feed-provided summary; fall back to the content prefix
+                    entry["excerpt"] = make_excerpt(
+                        entry.get("summary") or entry.get("content"), excerpt_length
+                    )
+                    entry["content"] = ""
+                else:
+                    # Normalize content: strip duplicate title heading if present
+                    entry["content"] = normalize_entry_content(
+                        entry.get("content", ""), entry.get("title")
+                    )
 
-            # Compute display author (filters email addresses in Python, not templates)
-            entry["display_author"] = get_display_author(
-                entry.get("author"), entry.get("feed_title")
-            )
+                # Compute display author (filters email addresses in Python, not templates)
+                entry["display_author"] = get_display_author(
+                    entry.get("author"), entry.get("feed_title")
+                )
 
-            entries_by_date[date_label].append(entry)
+                entries_by_date[date_label].append(entry)
 
         # Sort entries within each day by published_at (newest first)
         for date_label in entries_by_date:
@@ -1894,9 +2554,10 @@ class Default(WorkerEntrypoint):
         # Render template - track template time
         # Check if running in lite mode (no search, no auth)
         is_lite = check_lite_mode(self.env)
+        # Templates use is_lite_mode only to hide the search form
+        search_disabled = is_lite and not has_d1_search_index(self.env)
 
         # Build feed_links dict for templates
-        theme = self._get_theme()
         feed_links: dict[str, str] = {
             "atom": "/feed.atom",
             "rss": "/feed.rss",
@@ -1927,7 +2588,7 @@ class Default(WorkerEntrypoint):
         # Build date_labels for themes (identity mapping since keys are already formatted)
         date_labels = {date_key: date_key for date_key in entries_by_date}
 
-        with Timer() as render_timer:
+        with Timer() as render_timer, trace_span(event, "render"):
             html = render_template(
                 template,
                 theme=theme,
@@ -1937,7 +2598,8 @@ class Default(WorkerEntrypoint):
                 feed_links=feed_links,
                 date_labels=date_labels,
                 generated_at=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
-                is_lite_mode=is_lite,
+                is_lite_mode=search_disabled,
+                excerpt_mode=excerpt_mode,
                 show_admin_link=show_admin_link,
                 logo=THEME_LOGOS.get(theme),
                 submission=None,
@@ -1956,14 +2618,20 @@ class Default(WorkerEntrypoint):
     async def _apply_retention_policy(self) -> dict:
         """Delete old entries and clean up vectors based on configurable retention policy.
 
+        The age cutoff is an indexed range scan. The per-feed cap only ranks
+        entries of feeds marked in retention_dirty_feeds since the last run,
+        so D1 time follows churn rather than archive size.
+
         Returns:
             dict with retention stats for aggregation on SchedulerEvent:
             - retention_days: int
             - max_per_feed: int
+            - feeds_capped: int
             - entries_scanned: int
             - entries_deleted: int
             - vectors_deleted: int
             - errors: int
+            - backlog: int (entries left for the next run when the time budget ran out)
 
         """
         retention_days = self._get_retention_days()
@@ -1972,96 +2640,182 @@ class Default(WorkerEntrypoint):
         stats: dict[str, object] = {
             "retention_days": retention_days,
             "max_per_feed": max_per_feed,
+            "feeds_capped": 0,
             "entries_scanned": 0,
             "entries_deleted": 0,
             "vectors_deleted": 0,
             "errors": 0,
+            "backlog": 0,
         }
 
         # Calculate cutoff date in Python for parameterized query
-        cutoff_date = (datetime.now(timezone.utc) - timedelta(days=retention_days)).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        now = datetime.now(timezone.utc)
+        cutoff_date = (now - timedelta(days=retention_days)).strftime("%Y-%m-%d %H:%M:%S")
+        marks_cutoff = None
 
         with Timer() as d1_timer:
-            # Get IDs of entries to delete
-            to_delete = await (
+            # Age cutoff: both branches are range scans on idx_entries_published
+            # (published_at is only NULL on legacy rows)
+            expired = await (
                 self.env.DB.prepare("""
-                WITH ranked_entries AS (
-                    SELECT
-                        id,
-                        feed_id,
-                        published_at,
-                        first_seen,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY feed_id
-                            ORDER BY published_at DESC
-                        ) as rn
-                    FROM entries
-                ),
-                entries_to_delete AS (
-                    SELECT id FROM ranked_entries
-                    WHERE rn > ?
-                       OR COALESCE(published_at, first_seen) < ?
-                )
-                SELECT id FROM entries_to_delete
+                SELECT id FROM entries WHERE published_at < ?
+                UNION ALL
+                SELECT id FROM entries WHERE published_at IS NULL AND first_seen < ?
             """)
-                .bind(max_per_feed, cutoff_date)
+                .bind(cutoff_date, cutoff_date)
                 .all()
             )
+            to_delete = {row["id"] for row in entry_rows_from_d1(expired.results)}
+
+            # Per-feed cap, only for feeds that stored entries since the last run
+            has_dirty_feeds = False
+            try:
+                # Marks made before D1's clock read here are cleared once their
+                # feeds are capped. marked_at is D1's CURRENT_TIMESTAMP, so the
+                # cutoff comes from the same clock, not the isolate's.
+                dirty = await self.env.DB.prepare(
+                    "SELECT feed_id, CURRENT_TIMESTAMP AS now FROM retention_dirty_feeds"
+                ).all()
+                stats["feeds_capped"] = len(dirty.results)
+                if dirty.results:
+                    marks_cutoff = dirty.results[0]["now"]
+                    over_cap = await (
+                        self.env.DB.prepare("""
+                        WITH ranked_entries AS (
+                            SELECT
+                                id,
+                                ROW_NUMBER() OVER (
+                                    PARTITION BY feed_id
+                                    ORDER BY published_at DESC
+                                ) as rn
+                            FROM entries
+                            WHERE feed_id IN (SELECT feed_id FROM retention_dirty_feeds)
+                        )
+                        SELECT id FROM ranked_entries WHERE rn > ?
+                    """)
+                        .bind(max_per_feed)
+                        .all()
+                    )
+                    to_delete.update(row["id"] for row in entry_rows_from_d1(over_cap.results))
+                    has_dirty_feeds = True
+            except Exception as e:
+                # Migration 013 not applied yet: the age cutoff still runs
+                log_op("retention_cap_skipped", error=truncate_error(e))
 
-        deleted_ids = [row["id"] for row in entry_rows_from_d1(to_delete.results)]
+        deleted_ids = sorted(to_delete)
         stats["entries_scanned"] = len(deleted_ids)
         stats["d1_ms"] = d1_timer.elapsed_ms
 
         if deleted_ids:
-            # Delete vectors from Vectorize (Issue 11.2: handle errors gracefully)
-            with Timer() as vectorize_timer:
-                if self.env.SEARCH_INDEX is not None:
-                    try:
-                        await self.env.SEARCH_INDEX.deleteByIds([str(id) for id in deleted_ids])
-                        stats["vectors_deleted"] = len(deleted_ids)
-                    except Exception as e:
-                        stats["errors"] += 1
-                        log_op(
-                            "vectorize_delete_error",
-                            error_type=type(e).__name__,
-                            error_message=truncate_error(e),
-                            ids_count=len(deleted_ids),
-                        )
-                        # Continue with D1 deletion even if vector cleanup fails
-
-            stats["vectorize_ms"] = vectorize_timer.elapsed_ms
+            deletion = await self._delete_entries_chunked(
+                deleted_ids, get_retention_time_budget_ms(self.env)
+            )
+            stats["d1_ms"] += deletion["d1_ms"]
+            stats["vectorize_ms"] = deletion["vectorize_ms"]
+            stats["entries_deleted"] = deletion["entries_deleted"]
+            stats["vectors_deleted"] = deletion["vectors_deleted"]
+            stats["errors"] += deletion["errors"]
+            stats["backlog"] = deletion["backlog"]
+            log_op(
+                "retention_cleanup",
+                entries_deleted=deletion["entries_deleted"],
+                backlog=deletion["backlog"],
+            )
+            if deletion["entries_deleted"]:
+                await self._bump_content_generation()
 
-            # Delete entries from D1 (in batches to stay under parameter limit)
-            for i in range(0, len(deleted_ids), 50):
-                batch = deleted_ids[i : i + 50]
-                placeholders = ",".join("?" * len(batch))
+        # Keep the marks while a backlog remains, so the next run re-ranks those feeds
+        if has_dirty_feeds and marks_cutoff and not stats.get("backlog"):
+            try:
                 await (
-                    self.env.DB.prepare(f"""
-                    DELETE FROM entries WHERE id IN ({placeholders})
-                """)
-                    .bind(*batch)
+                    self.env.DB.prepare("DELETE FROM retention_dirty_feeds WHERE marked_at < ?")
+                    .bind(marks_cutoff)
                     .run()
                 )
-
-            stats["entries_deleted"] = len(deleted_ids)
-            log_op("retention_cleanup", entries_deleted=len(deleted_ids))
+            except Exception as e:
+                log_op("retention_marks_not_cleared", error=truncate_error(e))
 
         return stats
 
-    async def _serve_atom(self) -> Response:
-        """Generate and serve Atom feed on-demand."""
-        entries = await self._get_recent_entries(50)
-        planet = self._get_planet_config()
-        atom = self._generate_atom_feed(planet, entries)
-        return feed_response(atom, "application/atom+xml")
+    async def _delete_entries_chunked(self, entry_ids: list[int], budget_ms: int) -> dict:
+        """Delete entries and their vectors in chunks until the time budget runs out.
 
-    async def _serve_rss(self) -> Response:
-        """Generate and serve RSS feed on-demand."""
-        entries = await self._get_recent_entries(50)
-        planet = self._get_planet_config()
-        rss = self._generate_rss_feed(planet, entries)
+        Each chunk of RETENTION_DELETE_CHUNK_SIZE IDs is one deleteByIds call
+        (under Vectorize's per-call limit) and one D1 statement, whose IDs go
+        in as a single JSON array parameter rather than 100-parameter IN lists.
+        A failed vector delete is counted and the D1 rows are still removed.
+        IDs left when the budget is spent are reported as backlog; retention
+        finds them again on the next cron run.
+        """
+        result: dict[str, Any] = {
+            "entries_deleted": 0,
+            "vectors_deleted": 0,
+            "errors": 0,
+            "d1_ms": 0.0,
+            "vectorize_ms": 0.0,
+            "backlog": 0,
+        }
+        with Timer() as budget_timer:
+            for i in range(0, len(entry_ids), RETENTION_DELETE_CHUNK_SIZE):
+                # Always make progress: the budget is checked from the second chunk
+                if i and budget_timer.elapsed() >= budget_ms:
+                    result["backlog"] = len(entry_ids) - i
+                    log_op("retention_budget_exhausted", budget_ms=budget_ms, **result)
+                    break
+                chunk = entry_ids[i : i + RETENTION_DELETE_CHUNK_SIZE]
+
+                # Delete vectors first (Issue 11.2: handle errors gracefully)
+                if self.env.SEARCH_INDEX is not None:
+                    with Timer() as vectorize_timer:
+                        try:
+                            await self.env.SEARCH_INDEX.deleteByIds([str(id) for id in chunk])
+                            result["vectors_deleted"] += len(chunk)
+                        except Exception as e:
+                            result["errors"] += 1
+                            log_op(
+                                "vectorize_delete_error",
+                                error_type=type(e).__name__,
+                                error_message=truncate_error(e),
+                                ids_count=len(chunk),
+                            )
+                            # Continue with D1 deletion even if vector cleanup fails
+                    result["vectorize_ms"] += vectorize_timer.elapsed_ms
+
+                # Archived content objects (deleting missing keys is a no-op),
+                # after copying those that a promoted duplicate takes over
+                await self._hand_down_archived_content(chunk)
+                store = self._archive_store()
+                if store is not None:
+                    try:
+                        await store.delete([archive_key(id) for id in chunk])
+                    except Exception as e:
+                        result["errors"] += 1
+                        log_op("content_archive_delete_failed", error=truncate_error(e))
+
+                with Timer() as d1_timer:
+                    await (
+                        self.env.DB.prepare("""
+                        DELETE FROM entries WHERE id IN (SELECT value FROM json_each(?))
+                    """)
+                        .bind(json.dumps(chunk))
+                        .run()
+                    )
+                result["d1_ms"] += d1_timer.elapsed_ms
+                result["entries_deleted"] += len(chunk)
+        return result
+
+    async def _serve_atom(self) -> Response:
+        """Generate and serve Atom feed on-demand."""
+        entries = await self._get_recent_entries(50)
+        planet = self._get_planet_config()
+        atom = self._generate_atom_feed(planet, entries)
+        return feed_response(atom, "application/atom+xml")
+
+    async def _serve_rss(self) -> Response:
+        """Generate and serve RSS feed on-demand."""
+        entries = await self._get_recent_entries(50)
+        planet = self._get_planet_config()
+        rss = self._generate_rss_feed(planet, entries)
         return feed_response(rss, "application/rss+xml")
 
     async def _serve_rss10(self) -> Response:
@@ -2078,6 +2832,7 @@ class Default(WorkerEntrypoint):
             SELECT e.*, f.title as feed_title, f.site_url as feed_site_url
             FROM entries e
             JOIN feeds f ON e.feed_id = f.id
+            WHERE e.canonical_entry_id IS NULL
             ORDER BY e.published_at DESC
             LIMIT ?
         """)
@@ -2085,7 +2840,9 @@ class Default(WorkerEntrypoint):
             .all()
         )
 
-        return entry_rows_from_d1(result.results)
+        entries = entry_rows_from_d1(result.results)
+        await self._restore_archived_content(entries)
+        return entries
 
     def _get_planet_config(self) -> dict[str, str]:
         # Adapter: exposes module-level function as instance method
@@ -2107,6 +2864,17 @@ class Default(WorkerEntrypoint):
             log_op("theme_not_found", theme=theme, fallback="default")
         return theme
 
+    def _use_excerpt_mode(self, theme: str) -> bool:
+        """Check whether the homepage renders excerpts instead of full content.
+
+        Enabled per theme via _THEMES_WITH_EXCERPTS. EXCERPT_MODE="true" or
+        "false" overrides the theme default in either direction.
+        """
+        override = str(getattr(self.env, "EXCERPT_MODE", "") or "").lower()
+        if override in ("true", "false"):
+            return override == "true"
+        return theme in _THEMES_WITH_EXCERPTS
+
     def _get_user_agent(self) -> str:
         # Adapter: exposes module-level function as instance method
         """Get user agent string, supporting USER_AGENT_TEMPLATE env var."""
@@ -2363,6 +3131,225 @@ class Default(WorkerEntrypoint):
             }
         )
 
+    async def _keyword_search(
+        self, builder: SearchQueryBuilder, limit: int
+    ) -> tuple[list[dict[str, Any]], SearchQueryResult]:
+        """Run keyword search via the FTS5 index, falling back to LIKE scans.
+
+        The LIKE fallback covers databases without migration 006 (or without
+        FTS5 support) and queries with no tokenizable terms (e.g. "c++" or "--").
+        """
+        if self._fts_available is not False and builder.has_fts_terms:
+            search_result = builder.build_fts(limit=limit)
+            try:
+                result = (
+                    await self.env.DB.prepare(search_result.sql).bind(*search_result.params).all()
+                )
+                self._fts_available = True
+                return entry_rows_from_d1(result.results), search_result
+            except Exception as e:
+                # Only a missing table/module disables FTS for this isolate;
+                # anything else may be transient, so just fall back this once.
+                if "no such" in str(e).lower():
+                    self._fts_available = False
+                log_op("fts_search_fallback", error=truncate_error(e))
+
+        search_result = builder.build(limit=limit)
+        result = await self.env.DB.prepare(search_result.sql).bind(*search_result.params).all()
+        return entry_rows_from_d1(result.results), search_result
+
+    # Per-isolate first level of the query embedding cache (see embedding_cache.py).
+    # Mutated in place, never rebound, so every request in the isolate shares it.
+    _query_embedding_lru = EmbeddingLRU(QUERY_EMBEDDING_LRU_SIZE)
+
+    async def _get_query_embedding(
+        self,
+        query: str,
+        event: RequestEvent | None = None,
+        d1_lock: asyncio.Lock | None = None,
+    ) -> list[float] | None:
+        """Embed a search query via the in-isolate LRU, then D1, then Workers AI.
+
+        Sets event.search_embedding_cache to "memory", "d1" or "miss". Cache
+        read/write failures are logged and treated as misses. D1 statements
+        hold d1_lock, if given, so they never overlap another branch's query.
+        """
+        d1_lock = d1_lock or asyncio.Lock()
+        key = normalize_query_key(query)
+        vector = self._query_embedding_lru.get(EMBEDDING_MODEL, key)
+        source = "memory"
+
+        if vector is None:
+            async with d1_lock:
+                vector = await self._load_query_embedding(key)
+            source = "d1"
+        if vector is None:
+            embedding_result = await self.env.AI.run(
+                EMBEDDING_MODEL, {"text": [key], "pooling": "cls"}
+            )
+            if not embedding_result or "data" not in embedding_result:
+                return None
+            vector = embedding_result["data"][0]
+            source = "miss"
+            async with d1_lock:
+                await self._store_query_embedding(key, vector)
+
+        if source != "memory":
+            self._query_embedding_lru.put(EMBEDDING_MODEL, key, vector)
+        if event:
+            event.search_embedding_cache = source
+        return vector
+
+    async def _load_query_embedding(self, key: str) -> list[float] | None:
+        """Read an unexpired query embedding from the query_embeddings table."""
+        cutoff = (
+            datetime.now(timezone.utc)
+            - timedelta(seconds=get_embedding_cache_ttl_seconds(self.env))
+        ).strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            row = (
+                await self.env.DB.prepare("""
+                SELECT embedding FROM query_embeddings
+                WHERE model = ? AND query_key = ? AND created_at >= ?
+            """)
+                .bind(EMBEDDING_MODEL, key, cutoff)
+                .first()
+            )
+            if row and row.get("embedding"):
+                return decode_embedding(row["embedding"])
+        except Exception as e:
+            log_op("query_embedding_cache_read_failed", error=truncate_error(e))
+        return None
+
+    async def _store_query_embedding(self, key: str, vector: list[float]) -> None:
+        """Write a query embedding to the query_embeddings table (refreshing its TTL)."""
+        try:
+            await (
+                self.env.DB.prepare("""
+                INSERT OR REPLACE INTO query_embeddings (model, query_key, embedding)
+                VALUES (?, ?, ?)
+            """)
+                .bind(EMBEDDING_MODEL, key, encode_embedding(vector))
+                .run()
+            )
+        except Exception as e:
+            log_op("query_embedding_cache_write_failed", error=truncate_error(e))
+
+    async def _run_search_branch(
+        self, branch: Awaitable[Any], timeout_ms: int
+    ) -> tuple[Any, str | None]:
+        """Await one search branch under its own timeout.
+
+        Returns (result, None) on success or (None, error message) if the
+        branch timed out or raised, so one failing branch never fails the
+        whole search.
+        """
+        try:
+            return await asyncio.wait_for(branch, timeout=timeout_ms / 1000), None
+        except TimeoutError:
+            return None, f"Timeout after {timeout_ms}ms"
+        except Exception as e:
+            return None, truncate_error(e)
+
+    async def _semantic_search(
+        self,
+        query: str,
+        top_k: int,
+        score_threshold: float,
+        event: RequestEvent | None,
+        d1_lock: asyncio.Lock | None = None,
+    ) -> tuple[list[dict], dict[int, dict]]:
+        """Semantic branch: embed the query, query Vectorize, hydrate matches.
+
+        Returns the matches above score_threshold and their D1 rows by entry ID.
+        D1 statements hold d1_lock, if given (see _search_entries).
+        """
+        d1_lock = d1_lock or asyncio.Lock()
+        with Timer() as embedding_timer:
+            query_vector = await self._get_query_embedding(query, event, d1_lock)
+        if event:
+            event.search_embedding_ms = embedding_timer.elapsed_ms
+
+        if query_vector is None:
+            return [], {}
+
+        with Timer() as vectorize_timer:
+            results = await self.env.SEARCH_INDEX.query(
+                query_vector, {"topK": top_k, "returnMetadata": True}
+            )
+        if event:
+            event.search_vectorize_ms = vectorize_timer.elapsed_ms
+
+        matches_raw = results.get("matches", []) if results else []
+        # Apply score threshold
+        matches = [m for m in matches_raw if m.get("score", 0) >= score_threshold]
+        if not matches:
+            return [], {}
+
+        # Vectors can outlive their entries (a vector delete that failed during
+        # retention, say), so matches are intersected with D1 before rendering.
+        # Vectors carry the display fields (see vector_metadata.py), so that is
+        # an ID lookup; only vectors with missing or older metadata are
+        # hydrated with display columns. Keyword rows supersede these entries
+        # when results merge.
+        async with d1_lock:
+            existing = (
+                await self.env.DB.prepare("""
+                SELECT id FROM entries WHERE id IN (SELECT value FROM json_each(?))
+            """)
+                .bind(json.dumps([int(match["id"]) for match in matches]))
+                .all()
+            )
+        live_ids = {row["id"] for row in entry_rows_from_d1(existing.results)}
+        orphaned = len(matches) - len(live_ids)
+        if orphaned:
+            log_op("semantic_orphaned_vectors", count=orphaned)
+        matches = [match for match in matches if int(match["id"]) in live_ids]
+
+        entries: dict[int, dict] = {}
+        stale_ids: list[int] = []
+        for match in matches:
+            entry_id = int(match["id"])
+            entry = entry_from_vector_metadata(entry_id, match.get("metadata"))
+            if entry is None:
+                stale_ids.append(entry_id)
+            else:
+                entries[entry_id] = entry
+        if event:
+            event.search_semantic_hydrated = len(stale_ids)
+
+        if stale_ids:
+            async with d1_lock:
+                db_entries = (
+                    await self.env.DB.prepare("""
+                    SELECT e.id, e.feed_id, e.url, e.title, e.author, e.published_at,
+                           f.title as feed_title, f.site_url as feed_site_url
+                    FROM entries e
+                    JOIN feeds f ON e.feed_id = f.id
+                    WHERE e.id IN (SELECT value FROM json_each(?))
+                """)
+                    .bind(json.dumps(stale_ids))
+                    .all()
+                )
+            for entry in entry_rows_from_d1(db_entries.results):
+                entries[entry["id"]] = entry
+        return matches, entries
+
+    async def _keyword_search_timed(
+        self,
+        builder: SearchQueryBuilder,
+        limit: int,
+        event: RequestEvent | None,
+        d1_lock: asyncio.Lock | None = None,
+    ) -> tuple[list[dict], SearchQueryResult]:
+        """Keyword branch: run _keyword_search under d1_lock and record its D1 time."""
+        async with d1_lock or asyncio.Lock():
+            with Timer() as d1_timer:
+                result = await self._keyword_search(builder, limit)
+        if event:
+            event.search_d1_ms = d1_timer.elapsed_ms
+        return result
+
     async def _search_entries(
         self, request: WorkerRequest, event: RequestEvent | None = None
     ) -> Response:
@@ -2384,13 +3371,15 @@ class Default(WorkerEntrypoint):
 
         # Parse query string
         url_str = str(request.url)
-        query = ""
+        raw_query = ""
+        requested_generation = ""
         if "?" in url_str:
             qs = parse_qs(url_str.split("?", 1)[1])
-            query = qs.get("q", [""])[0]
+            raw_query = qs.get("q", [""])[0]
+            requested_generation = qs.get("g", [""])[0]
 
         # Detect phrase search (quoted queries) and normalize
-        builder = SearchQueryBuilder.from_raw_query(query, max_words=MAX_SEARCH_WORDS)
+        builder = SearchQueryBuilder.from_raw_query(raw_query, max_words=MAX_SEARCH_WORDS)
         query = builder.query
 
         # Populate search query fields on consolidated event
@@ -2429,6 +3418,18 @@ class Default(WorkerEntrypoint):
             )
             return html_response(html, cache_max_age=0)
 
+        # Results are cached at the edge under one canonical, generation-stamped
+        # URL per query. Ingest bumps the generation, so new content means a
+        # new URL rather than a stale hit. Other spellings redirect there.
+        generation = await self._get_content_generation()
+        if generation is not None:
+            canonical_query = builder.canonical_query
+            if raw_query != canonical_query or requested_generation != str(generation):
+                if event:
+                    event.search_redirected = True
+                location = "/search?" + urlencode({"q": canonical_query, "g": generation})
+                return redirect_response(location, cache_max_age=SEARCH_REDIRECT_CACHE_SECONDS)
+
         # Get search configuration
         top_k = self._get_search_top_k()
         score_threshold = self._get_search_score_threshold()
@@ -2436,67 +3437,57 @@ class Default(WorkerEntrypoint):
         # Track if query was truncated for user feedback
         words_truncated = False
 
-        # Run semantic search and keyword search
-        semantic_matches = []
-        semantic_matches_raw = []
-        keyword_entries = []
+        # Run semantic search and keyword search concurrently. Neither branch
+        # depends on the other, so the Workers AI and Vectorize calls overlap
+        # the keyword query. D1 does not support concurrent queries from a
+        # single Worker invocation, so the branches' D1 statements take d1_lock
+        # in turn. Each branch has its own timeout and degrades to no results.
+        semantic_timeout_ms = get_search_semantic_timeout_ms(self.env)
+        keyword_timeout_ms = get_search_keyword_timeout_ms(self.env)
+        d1_lock = asyncio.Lock()
+        (semantic_outcome, semantic_error), (keyword_outcome, keyword_error) = await asyncio.gather(
+            self._run_search_branch(
+                self._semantic_search(query, top_k, score_threshold, event, d1_lock),
+                semantic_timeout_ms,
+            ),
+            self._run_search_branch(
+                self._keyword_search_timed(builder, top_k, event, d1_lock), keyword_timeout_ms
+            ),
+        )
 
-        # 1. Semantic search via Vectorize
-        try:
-            with Timer() as embedding_timer:
-                embedding_result = await self.env.AI.run(
-                    "@cf/baai/bge-base-en-v1.5", {"text": [query], "pooling": "cls"}
-                )
+        # 1. Semantic search via Vectorize (hydrated entries by ID)
+        semantic_matches: list[dict] = []
+        semantic_entries: dict[int, dict] = {}
+        if semantic_error:
+            log_op("semantic_search_failed", error=semantic_error)
             if event:
-                event.search_embedding_ms = embedding_timer.elapsed_ms
-
-            if embedding_result and "data" in embedding_result:
-                query_vector = embedding_result["data"][0]
-                with Timer() as vectorize_timer:
-                    results = await self.env.SEARCH_INDEX.query(
-                        query_vector, {"topK": top_k, "returnMetadata": True}
-                    )
-                if event:
-                    event.search_vectorize_ms = vectorize_timer.elapsed_ms
-
-                semantic_matches_raw = results.get("matches", []) if results else []
-
-                # Apply score threshold
-                semantic_matches = [
-                    m for m in semantic_matches_raw if m.get("score", 0) >= score_threshold
-                ]
-        except Exception as e:
-            log_op("semantic_search_failed", error=truncate_error(e))
+                event.search_semantic_error = semantic_error
+        else:
+            semantic_matches, semantic_entries = semantic_outcome
 
         # 2. Keyword search via D1 (primary ranking signal)
-        # Use SearchQueryBuilder for SQL query construction
-        try:
-            search_limit = self._get_search_top_k()
-            with Timer() as d1_timer:
-                # Build SQL from the already-configured builder
-                search_result = builder.build(limit=search_limit)
-
-                # Track if words were truncated for DoS protection
-                if search_result.words_truncated:
-                    words_truncated = True
-                    if event:
-                        event.search_words_truncated = True
-
-                # Execute the built query
-                keyword_result = (
-                    await self.env.DB.prepare(search_result.sql).bind(*search_result.params).all()
-                )
-
-                keyword_entries = entry_rows_from_d1(keyword_result.results)
+        keyword_entries: list[dict] = []
+        if keyword_error:
+            log_op("keyword_search_failed", error=keyword_error)
             if event:
-                event.search_d1_ms = d1_timer.elapsed_ms
-        except Exception as e:
-            log_op("keyword_search_failed", error=truncate_error(e))
+                event.search_keyword_error = keyword_error
+        else:
+            keyword_entries, search_result = keyword_outcome
+            # Track if words were truncated for DoS protection
+            if search_result.words_truncated:
+                words_truncated = True
+                if event:
+                    event.search_words_truncated = True
+
+        # Only complete results are cached; a page missing a branch is not
+        cache_max_age = 0
+        if generation is not None and not semantic_error and not keyword_error:
+            cache_max_age = get_search_cache_seconds(self.env)
 
         # 3. Combine results: keyword matches FIRST, then semantic matches
         # This is the key ranking insight: exact text match is the strongest signal
         keyword_ids = {entry.get("id") for entry in keyword_entries if entry.get("id")}
-        semantic_ids = {int(m["id"]) for m in semantic_matches}
+        semantic_ids = set(semantic_entries)
 
         # Check for empty results
         if not keyword_ids and not semantic_ids:
@@ -2505,32 +3496,13 @@ class Default(WorkerEntrypoint):
             html = render_template(
                 TEMPLATE_SEARCH, theme=theme, planet=planet, query=query, results=[]
             )
-            return html_response(html, cache_max_age=0)
-
-        # 4. Build entry map for lookups
-        entry_map = {}
+            return html_response(html, cache_max_age=cache_max_age)
 
-        # Add keyword entries to map (already have full data)
+        # 4. Build entry map for lookups (keyword rows win for shared IDs)
+        entry_map = {**semantic_entries}
         for entry in keyword_entries:
             entry_map[entry["id"]] = entry
 
-        # Fetch semantic entries not already in keyword results
-        semantic_only_ids = [eid for eid in semantic_ids if eid not in entry_map]
-        if semantic_only_ids:
-            placeholders = ",".join("?" * len(semantic_only_ids))
-            db_entries = (
-                await self.env.DB.prepare(f"""
-                SELECT e.*, f.title as feed_title, f.site_url as feed_site_url
-                FROM entries e
-                JOIN feeds f ON e.feed_id = f.id
-                WHERE e.id IN ({placeholders})
-            """)
-                .bind(*semantic_only_ids)
-                .all()
-            )
-            for entry in entry_rows_from_d1(db_entries.results):
-                entry_map[entry["id"]] = entry
-
         # 5. Build sorted results: KEYWORD FIRST, SEMANTIC SECOND
         sorted_results = []
         added_ids = set()
@@ -2599,11 +3571,13 @@ class Default(WorkerEntrypoint):
             event.search_title_in_query_matches = title_in_query_count
             event.search_query_in_title_matches = query_in_title_count
 
-        # Add display_author to each result (filters email addresses in Python)
+        # Add display fields to each result (display_author filters email addresses)
         for result in sorted_results:
             result["display_author"] = get_display_author(
                 result.get("author"), result.get("feed_title")
             )
+            result["published_at_display"] = format_pub_date(str(result.get("published_at") or ""))
+            result["snippet_html"] = snippet_to_html(str(result.get("snippet") or ""))
 
         # Return HTML search results page
         html = render_template(
@@ -2615,7 +3589,7 @@ class Default(WorkerEntrypoint):
             words_truncated=words_truncated,
             max_search_words=MAX_SEARCH_WORDS,
         )
-        return html_response(html, cache_max_age=0)
+        return html_response(html, cache_max_age=cache_max_age)
 
     # =========================================================================
     # Admin Routes
@@ -2802,6 +3776,9 @@ class Default(WorkerEntrypoint):
         if path == "/admin/reindex" and method == "POST":
             return await self._reindex_all_entries(admin)
 
+        if path == "/admin/reindex/status" and method == "GET":
+            return await self._reindex_status()
+
         if path == "/admin/logout" and method == "POST":
             return self._logout(request)
 
@@ -2888,6 +3865,8 @@ class Default(WorkerEntrypoint):
                 }
 
             # Parse with feedparser - response_text is pure Python string
+            import feedparser
+
             feed_data = feedparser.parse(response_text)
 
             # Check for parse errors
@@ -3072,8 +4051,20 @@ class Default(WorkerEntrypoint):
                         status=404,
                     )
 
+                # Vectors and archive objects don't cascade with the entries,
+                # so handle them first
+                entries = (
+                    await self.env.DB.prepare("SELECT id FROM entries WHERE feed_id = ?")
+                    .bind(feed_id)
+                    .all()
+                )
+                entry_ids = [row["id"] for row in entry_rows_from_d1(entries.results)]
+                await self._delete_feed_vectors(feed_id, entry_ids)
+                await self._hand_down_archived_content(entry_ids)
+
                 # Delete feed (entries will cascade)
                 await self.env.DB.prepare("DELETE FROM feeds WHERE id = ?").bind(feed_id).run()
+                await self._bump_content_generation()
 
                 # Audit log - feed is now a Python dict
                 await ctx.log_action(
@@ -3097,6 +4088,22 @@ class Default(WorkerEntrypoint):
                     status=500,
                 )
 
+    async def _delete_feed_vectors(self, feed_id: int, entry_ids: list[int]) -> None:
+        """Delete the vectors of a feed's entries, in RETENTION_DELETE_CHUNK_SIZE chunks.
+
+        Failures are logged and the feed is still removed: semantic search
+        drops matches whose entry no longer exists (see _semantic_search).
+        """
+        if self.env.SEARCH_INDEX is None:
+            return
+        try:
+            for i in range(0, len(entry_ids), RETENTION_DELETE_CHUNK_SIZE):
+                await self.env.SEARCH_INDEX.deleteByIds(
+                    [str(id) for id in entry_ids[i : i + RETENTION_DELETE_CHUNK_SIZE]]
+                )
+        except Exception as e:
+            log_op("feed_vectors_delete_failed", feed_id=feed_id, error=truncate_error(e))
+
     async def _update_feed(
         self, request: WorkerRequest, feed_id: int, admin: dict[str, Any]
     ) -> Response:
@@ -3525,24 +4532,31 @@ class Default(WorkerEntrypoint):
         return html_response(html, cache_max_age=0)
 
     async def _reindex_all_entries(self, admin: dict[str, Any]) -> Response:
-        """Re-index all entries in Vectorize for search.
+        """Start a background job that re-indexes all entries in Vectorize.
 
         This is needed when entries exist in D1 but were never indexed
         (e.g., added before Vectorize was configured, or indexing failed).
 
-        Rate limited to prevent DoS - only one reindex per REINDEX_COOLDOWN_SECONDS.
+        The job is a reindex_jobs row (migration 010) that works through entries
+        in id order, REINDEX_BATCH_SIZE at a time. The first batch runs in this
+        request, so small planets are done when it returns; the rest run one
+        batch per FEED_QUEUE message (see _process_reindex_message). The admin
+        UI polls GET /admin/reindex/status while the job is running.
 
-        CC2: TOCTOU race note — The cooldown check (read last reindex time) and the
-        subsequent reindex operation are not atomic. Two admins could theoretically
-        both pass the cooldown check and trigger concurrent reindexes. This is
-        mitigated by: (1) single-admin access in practice, (2) idempotent vector
-        upserts, and (3) the cooldown window making the race window very small.
+        Rate limited to prevent DoS - only one reindex per REINDEX_COOLDOWN_SECONDS.
+        The audit log row is written when the job starts, and a running job is
+        returned instead of starting a second one.
         """
         deployment = self._get_deployment_context()
         async with admin_action_context(
             admin, "reindex", "search_index", deployment, self._log_admin_action
         ) as ctx:
             try:
+                latest = await self._get_reindex_job()
+                if latest and latest.get("status") == "running":
+                    ctx.set_error("AlreadyRunning", f"Reindex job {latest['id']} in progress")
+                    return json_response(self._reindex_job_progress(latest), status=202)
+
                 # Rate limiting: check last reindex time
                 last_reindex = await self.env.DB.prepare("""
                     SELECT created_at FROM audit_log
@@ -3565,60 +4579,48 @@ class Default(WorkerEntrypoint):
                                 status=429,
                             )
 
-                # Get all entries with their content (include feed_id for observability)
-                result = await self.env.DB.prepare("""
-                    SELECT id, feed_id, title, content FROM entries WHERE title IS NOT NULL
-                """).all()
-
-                entries = entry_rows_from_d1(result.results)
-                indexed = 0
-                failed = 0
-
-                ctx.set_reindex_metrics(entries_total=len(entries))
-
-                for entry in entries:
-                    entry_id = entry.get("id")
-                    feed_id = entry.get("feed_id", 0)
-                    title = entry.get("title", "")
-                    content = entry.get("content", "")
+                count_row = await self.env.DB.prepare(
+                    "SELECT COUNT(*) AS total FROM entries"
+                    " WHERE title IS NOT NULL AND canonical_entry_id IS NULL"
+                ).first()
+                total = int((count_row or {}).get("total") or 0)
 
-                    if not entry_id or not title:
-                        continue
-
-                    try:
-                        await self._index_entry_for_search(
-                            entry_id, title, content, feed_id=feed_id, trigger="reindex"
-                        )
-                        indexed += 1
-                    except Exception as e:
-                        failed += 1
-                        log_op(
-                            "reindex_entry_failed",
-                            entry_id=entry_id,
-                            error_type=type(e).__name__,
-                            error=truncate_error(e),
-                        )
-
-                ctx.set_reindex_metrics(entries_indexed=indexed, entries_failed=failed)
+                job = await (
+                    self.env.DB.prepare("""
+                    INSERT INTO reindex_jobs (admin_id, entries_total) VALUES (?, ?)
+                    RETURNING *
+                """)
+                    .bind(admin["id"], total)
+                    .first()
+                )
+                if job is None:
+                    raise RuntimeError("INSERT INTO reindex_jobs returned no row")
+                job_id = int(job["id"])
+                ctx.set_target_id(job_id)
+                ctx.set_reindex_metrics(entries_total=total)
 
-                # Log admin action
+                # Logged at the start so the cooldown and audit trail cover running jobs
                 await ctx.log_action(
                     admin["id"],
                     "reindex",
                     "search_index",
-                    0,
-                    {"indexed": indexed, "failed": failed, "total": len(entries)},
+                    job_id,
+                    {"job_id": job_id, "total": total},
                 )
 
+                job = await self._run_reindex_batch(job_id) or job
+                if job.get("status") == "running":
+                    job = await self._continue_reindex_job(job)
+
+                ctx.set_reindex_metrics(
+                    entries_indexed=job.get("entries_indexed"),
+                    entries_failed=job.get("entries_failed"),
+                )
                 ctx.set_success()
 
+                progress = self._reindex_job_progress(job)
                 return json_response(
-                    {
-                        "success": True,
-                        "indexed": indexed,
-                        "failed": failed,
-                        "total": len(entries),
-                    }
+                    progress, status=202 if progress["status"] == "running" else 200
                 )
 
             except Exception as e:
@@ -3630,6 +4632,574 @@ class Default(WorkerEntrypoint):
                 )
                 return json_error("An unexpected error occurred during reindexing.", status=500)
 
+    async def _reindex_status(self) -> Response:
+        """Report progress of the most recent reindex job for the admin UI to poll."""
+        job = await self._get_reindex_job()
+        if not job:
+            return json_response(
+                {"success": True, "status": "idle", "indexed": 0, "failed": 0, "total": 0}
+            )
+        return json_response(self._reindex_job_progress(job))
+
+    async def _get_reindex_job(self, job_id: int | None = None) -> dict[str, Any] | None:
+        """Load a reindex job by id, or the most recent job if no id is given."""
+        if job_id is None:
+            row = await self.env.DB.prepare(
+                "SELECT * FROM reindex_jobs ORDER BY id DESC LIMIT 1"
+            ).first()
+        else:
+            row = await (
+                self.env.DB.prepare("SELECT * FROM reindex_jobs WHERE id = ?").bind(job_id).first()
+            )
+        return _to_py_safe(row) or None
+
+    @staticmethod
+    def _reindex_job_progress(job: dict[str, Any]) -> dict[str, Any]:
+        """Shape a reindex_jobs row as the JSON the admin UI reads."""
+        return {
+            "success": True,
+            "job_id": job.get("id"),
+            "status": job.get("status"),
+            "indexed": job.get("entries_indexed") or 0,
+            "failed": job.get("entries_failed") or 0,
+            "total": job.get("entries_total") or 0,
+            "batches": job.get("batches") or 0,
+            "last_error": job.get("last_error"),
+            "started_at": job.get("created_at"),
+            "updated_at": job.get("updated_at"),
+            "completed_at": job.get("completed_at"),
+        }
+
+    async def _continue_reindex_job(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Hand the next batch of a running job to the queue.
+
+        Without a queue binding (e.g. wrangler dev --remote) the remaining
+        batches run inline instead, as the reindex did before it was batched.
+        """
+        if self.env.FEED_QUEUE is not None:
+            await self.env.FEED_QUEUE.send({"reindex_job_id": job["id"]})
+            return job
+        while job.get("status") == "running":
+            next_job = await self._run_reindex_batch(int(job["id"]))
+            if not next_job:
+                break
+            job = next_job
+        return job
+
+    async def _run_reindex_batch(self, job_id: int) -> dict[str, Any] | None:
+        """Index the next batch of a running reindex job and advance its cursor.
+
+        Returns the job row after the batch, the unchanged row if the job is no
+        longer running, or None if another delivery of the same batch recorded
+        it first: the cursor update only applies if last_entry_id still holds
+        the value this batch started from.
+        """
+        job = await self._get_reindex_job(job_id)
+        if not job or job.get("status") != "running":
+            return job
+        cursor = int(job.get("last_entry_id") or 0)
+
+        # content is only needed to backfill content_text (entries before migration 009)
+        result = await (
+            self.env.DB.prepare("""
+            SELECT e.id, e.feed_id, e.title, e.content_text,
+                   CASE WHEN e.content_text IS NULL THEN e.content END AS content,
+                   e.url, e.author, e.published_at,
+                   f.title AS feed_title, f.site_url AS feed_site_url
+            FROM entries e
+            JOIN feeds f ON e.feed_id = f.id
+            WHERE e.id > ? AND e.title IS NOT NULL AND e.canonical_entry_id IS NULL
+            ORDER BY e.id
+            LIMIT ?
+        """)
+            .bind(cursor, REINDEX_BATCH_SIZE)
+            .all()
+        )
+        entries = entry_rows_from_d1(result.results)
+
+        stats = await self._index_entries_batch(entries)
+        next_cursor = max((entry["id"] for entry in entries), default=cursor)
+        status = "completed" if len(entries) < REINDEX_BATCH_SIZE else "running"
+
+        updated = await (
+            self.env.DB.prepare("""
+            UPDATE reindex_jobs SET
+                last_entry_id = ?,
+                entries_indexed = entries_indexed + ?,
+                entries_failed = entries_failed + ?,
+                batches = batches + 1,
+                last_error = COALESCE(?, last_error),
+                status = ?,
+                completed_at = CASE WHEN ? = 'completed' THEN CURRENT_TIMESTAMP END,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'running' AND last_entry_id = ?
+            RETURNING *
+        """)
+            .bind(
+                next_cursor,
+                stats["indexed"],
+                stats["failed"],
+                stats["error_message"],
+                status,
+                status,
+                job_id,
+                cursor,
+            )
+            .first()
+        )
+        log_op(
+            "reindex_batch",
+            job_id=job_id,
+            cursor=next_cursor,
+            entries=len(entries),
+            indexed=stats["indexed"],
+            failed=stats["failed"],
+            embedding_ms=stats["embedding_ms"],
+            upsert_ms=stats["upsert_ms"],
+            status=status,
+            recorded=bool(updated),
+        )
+        return _to_py_safe(updated) or None
+
+    async def _index_entries_batch(self, entries: list[dict[str, Any]]) -> dict[str, Any]:
+        """Embed a batch of entries with one AI call and store them with one upsert.
+
+        Each entry's keyword index row is rewritten first, backfilling
+        content_text for entries stored before migration 009. If the AI or
+        Vectorize call fails, the whole batch is counted as failed and the error
+        returned rather than raised, so a reindex job moves on to the next batch.
+
+        Returns:
+            dict with indexed, failed, embedding_ms, upsert_ms and error_message
+            (None unless the batch failed).
+        """
+        stats: dict[str, Any] = {
+            "indexed": 0,
+            "failed": 0,
+            "embedding_ms": 0,
+            "upsert_ms": 0,
+            "error_message": None,
+        }
+        max_chars = self._get_embedding_max_chars()
+        batch: list[dict[str, Any]] = []
+        texts: list[str] = []
+
+        for entry in entries:
+            entry_id = entry.get("id")
+            title = entry.get("title", "")
+            if not entry_id or not title:
+                continue
+
+            # Entries stored before migration 009 have no extracted text yet
+            content_text = entry.get("content_text")
+            if content_text is None:
+                content_text = extract_entry_text(entry.get("content"))
+                await self._store_entry_text(entry_id, content_text)
+
+            # Rewrite the keyword index row as plain text (backfilled rows hold HTML)
+            await self._index_entry_text(entry_id, title, content_text)
+
+            batch.append(entry)
+            texts.append(f"{title}\n\n{content_text[:max_chars]}")
+
+        if not batch:
+            return stats
+
+        try:
+            with Timer() as embedding_timer:
+                embedding_result = await self.env.AI.run(
+                    EMBEDDING_MODEL,
+                    {"text": texts, "pooling": "cls"},
+                )
+            stats["embedding_ms"] = embedding_timer.elapsed_ms
+
+            vectors = (embedding_result or {}).get("data") or []
+            if len(vectors) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(vectors)}")
+
+            with Timer() as upsert_timer:
+                await self.env.SEARCH_INDEX.upsert(
+                    [
+                        {
+                            "id": str(entry["id"]),
+                            "values": vector,
+                            "metadata": build_vector_metadata(entry["id"], entry),
+                        }
+                        for entry, vector in zip(batch, vectors, strict=True)
+                    ]
+                )
+            stats["upsert_ms"] = upsert_timer.elapsed_ms
+            stats["indexed"] = len(batch)
+            await self._mark_entries_indexed([entry["id"] for entry in batch])
+
+        except Exception as e:
+            stats["failed"] = len(batch)
+            stats["error_message"] = truncate_error(e)
+            log_op(
+                "reindex_batch_failed",
+                entries=len(batch),
+                first_entry_id=batch[0]["id"],
+                error_type=type(e).__name__,
+                error=truncate_error(e),
+            )
+            await self._mark_index_failed([entry["id"] for entry in batch])
+
+        return stats
+
+    async def _mark_entries_indexed(self, entry_ids: list[int]) -> None:
+        """Record that entries' vectors are current for EMBEDDING_MODEL (migration 011).
+
+        Failures are logged: the vectors are stored, and the sweeper will at
+        worst embed these entries once more.
+        """
+        try:
+            await (
+                self.env.DB.prepare("""
+                UPDATE entries
+                SET embedding_model = ?, indexed_at = CURRENT_TIMESTAMP,
+                    index_attempts = 0, index_retry_after = NULL
+                WHERE id IN (SELECT value FROM json_each(?))
+            """)
+                .bind(EMBEDDING_MODEL, json.dumps(entry_ids))
+                .run()
+            )
+        except Exception as e:
+            log_op(
+                "entry_index_mark_failed",
+                entries=len(entry_ids),
+                error_type=type(e).__name__,
+                error=truncate_error(e),
+            )
+
+    async def _mark_index_failed(self, entry_ids: list[int]) -> None:
+        """Back off entries whose indexing failed (migration 017).
+
+        Each failure doubles the wait before the sweeper retries the entry:
+        2^attempts hours, at most INDEX_RETRY_MAX_HOURS. Failures to record
+        this are logged; the entry is then simply retried on the next sweep.
+        """
+        try:
+            await (
+                self.env.DB.prepare("""
+                UPDATE entries
+                SET index_attempts = index_attempts + 1,
+                    index_retry_after = datetime(
+                        'now', printf('+%d hours', min(1 << min(index_attempts, 8), ?))
+                    )
+                WHERE id IN (SELECT value FROM json_each(?))
+            """)
+                .bind(INDEX_RETRY_MAX_HOURS, json.dumps(entry_ids))
+                .run()
+            )
+        except Exception as e:
+            log_op(
+                "entry_index_backoff_failed",
+                entries=len(entry_ids),
+                error_type=type(e).__name__,
+                error=truncate_error(e),
+            )
+
+    async def _sweep_unindexed_entries(self) -> dict[str, Any]:
+        """Embed entries that have no vector, or one from an older embedding model.
+
+        Runs from the cron and handles at most INDEX_SWEEP_LIMIT entries per run,
+        newest first, in batches of REINDEX_BATCH_SIZE. Entries whose indexing
+        failed at ingest and entries left on a previous EMBEDDING_MODEL are
+        caught up a few hundred at a time instead of by a full reindex.
+
+        Entries that failed before are skipped until their index_retry_after
+        (see _mark_index_failed) and are then retried one per batch, so an
+        entry that can never be embedded neither holds up the sweep nor fails
+        the batch of the entries around it again.
+
+        Returns:
+            dict with candidates, indexed, failed and ms for the SchedulerEvent.
+        """
+        stats: dict[str, Any] = {"candidates": 0, "indexed": 0, "failed": 0, "ms": 0}
+        limit = get_index_sweep_limit(self.env)
+        if limit <= 0 or self.env.AI is None or self.env.SEARCH_INDEX is None:
+            return stats
+
+        with Timer() as sweep_timer:
+            result = await (
+                self.env.DB.prepare("""
+                SELECT e.id, e.feed_id, e.title, e.content_text,
+                       CASE WHEN e.content_text IS NULL THEN e.content END AS content,
+                       e.url, e.author, e.published_at, e.index_attempts,
+                       f.title AS feed_title, f.site_url AS feed_site_url
+                FROM entries e
+                JOIN feeds f ON e.feed_id = f.id
+                WHERE e.id IN (
+                    -- Three ranges of idx_entries_index_sweep (migration 020);
+                    -- "IS NULL OR != ?" would scan every entry
+                    SELECT id FROM entries WHERE embedding_model IS NULL
+                      AND title IS NOT NULL AND canonical_entry_id IS NULL
+                    UNION ALL
+                    SELECT id FROM entries WHERE embedding_model < ?
+                      AND title IS NOT NULL AND canonical_entry_id IS NULL
+                    UNION ALL
+                    SELECT id FROM entries WHERE embedding_model > ?
+                      AND title IS NOT NULL AND canonical_entry_id IS NULL
+                )
+                  AND (e.index_retry_after IS NULL OR e.index_retry_after <= CURRENT_TIMESTAMP)
+                ORDER BY e.id DESC
+                LIMIT ?
+            """)
+                .bind(EMBEDDING_MODEL, EMBEDDING_MODEL, limit)
+                .all()
+            )
+            entries = entry_rows_from_d1(result.results)
+            stats["candidates"] = len(entries)
+
+            fresh = [entry for entry in entries if not entry.get("index_attempts")]
+            batches = [
+                fresh[start : start + REINDEX_BATCH_SIZE]
+                for start in range(0, len(fresh), REINDEX_BATCH_SIZE)
+            ]
+            batches += [[entry] for entry in entries if entry.get("index_attempts")]
+            for batch in batches:
+                batch_stats = await self._index_entries_batch(batch)
+                stats["indexed"] += batch_stats["indexed"]
+                stats["failed"] += batch_stats["failed"]
+
+        stats["ms"] = sweep_timer.elapsed_ms
+        return stats
+
+    async def _compress_stored_content(self) -> dict[str, Any]:
+        """Rewrite plain entries.content in the compressed format, in chunks.
+
+        The migration path for existing rows once CONTENT_COMPRESSION is
+        enabled: each cron run compresses up to CONTENT_COMPRESSION_LIMIT
+        entries, lowest id first, read through idx_entries_uncompressed
+        (migration 015), so a finished backlog costs one empty index read.
+        Rows that wouldn't get smaller are left plain and marked
+        content_encoding = 'identity' (migration 018), which takes them out of
+        the index so they aren't read again on every run.
+
+        Returns:
+            dict with candidates, compressed, bytes_saved and ms for the SchedulerEvent.
+        """
+        stats: dict[str, Any] = {"candidates": 0, "compressed": 0, "bytes_saved": 0, "ms": 0}
+        if not get_content_compression_enabled(self.env):
+            return stats
+
+        with Timer() as compress_timer:
+            # Predicate must match the partial index in migration 018 exactly
+            result = await (
+                self.env.DB.prepare("""
+                SELECT id, content FROM entries
+                WHERE length(content) >= 1024 AND substr(content, 1, 3) <> 'z1:'
+                  AND content_encoding IS NULL
+                ORDER BY id
+                LIMIT ?
+            """)
+                .bind(get_content_compression_limit(self.env))
+                .all()
+            )
+            rows = _to_py_list(result.results)
+            stats["candidates"] = len(rows)
+
+            for row in rows:
+                plain = _safe_str(row.get("content")) or ""
+                encoded = encode_content(plain)
+                if encoded == plain:
+                    await (
+                        self.env.DB.prepare(
+                            "UPDATE entries SET content_encoding = 'identity' "
+                            "WHERE id = ? AND content = ?"
+                        )
+                        .bind(row["id"], plain)
+                        .run()
+                    )
+                    continue
+                # Only replace the value that was read, in case ingest rewrote it since
+                await (
+                    self.env.DB.prepare(
+                        "UPDATE entries SET content = ? WHERE id = ? AND content = ?"
+                    )
+                    .bind(encoded, row["id"], plain)
+                    .run()
+                )
+                stats["compressed"] += 1
+                stats["bytes_saved"] += len(plain.encode("utf-8")) - len(encoded)
+
+        stats["ms"] = compress_timer.elapsed_ms
+        return stats
+
+    def _archive_store(self) -> Any:
+        """Return the ARCHIVE bucket (SafeR2 or a FileArchiveStore), or None."""
+        return getattr(self.env, "ARCHIVE", None)
+
+    async def _hand_down_archived_content(self, entry_ids: list[int]) -> None:
+        """Copy the archive objects of entries about to be deleted to their heirs.
+
+        Deleting a canonical entry promotes its oldest remaining duplicate,
+        which takes over content_archived_at (entries_promote_duplicate,
+        migration 019). The archived HTML is keyed by the deleted entry's id,
+        so it is copied to the heir's key first. Failures are logged; the heir
+        then renders from its summary, as for any missing archive object.
+        """
+        store = self._archive_store()
+        if store is None or not entry_ids:
+            return
+        try:
+            ids = json.dumps(entry_ids)
+            result = await (
+                self.env.DB.prepare("""
+                SELECT e.id, MIN(d.id) AS heir_id
+                FROM entries e
+                JOIN entries d ON d.canonical_entry_id = e.id
+                WHERE e.id IN (SELECT value FROM json_each(?))
+                  AND e.content_archived_at IS NOT NULL
+                  AND d.id NOT IN (SELECT value FROM json_each(?))
+                GROUP BY e.id
+            """)
+                .bind(ids, ids)
+                .all()
+            )
+            for row in _to_py_list(result.results):
+                blob = await store.get(archive_key(row["id"]))
+                if blob is not None:
+                    await store.put(archive_key(row["heir_id"]), blob)
+        except Exception as e:
+            log_op("content_archive_handoff_failed", error=truncate_error(e))
+
+    async def _archive_old_content(self) -> dict[str, Any]:
+        """Move the HTML of entries older than ARCHIVE_AFTER_DAYS into the archive.
+
+        Runs from the cron, oldest first, at most ARCHIVE_LIMIT entries per
+        run. Each entry's content is compressed into its own object; only
+        entries whose object was written get content = NULL in D1. Entries
+        without content_text are skipped, since search and snippets need it.
+
+        Returns:
+            dict with candidates, archived, failed and ms for the SchedulerEvent.
+        """
+        stats: dict[str, Any] = {"candidates": 0, "archived": 0, "failed": 0, "ms": 0}
+        store = self._archive_store()
+        after_days = get_archive_after_days(self.env)
+        if store is None or after_days <= 0:
+            return stats
+
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=after_days)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        with Timer() as archive_timer:
+            result = await (
+                self.env.DB.prepare("""
+                SELECT id, content FROM entries
+                WHERE content_archived_at IS NULL
+                  AND published_at < ?
+                  AND content IS NOT NULL
+                  AND content_text IS NOT NULL
+                ORDER BY published_at
+                LIMIT ?
+            """)
+                .bind(cutoff, get_archive_limit(self.env))
+                .all()
+            )
+            rows = entry_rows_from_d1(result.results)
+            stats["candidates"] = len(rows)
+
+            archived_ids: list[int] = []
+            for row in rows:
+                try:
+                    await store.put(archive_key(row["id"]), compress_content(row["content"]))
+                    archived_ids.append(row["id"])
+                except Exception as e:
+                    stats["failed"] += 1
+                    log_op(
+                        "content_archive_put_failed",
+                        entry_id=row["id"],
+                        error_type=type(e).__name__,
+                        error=truncate_error(e),
+                    )
+
+            if archived_ids:
+                await (
+                    self.env.DB.prepare("""
+                    UPDATE entries
+                    SET content = NULL, content_archived_at = CURRENT_TIMESTAMP
+                    WHERE id IN (SELECT value FROM json_each(?))
+                """)
+                    .bind(json.dumps(archived_ids))
+                    .run()
+                )
+                stats["archived"] = len(archived_ids)
+
+        stats["ms"] = archive_timer.elapsed_ms
+        return stats
+
+    async def _restore_archived_content(self, entries: list[dict[str, Any]]) -> None:
+        """Fill in content for archived entries from the archive, in place.
+
+        Only rows with content_archived_at set and no content are fetched,
+        concurrently. A missing object or read failure is logged and leaves
+        content empty, so the entry renders from its summary.
+        """
+        archived = [e for e in entries if e.get("content_archived_at") and not e.get("content")]
+        store = self._archive_store()
+        if not archived or store is None:
+            return
+
+        blobs = await asyncio.gather(
+            *(store.get(archive_key(e["id"])) for e in archived), return_exceptions=True
+        )
+        for entry, blob in zip(archived, blobs, strict=True):
+            if isinstance(blob, BaseException) or blob is None:
+                log_op(
+                    "content_archive_read_failed",
+                    entry_id=entry["id"],
+                    error=truncate_error(str(blob)) if blob else "missing object",
+                )
+                continue
+            entry["content"] = decompress_content(blob)
+
+    async def _process_reindex_message(self, message: Any, job_id: int) -> None:
+        """Run one reindex batch for a queue message and enqueue the next.
+
+        If the batch raises, the message is retried; the job's cursor has not
+        moved, so the retry resumes at the same batch.
+        """
+        try:
+            job = await self._run_reindex_batch(job_id)
+            if job and job.get("status") == "running":
+                await self._continue_reindex_job(job)
+            message.ack()
+        except Exception as e:
+            log_op(
+                "reindex_batch_error",
+                job_id=job_id,
+                error_type=type(e).__name__,
+                error=truncate_error(e),
+            )
+            message.retry()
+
+    async def _resume_stale_reindex_jobs(self) -> int:
+        """Re-enqueue running reindex jobs whose batch chain has stopped.
+
+        A job stops advancing if its queue message was dead-lettered or lost.
+        It resumes from its cursor. Returns the number of jobs resumed.
+        """
+        if self.env.FEED_QUEUE is None:
+            return 0
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=REINDEX_STALE_SECONDS)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        result = await (
+            self.env.DB.prepare("""
+            SELECT id, last_entry_id FROM reindex_jobs
+            WHERE status = 'running' AND updated_at < ?
+        """)
+            .bind(cutoff)
+            .all()
+        )
+        jobs = _to_py_list(result.results)
+        for job in jobs:
+            await self.env.FEED_QUEUE.send({"reindex_job_id": job["id"]})
+            log_op("reindex_job_resumed", job_id=job["id"], cursor=job.get("last_entry_id"))
+        return len(jobs)
+
     async def _log_admin_action(
         self,
         admin_id: int | None,
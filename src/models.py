@@ -8,8 +8,6 @@ from datetime import datetime
 from enum import Enum, auto
 from typing import Literal, NewType, NotRequired, Self, TypedDict
 
-import bleach
-
 # =============================================================================
 # Semantic Type Aliases
 # =============================================================================
@@ -183,6 +181,7 @@ class EntryRow(TypedDict):
     title: str
     author: NotRequired[str | None]
     content: str
+    content_text: NotRequired[str | None]  # Added by migration 009
     summary: NotRequired[str | None]
     published_at: str
     created_at: str
@@ -190,6 +189,8 @@ class EntryRow(TypedDict):
     # Joined fields (when querying with feeds)
     feed_title: NotRequired[str]
     feed_site_url: NotRequired[str]
+    # FTS5 snippet around the first match (keyword search only)
+    snippet: NotRequired[str | None]
 
 
 class AdminRow(TypedDict):
@@ -330,7 +331,10 @@ class BleachSanitizer:
         html = _RE_SCRIPT_TAG.sub("", html)
         html = _RE_STYLE_TAG.sub("", html)
 
-        # Clean HTML with bleach
+        # Clean HTML with bleach (imported on first use: only the ingest path
+        # sanitizes, so public page renders never pay for loading it)
+        import bleach
+
         cleaned = bleach.clean(
             html,
             tags=self.ALLOWED_TAGS,
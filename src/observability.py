@@ -13,18 +13,27 @@ KEY PRINCIPLE: One event per unit of work, not one event per function call.
 Usage:
     event = RequestEvent(method="GET", path="/search")
     # ... populate route-specific fields during operation ...
+    with event.trace.span("render", entries=50):
+        ...
     emit_event(event)
+
+Spans break a unit of work into nested, named stages without adding event
+fields; they are emitted with the event as a compact "spans" tree, so tail
+sampling applies to them too.
 """
 
 import json
 import logging
 import random
+import re
 import secrets
 import time
-from dataclasses import asdict, dataclass, field
-from typing import Any, cast
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from typing import Any
 from urllib.parse import urlparse
 
+from latency import LatencyHistograms
 from utils import (
     ERROR_MESSAGE_MAX_LENGTH,  # noqa: F401 (re-exported)
     get_iso_timestamp,
@@ -51,19 +60,318 @@ def generate_request_id() -> str:
     return secrets.token_hex(8)
 
 
+# =============================================================================
+# Timer Utility
+# =============================================================================
+
+
+class Timer:
+    """Context manager for timing operations."""
+
+    def __init__(self) -> None:
+        """Initialize timer with zero values."""
+        self.start_time: float = 0
+        self.end_time: float = 0
+        self.elapsed_ms: float = 0
+
+    def __enter__(self) -> "Timer":
+        """Start timing when entering context."""
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object | None,
+    ) -> None:
+        """Stop timing when exiting context."""
+        self.end_time = time.perf_counter()
+        self.elapsed_ms = (self.end_time - self.start_time) * 1000
+
+    def elapsed(self) -> float:
+        """Return elapsed time in milliseconds."""
+        if self.end_time:
+            return self.elapsed_ms
+        return (time.perf_counter() - self.start_time) * 1000
+
+
+# =============================================================================
+# Span Tracing
+# =============================================================================
+
+#: Distinct span paths kept per trace; further new names are timed but dropped
+MAX_SPAN_NODES = 64
+
+
+class Span(Timer):
+    """A named, timed stage of a unit of work, nested inside the enclosing span.
+
+    Created by Trace.span(); add attributes while it runs with set().
+    """
+
+    def __init__(self, trace: "Trace", name: str, attrs: dict[str, Any]) -> None:
+        """Initialize an unstarted span belonging to trace."""
+        super().__init__()
+        self.trace = trace
+        self.name = name
+        self.attrs = attrs
+        self._node: dict[str, Any] = {}
+
+    def set(self, **attrs: Any) -> None:
+        """Record attributes on the span (entry counts, cache outcome, ...)."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        """Start timing and make this the parent of spans opened inside it."""
+        super().__enter__()
+        self._node = self.trace._open(self.name)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object | None,
+    ) -> None:
+        """Stop timing and fold the span into its trace."""
+        super().__exit__(exc_type, exc_val, exc_tb)
+        self.trace._close(self._node, self, exc_type)
+
+
+class _NoopSpan:
+    """Stand-in returned by trace_span() when there is no event to trace."""
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """Span tree for one unit of work, attached to its wide event as "spans".
+
+    Spans with the same name under the same parent are merged into one node
+    with a count and summed time, so a feed with 50 entries yields one
+    "upsert" node rather than 50, and the tree's size depends on the code
+    paths taken, not on the data. Numeric attributes of merged spans are
+    summed; others keep the last value. Nesting follows the order spans are
+    entered, so spans in one trace must not run concurrently.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trace."""
+        self._root: dict[str, Any] = {"children": {}}
+        self._stack: list[dict[str, Any]] = [self._root]
+        self._nodes = 0
+        self.dropped = 0
+
+    def span(self, name: str, **attrs: Any) -> Span:
+        """Return a span to use as a context manager: with trace.span("parse"): ..."""
+        return Span(self, name, attrs)
+
+    def _open(self, name: str) -> dict[str, Any]:
+        children = self._stack[-1]["children"]
+        node = children.get(name)
+        if node is None:
+            node = {"ms": 0.0, "count": 0, "attrs": {}, "children": {}}
+            if self._nodes < MAX_SPAN_NODES:
+                children[name] = node
+                self._nodes += 1
+            else:
+                self.dropped += 1
+        self._stack.append(node)
+        return node
+
+    def _close(
+        self, node: dict[str, Any], span: Span, exc_type: type[BaseException] | None
+    ) -> None:
+        # Pop back to this span's node (identity, not equality: merged nodes look alike)
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth] is node:
+                del self._stack[depth:]
+                break
+        node["ms"] += span.elapsed_ms
+        node["count"] += 1
+        attrs = node["attrs"]
+        for key, value in span.attrs.items():
+            previous = attrs.get(key)
+            if _is_number(value) and _is_number(previous):
+                attrs[key] = previous + value
+            else:
+                attrs[key] = value
+        if exc_type is not None:
+            attrs["error"] = exc_type.__name__
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Compact span tree: [{"name", "ms", "count"?, "attrs"?, "children"?}]."""
+        return _span_nodes(self._root["children"])
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _span_nodes(children: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    nodes = []
+    for name, node in children.items():
+        if not node["count"]:
+            continue  # Still open when the event was emitted
+        compact: dict[str, Any] = {"name": name, "ms": round(node["ms"], 2)}
+        if node["count"] > 1:
+            compact["count"] = node["count"]
+        if node["attrs"]:
+            compact["attrs"] = node["attrs"]
+        if node["children"]:
+            compact["children"] = _span_nodes(node["children"])
+        nodes.append(compact)
+    return nodes
+
+
+def trace_span(event: Any, name: str, **attrs: Any) -> Span | _NoopSpan:
+    """Open a span on event's trace, or a no-op span when event is None.
+
+    For code paths whose wide event is optional (event: ... | None = None).
+    """
+    if event is None:
+        return _NOOP_SPAN
+    return event.trace.span(name, **attrs)
+
+
+# =============================================================================
+# D1 Statement Stats
+# =============================================================================
+
+#: Statements listed in d1_slowest, by total time
+D1_SLOWEST_STATEMENTS = 5
+
+#: Fingerprints longer than this are cut (enough to recognize the statement)
+_D1_FINGERPRINT_MAX_CHARS = 160
+
+#: Raw SQL -> fingerprint memo; the app prepares a few hundred distinct strings
+_fingerprint_cache: dict[str, str] = {}
+_FINGERPRINT_CACHE_SIZE = 512
+
+_SQL_COMMENT = re.compile(r"--[^\n]*")
+_SQL_STRING = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SQL_WHITESPACE = re.compile(r"\s+")
+
+
+def d1_fingerprint(sql: str) -> str:
+    """Normalize a statement so every execution of it shares one key.
+
+    Literals become ?, placeholder lists collapse to (?), and whitespace
+    and comments are dropped: "WHERE id IN (?,?,?)" and "WHERE id IN (?)"
+    are the same statement.
+    """
+    fingerprint = _fingerprint_cache.get(sql)
+    if fingerprint is None:
+        normalized = _SQL_COMMENT.sub(" ", sql)
+        normalized = _SQL_STRING.sub("?", normalized)
+        normalized = _SQL_NUMBER.sub("?", normalized)
+        normalized = _SQL_WHITESPACE.sub(" ", normalized).strip()
+        normalized = _SQL_PLACEHOLDER_LIST.sub("(?)", normalized)
+        fingerprint = normalized[:_D1_FINGERPRINT_MAX_CHARS]
+        if len(_fingerprint_cache) >= _FINGERPRINT_CACHE_SIZE:
+            _fingerprint_cache.clear()
+        _fingerprint_cache[sql] = fingerprint
+    return fingerprint
+
+
+class D1Stats:
+    """Per-statement D1 timings and row counts for one unit of work.
+
+    SafeD1 reports every statement it runs to the event bound with
+    bind_event(). Each is timed around the call (ms) and, when D1 returns
+    result meta (all() and run(); first() returns only the row), counted in
+    D1's own duration and rows read and written. emit_event adds the totals
+    and the D1_SLOWEST_STATEMENTS statements with the highest total time
+    as d1_* fields.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no statements recorded."""
+        # fingerprint -> [count, ms, duration_ms, rows_read, rows_written]
+        self._statements: dict[str, list[float]] = {}
+
+    def record(self, sql: str, elapsed_ms: float, meta: dict[str, Any] | None) -> None:
+        """Add one execution of sql."""
+        key = d1_fingerprint(sql)
+        totals = self._statements.get(key)
+        if totals is None:
+            totals = self._statements[key] = [0, 0.0, 0.0, 0, 0]
+        totals[0] += 1
+        totals[1] += elapsed_ms
+        if meta:
+            totals[2] += meta.get("duration") or 0
+            totals[3] += meta.get("rows_read") or 0
+            totals[4] += meta.get("rows_written") or 0
+
+    def to_fields(self) -> dict[str, Any]:
+        """Event fields: d1_statements, d1_ms, d1_duration_ms, d1_rows_*, d1_slowest."""
+        if not self._statements:
+            return {}
+        totals = self._statements.values()
+        slowest = sorted(self._statements.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            "d1_statements": int(sum(t[0] for t in totals)),
+            "d1_ms": round(sum(t[1] for t in totals), 2),
+            "d1_duration_ms": round(sum(t[2] for t in totals), 2),
+            "d1_rows_read": int(sum(t[3] for t in totals)),
+            "d1_rows_written": int(sum(t[4] for t in totals)),
+            "d1_slowest": [
+                {
+                    "sql": fingerprint,
+                    "count": int(t[0]),
+                    "ms": round(t[1], 2),
+                    "rows_read": int(t[3]),
+                    "rows_written": int(t[4]),
+                }
+                for fingerprint, t in slowest[:D1_SLOWEST_STATEMENTS]
+            ],
+        }
+
+
+# The event D1 statements are attributed to. A ContextVar, not a global: each
+# fetch()/queue()/scheduled() invocation runs in its own asyncio task, and
+# concurrent invocations in one isolate must not share an event.
+_bound_event: ContextVar[Any] = ContextVar("bound_event", default=None)
+
+
+def bind_event(event: Any) -> None:
+    """Attribute D1 statements run by the current task to event."""
+    _bound_event.set(event)
+
+
+def record_d1_statement(sql: str, elapsed_ms: float, meta: dict[str, Any] | None) -> None:
+    """Add a statement's timing to the bound event (no-op when none is bound)."""
+    event = _bound_event.get()
+    if event is not None:
+        event.d1.record(sql, elapsed_ms, meta)
+
+
 # =============================================================================
 # RequestEvent: One event per HTTP request
 # Absorbs: PageServeEvent, SearchEvent, GenerationEvent
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestEvent:
     """Canonical log line for HTTP requests.
 
     Emitted once per fetch() invocation. Contains base request/response fields
-    plus route-specific fields (search_*, generation_*, oauth_*) that are null
-    for non-applicable routes.
+    plus route-specific fields (search_*, generation_*, oauth_*) that stay None,
+    and are left out of the emitted event, for non-applicable routes.
     """
 
     # Identity
@@ -91,6 +399,7 @@ class RequestEvent:
     search_query_length: int | None = None
     search_words_truncated: bool | None = None  # True if query exceeded MAX_SEARCH_WORDS
     search_embedding_ms: float | None = None
+    search_embedding_cache: str | None = None  # "memory", "d1" or "miss"
     search_vectorize_ms: float | None = None
     search_d1_ms: float | None = None
     search_results_total: int | None = None
@@ -101,6 +410,8 @@ class RequestEvent:
     search_query_in_title_matches: int | None = None
     search_semantic_error: str | None = None  # Error from semantic search
     search_keyword_error: str | None = None  # Error from keyword search
+    search_redirected: bool | None = None  # Redirected to canonical cached URL
+    search_semantic_hydrated: int | None = None  # Semantic matches read from D1 (stale metadata)
 
     # === Generation fields (null for non-generation routes) ===
     generation_d1_ms: float | None = None
@@ -116,6 +427,18 @@ class RequestEvent:
     oauth_success: bool | None = None
     oauth_username: str | None = None
 
+    # === Startup fields (first request of each isolate only) ===
+    startup_import_ms: float | None = None  # Total time spent importing main.py
+    startup_imports: dict[str, float] | None = None  # Slowest modules, self time in ms
+    startup_db_init_ms: float | None = None  # Database auto-init, when this request ran it
+    startup_schema_drift_ms: float | None = None  # Part of it spent checking schema drift
+
+    # === Isolate lifecycle (see isolate.py) ===
+    isolate_id: str = ""
+    isolate_started_at: str = ""  # First invocation of the isolate
+    isolate_request_ordinal: int = 0  # 1 for the first request the isolate served
+    isolate_cold: bool = False  # True if this is the isolate's first invocation of any kind
+
     # Outcome
     outcome: str = "success"
     error_type: str | None = None
@@ -125,6 +448,11 @@ class RequestEvent:
     worker_version: str = ""  # Set from DEPLOYMENT_VERSION env var
     deployment_environment: str = ""  # Set from DEPLOYMENT_ENVIRONMENT env var
 
+    # Stage timings, emitted as "spans" (see Trace)
+    trace: Trace = field(default_factory=Trace, init=False, repr=False, compare=False)
+    # D1 statements, emitted as d1_* fields (see D1Stats)
+    d1: D1Stats = field(default_factory=D1Stats, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Initialize timestamp, request_id, and correlation_id if not provided."""
         if not self.timestamp:
@@ -141,7 +469,7 @@ class RequestEvent:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedFetchEvent:
     """Canonical log line for feed fetch operations.
 
@@ -176,6 +504,7 @@ class FeedFetchEvent:
     # Parsing
     entries_found: int = 0
     entries_added: int = 0
+    entries_duplicate: int = 0  # Entries stored as links to another feed's copy
     parse_errors: int = 0
     upsert_failures: int = 0  # Count of failed entry upserts
     content_fetched_count: int = 0  # Count of entries where full content was fetched
@@ -204,11 +533,17 @@ class FeedFetchEvent:
     worker_version: str = ""  # Set from DEPLOYMENT_VERSION env var
     deployment_environment: str = ""  # Set from DEPLOYMENT_ENVIRONMENT env var
     queue_attempt: int = 1
+    isolate_id: str = ""  # See isolate.py
 
     # Cross-boundary correlation
     # Links scheduler -> queue -> feed fetch for tracing feed lifecycle
     correlation_id: str = ""  # Propagated from scheduler through queue
 
+    # Stage timings, emitted as "spans" (see Trace)
+    trace: Trace = field(default_factory=Trace, init=False, repr=False, compare=False)
+    # D1 statements, emitted as d1_* fields (see D1Stats)
+    d1: D1Stats = field(default_factory=D1Stats, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Initialize timestamp, request_id, and feed_domain if not provided."""
         if not self.timestamp:
@@ -228,7 +563,7 @@ class FeedFetchEvent:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulerEvent:
     """Canonical log line for cron execution.
 
@@ -259,13 +594,33 @@ class SchedulerEvent:
     # === Retention phase (absorbed) ===
     retention_d1_ms: float = 0
     retention_vectorize_ms: float = 0
+    retention_feeds_capped: int = 0  # Feeds with new entries checked against the per-feed cap
     retention_entries_scanned: int = 0
     retention_entries_deleted: int = 0
     retention_vectors_deleted: int = 0
     retention_errors: int = 0
+    retention_backlog: int = 0  # Entries left for the next run when the time budget ran out
     retention_days: int = 0
     retention_max_per_feed: int = 0
 
+    # === Index sweep phase ===
+    index_sweep_ms: float = 0
+    index_sweep_candidates: int = 0  # Unindexed or outdated-model entries selected
+    index_sweep_indexed: int = 0
+    index_sweep_failed: int = 0
+
+    # === Content compression phase ===
+    content_compress_ms: float = 0
+    content_compress_candidates: int = 0  # Plain entries long enough to compress
+    content_compress_rewritten: int = 0
+    content_compress_bytes_saved: int = 0
+
+    # === Content archive phase ===
+    archive_ms: float = 0
+    archive_candidates: int = 0  # Entries past ARCHIVE_AFTER_DAYS with content still in D1
+    archive_moved: int = 0
+    archive_failed: int = 0
+
     # Overall
     wall_time_ms: float = 0
 
@@ -277,11 +632,17 @@ class SchedulerEvent:
     # Context / Deployment
     worker_version: str = ""  # Set from DEPLOYMENT_VERSION env var
     deployment_environment: str = ""  # Set from DEPLOYMENT_ENVIRONMENT env var
+    isolate_id: str = ""  # See isolate.py
 
     # Cross-boundary correlation
     # This correlation_id is passed to all feed queue messages for tracing
     correlation_id: str = ""  # Generated per scheduler run, propagated to feeds
 
+    # Stage timings, emitted as "spans" (see Trace)
+    trace: Trace = field(default_factory=Trace, init=False, repr=False, compare=False)
+    # D1 statements, emitted as d1_* fields (see D1Stats)
+    d1: D1Stats = field(default_factory=D1Stats, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Initialize timestamp, request_id, and correlation_id if not provided."""
         if not self.timestamp:
@@ -298,7 +659,7 @@ class SchedulerEvent:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminActionEvent:
     """Canonical log line for admin operations.
 
@@ -351,6 +712,11 @@ class AdminActionEvent:
     worker_version: str = ""  # Set from DEPLOYMENT_VERSION env var
     deployment_environment: str = ""  # Set from DEPLOYMENT_ENVIRONMENT env var
 
+    # Stage timings, emitted as "spans" (see Trace)
+    trace: Trace = field(default_factory=Trace, init=False, repr=False, compare=False)
+    # D1 statements, emitted as d1_* fields (see D1Stats)
+    d1: D1Stats = field(default_factory=D1Stats, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Initialize timestamp and request_id if not provided."""
         if not self.timestamp:
@@ -364,26 +730,48 @@ class AdminActionEvent:
 # =============================================================================
 
 
+#: Static "slow" thresholds (ms), used until an event type has enough history
+SLOW_THRESHOLDS_MS = {
+    "feed_fetch": 10000,  # timeout is 60s
+    "request": 1000,
+    "scheduler": 60000,
+    "admin_action": 30000,
+}
+
+#: Latencies a histogram needs before its quantiles replace SLOW_THRESHOLDS_MS
+ADAPTIVE_MIN_SAMPLES = 100
+
+#: Share of events between the live p95 and p99 that are kept
+TAIL_SAMPLE_RATE = 0.5
+
+# Latency history of every event emit_event() has seen in this isolate
+_latency_histograms = LatencyHistograms()
+
+
 def should_sample(
     event: dict[str, Any],
     debug_feed_ids: list[str] | None = None,
     sample_rate: float = 0.10,
+    histograms: LatencyHistograms | None = None,
 ) -> bool:
     """Tail sampling strategy for high-traffic deployments.
 
     Always keep:
     - Errors (100%)
-    - Slow operations (above p95 thresholds)
+    - Slow operations (above the live p99, or the static thresholds)
     - Zero-result searches
     - Specific feeds being debugged
 
     Sample:
+    - Operations between the live p95 and p99 (TAIL_SAMPLE_RATE)
     - Successful, fast operations (default 10%)
 
     Args:
         event: The event dict to evaluate
         debug_feed_ids: List of feed IDs to always keep
         sample_rate: Sampling rate for successful fast operations (default 10%)
+        histograms: Recent latencies; once the event's route or type has
+            ADAPTIVE_MIN_SAMPLES of them, "slow" means above its p99
 
     Returns:
         True if this event should be emitted, False to drop
@@ -393,17 +781,19 @@ def should_sample(
     if event.get("outcome") == "error":
         return True
 
-    # Always keep slow operations (thresholds based on p95 expectations)
     wall_time_ms = event.get("wall_time_ms", 0)
     event_type = event.get("event_type", "")
 
-    if event_type == "feed_fetch" and wall_time_ms > 10000:  # >10s
-        return True
-    if event_type == "request" and wall_time_ms > 1000:  # >1s for HTTP
-        return True
-    if event_type == "scheduler" and wall_time_ms > 60000:  # >60s for cron
-        return True
-    if event_type == "admin_action" and wall_time_ms > 30000:  # >30s for admin
+    histogram = histograms.get(event, ADAPTIVE_MIN_SAMPLES) if histograms else None
+    thresholds = histogram.tail_thresholds() if histogram else None
+    if thresholds is not None:
+        p95_ms, p99_ms = thresholds
+        # Strictly above: quantiles are capped at the window's max latency
+        if wall_time_ms > p99_ms:
+            return True
+        if wall_time_ms > p95_ms and random.random() < TAIL_SAMPLE_RATE:
+            return True
+    elif wall_time_ms > SLOW_THRESHOLDS_MS.get(event_type, float("inf")):
         return True
 
     # Always keep zero-result searches (important for understanding user needs)
@@ -418,6 +808,52 @@ def should_sample(
     return random.random() < sample_rate
 
 
+#: Fields should_sample() and LatencyHistograms read, copied before deciding
+_SAMPLING_FIELDS = (
+    "event_type",
+    "route",
+    "outcome",
+    "wall_time_ms",
+    "search_results_total",
+    "feed_id",
+)
+
+# Emitted field names per event class, computed on first use
+_emit_fields: dict[type, tuple[str, ...]] = {}
+
+
+def _event_fields(
+    cls: type[RequestEvent | FeedFetchEvent | SchedulerEvent | AdminActionEvent],
+) -> tuple[str, ...]:
+    names = _emit_fields.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls) if f.name not in ("trace", "d1"))
+        _emit_fields[cls] = names
+    return names
+
+
+def event_to_dict(
+    event: RequestEvent | FeedFetchEvent | SchedulerEvent | AdminActionEvent,
+) -> dict[str, Any]:
+    """Flatten an event for emission, expanding its trace and D1 stats.
+
+    Events hold only JSON-ready values, so a shallow copy of the fields is
+    enough. Fields that are None (route-specific fields of other routes,
+    unset errors) are omitted, as are "spans" and the d1_* fields when there
+    is nothing to report.
+    """
+    event_dict = {}
+    for name in _event_fields(type(event)):
+        value = getattr(event, name)
+        if value is not None:
+            event_dict[name] = value
+    spans = event.trace.to_list()
+    if spans:
+        event_dict["spans"] = spans
+    event_dict.update(event.d1.to_fields())
+    return event_dict
+
+
 def emit_event(
     event: (RequestEvent | FeedFetchEvent | SchedulerEvent | AdminActionEvent | dict[str, Any]),
     debug_feed_ids: list[str] | None = None,
@@ -429,6 +865,11 @@ def emit_event(
     Uses Python's standard logging module for output, which integrates better
     with Cloudflare Workers' log capture than raw print() statements.
 
+    Sampling reads only a handful of fields; events are flattened and
+    serialized only if they are kept. Every event's latency, emitted or not,
+    feeds the isolate's rolling histograms, and a latency_summary event
+    carrying them is logged alongside at most once per SUMMARY_INTERVAL_SECONDS.
+
     Args:
         event: The event to emit (dataclass or dict)
         debug_feed_ids: List of feed IDs to always keep
@@ -439,48 +880,24 @@ def emit_event(
         True if event was emitted, False if dropped by sampling
 
     """
-    event_dict = cast(dict[str, Any], event if isinstance(event, dict) else asdict(event))
-
-    if force or should_sample(event_dict, debug_feed_ids, sample_rate):
-        logger.info(json.dumps(event_dict))
-        return True
-    return False
-
-
-# =============================================================================
-# Timer Utility
-# =============================================================================
-
-
-class Timer:
-    """Context manager for timing operations."""
-
-    def __init__(self) -> None:
-        """Initialize timer with zero values."""
-        self.start_time: float = 0
-        self.end_time: float = 0
-        self.elapsed_ms: float = 0
-
-    def __enter__(self) -> "Timer":
-        """Start timing when entering context."""
-        self.start_time = time.perf_counter()
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: object | None,
-    ) -> None:
-        """Stop timing when exiting context."""
-        self.end_time = time.perf_counter()
-        self.elapsed_ms = (self.end_time - self.start_time) * 1000
-
-    def elapsed(self) -> float:
-        """Return elapsed time in milliseconds."""
-        if self.end_time:
-            return self.elapsed_ms
-        return (time.perf_counter() - self.start_time) * 1000
+    if isinstance(event, dict):
+        sampling_fields = event
+    else:
+        sampling_fields = {name: getattr(event, name, None) for name in _SAMPLING_FIELDS}
+
+    emitted = force or should_sample(
+        sampling_fields, debug_feed_ids, sample_rate, histograms=_latency_histograms
+    )
+    _latency_histograms.record(sampling_fields)
+    if emitted:
+        event_dict = event if isinstance(event, dict) else event_to_dict(event)
+        logger.info(json.dumps(event_dict, separators=(",", ":")))
+
+    summary = _latency_histograms.summary_due()
+    if summary is not None:
+        summary["timestamp"] = get_iso_timestamp()
+        logger.info(json.dumps(summary, separators=(",", ":")))
+    return emitted
 
 
 # =============================================================================
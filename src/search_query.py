@@ -7,20 +7,53 @@ the SQL query building logic for search operations:
 - Single-word search
 - Multi-word search (all words must appear)
 
+Two strategies are available: build_fts() matches against the entries_fts
+FTS5 index (migration 006), and build() uses LIKE scans over entries as a
+fallback for databases without FTS5.
+
 The builder handles SQL escaping and returns prepared statements
 with bind parameters to prevent SQL injection.
 
 Usage:
     builder = SearchQueryBuilder(query, is_phrase_search=True)
-    sql, params = builder.build(limit=50)
+    sql, params = builder.build_fts(limit=50)
     result = await db.prepare(sql).bind(*params).all()
 """
 
+import html
+import re
 from dataclasses import dataclass, field
 
 # Maximum number of words to search for (prevents DoS)
 DEFAULT_MAX_SEARCH_WORDS = 10
 
+# A term is only searchable via FTS5 if the tokenizer will produce a token from it
+_RE_TOKEN_CHAR = re.compile(r"\w")
+
+# FTS candidates fetched per result slot. FTS5 walks its doclists newest rowid
+# first and stops early, so common words stay cheap; the candidates are then
+# re-sorted by published_at, which mostly (not strictly) follows insert order.
+FTS_CANDIDATE_FACTOR = 4
+
+# Columns a search result displays. Entry content never leaves D1 on the search
+# path: keyword results carry a bounded snippet instead.
+SEARCH_DISPLAY_COLUMNS = """e.id, e.feed_id, e.url, e.title, e.author, e.published_at,
+                   f.title as feed_title, f.site_url as feed_site_url"""
+
+# Body the LIKE fallback matches: the extracted text, or the HTML for entries
+# stored before migration 009. content may be compressed (see content_codec.py)
+# but is only read when content_text is NULL, which compressed rows never are.
+LIKE_BODY_COLUMN = "COALESCE(e.content_text, e.content)"
+
+# Tokens of body text in each FTS5 snippet (FTS5 allows at most 64)
+SNIPPET_TOKENS = 24
+
+# Control characters FTS5 wraps matched terms in. Body text is plain text
+# extracted from HTML, so they cannot collide with content, and unlike HTML
+# tags they survive escaping intact for snippet_to_html() to replace.
+SNIPPET_MARK_START = "\x02"
+SNIPPET_MARK_END = "\x03"
+
 
 @dataclass
 class SearchQueryResult:
@@ -76,17 +109,51 @@ class SearchQueryBuilder:
         """
         return value.replace("%", "\\%").replace("_", "\\_")
 
+    @staticmethod
+    def fts_prefix_phrase(value: str) -> str:
+        """Quote a term as an FTS5 prefix phrase.
+
+        Double quotes inside the term are doubled, so user input can never
+        inject FTS5 operators (AND/OR/NEAR, column filters). The trailing *
+        makes the last token a prefix match, mirroring LIKE's substring
+        behaviour for partial words ("cloud" matches "Cloudflare").
+
+        Args:
+            value: The term to quote
+
+        Returns:
+            FTS5 phrase string such as '"edge compute"*'
+        """
+        return '"' + value.replace('"', '""') + '"*'
+
+    @property
+    def canonical_query(self) -> str:
+        """Return the query in canonical form for cache keys and URLs.
+
+        Lowercased with whitespace collapsed (matching is case-insensitive),
+        and phrase searches re-quoted with double quotes: `Edge  Compute`
+        becomes `edge compute`, and both `'Edge Compute'` and
+        `"edge compute"` become `"edge compute"`. Parsing the canonical form
+        with from_raw_query() yields the same search.
+        """
+        text = " ".join(self.query.lower().split())
+        return f'"{text}"' if self.is_phrase_search else text
+
     @property
     def words_truncated(self) -> bool:
         """Return whether words were truncated to max limit."""
         return self._words_truncated
 
     def _build_base_select(self) -> str:
-        """Build the base SELECT clause with all needed columns."""
-        return """
-            SELECT e.id, e.feed_id, e.guid, e.url, e.title, e.author,
-                   e.content, e.summary, e.published_at, e.first_seen,
-                   f.title as feed_title, f.site_url as feed_site_url
+        """Build the base SELECT clause with the display columns.
+
+        The LIKE fallback has no plain-text column to cut a snippet from, so
+        its rows carry no snippet rather than the full entry content. Its
+        WHERE clauses skip cross-feed duplicates (entries.canonical_entry_id),
+        which the FTS index and Vectorize never contain.
+        """
+        return f"""
+            SELECT {SEARCH_DISPLAY_COLUMNS}, NULL AS snippet
             FROM entries e
             JOIN feeds f ON e.feed_id = f.id
         """
@@ -95,7 +162,7 @@ class SearchQueryBuilder:
         """Build query for single-term search (phrase or single word).
 
         Both phrase search and single-word search produce the same SQL:
-        a LIKE match against title and content columns.
+        a LIKE match against the title and body (LIKE_BODY_COLUMN).
 
         Args:
             limit: Maximum number of results
@@ -108,8 +175,9 @@ class SearchQueryBuilder:
 
         sql = f"""
             {self._build_base_select()}
-            WHERE e.title LIKE ? ESCAPE '\\'
-               OR e.content LIKE ? ESCAPE '\\'
+            WHERE e.canonical_entry_id IS NULL
+              AND (e.title LIKE ? ESCAPE '\\'
+                   OR {LIKE_BODY_COLUMN} LIKE ? ESCAPE '\\')
             ORDER BY e.published_at DESC
             LIMIT ?
         """
@@ -139,12 +207,15 @@ class SearchQueryBuilder:
 
         # Build WHERE conditions
         title_conditions = " AND ".join(["e.title LIKE ? ESCAPE '\\'" for _ in self._words])
-        content_conditions = " AND ".join(["e.content LIKE ? ESCAPE '\\'" for _ in self._words])
+        content_conditions = " AND ".join(
+            [f"{LIKE_BODY_COLUMN} LIKE ? ESCAPE '\\'" for _ in self._words]
+        )
 
         sql = f"""
             {self._build_base_select()}
-            WHERE ({title_conditions})
-               OR ({content_conditions})
+            WHERE e.canonical_entry_id IS NULL
+              AND (({title_conditions})
+                   OR ({content_conditions}))
             ORDER BY e.published_at DESC
             LIMIT ?
         """
@@ -158,6 +229,65 @@ class SearchQueryBuilder:
             words_truncated=self._words_truncated,
         )
 
+    @property
+    def has_fts_terms(self) -> bool:
+        """Return whether the query contains anything the FTS5 tokenizer can match."""
+        terms = [self.query] if self.is_phrase_search or not self._words else self._words
+        return any(_RE_TOKEN_CHAR.search(term) for term in terms)
+
+    def build_fts(self, limit: int = 50) -> SearchQueryResult:
+        """Build an FTS5 MATCH query against the entries_fts index.
+
+        Phrase searches become a single prefix phrase; word searches become
+        one prefix phrase per word, which FTS5 combines with an implicit AND.
+        Results carry the display columns plus a snippet of the text-only body
+        around the first match (see snippet_to_html()), and are ordered by
+        published_at among the most recently inserted matches (see
+        FTS_CANDIDATE_FACTOR).
+
+        Args:
+            limit: Maximum number of results to return
+
+        Returns:
+            SearchQueryResult with SQL, params, and metadata
+
+        Raises:
+            ValueError: If query is empty or has no searchable terms
+        """
+        if not self.query or not self.query.strip():
+            raise ValueError("Search query cannot be empty")
+        if not self.has_fts_terms:
+            raise ValueError("Search query has no full-text searchable terms")
+
+        if self.is_phrase_search or len(self._words) <= 1:
+            match_expr = self.fts_prefix_phrase(self.query.strip())
+        else:
+            match_expr = " ".join(
+                self.fts_prefix_phrase(word) for word in self._words if _RE_TOKEN_CHAR.search(word)
+            )
+
+        sql = f"""
+            SELECT {SEARCH_DISPLAY_COLUMNS}, matches.snippet
+            FROM (
+                SELECT rowid,
+                       snippet(entries_fts, 1, char(2), char(3), '…', {SNIPPET_TOKENS}) AS snippet
+                FROM entries_fts
+                WHERE entries_fts MATCH ?
+                ORDER BY rowid DESC
+                LIMIT ?
+            ) AS matches
+            JOIN entries e ON e.id = matches.rowid
+            JOIN feeds f ON e.feed_id = f.id
+            ORDER BY e.published_at DESC
+            LIMIT ?
+        """
+
+        return SearchQueryResult(
+            sql=sql,
+            params=(match_expr, limit * FTS_CANDIDATE_FACTOR, limit),
+            words_truncated=self._words_truncated,
+        )
+
     def build(self, limit: int = 50) -> SearchQueryResult:
         """Build the SQL query based on search type.
 
@@ -209,3 +339,24 @@ class SearchQueryBuilder:
             query = query[1:-1].strip()
 
         return cls(query=query, is_phrase_search=is_phrase_search, max_words=max_words)
+
+
+def snippet_to_html(snippet: str | None) -> str | None:
+    """Render an FTS5 snippet as HTML with matched terms in <mark> elements.
+
+    The snippet text is escaped first, then the match markers are swapped
+    for tags, so the result is safe to emit without further escaping.
+
+    Args:
+        snippet: Snippet from build_fts(), or None for rows without one
+
+    Returns:
+        HTML string, or None if there is no snippet text
+    """
+    if not snippet or not snippet.strip():
+        return None
+    return (
+        html.escape(snippet)
+        .replace(SNIPPET_MARK_START, "<mark>")
+        .replace(SNIPPET_MARK_END, "</mark>")
+    )
@@ -0,0 +1,495 @@
+# src/templates_admin.py
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Edit the template files and run: python scripts/build_templates.py
+"""Embedded template sources for the _admin group, imported on first use."""
+
+TEMPLATES = {
+    "admin/dashboard.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Admin - {{ planet.name }}</title>
+    <link rel="icon" href="/static/favicon.ico" sizes="32x32">
+    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">
+    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">
+    <link rel="stylesheet" href="/static/style.css">
+    <style>
+        /* Admin-specific overrides */
+        body { max-width: 1000px; margin: 0 auto; padding: 0; }
+        header { display: flex; justify-content: space-between; align-items: center; text-align: left; }
+        header h1 { margin: 0; }
+        header h1::before { display: none; }
+        .header-actions { display: flex; align-items: center; gap: 0.75rem; }
+        .user-info { display: flex; align-items: center; gap: 0.5rem; font-size: 0.875rem; }
+        .admin-content { padding: 1rem 1.5rem; }
+        .section { margin-bottom: 1.5rem; padding: 1rem; background: var(--bg-tertiary); border-radius: 8px; }
+        .section h2 { margin-top: 0; margin-bottom: 1rem; font-size: 1.125rem; }
+        .add-form { display: flex; gap: 0.5rem; flex-wrap: wrap; }
+        .add-form input[type="url"] { flex: 1; min-width: 200px; padding: 0.5rem; border: 1px solid var(--border-light); border-radius: 4px; font-size: 0.875rem; }
+        .add-form input[type="text"] { width: 200px; padding: 0.5rem; border: 1px solid var(--border-light); border-radius: 4px; font-size: 0.875rem; }
+        .add-form input[type="file"] { padding: 0.5rem; font-size: 0.875rem; }
+        .feed-list { list-style: none; padding: 0; margin: 0; }
+        .feed-item { display: flex; justify-content: space-between; align-items: center; padding: 0.75rem; background: var(--bg-primary); border: 1px solid var(--border-light); margin-bottom: 0.5rem; border-radius: 4px; }
+        .feed-info { flex: 1; }
+        .feed-title { font-weight: bold; font-size: 0.9rem; display: flex; align-items: center; gap: 0.5rem; }
+        .feed-title-text { cursor: pointer; }
+        .feed-title-text:hover { text-decoration: underline; text-decoration-style: dotted; }
+        .feed-title-input { font-weight: bold; font-size: 0.9rem; padding: 0.125rem 0.25rem; border: 1px solid var(--accent); border-radius: 3px; width: 200px; }
+        .feed-title-input:focus { outline: none; box-shadow: 0 0 0 2px rgba(0, 113, 227, 0.2); }
+        .feed-title-actions { display: none; gap: 0.25rem; }
+        .feed-title-actions button { padding: 0.125rem 0.5rem; font-size: 0.75rem; }
+        .feed-title.editing .feed-title-text { display: none; }
+        .feed-title.editing .feed-title-input { display: inline-block; }
+        .feed-title.editing .feed-title-actions { display: flex; }
+        .feed-title .feed-title-input { display: none; }
+        .feed-url { color: var(--text-muted); font-size: 0.8rem; word-break: break-all; }
+        .feed-status { font-size: 0.75rem; margin-top: 0.25rem; }
+        .feed-status.healthy { color: var(--success); }
+        .feed-status.failing { color: var(--error); }
+        .feed-status.disabled { color: var(--text-muted); }
+        .feed-actions { display: flex; gap: 0.5rem; align-items: center; }
+        .toggle { position: relative; display: inline-block; width: 44px; height: 22px; }
+        .toggle input { opacity: 0; width: 0; height: 0; }
+        .toggle-slider { position: absolute; cursor: pointer; inset: 0; background: var(--border-medium); border-radius: 22px; transition: 0.3s; }
+        .toggle-slider:before { position: absolute; content: ""; height: 16px; width: 16px; left: 3px; bottom: 3px; background: white; border-radius: 50%; transition: 0.3s; }
+        .toggle input:checked + .toggle-slider { background: var(--success); }
+        .toggle input:checked + .toggle-slider:before { transform: translateX(22px); }
+        .tabs { display: flex; gap: 0.25rem; margin-bottom: 1rem; border-bottom: 2px solid var(--border-light); }
+        .tab { padding: 0.5rem 1rem; cursor: pointer; border: none; background: none; font-size: 0.875rem; border-bottom: 2px solid transparent; margin-bottom: -2px; color: var(--text-secondary); }
+        .tab:hover { color: var(--text-primary); }
+        .tab.active { border-bottom-color: var(--accent); color: var(--accent); font-weight: 600; }
+        .tab-content { display: none; }
+        .tab-content.active { display: block; }
+        .dlq-item, .audit-item { padding: 0.75rem; background: var(--bg-primary); border: 1px solid var(--border-light); margin-bottom: 0.5rem; border-radius: 4px; }
+        .dlq-item { border-left: 3px solid var(--error); }
+        .audit-item { border-left: 3px solid var(--text-muted); }
+        .audit-action { font-weight: bold; color: var(--text-secondary); font-size: 0.9rem; }
+        .audit-time { color: var(--text-muted); font-size: 0.75rem; }
+        .audit-details { font-size: 0.8rem; color: var(--text-muted); margin-top: 0.25rem; }
+        .empty-state { color: var(--text-muted); font-style: italic; padding: 1rem; text-align: center; }
+        #dlq-list, #audit-list { max-height: 400px; overflow-y: auto; }
+    </style>
+</head>
+<body>
+    <header>
+        <h1><a href="/">{{ planet.name }}</a> <span style="color: var(--text-muted); font-weight: normal; font-size: 0.875rem;">Admin</span></h1>
+        <div class="header-actions">
+            <form action="/admin/regenerate" method="POST" style="margin: 0;">
+                <button type="submit" class="btn" title="Re-fetch all feeds now">Refresh Feeds</button>
+            </form>
+            <button id="reindex-btn" class="btn" title="Rebuild search index" onclick="rebuildSearchIndex()">Reindex</button>
+            <div class="user-info">
+                <span>{{ admin.display_name or admin.github_username }}</span>
+                <form action="/admin/logout" method="POST" style="margin: 0;">
+                    <button type="submit" class="btn btn-danger btn-sm">Logout</button>
+                </form>
+            </div>
+        </div>
+    </header>
+
+    <div class="admin-content">
+
+    <div class="tabs">
+        <button class="tab active" data-tab="feeds">Feeds</button>
+        <button class="tab" data-tab="import">Import OPML</button>
+        <button class="tab" data-tab="dlq">Failed Feeds</button>
+        <button class="tab" data-tab="audit">Audit Log</button>
+    </div>
+
+    <div id="feeds" class="tab-content active">
+        <div class="section">
+            <h2>Add Feed</h2>
+            <form action="/admin/feeds" method="POST" class="add-form">
+                <input type="url" name="url" placeholder="https://example.com/feed.xml" required>
+                <input type="text" name="title" placeholder="Feed title (optional)">
+                <button type="submit" class="btn btn-success">Add Feed</button>
+            </form>
+        </div>
+
+        <div class="section">
+            <h2>Feeds ({{ feeds | length }})</h2>
+            {% if feeds %}
+            <ul class="feed-list">
+                {% for feed in feeds %}
+                <li class="feed-item" data-feed-id="{{ feed.id }}">
+                    <div class="feed-info">
+                        <div class="feed-title" data-feed-id="{{ feed.id }}">
+                            <span class="feed-title-text">{{ feed.title or 'Untitled' }}</span>
+                            <input type="text" class="feed-title-input" value="{{ feed.title or '' }}" placeholder="Enter feed title">
+                            <div class="feed-title-actions">
+                                <button type="button" class="btn btn-success btn-sm save-title-btn">Save</button>
+                                <button type="button" class="btn btn-sm cancel-title-btn">Cancel</button>
+                            </div>
+                        </div>
+                        <div class="feed-url">{{ feed.url }}</div>
+                        <div class="feed-status {% if not feed.is_active %}disabled{% elif feed.consecutive_failures >= 3 %}failing{% else %}healthy{% endif %}">
+                            {% if not feed.is_active %}
+                                Disabled
+                            {% elif feed.consecutive_failures >= 3 %}
+                                Failing ({{ feed.consecutive_failures }} errors)
+                            {% else %}
+                                Healthy
+                            {% endif %}
+                        </div>
+                    </div>
+                    <div class="feed-actions">
+                        <label class="toggle" title="Enable/Disable feed">
+                            <input type="checkbox" class="feed-toggle" data-feed-id="{{ feed.id }}" {% if feed.is_active %}checked{% endif %}>
+                            <span class="toggle-slider"></span>
+                        </label>
+                        <form action="/admin/feeds/{{ feed.id }}" method="POST" style="margin: 0;">
+                            <input type="hidden" name="_method" value="DELETE">
+                            <button type="submit" class="btn btn-danger btn-sm" onclick="return confirm('Delete this feed?')">Delete</button>
+                        </form>
+                    </div>
+                </li>
+                {% endfor %}
+            </ul>
+            {% else %}
+            <p class="empty-state">No feeds yet. Add one above!</p>
+            {% endif %}
+        </div>
+    </div>
+
+    <div id="import" class="tab-content">
+        <div class="section">
+            <h2>Import OPML</h2>
+            <p style="margin-bottom: 1rem; color: #666;">Upload an OPML file to import multiple feeds at once.</p>
+            <form action="/admin/import-opml" method="POST" enctype="multipart/form-data" class="add-form">
+                <input type="file" name="opml" accept=".opml,.xml" required>
+                <button type="submit" class="btn btn-success">Import Feeds</button>
+            </form>
+        </div>
+    </div>
+
+    <div id="dlq" class="tab-content">
+        <div class="section">
+            <h2>Failed Feeds (Dead Letter Queue)</h2>
+            <p style="margin-bottom: 1rem; color: #666;">Feeds that have failed 3 or more times consecutively.</p>
+            <div id="dlq-list">
+                <p class="empty-state">Loading...</p>
+            </div>
+        </div>
+    </div>
+
+    <div id="audit" class="tab-content">
+        <div class="section">
+            <h2>Audit Log</h2>
+            <p style="margin-bottom: 1rem; color: #666;">Recent admin actions.</p>
+            <div id="audit-list">
+                <p class="empty-state">Loading...</p>
+            </div>
+        </div>
+    </div>
+
+    </div><!-- .admin-content -->
+
+    <script src="/static/admin.js"></script>
+</body>
+</html>
+""",
+    "admin/error.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Error - {{ planet.name }} Admin</title>
+    <link rel="icon" href="/static/favicon.ico" sizes="32x32">
+    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">
+    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">
+    <style>
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
+            font-family: system-ui, -apple-system, sans-serif;
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .error-card {
+            background: white;
+            padding: 3rem;
+            border-radius: 12px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+            text-align: center;
+            max-width: 500px;
+            width: 90%;
+        }
+        .icon { font-size: 3rem; margin-bottom: 1rem; }
+        h1 { color: #333; margin-bottom: 0.5rem; font-size: 1.5rem; }
+        .error-message {
+            color: #666;
+            margin-bottom: 2rem;
+            line-height: 1.5;
+        }
+        .actions {
+            display: flex;
+            gap: 1rem;
+            justify-content: center;
+            flex-wrap: wrap;
+        }
+        .btn {
+            display: inline-flex;
+            align-items: center;
+            gap: 0.5rem;
+            padding: 0.875rem 1.5rem;
+            border-radius: 8px;
+            text-decoration: none;
+            font-weight: 500;
+            font-size: 1rem;
+            transition: background 0.2s, transform 0.1s;
+        }
+        .btn:hover { transform: translateY(-1px); }
+        .btn-primary {
+            background: #667eea;
+            color: white;
+        }
+        .btn-primary:hover { background: #5a6fd6; }
+        .btn-secondary {
+            background: #f0f0f0;
+            color: #333;
+        }
+        .btn-secondary:hover { background: #e0e0e0; }
+        .footer { margin-top: 2rem; color: #999; font-size: 0.875rem; }
+        .footer a { color: #667eea; text-decoration: none; }
+    </style>
+</head>
+<body>
+    <div class="error-card">
+        <div class="icon">&#9888;</div>
+        <h1>{{ title or 'Something went wrong' }}</h1>
+        <p class="error-message">{{ message }}</p>
+
+        <div class="actions">
+            {% if back_url %}
+            <a href="{{ back_url }}" class="btn btn-primary">&#8592; Go Back</a>
+            {% endif %}
+            <a href="/admin" class="btn btn-secondary">Admin Dashboard</a>
+        </div>
+
+        <p class="footer">
+            <a href="/">&#8592; Back to {{ planet.name }}</a>
+        </p>
+    </div>
+</body>
+</html>
+""",
+    "admin/health.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Feed Health - {{ planet.name }}</title>
+    <link rel="icon" href="/static/favicon.ico" sizes="32x32">
+    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">
+    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">
+    <link rel="stylesheet" href="/static/style.css">
+    <style>
+        body { max-width: 1200px; margin: 0 auto; padding: 0; }
+        header { display: flex; justify-content: space-between; align-items: center; text-align: left; padding: 1rem 1.5rem; }
+        header h1 { margin: 0; font-size: 1.5rem; }
+        header h1::before { display: none; }
+        .header-actions { display: flex; gap: 0.75rem; }
+        .health-content { padding: 1rem 1.5rem; }
+        .summary-cards { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; margin-bottom: 1.5rem; }
+        .summary-card { padding: 1rem; background: var(--bg-tertiary); border-radius: 8px; text-align: center; }
+        .summary-card .count { font-size: 2rem; font-weight: bold; }
+        .summary-card .label { font-size: 0.875rem; color: var(--text-muted); }
+        .summary-card.healthy .count { color: var(--success); }
+        .summary-card.warning .count { color: #f59e0b; }
+        .summary-card.failing .count { color: var(--error); }
+        .summary-card.inactive .count { color: var(--text-muted); }
+        .health-table { width: 100%; border-collapse: collapse; background: var(--bg-primary); border-radius: 8px; overflow: hidden; }
+        .health-table th, .health-table td { padding: 0.75rem 1rem; text-align: left; border-bottom: 1px solid var(--border-light); }
+        .health-table th { background: var(--bg-tertiary); font-weight: 600; font-size: 0.875rem; }
+        .health-table tr:last-child td { border-bottom: none; }
+        .health-table tr:hover { background: var(--bg-secondary); }
+        .status-badge { padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; }
+        .status-badge.healthy { background: #d1fae5; color: #065f46; }
+        .status-badge.warning { background: #fef3c7; color: #92400e; }
+        .status-badge.failing { background: #fee2e2; color: #991b1b; }
+        .status-badge.inactive { background: #e5e7eb; color: #6b7280; }
+        .feed-title { font-weight: 600; }
+        .feed-url { font-size: 0.75rem; color: var(--text-muted); word-break: break-all; max-width: 300px; }
+        .error-text { font-size: 0.75rem; color: var(--error); max-width: 200px; word-break: break-word; }
+        .time-ago { font-size: 0.875rem; color: var(--text-muted); }
+        .actions-cell { white-space: nowrap; }
+        .actions-cell form { display: inline; }
+        .btn-sm { padding: 0.25rem 0.5rem; font-size: 0.75rem; }
+        .table-responsive { overflow-x: auto; }
+        @media (max-width: 768px) {
+            .feed-url { max-width: 150px; }
+            .health-table th, .health-table td { padding: 0.5rem; font-size: 0.875rem; }
+        }
+    </style>
+</head>
+<body>
+    <header>
+        <h1><a href="/">{{ planet.name }}</a> <span style="color: var(--text-muted); font-weight: normal; font-size: 0.875rem;">Feed Health</span></h1>
+        <div class="header-actions">
+            <a href="/admin" class="btn">Back to Dashboard</a>
+        </div>
+    </header>
+
+    <div class="health-content">
+        <div class="summary-cards">
+            <div class="summary-card">
+                <div class="count">{{ total_feeds }}</div>
+                <div class="label">Total Feeds</div>
+            </div>
+            <div class="summary-card healthy">
+                <div class="count">{{ healthy_count }}</div>
+                <div class="label">Healthy</div>
+            </div>
+            <div class="summary-card warning">
+                <div class="count">{{ warning_count }}</div>
+                <div class="label">Warning</div>
+            </div>
+            <div class="summary-card failing">
+                <div class="count">{{ failing_count }}</div>
+                <div class="label">Failing</div>
+            </div>
+            <div class="summary-card inactive">
+                <div class="count">{{ inactive_count }}</div>
+                <div class="label">Inactive</div>
+            </div>
+        </div>
+
+        <div class="table-responsive">
+            <table class="health-table">
+                <thead>
+                    <tr>
+                        <th>Status</th>
+                        <th>Feed</th>
+                        <th>Last Fetch</th>
+                        <th>Last Entry</th>
+                        <th>Failures</th>
+                        <th>Entries</th>
+                        <th>Actions</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for feed in feeds %}
+                    <tr>
+                        <td>
+                            <span class="status-badge {{ feed.health_status }}">{{ feed.health_status }}</span>
+                        </td>
+                        <td>
+                            <div class="feed-title">{{ feed.title or 'Untitled' }}</div>
+                            <div class="feed-url">{{ feed.url }}</div>
+                            {% if feed.fetch_error and feed.health_status == 'failing' %}
+                            <div class="error-text">{{ feed.fetch_error }}</div>
+                            {% endif %}
+                        </td>
+                        <td class="time-ago">{{ feed.last_fetch_at or 'Never' }}</td>
+                        <td class="time-ago">{{ feed.last_entry_at or 'Never' }}</td>
+                        <td>{{ feed.consecutive_failures or 0 }}</td>
+                        <td>{{ feed.entry_count or 0 }}</td>
+                        <td class="actions-cell">
+                            {% if feed.health_status == 'failing' %}
+                            <form action="/admin/dlq/{{ feed.id }}/retry" method="POST" style="display: inline;">
+                                <button type="submit" class="btn btn-sm">Retry</button>
+                            </form>
+                            {% endif %}
+                            {% if feed.is_active %}
+                            <form action="/admin/feeds/{{ feed.id }}" method="POST" style="display: inline;">
+                                <input type="hidden" name="_method" value="PUT">
+                                <input type="hidden" name="is_active" value="0">
+                                <button type="submit" class="btn btn-sm btn-danger" onclick="return confirm('Deactivate this feed?')">Deactivate</button>
+                            </form>
+                            {% else %}
+                            <form action="/admin/feeds/{{ feed.id }}" method="POST" style="display: inline;">
+                                <input type="hidden" name="_method" value="PUT">
+                                <input type="hidden" name="is_active" value="1">
+                                <button type="submit" class="btn btn-sm btn-success">Activate</button>
+                            </form>
+                            {% endif %}
+                        </td>
+                    </tr>
+                    {% else %}
+                    <tr>
+                        <td colspan="7" style="text-align: center; color: var(--text-muted); padding: 2rem;">
+                            No feeds configured yet.
+                        </td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+    </div>
+</body>
+</html>
+""",
+    "admin/login.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Admin Login - {{ planet.name }}</title>
+    <link rel="icon" href="/static/favicon.ico" sizes="32x32">
+    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">
+    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">
+    <style>
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
+            font-family: system-ui, -apple-system, sans-serif;
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .login-card {
+            background: white;
+            padding: 3rem;
+            border-radius: 12px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+            text-align: center;
+            max-width: 400px;
+            width: 90%;
+        }
+        .logo { font-size: 3rem; margin-bottom: 1rem; }
+        h1 { color: #333; margin-bottom: 0.5rem; font-size: 1.5rem; }
+        .subtitle { color: #666; margin-bottom: 2rem; }
+        .github-btn {
+            display: inline-flex;
+            align-items: center;
+            gap: 0.75rem;
+            background: #24292e;
+            color: white;
+            padding: 0.875rem 1.5rem;
+            border-radius: 8px;
+            text-decoration: none;
+            font-weight: 500;
+            font-size: 1rem;
+            transition: background 0.2s;
+        }
+        .github-btn:hover { background: #1b1f23; }
+        .github-btn svg { width: 20px; height: 20px; fill: currentColor; }
+        .footer { margin-top: 2rem; color: #999; font-size: 0.875rem; }
+        .footer a { color: #667eea; text-decoration: none; }
+    </style>
+</head>
+<body>
+    <div class="login-card">
+        <div class="logo">&#9741;</div>
+        <h1>{{ planet.name }} Admin</h1>
+        <p class="subtitle">Sign in to manage feeds and settings</p>
+
+        <a href="/auth/github" class="github-btn">
+            <svg viewBox="0 0 16 16">
+                <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/>
+            </svg>
+            Sign in with GitHub
+        </a>
+
+        <p class="footer">
+            <a href="/">&#8592; Back to {{ planet.name }}</a>
+        </p>
+    </div>
+</body>
+</html>
+""",
+}
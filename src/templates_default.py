@@ -0,0 +1,294 @@
+# src/templates_default.py
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Edit the template files and run: python scripts/build_templates.py
+"""Embedded template sources for the default group, imported on first use."""
+
+TEMPLATES = {
+    "index.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ planet.name }}</title>
+    <link rel="icon" href="/static/favicon.ico" sizes="32x32">
+    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">
+    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">
+    <link rel="stylesheet" href="/static/style.css">
+    <link rel="alternate" type="application/atom+xml" title="{{ planet.name }} Atom Feed" href="{{ feed_links.atom or '/feed.atom' }}">
+    <link rel="alternate" type="application/rss+xml" title="{{ planet.name }} RSS Feed" href="{{ feed_links.rss or '/feed.rss' }}">
+</head>
+<body>
+    <header>
+        {% if logo %}
+        <a href="/" class="logo-link">
+            <img src="{{ logo.url }}" alt="{{ logo.alt }}" width="{{ logo.width }}" height="{{ logo.height }}" class="logo">
+        </a>
+        {% endif %}
+        <div class="header-text">
+            <h1><a href="/">{{ planet.name }}</a></h1>
+            <p>{{ planet.description }}</p>
+        </div>
+    </header>
+
+    <div class="container">
+        <main>
+            {% for date, day_entries in entries_by_date.items() %}
+            <section class="day">
+                <h2 class="date">{{ date }}</h2>
+                {% for entry in day_entries %}
+                <article>
+                    <h3><a href="{{ entry.url or '#' }}">{{ entry.title or 'Untitled' }}</a></h3>
+                    <p class="meta">
+                        <span class="author">{{ entry.display_author }}</span>
+                        {% if entry.published_at_display %}<span class="date-sep">·</span> <time datetime="{{ entry.published_at }}">{{ entry.published_at_display }}</time>{% endif %}
+                        {% if entry.also_in %}<span class="date-sep">·</span> <span class="also-in">also in {% for source in entry.also_in %}<a href="{{ source.url or source.feed_site_url or '#' }}">{{ source.feed_title or 'another feed' }}</a>{% if not loop.last %}, {% endif %}{% endfor %}</span>{% endif %}
+                    </p>
+                    {% if excerpt_mode %}
+                    <div class="content excerpt"><p>{{ entry.excerpt }}</p></div>
+                    <p class="read-more"><a href="{{ entry.url or '#' }}" data-entry-content="/entry/{{ entry.id }}">Read more</a></p>
+                    {% else %}
+                    <div class="content">{{ entry.content | safe }}</div>
+                    {% endif %}
+                </article>
+                {% endfor %}
+            </section>
+            {% else %}
+            <p>No entries yet.</p>
+            {% endfor %}
+        </main>
+
+        <aside class="sidebar">
+            {% if feed_links and (feed_links.sidebar_rss or feed_links.titles_only or feed_links.planet_planet) %}
+            <div class="sidebar-links">
+                {% if feed_links.sidebar_rss %}<a href="{{ feed_links.sidebar_rss }}">RSS</a>{% endif %}
+                {% if feed_links.titles_only %}<a href="{{ feed_links.titles_only }}">titles only</a>{% endif %}
+                {% if feed_links.planet_planet %}<a href="{{ feed_links.planet_planet }}">Planet Planet</a>{% endif %}
+            </div>
+            {% endif %}
+
+            {% if not is_lite_mode %}
+            <form action="/search" method="GET" class="search-form">
+                <label class="search-label"><strong>Search</strong></label>
+                <input type="search" name="q" placeholder="Search entries..." aria-label="Search entries">
+                <button type="submit">Search</button>
+            </form>
+            {% endif %}
+
+            <h2>Subscriptions</h2>
+            <ul class="feeds">
+                {% for feed in feeds %}
+                <li class="{{ 'feed-inactive' if feed.is_inactive else ('healthy' if feed.is_healthy else 'unhealthy') }}"{% if feed.is_inactive %} title="Feed temporarily unavailable"{% endif %}>
+                    {% if feed.url %}<a href="{{ feed.url }}" class="feed-icon" title="RSS Feed"><svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="currentColor"><circle cx="6.18" cy="17.82" r="2.18"/><path d="M4 4.44v2.83c7.03 0 12.73 5.7 12.73 12.73h2.83c0-8.59-6.97-15.56-15.56-15.56zm0 5.66v2.83c3.9 0 7.07 3.17 7.07 7.07h2.83c0-5.47-4.43-9.9-9.9-9.9z"/></svg></a>{% endif %}
+                    {% if feed.site_url %}<a href="{{ feed.site_url }}">{{ feed.title or 'Untitled' }}</a>{% else %}{{ feed.title or 'Untitled' }}{% endif %}
+                </li>
+                {% else %}
+                <li>No feeds configured</li>
+                {% endfor %}
+            </ul>
+            {% if submission %}
+            <p class="submission-link"><a href="{{ submission.url }}">{{ submission.text }}</a></p>
+            {% endif %}
+
+            {% if related_sites %}
+            {% for section in related_sites %}
+            <h2 class="nav-level-one">{{ section.title }}</h2>
+            <ul class="related-links nav-level-two">
+                {% for link in section.links %}
+                <li class="nav-level-three"><a href="{{ link.url }}">{{ link.name }}</a></li>
+                {% endfor %}
+            </ul>
+            {% endfor %}
+            {% endif %}
+        </aside>
+    </div>
+
+    <footer>
+        <p><a href="{{ feed_links.atom or '/feed.atom' }}">Atom</a> · <a href="{{ feed_links.rss or '/feed.rss' }}">RSS</a> · <a href="{{ feed_links.opml or '/feeds.opml' }}">OPML</a></p>
+        <p>{{ footer_text }}{% if show_admin_link %} · <a href="/admin" style="color: #999; font-size: 0.8em;">Admin</a>{% endif %} · <span class="hint">Press <kbd>?</kbd> for shortcuts</span></p>
+        <p>Last updated: {{ generated_at }}</p>
+    </footer>
+
+    <!-- Keyboard shortcuts help panel -->
+    <div class="shortcuts-backdrop hidden" id="shortcuts-backdrop"></div>
+    <div class="shortcuts-panel hidden" id="shortcuts-panel" role="dialog" aria-labelledby="shortcuts-title" aria-modal="true">
+        <h3 id="shortcuts-title">Keyboard Shortcuts</h3>
+        <dl>
+            <dt><kbd>j</kbd></dt>
+            <dd>Next entry</dd>
+            <dt><kbd>k</kbd></dt>
+            <dd>Previous entry</dd>
+            {% if excerpt_mode %}
+            <dt><kbd>o</kbd></dt>
+            <dd>Expand entry</dd>
+            {% endif %}
+            <dt><kbd>?</kbd></dt>
+            <dd>Toggle this help</dd>
+            <dt><kbd>Esc</kbd></dt>
+            <dd>Close help</dd>
+        </dl>
+        <button type="button" class="close-btn" id="close-shortcuts">Close</button>
+    </div>
+
+    <script src="/static/keyboard-nav.js"></script>
+</body>
+</html>
+""",
+    "titles.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ planet.name }} - Titles Only</title>
+    <link rel="icon" href="/static/favicon.ico" sizes="32x32">
+    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">
+    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">
+    <link rel="stylesheet" href="/static/style.css">
+    <link rel="alternate" type="application/atom+xml" title="{{ planet.name }} Atom Feed" href="{{ feed_links.atom or '/feed.atom' }}">
+    <link rel="alternate" type="application/rss+xml" title="{{ planet.name }} RSS Feed" href="{{ feed_links.rss or '/feed.rss' }}">
+</head>
+<body class="titles-only">
+    <header>
+        {% if logo %}
+        <a href="/" class="logo-link">
+            <img src="{{ logo.url }}" alt="{{ logo.alt }}" width="{{ logo.width }}" height="{{ logo.height }}" class="logo">
+        </a>
+        {% endif %}
+        <div class="header-text">
+            <h1><a href="/">{{ planet.name }}</a></h1>
+            <p>{{ planet.description }}</p>
+        </div>
+    </header>
+
+    <div class="container">
+        <main>
+            <p class="view-toggle"><a href="/">View full content</a></p>
+            {% for date, day_entries in entries_by_date.items() %}
+            <section class="day">
+                <h2 class="date">{{ date }}</h2>
+                {% set current_author = namespace(value='') %}
+                {% for entry in day_entries %}
+                    {% if entry.display_author != current_author.value %}
+                        {% set current_author.value = entry.display_author %}
+                <h3 class="post"><a href="{{ entry.feed_site_url or entry.feed_url or '#' }}">{{ entry.display_author or 'Unknown' }}</a></h3>
+                    {% endif %}
+                <h4 class="entry-title"><a href="{{ entry.url or '#' }}">{{ entry.title or 'Untitled' }}</a></h4>
+                <p class="entry-meta"><em>{% if entry.display_author %}by {{ entry.display_author }} at {% endif %}{{ entry.published_at_display }}</em></p>
+                {% endfor %}
+            </section>
+            {% else %}
+            <p>No entries yet.</p>
+            {% endfor %}
+        </main>
+
+        <aside class="sidebar">
+            {% if feed_links and (feed_links.sidebar_rss or feed_links.titles_only or feed_links.planet_planet) %}
+            <div class="sidebar-links">
+                {% if feed_links.sidebar_rss %}<a href="{{ feed_links.sidebar_rss }}">RSS</a>{% endif %}
+                {% if feed_links.titles_only %}<a href="{{ feed_links.titles_only }}">titles only</a>{% endif %}
+                {% if feed_links.planet_planet %}<a href="{{ feed_links.planet_planet }}">Planet Planet</a>{% endif %}
+            </div>
+            {% endif %}
+
+            {% if not is_lite_mode %}
+            <form action="/search" method="GET" class="search-form">
+                <label class="search-label"><strong>Search</strong></label>
+                <input type="search" name="q" placeholder="Search entries..." aria-label="Search entries">
+                <button type="submit">Search</button>
+            </form>
+            {% endif %}
+
+            <h2>Subscriptions</h2>
+            <ul class="feeds">
+                {% for feed in feeds %}
+                <li class="{{ 'healthy' if feed.is_healthy else 'unhealthy' }}">
+                    {% if feed.url %}<a href="{{ feed.url }}" class="feed-icon" title="RSS Feed"><svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="currentColor"><circle cx="6.18" cy="17.82" r="2.18"/><path d="M4 4.44v2.83c7.03 0 12.73 5.7 12.73 12.73h2.83c0-8.59-6.97-15.56-15.56-15.56zm0 5.66v2.83c3.9 0 7.07 3.17 7.07 7.07h2.83c0-5.47-4.43-9.9-9.9-9.9z"/></svg></a>{% endif %}
+                    {% if feed.site_url %}<a href="{{ feed.site_url }}">{{ feed.title or 'Untitled' }}</a>{% else %}{{ feed.title or 'Untitled' }}{% endif %}
+                </li>
+                {% else %}
+                <li>No feeds configured</li>
+                {% endfor %}
+            </ul>
+            {% if submission %}
+            <p class="submission-link"><a href="{{ submission.url }}">{{ submission.text }}</a></p>
+            {% endif %}
+
+            {% if related_sites %}
+            {% for section in related_sites %}
+            <h2 class="nav-level-one">{{ section.title }}</h2>
+            <ul class="related-links nav-level-two">
+                {% for link in section.links %}
+                <li class="nav-level-three"><a href="{{ link.url }}">{{ link.name }}</a></li>
+                {% endfor %}
+            </ul>
+            {% endfor %}
+            {% endif %}
+        </aside>
+    </div>
+
+    <footer>
+        <p><a href="{{ feed_links.atom or '/feed.atom' }}">Atom</a> · <a href="{{ feed_links.rss or '/feed.rss' }}">RSS</a> · <a href="{{ feed_links.opml or '/feeds.opml' }}">OPML</a></p>
+        <p>{{ footer_text }}{% if show_admin_link %} · <a href="/admin" style="color: #999; font-size: 0.8em;">Admin</a>{% endif %}</p>
+        <p>Last updated: {{ generated_at }}</p>
+    </footer>
+</body>
+</html>
+""",
+    "search.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Search Results - {{ planet.name }}</title>
+    <link rel="icon" href="/static/favicon.ico" sizes="32x32">
+    <link rel="icon" href="/static/favicon.svg" type="image/svg+xml">
+    <link rel="apple-touch-icon" href="/static/apple-touch-icon.png">
+    <link rel="stylesheet" href="/static/style.css">
+</head>
+<body>
+    <header>
+        <h1><a href="/">{{ planet.name }}</a></h1>
+        <p>Search Results</p>
+    </header>
+
+    <div class="container">
+        <main class="search-page">
+            {% if error %}
+            <div class="search-error">
+                <p>{{ error }}</p>
+            </div>
+            {% else %}
+            <h2>Results for "{{ query }}"</h2>
+            {% if words_truncated %}
+            <p class="search-notice">Note: Your search was limited to the first {{ max_search_words }} words.</p>
+            {% endif %}
+            {% if results %}
+            <ul class="search-results">
+                {% for entry in results %}
+                <li>
+                    <h3><a href="{{ entry.url or '#' }}">{{ entry.title or 'Untitled' }}</a></h3>
+                    <p class="meta">{{ entry.display_author }}</p>
+                    {% if entry.snippet_html %}<p class="snippet">{{ entry.snippet_html | safe }}</p>{% endif %}
+                </li>
+                {% endfor %}
+            </ul>
+            {% else %}
+            <p>No results found for "{{ query }}"</p>
+            {% endif %}
+            {% endif %}
+        </main>
+
+        <aside class="sidebar">
+            <form action="/search" method="GET" class="search-form">
+                <input type="search" name="q" placeholder="Search entries..." value="{{ query }}" aria-label="Search entries">
+                <button type="submit">Search</button>
+            </form>
+
+            <p style="margin-top: 1rem;"><a href="/">← Back to home</a></p>
+        </aside>
+    </div>
+
+    <footer><p><a href="/">Back to {{ planet.name }}</a></p></footer>
+</body>
+</html>
+""",
+}
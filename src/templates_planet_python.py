@@ -0,0 +1,321 @@
+# src/templates_planet_python.py
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Edit the template files and run: python scripts/build_templates.py
+"""Embedded template sources for the planet-python group, imported on first use."""
+
+TEMPLATES = {
+    "index.html": """<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">
+<head>
+  <meta http-equiv="content-type" content="text/html; charset=utf-8" />
+  <title>{{ planet.name }}</title>
+  <link rel="stylesheet" type="text/css" href="/static/styles/screen-switcher-default.css" />
+  <link rel="stylesheet" type="text/css" href="/static/styles/netscape4.css" />
+  <link rel="stylesheet" type="text/css" media="print" href="/static/styles/print.css" />
+  <link rel="alternate stylesheet" type="text/css" href="/static/styles/largestyles.css" title="Large" />
+  <link rel="alternate stylesheet" type="text/css" href="/static/styles/defaultfonts.css" title="Default fonts" />
+  <meta name="generator" content="PlanetCF" />
+  <meta name="keywords" content="Python weblog blog blogs blogger weblogger aggregator rss" />
+  <meta name="description" content="{{ planet.description or 'Recent postings from Python-related blogs.' }}" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <link rel="alternate" type="application/rss+xml" title="RSS" href="{{ feed_links.rss or '/feed.rss' }}" />
+  <link rel="alternate" type="application/atom+xml" title="Atom" href="{{ feed_links.atom or '/feed.atom' }}" />
+  <link rel="icon" href="/static/favicon.ico" sizes="32x32" />
+  <style>
+    /* Make images responsive */
+    img {
+        border: 0;
+        height: auto;
+        max-width: 100%;
+        display: block;
+        padding-top: 5px;
+        padding-bottom: 35px;
+    }
+  </style>
+</head>
+
+<body>
+  <!-- Logo -->
+  <h1 id="logoheader">
+    <a href="/" id="logolink" accesskey="1"><img id="logo"
+src="{{ logo.url or '/static/images/python-logo.gif' }}" alt="{{ logo.alt or 'homepage' }}" border="0" /></a>
+  </h1>
+  <!-- Skip to Navigation -->
+  <div class="skiptonav"><a href="#left-hand-navigation" accesskey="2"><img src="/static/images/trans.gif" id="skiptonav" alt="skip to navigation" border="0" width="1" height="1" /></a></div>
+  <div class="skiptonav"><a href="#content-body" accesskey="3"><img src="/static/images/trans.gif" id="skiptocontent" alt="skip to content" border="0" width="1" height="1" /></a></div>
+
+  <div id="content-body">
+    <main id="body-main">
+
+<h1 class="pageheading">{{ planet.name }}</h1>
+
+<p>Last update: {{ generated_at }}
+
+{% for date, day_entries in entries_by_date.items() %}
+
+
+<h2>{{ date_labels[date] }}</h2>
+
+{% set current_author = namespace(value='') %}
+{% for entry in day_entries %}
+{% if entry.display_author != current_author.value %}
+{% set current_author.value = entry.display_author %}
+
+<hr /><h3 class="post"><a href="{{ entry.feed_site_url or entry.feed_url or '#' }}" title="{{ entry.display_author }}">{{ entry.display_author or 'Unknown' }}</a></h3>
+
+{% endif %}
+
+<h4><a href="{{ entry.url or '#' }}">{{ entry.title or 'Untitled' }}</a></h4>
+{% if excerpt_mode %}
+<p class="excerpt">
+{{ entry.excerpt }}</p>
+<p class="read-more"><a href="{{ entry.url or '#' }}" data-entry-content="/entry/{{ entry.id }}">Read more</a></p>
+{% else %}
+<p>
+{{ entry.content | safe }}</p>
+{% endif %}
+<p>
+<em><a href="{{ entry.url or '#' }}">{{ entry.published_at_display }}</a></em>
+{% if entry.also_in %}<br />also in {% for source in entry.also_in %}<a href="{{ source.url or source.feed_site_url or '#' }}">{{ source.feed_title or 'another feed' }}</a>{% if not loop.last %}, {% endif %}{% endfor %}{% endif %}
+</p>
+
+{% endfor %}
+{% else %}
+<p>No entries yet.</p>
+{% endfor %}
+
+
+    </main>
+  </div>
+
+  <div id="left-hand-navigation">
+    <div id="menu">
+      <ul class="level-one">
+          <li>
+          <ul class="level-two">
+             <li><a href="{{ feed_links.rss or '/feed.rss' }}">RSS feed</a></li>
+             <li><a href="/titles">Titles Only</a></li>
+             <li><a href="http://www.planetplanet.org/">Powered by Planet!</a></li>
+          </ul></li>
+          <li>Other Python Planets
+            <ul class="level-two">
+              <li><a href="http://terri.toybox.ca/python-soc/">Python Summer of Code</a></li>
+              <li><a href="http://www.afpy.org/planet/">Planet Python Francophone</a></li>
+              <li><a href="http://planeta.python.org.ar/">Planet Python Argentina</a></li>
+              <li><a href="http://planet.python.org.br/">Planet Python Brasil</a></li>
+              <li><a href="http://pl.python.org/planeta/">Planet Python Poland</a></li>
+            </ul></li>
+          <li>Python Libraries
+          <ul class="level-two">
+            <li><a href="http://planet.laptop.org/">OLPC</a></li>
+            <li><a href="http://planet.pysoy.org/">PySoy</a></li>
+            <li><a href="http://planet.scipy.org/">SciPy</a></li>
+            <li><a href="http://planet.sympy.org/">SymPy</a></li>
+            <li><a href="http://planet.twistedmatrix.com/">Twisted</a></li>
+          </ul></li>
+          <li>Python/Web Planets
+          <ul class="level-two">
+            <li><a href="http://planet.cherrypy.org/">CherryPy</a></li>
+            <li><a href="http://www.djangoproject.com/community/">Django Community</a></li>
+            <li><a href="http://planet.plone.org/">Plone</a></li>
+            <li><a href="http://planet.turbogears.org/">Turbogears</a></li>
+          </ul></li>
+          <li>Other Languages
+          <ul class="level-two">
+            <li><a href="http://planet.haskell.org/">Haskell</a></li>
+            <li><a href="http://planet.lisp.org/">Lisp</a></li>
+            <li><a href="http://planet.parrotcode.org/">Parrot</a></li>
+            <li><a href="http://planet.perl.org/">Perl</a></li>
+            <li><a href="http://planetruby.0x42.net/">Ruby</a></li>
+          </ul></li>
+          <li>Databases
+          <ul class="level-two">
+            <li><a href="http://www.planetmysql.org/">MySQL</a></li>
+            <li><a href="http://planet.postgresql.org/">PostgreSQL</a></li>
+          </ul></li>
+          <li>Subscriptions
+          <ul class="level-two">
+<li><a href="{{ feed_links.opml or '/feeds.opml' }}">[OPML feed]</a></li>
+{% for feed in feeds %}
+<li{% if feed.is_inactive %} class="feed-inactive" title="Feed temporarily unavailable"{% endif %}><a href="{{ feed.site_url or feed.url or '#' }}" title="{{ feed.title }}">{{ feed.title or 'Untitled' }}</a>
+</li>
+{% else %}
+<li>No feeds configured</li>
+{% endfor %}
+
+<li>
+    <i>
+    To request addition or removal,
+    <a href="https://github.com/python/planet">open a PR or issue</a>
+    </i>
+</li>
+          </ul></li>
+      </ul>
+    </div>
+  </div>
+</body>
+</html>
+""",
+    "titles.html": """<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">
+<head>
+  <meta http-equiv="content-type" content="text/html; charset=utf-8" />
+  <title>{{ planet.name }}</title>
+  <link rel="stylesheet" type="text/css" href="/static/styles/screen-switcher-default.css" />
+  <link rel="stylesheet" type="text/css" href="/static/styles/netscape4.css" />
+  <link rel="stylesheet" type="text/css" media="print" href="/static/styles/print.css" />
+  <link rel="alternate stylesheet" type="text/css" href="/static/styles/largestyles.css" title="Large" />
+  <link rel="alternate stylesheet" type="text/css" href="/static/styles/defaultfonts.css" title="Default fonts" />
+  <meta name="generator" content="PlanetCF" />
+  <meta name="keywords" content="Python weblog blog blogs blogger weblogger aggregator rss" />
+  <meta name="description" content="{{ planet.description or 'Recent postings from Python-related blogs.' }}" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <link rel="alternate" type="application/rss+xml" title="RSS" href="{{ feed_links.rss or '/feed.rss' }}" />
+  <link rel="alternate" type="application/atom+xml" title="Atom" href="{{ feed_links.atom or '/feed.atom' }}" />
+  <link rel="icon" href="/static/favicon.ico" sizes="32x32" />
+</head>
+
+<body>
+  <!-- Logo -->
+  <h1 id="logoheader">
+    <a href="/" id="logolink" accesskey="1"><img id="logo"
+src="{{ logo.url or '/static/images/python-logo.gif' }}" alt="{{ logo.alt or 'homepage' }}" border="0" /></a>
+  </h1>
+  <!-- Skip to Navigation -->
+  <div class="skiptonav"><a href="#left-hand-navigation" accesskey="2"><img src="/static/images/trans.gif" id="skiptonav" alt="skip to navigation" border="0" width="1" height="1" /></a></div>
+  <div class="skiptonav"><a href="#content-body" accesskey="3"><img src="/static/images/trans.gif" id="skiptocontent" alt="skip to content" border="0" width="1" height="1" /></a></div>
+
+  <div id="content-body">
+    <main id="body-main">
+
+<h1 class="pageheading">{{ planet.name }}</h1>
+
+<p>Last update: {{ generated_at }}
+
+{% for date, day_entries in entries_by_date.items() %}
+
+
+<h2>{{ date_labels[date] }}</h2>
+
+{% set current_author = namespace(value='') %}
+{% for entry in day_entries %}
+{% if entry.display_author != current_author.value %}
+{% set current_author.value = entry.display_author %}
+
+<hr /><h3 class="post"><a href="{{ entry.feed_site_url or entry.feed_url or '#' }}" title="{{ entry.display_author }}">{{ entry.display_author or 'Unknown' }}</a></h3>
+
+{% endif %}
+
+<h4><a href="{{ entry.url or '#' }}">{{ entry.title or 'Untitled' }}</a></h4>
+<p>
+<em><a href="{{ entry.url or '#' }}">{{ entry.published_at_display }}</a></em>
+</p>
+
+{% endfor %}
+{% else %}
+<p>No entries yet.</p>
+{% endfor %}
+
+
+    </main>
+  </div>
+
+  <div id="left-hand-navigation">
+    <div id="menu">
+      <ul class="level-one">
+          <li>
+          <ul class="level-two">
+             <li><a href="{{ feed_links.rss or '/feed.rss' }}">RSS feed</a></li>
+             <li><a href="/">Full content</a></li>
+             <li><a href="http://www.planetplanet.org/">Powered by Planet!</a></li>
+          </ul></li>
+          <li>Subscriptions
+          <ul class="level-two">
+<li><a href="{{ feed_links.opml or '/feeds.opml' }}">[OPML feed]</a></li>
+{% for feed in feeds %}
+<li><a href="{{ feed.site_url or feed.url or '#' }}" title="{{ feed.title }}">{{ feed.title or 'Untitled' }}</a>
+</li>
+{% else %}
+<li>No feeds configured</li>
+{% endfor %}
+          </ul></li>
+      </ul>
+    </div>
+  </div>
+</body>
+</html>
+""",
+    "search.html": """<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">
+<head>
+  <meta http-equiv="content-type" content="text/html; charset=utf-8" />
+  <title>Search Results - {{ planet.name }}</title>
+  <link rel="stylesheet" type="text/css" href="/static/style.css" />
+  <meta name="generator" content="PlanetCF" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <link rel="icon" href="/static/favicon.ico" sizes="32x32" />
+</head>
+
+<body>
+  <!-- Logo -->
+  <h1 id="logoheader">
+    <a href="/" id="logolink" accesskey="1"><img id="logo"
+src="{{ logo.url or '/static/images/python-logo.gif' }}" alt="{{ logo.alt or 'homepage' }}" border="0" /></a>
+  </h1>
+  <!-- Skip to Navigation -->
+  <div class="skiptonav"><a href="#left-hand-navigation" accesskey="2"><img src="/static/images/trans.gif" id="skiptonav" alt="skip to navigation" border="0" width="1" height="1" /></a></div>
+  <div class="skiptonav"><a href="#content-body" accesskey="3"><img src="/static/images/trans.gif" id="skiptocontent" alt="skip to content" border="0" width="1" height="1" /></a></div>
+
+  <div id="content-body">
+    <main id="body-main">
+
+<h1 class="pageheading">Search Results</h1>
+
+{% if error %}
+<p style="color: #c00;">{{ error }}</p>
+{% else %}
+<h2>Results for "{{ query }}"</h2>
+{% if words_truncated %}
+<p><em>Note: Your search was limited to the first {{ max_search_words }} words.</em></p>
+{% endif %}
+{% if results %}
+{% for entry in results %}
+
+<hr /><h3 class="post"><a href="{{ entry.feed_site_url or entry.feed_url or '#' }}" title="{{ entry.display_author }}">{{ entry.display_author or 'Unknown' }}</a></h3>
+
+<h4><a href="{{ entry.url or '#' }}">{{ entry.title or 'Untitled' }}</a></h4>
+<p>
+<em>{{ entry.published_at_display }}</em>
+</p>
+{% if entry.snippet_html %}<p>{{ entry.snippet_html | safe }}</p>{% endif %}
+
+{% endfor %}
+{% else %}
+<p>No results found for "{{ query }}"</p>
+{% endif %}
+{% endif %}
+
+    </main>
+  </div>
+
+  <div id="left-hand-navigation">
+    <div id="menu">
+      <ul class="level-one">
+          <li>
+          <ul class="level-two">
+             <li><a href="/">Back to home</a></li>
+             <li><a href="{{ feed_links.rss or '/feed.rss' }}">RSS feed</a></li>
+          </ul></li>
+      </ul>
+      <form action="/search" method="get" style="margin: 1em;">
+        <p>
+          <input type="text" name="q" value="{{ query }}" style="width: 10em;" />
+          <input type="submit" value="Search" />
+        </p>
+      </form>
+    </div>
+  </div>
+</body>
+</html>
+""",
+}
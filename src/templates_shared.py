@@ -0,0 +1,116 @@
+# src/templates_shared.py
+# AUTO-GENERATED - DO NOT EDIT DIRECTLY
+# Edit the template files and run: python scripts/build_templates.py
+"""Embedded template sources for the _shared group, imported on first use."""
+
+TEMPLATES = {
+    "feed.atom.xml": """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>{{ planet.name | e }}</title>
+  <subtitle>{{ planet.description | e }}</subtitle>
+  <link href="{{ planet.link }}" rel="alternate"/>
+  <link href="{{ planet.link }}/feed.atom" rel="self"/>
+  <id>{{ planet.link }}/</id>
+  <updated>{{ updated_at }}</updated>
+{% for entry in entries %}
+  <entry>
+    <title>{{ entry.title | e }}</title>
+    <link href="{{ entry.url | e }}" rel="alternate"/>
+    <id>{{ entry.guid | e }}</id>
+    <published>{{ entry.published_at }}Z</published>
+    <author><name>{{ entry.author | e }}</name></author>
+    <content type="html">{{ entry.content | e }}</content>
+  </entry>
+{% endfor %}
+</feed>
+""",
+    "feed.rss.xml": """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>{{ planet.name | e }}</title>
+    <description>{{ planet.description | e }}</description>
+    <link>{{ planet.link }}</link>
+    <atom:link href="{{ planet.link }}/feed.rss" rel="self" type="application/rss+xml"/>
+    <lastBuildDate>{{ last_build_date }}</lastBuildDate>
+{% for entry in entries %}
+    <item>
+      <title>{{ entry.title | e }}</title>
+      <link>{{ entry.url | e }}</link>
+      <guid>{{ entry.guid | e }}</guid>
+      <pubDate>{{ entry.published_at }}</pubDate>
+      <author>{{ entry.author | e }}</author>
+      <description><![CDATA[{{ entry.content_cdata }}]]></description>
+    </item>
+{% endfor %}
+  </channel>
+</rss>
+""",
+    "feed.rss10.xml": """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="{{ planet.link }}">
+    <title>{{ planet.name | e }}</title>
+    <link>{{ planet.link }}</link>
+    <description>{{ planet.description | e }}</description>
+    <items>
+      <rdf:Seq>
+{% for entry in entries %}
+        <rdf:li rdf:resource="{{ entry.url | e }}"/>
+{% endfor %}
+      </rdf:Seq>
+    </items>
+  </channel>
+{% for entry in entries %}
+  <item rdf:about="{{ entry.url | e }}">
+    <title>{{ entry.title | e }}</title>
+    <link>{{ entry.url | e }}</link>
+    <dc:date>{{ entry.published_at_iso }}</dc:date>
+    <dc:creator>{{ entry.author | e }}</dc:creator>
+    <description><![CDATA[{{ entry.content_truncated }}]]></description>
+  </item>
+{% endfor %}
+</rdf:RDF>
+""",
+    "feeds.opml": """<?xml version="1.0" encoding="UTF-8"?>
+<opml version="2.0">
+  <head>
+    <title>{{ planet.name }} Subscriptions</title>
+    <dateCreated>{{ date_created }}</dateCreated>
+    <ownerName>{{ owner_name | e }}</ownerName>
+  </head>
+  <body>
+    <outline text="{{ planet.name }} Feeds" title="{{ planet.name }} Feeds">
+{% for feed in feeds %}
+      <outline type="rss" text="{{ feed.title | e }}" title="{{ feed.title | e }}" xmlUrl="{{ feed.url | e }}" htmlUrl="{{ feed.site_url | e }}"/>
+{% endfor %}
+    </outline>
+  </body>
+</opml>
+""",
+    "foafroll.xml": """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:foaf="http://xmlns.com/foaf/0.1/"
+         xmlns:rss="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <foaf:Group>
+    <foaf:name>{{ planet.name | e }}</foaf:name>
+    <foaf:homepage rdf:resource="{{ planet.link }}"/>
+{% for feed in feeds %}
+    <foaf:member>
+      <foaf:Agent>
+        <foaf:name>{{ feed.title | e }}</foaf:name>
+        <foaf:weblog rdf:resource="{{ feed.site_url | e }}"/>
+        <foaf:member_weblog>
+          <foaf:Document rdf:about="{{ feed.site_url | e }}">
+            <dc:title>{{ feed.title | e }}</dc:title>
+            <rss:channel rdf:resource="{{ feed.url | e }}"/>
+          </foaf:Document>
+        </foaf:member_weblog>
+      </foaf:Agent>
+    </foaf:member>
+{% endfor %}
+  </foaf:Group>
+</rdf:RDF>
+""",
+}
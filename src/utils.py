@@ -5,6 +5,7 @@ Standalone helper functions for logging, validation, response building,
 and content processing. These have no dependencies on the Worker class.
 """
 
+import html as html_lib
 import json
 import logging
 import re
@@ -176,6 +177,73 @@ def normalize_entry_content(content: str, title: str | None) -> str:
     return content
 
 
+# Tag and whitespace patterns used to flatten HTML into plain text.
+# <script>/<style> bodies are dropped entirely rather than leaking into the text.
+_RE_SCRIPT_STYLE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_RE_HTML_TAG = re.compile(r"<[^>]*>?")
+_RE_WHITESPACE = re.compile(r"\s+")
+
+
+def html_to_text(text: str | None) -> str:
+    """Flatten an HTML fragment into plain text.
+
+    Strips tags, decodes entities and collapses whitespace. A dangling,
+    unclosed tag at the end (e.g. from a SQL substr() prefix) is discarded.
+    """
+    if not text:
+        return ""
+    text = _RE_SCRIPT_STYLE.sub(" ", text)
+    text = _RE_HTML_TAG.sub(" ", text)
+    return _RE_WHITESPACE.sub(" ", html_lib.unescape(text)).strip()
+
+
+# Blocks extract_entry_text() drops: code listings (<pre>) and the footers feed
+# generators append to every post, such as WordPress's "The post X appeared
+# first on Y." and "Continue reading" links.
+_RE_CODE_BLOCK = re.compile(r"<pre\b[^>]*>.*?</pre\s*>", re.IGNORECASE | re.DOTALL)
+_RE_BOILERPLATE = re.compile(
+    r"<p\b[^>]*>\s*The post\b(?:(?!</p>).)*?\bappeared first on\b(?:(?!</p>).)*?</p\s*>"
+    r"|<a\b[^>]*>\s*(?:Continue reading|Read more)\b(?:(?!</a>).)*?</a\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# Inline tags (from the sanitizer's allowlist) are removed without a space, so
+# "<b>fast</b>." stays "fast." rather than "fast ."
+_RE_INLINE_TAG = re.compile(r"</?(?:a|abbr|acronym|b|code|em|i|span|strong)\b[^>]*>", re.IGNORECASE)
+
+
+def extract_entry_text(content: str | None) -> str:
+    """Extract the prose of an entry's sanitized HTML as plain text.
+
+    Like html_to_text(), but also drops code blocks and feed boilerplate,
+    which spend embedding and index budget without describing the post.
+    Stored once per entry (entries.content_text) and reused for embeddings,
+    the entries_fts index and search snippets.
+    """
+    if not content:
+        return ""
+    content = _RE_CODE_BLOCK.sub(" ", content)
+    content = _RE_BOILERPLATE.sub(" ", content)
+    content = _RE_INLINE_TAG.sub("", content)
+    return html_to_text(content)
+
+
+def make_excerpt(text: str | None, max_length: int) -> str:
+    """Build a plain-text excerpt from an HTML fragment.
+
+    Flattens the HTML with html_to_text(), then truncates at a word boundary
+    with an ellipsis. The input may itself be a truncated prefix (e.g. a
+    stored summary or a SQL substr() of content).
+    """
+    text = html_to_text(text)
+    if len(text) <= max_length:
+        return text
+    cut = text[:max_length]
+    space = cut.rfind(" ")
+    if space > max_length // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,;:.-") + "…"
+
+
 # =============================================================================
 # Response Builders
 # =============================================================================
@@ -232,9 +300,12 @@ def json_error(message: str, status: int = 400) -> Response:
     return json_response({"error": message}, status=status)
 
 
-def redirect_response(location: str) -> Response:
-    """Create a redirect response."""
-    return Response("", status=302, headers={"Location": location})
+def redirect_response(location: str, cache_max_age: int | None = None) -> Response:
+    """Create a redirect response, optionally cacheable at the edge."""
+    headers = {"Location": location}
+    if cache_max_age is not None:
+        headers["Cache-Control"] = f"public, max-age={cache_max_age}"
+    return Response("", status=302, headers=headers)
 
 
 def feed_response(content: str, content_type: str, cache_max_age: int = 3600) -> Response:
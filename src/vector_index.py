@@ -0,0 +1,210 @@
+# src/vector_index.py
+"""Vector index stored in D1, for instances without Vectorize.
+
+D1VectorIndex has the same query/upsert/deleteByIds interface as
+SafeVectorize, so _search_entries, ingest, the reindex job and retention use
+it unchanged. It is selected with SEARCH_INDEX_BACKEND=d1 when there is no
+SEARCH_INDEX binding, which lets lite mode (no Vectorize) offer semantic
+search on small planets, and gives tests and benchmarks a deterministic
+local index.
+
+Vectors are L2-normalized and quantized to int8 with one scale per vector
+(768 bytes instead of 3 KB of float32), stored base64-encoded in the
+entry_vectors table (migrations/012_add_entry_vectors.sql). Queries score
+against a matrix of every vector loaded once per isolate and reloaded only
+when the table changes, so a search costs one small D1 query plus an
+in-memory scan. The scan uses NumPy when the runtime provides it and a
+pure-Python dot product otherwise.
+"""
+
+import base64
+import json
+import math
+from array import array
+from operator import mul
+from typing import Any
+
+#: int8 range used for quantized components
+_INT8_MAX = 127
+
+# Tri-state like PlanetCF._fts_available: None=untested, False=not installed
+_numpy: Any = None
+
+
+def _load_numpy() -> Any:
+    """Return the numpy module if the runtime has it, else False."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy  # ty: ignore[unresolved-import]
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+
+def _normalize(values: list[float]) -> list[float]:
+    """Scale a vector to unit length (zero vectors are returned unchanged)."""
+    norm = math.sqrt(sum(v * v for v in values))
+    return [v / norm for v in values] if norm else list(values)
+
+
+def quantize_vector(values: list[float]) -> tuple[array, float]:
+    """Quantize a vector to int8 after L2 normalization.
+
+    Returns (components, scale); components * scale approximates the
+    normalized vector, so a dot product with a unit query is its cosine.
+    """
+    unit = _normalize(values)
+    peak = max((abs(v) for v in unit), default=0.0)
+    if not peak:
+        return array("b", bytes(len(unit))), 0.0
+    factor = _INT8_MAX / peak
+    return array("b", (round(v * factor) for v in unit)), peak / _INT8_MAX
+
+
+def encode_quantized(components: array) -> str:
+    """Pack int8 components as base64 for storage in D1."""
+    return base64.b64encode(components.tobytes()).decode("ascii")
+
+
+def decode_quantized(encoded: str) -> array:
+    """Unpack components stored by encode_quantized()."""
+    components = array("b")
+    components.frombytes(base64.b64decode(encoded))
+    return components
+
+
+class VectorMatrix:
+    """Every stored vector as one row-major int8 matrix, scored in bulk."""
+
+    def __init__(self, rows: list[dict[str, Any]], stamp: tuple[int, int]) -> None:
+        """Build the matrix from entry_vectors rows (id, scale, vector, metadata)."""
+        self.stamp = stamp
+        self.ids: list[str] = []
+        self.scales: list[float] = []
+        self.metadata: list[dict[str, Any] | None] = []
+        self.values = array("b")
+        self.dimensions = 0
+        for row in rows:
+            components = decode_quantized(row["vector"])
+            if not self.dimensions:
+                self.dimensions = len(components)
+            if len(components) != self.dimensions:
+                continue
+            self.ids.append(str(row["id"]))
+            self.scales.append(float(row["scale"]))
+            self.metadata.append(json.loads(row["metadata"]) if row.get("metadata") else None)
+            self.values.extend(components)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scores(self, query: list[float]) -> list[float]:
+        """Cosine similarity of the query against every row."""
+        if not self.ids or len(query) != self.dimensions:
+            return []
+        unit = _normalize(query)
+        numpy = _load_numpy()
+        if numpy:
+            matrix = numpy.frombuffer(self.values, dtype=numpy.int8).reshape(
+                len(self.ids), self.dimensions
+            )
+            dots = matrix @ numpy.asarray(unit, dtype=numpy.float32)
+            return (dots * numpy.asarray(self.scales, dtype=numpy.float32)).tolist()
+        view = memoryview(self.values)
+        width = self.dimensions
+        return [
+            sum(map(mul, unit, view[i * width : (i + 1) * width])) * scale
+            for i, scale in enumerate(self.scales)
+        ]
+
+    def top_k(self, query: list[float], k: int) -> list[tuple[int, float]]:
+        """Return (row, score) for the k best rows, highest score first."""
+        ranked = sorted(enumerate(self.scores(query)), key=lambda item: (-item[1], item[0]))
+        return ranked[:k]
+
+
+class D1VectorIndex:
+    """Vectorize-compatible index over the entry_vectors D1 table."""
+
+    # Per-isolate matrix, shared by every request (like the query embedding LRU)
+    _matrix: VectorMatrix | None = None
+
+    def __init__(self, db: Any) -> None:
+        """Initialize with a SafeD1 database."""
+        self._db = db
+
+    async def _stamp(self) -> tuple[int, int]:
+        """Cheap change marker: writes take a new seq, deletes lower the count."""
+        row = await self._db.prepare(
+            "SELECT COUNT(*) AS n, COALESCE(MAX(seq), 0) AS last FROM entry_vectors"
+        ).first()
+        row = row or {}
+        return int(row.get("n") or 0), int(row.get("last") or 0)
+
+    async def _load(self) -> VectorMatrix:
+        """Return the isolate's matrix, reloading it if the table has changed."""
+        stamp = await self._stamp()
+        cached = D1VectorIndex._matrix
+        if cached is not None and cached.stamp == stamp:
+            return cached
+        result = await self._db.prepare(
+            "SELECT id, scale, vector, metadata FROM entry_vectors"
+        ).all()
+        matrix = VectorMatrix(list(result.results), stamp)
+        D1VectorIndex._matrix = matrix
+        return matrix
+
+    async def query(self, vector: Any, options: dict[str, Any]) -> dict[str, Any]:
+        """Return the topK matches by cosine similarity, like Vectorize."""
+        matrix = await self._load()
+        return_metadata = bool(options.get("returnMetadata"))
+        matches = []
+        for row, score in matrix.top_k(list(vector), int(options.get("topK", 10))):
+            match: dict[str, Any] = {"id": matrix.ids[row], "score": score}
+            if return_metadata and matrix.metadata[row] is not None:
+                match["metadata"] = matrix.metadata[row]
+            matches.append(match)
+        return {"matches": matches}
+
+    async def upsert(self, vectors: Any) -> None:
+        """Quantize and store vectors ({id, values, metadata?}), replacing existing ids.
+
+        All rows are written in one D1 batch: one round trip per upsert call
+        instead of one per vector.
+        """
+        statements = []
+        for item in vectors:
+            components, scale = quantize_vector(list(item["values"]))
+            metadata = item.get("metadata")
+            statements.append(
+                self._db.prepare("""
+                INSERT OR REPLACE INTO entry_vectors (id, scale, vector, metadata, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """).bind(
+                    str(item["id"]),
+                    scale,
+                    encode_quantized(components),
+                    json.dumps(metadata) if metadata is not None else None,
+                )
+            )
+        if statements:
+            await self._db.batch(statements)
+
+    async def deleteByIds(self, ids: list[str]) -> None:
+        """Delete vectors by id.
+
+        The ids are bound as one JSON array: D1 allows at most 100 bound
+        parameters, and retention deletes in chunks of 500.
+        """
+        if not ids:
+            return
+        await (
+            self._db.prepare("""
+                DELETE FROM entry_vectors WHERE id IN (SELECT value FROM json_each(?))
+            """)
+            .bind(json.dumps([str(i) for i in ids]))
+            .run()
+        )
@@ -0,0 +1,60 @@
+# src/vector_metadata.py
+"""Vectorize metadata layout for semantic search.
+
+Each entry's vector carries the fields the search results page displays, so
+semantic matches render straight from the Vectorize query response instead
+of a D1 round-trip that pulls full entry content. Vectors written before
+this layout ({title, entry_id} only) or by an older version are treated as
+stale: search hydrates them from D1 and the next reindex rewrites them.
+
+Vectorize allows 10 KiB of metadata per vector; titles and names are capped
+well below that.
+"""
+
+from typing import Any
+
+#: Bump when the field set changes so older vectors are hydrated from D1
+VECTOR_METADATA_VERSION = 2
+
+# Display fields stored on each vector, with per-field length caps
+_DISPLAY_FIELDS: dict[str, int] = {
+    "title": 200,
+    "url": 2000,
+    "author": 200,
+    "published_at": 40,
+    "feed_title": 200,
+    "feed_site_url": 2000,
+}
+
+
+def build_vector_metadata(entry_id: int, fields: dict[str, Any]) -> dict[str, Any]:
+    """Build the metadata stored with an entry's vector.
+
+    Args:
+        entry_id: Database ID of the entry
+        fields: Entry display fields (title, url, author, published_at,
+            feed_title, feed_site_url); missing or empty fields are omitted
+
+    Returns:
+        Metadata dict tagged with VECTOR_METADATA_VERSION
+    """
+    metadata: dict[str, Any] = {"v": VECTOR_METADATA_VERSION, "entry_id": entry_id}
+    for name, max_length in _DISPLAY_FIELDS.items():
+        value = fields.get(name)
+        if value:
+            metadata[name] = str(value)[:max_length]
+    return metadata
+
+
+def entry_from_vector_metadata(entry_id: int, metadata: Any) -> dict[str, Any] | None:
+    """Rebuild a search result entry from vector metadata.
+
+    Returns None when the metadata is missing or from an older layout, in
+    which case the caller hydrates the entry from D1.
+    """
+    if not isinstance(metadata, dict) or metadata.get("v") != VECTOR_METADATA_VERSION:
+        return None
+    entry: dict[str, Any] = {"id": entry_id}
+    for name in _DISPLAY_FIELDS:
+        entry[name] = metadata.get(name)
+    return entry
@@ -9,11 +9,15 @@ This ensures that application code NEVER sees JsProxy objects - they are
 converted at the boundary layer before reaching business logic.
 """
 
+import json
 import logging
+import time
 from typing import Any
 from urllib.parse import urlencode
 
-import httpx
+from content_codec import EntryRow
+from observability import record_d1_statement
+from vector_index import D1VectorIndex
 
 logger = logging.getLogger("src.main")
 
@@ -264,11 +268,16 @@ def _to_d1_value(value: Any) -> Any:
 
 
 class SafeD1Statement:
-    """Wrapper for D1 prepared statement that auto-converts results to Python."""
+    """Wrapper for D1 prepared statement that auto-converts results to Python.
 
-    def __init__(self, stmt: Any) -> None:
-        """Initialize with a D1 prepared statement."""
+    Each execution is timed and reported, with D1's result meta, to the
+    event bound with observability.bind_event() (see D1Stats).
+    """
+
+    def __init__(self, stmt: Any, sql: str = "") -> None:
+        """Initialize with a D1 prepared statement and the SQL it was prepared from."""
         self._stmt = stmt
+        self._sql = sql
 
     def bind(self, *args: Any) -> "SafeD1Statement":
         """Bind parameters and return self for chaining.
@@ -285,7 +294,12 @@ class SafeD1Statement:
 
     async def first(self) -> dict[str, Any] | None:
         """Execute and return first result as Python dict."""
-        result = await self._stmt.first()
+        start = time.perf_counter()
+        try:
+            result = await self._stmt.first()
+        finally:
+            # first() resolves to the row alone: D1 returns no meta for it
+            record_d1_statement(self._sql, (time.perf_counter() - start) * 1000, None)
         return _to_py_safe(result)
 
     async def all(self) -> Any:
@@ -294,7 +308,12 @@ class SafeD1Statement:
         Returns an object with .results (list[dict]) and .success (bool)
         to match the D1 API that callers expect.
         """
-        result = await self._stmt.all()
+        start = time.perf_counter()
+        result = None
+        try:
+            result = await self._stmt.all()
+        finally:
+            record_d1_statement(self._sql, (time.perf_counter() - start) * 1000, _d1_meta(result))
 
         # Create result object with attributes (to match D1 API)
         class D1Result:
@@ -309,7 +328,24 @@ class SafeD1Statement:
 
     async def run(self) -> Any:
         """Execute statement (for INSERT/UPDATE/DELETE)."""
-        return await self._stmt.run()
+        start = time.perf_counter()
+        result = None
+        try:
+            result = await self._stmt.run()
+        finally:
+            record_d1_statement(self._sql, (time.perf_counter() - start) * 1000, _d1_meta(result))
+        return result
+
+
+def _d1_meta(result: Any) -> dict[str, Any] | None:
+    """Extract D1's result meta (duration, rows_read, rows_written), if any."""
+    if result is None:
+        return None
+    meta = result.get("meta") if isinstance(result, dict) else getattr(result, "meta", None)
+    if meta is None or _is_js_undefined(meta):
+        return None
+    meta = _to_py_safe(meta)
+    return meta if isinstance(meta, dict) else None
 
 
 class SafeD1:
@@ -321,11 +357,29 @@ class SafeD1:
 
     def prepare(self, sql: str) -> SafeD1Statement:
         """Prepare a SQL statement with automatic result conversion."""
-        return SafeD1Statement(self._db.prepare(sql))
+        return SafeD1Statement(self._db.prepare(sql), sql)
 
     async def exec(self, sql: str) -> Any:
         """Execute raw SQL (for multi-statement DDL like schema creation)."""
-        return await self._db.exec(sql)
+        start = time.perf_counter()
+        try:
+            return await self._db.exec(sql)
+        finally:
+            record_d1_statement(sql, (time.perf_counter() - start) * 1000, None)
+
+    async def batch(self, statements: list[SafeD1Statement]) -> Any:
+        """Run bound statements in one round trip, as a single transaction.
+
+        Recorded as one statement (the first one's SQL): D1 reports the
+        batch's timing as a whole.
+        """
+        if not statements:
+            return []
+        start = time.perf_counter()
+        try:
+            return await self._db.batch(_to_js_value([s._stmt for s in statements]))
+        finally:
+            record_d1_statement(statements[0]._sql, (time.perf_counter() - start) * 1000, None)
 
 
 class SafeAI:
@@ -381,6 +435,31 @@ class SafeQueue:
         return await self._queue.send(message)
 
 
+class SafeR2:
+    """Wrapper for an R2 bucket that exchanges object bodies as Python bytes."""
+
+    def __init__(self, bucket: Any) -> None:
+        """Initialize with an R2 bucket binding."""
+        self._bucket = bucket
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the object's body, or None if it doesn't exist."""
+        obj = await self._bucket.get(key)
+        if obj is None or _is_js_undefined(obj):
+            return None
+        body = await obj.arrayBuffer()
+        return bytes(body.to_py()) if HAS_PYODIDE else bytes(body)
+
+    async def put(self, key: str, data: bytes) -> Any:
+        """Write an object, replacing any existing one."""
+        # to_js() converts Python buffers to a Uint8Array
+        return await self._bucket.put(key, _to_js_value(data))
+
+    async def delete(self, keys: list[str]) -> Any:
+        """Delete objects (R2 accepts up to 1000 keys per call)."""
+        return await self._bucket.delete(_to_js_value(keys))
+
+
 class HttpResponse:
     """Normalized HTTP response for boundary layer."""
 
@@ -471,7 +550,9 @@ async def safe_http_fetch(
 
         return HttpResponse(status_code, text, response_headers, final_url)
     else:
-        # Test environment: Use httpx
+        # Test environment: Use httpx (imported here so Pyodide never loads it)
+        import httpx
+
         async with httpx.AsyncClient(follow_redirects=True, timeout=timeout_seconds) as client:
             response = await client.request(method, url, headers=headers, data=data)
             return HttpResponse(
@@ -504,11 +585,18 @@ class SafeEnv:
         self.AI = SafeAI(ai) if ai else None
         search_index = getattr(env, "SEARCH_INDEX", None)
         self.SEARCH_INDEX = SafeVectorize(search_index) if search_index else None
+        # Without Vectorize, SEARCH_INDEX_BACKEND=d1 serves the same interface from D1
+        backend = str(getattr(env, "SEARCH_INDEX_BACKEND", None) or "").lower()
+        if self.SEARCH_INDEX is None and backend == "d1":
+            self.SEARCH_INDEX = D1VectorIndex(self.DB)
         # Queue bindings are optional (not supported in wrangler dev --remote)
         queue = getattr(env, "FEED_QUEUE", None)
         self.FEED_QUEUE = SafeQueue(queue) if queue else None
         dlq = getattr(env, "DEAD_LETTER_QUEUE", None)
         self.DEAD_LETTER_QUEUE = SafeQueue(dlq) if dlq else None
+        # R2 bucket for archived entry content (optional, see content_archive.py)
+        archive = getattr(env, "ARCHIVE", None)
+        self.ARCHIVE = SafeR2(archive) if archive else None
 
     def __getattr__(self, name: str) -> Any:
         """Pass through other environment variables (strings, etc.)."""
@@ -572,28 +660,57 @@ def entry_row_from_js(row: Any) -> dict[str, Any]:
     """Convert a single D1 entry row (JsProxy) to Python dict.
 
     Ensures all values are proper Python types, not JsProxy objects.
+    Compressed content (see content_codec.py) is decoded on first access.
     """
     if row is None:
         return {}
     py_row = _to_py_safe(row)
     if not py_row:
         return {}
-    return {
-        "id": int(py_row.get("id", 0)),
-        "feed_id": int(py_row.get("feed_id", 0)),
-        "guid": _safe_str(py_row.get("guid")) or "",
-        "url": _safe_str(py_row.get("url")) or "",
-        "title": _safe_str(py_row.get("title")) or "",
-        "author": _safe_str(py_row.get("author")),
-        "content": _safe_str(py_row.get("content")) or "",
-        "summary": _safe_str(py_row.get("summary")),
-        "published_at": _safe_str(py_row.get("published_at")) or "",
-        "created_at": _safe_str(py_row.get("created_at")) or "",
-        "first_seen": _safe_str(py_row.get("first_seen")),
-        # Joined fields
-        "feed_title": _safe_str(py_row.get("feed_title")),
-        "feed_site_url": _safe_str(py_row.get("feed_site_url")),
-    }
+    return EntryRow(
+        {
+            "id": int(py_row.get("id", 0)),
+            "feed_id": int(py_row.get("feed_id", 0)),
+            "guid": _safe_str(py_row.get("guid")) or "",
+            "url": _safe_str(py_row.get("url")) or "",
+            "title": _safe_str(py_row.get("title")) or "",
+            "author": _safe_str(py_row.get("author")),
+            "content": _safe_str(py_row.get("content")) or "",
+            "content_text": _safe_str(py_row.get("content_text")),
+            "content_archived_at": _safe_str(py_row.get("content_archived_at")),
+            "summary": _safe_str(py_row.get("summary")),
+            "published_at": _safe_str(py_row.get("published_at")) or "",
+            "created_at": _safe_str(py_row.get("created_at")) or "",
+            "first_seen": _safe_str(py_row.get("first_seen")),
+            # Failed index attempts (index sweep only, migration 017)
+            "index_attempts": int(py_row.get("index_attempts") or 0),
+            # Joined fields
+            "feed_title": _safe_str(py_row.get("feed_title")),
+            "feed_site_url": _safe_str(py_row.get("feed_site_url")),
+            # FTS5 snippet (keyword search only)
+            "snippet": _safe_str(py_row.get("snippet")),
+            # Other feeds that carried the entry (homepage only, migration 016)
+            "also_in": _also_in_sources(py_row.get("also_in")),
+        }
+    )
+
+
+def _also_in_sources(value: Any) -> list[dict[str, str]]:
+    """Parse the also_in JSON array of {feed_title, feed_site_url, url} objects."""
+    raw = _safe_str(value)
+    if not raw:
+        return []
+    try:
+        sources = json.loads(raw)
+    except ValueError:
+        return []
+    if not isinstance(sources, list):
+        return []
+    return [
+        {key: _safe_str(source.get(key)) or "" for key in ("feed_title", "feed_site_url", "url")}
+        for source in sources
+        if isinstance(source, dict)
+    ]
 
 
 def entry_rows_from_d1(results: Any) -> list[dict[str, Any]]:
@@ -127,6 +127,10 @@ function rebuildSearchIndex() {
         if (!r.ok) throw new Error('Server error: ' + r.status);
         return r.json();
     })
+    .then(function(data) {
+        // Large planets reindex in the background; poll until the job finishes
+        return data.status === 'running' ? pollReindexStatus(btn, data) : data;
+    })
     .then(function(data) {
         btn.disabled = false;
         btn.style.opacity = '1';
@@ -146,6 +150,21 @@ function rebuildSearchIndex() {
     });
 }
 
+var REINDEX_POLL_INTERVAL_MS = 2000;
+
+function pollReindexStatus(btn, data) {
+    btn.textContent = 'Reindexing... (' + (data.indexed + data.failed) + '/' + data.total + ')';
+    return new Promise(function(resolve) { setTimeout(resolve, REINDEX_POLL_INTERVAL_MS); })
+        .then(function() { return fetch('/admin/reindex/status'); })
+        .then(function(r) {
+            if (!r.ok) throw new Error('Server error: ' + r.status);
+            return r.json();
+        })
+        .then(function(next) {
+            return next.status === 'running' ? pollReindexStatus(btn, next) : next;
+        });
+}
+
 // =============================================================================
 // Event Handlers (attached on DOMContentLoaded)
 // =============================================================================
@@ -242,6 +261,7 @@ if (typeof module !== 'undefined' && module.exports) {
         loadAuditLog,
         escapeHtml,
         rebuildSearchIndex,
+        pollReindexStatus,
         initAdminDashboard,
         initTitleEditing
     };
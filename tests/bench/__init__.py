@@ -0,0 +1,7 @@
+# tests/bench/__init__.py
+"""
+Performance benchmarks for the Worker's hot paths.
+
+Opt-in (RUN_BENCHMARKS=1) and compared against stored baselines; see
+tests/bench/conftest.py.
+"""
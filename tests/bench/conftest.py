@@ -0,0 +1,337 @@
+# tests/bench/conftest.py
+"""Benchmark harness, synthetic planets and the regression gate.
+
+Benchmarks are skipped unless RUN_BENCHMARKS=1. Each one times its target
+with the ``bench`` fixture: the median of BENCH_ROUNDS rounds after one
+warm-up run, with per-round setup (such as copying a database the target
+mutates) excluded. Medians are divided by the median time of a fixed
+pure-Python reference workload measured in the same session, so the stored
+baselines (baselines.json) carry over between machines of different speeds
+to within the threshold.
+
+Benchmarks using the planet fixture run once per scale in BENCH_SCALES. Each scale is a
+synthetic planet in in-memory SQLite (SqliteD1, every migration applied):
+feeds x entries, published over the last 120 days, with 500-word-ish HTML
+entries, so the default 90-day retention and 100-per-feed cap have work.
+
+Configuration (override via environment variables):
+    RUN_BENCHMARKS   Set to "1" to run the suite
+    BENCH_SCALES     Comma-separated scales from SCALES, or "all" (default: 50x10k)
+    BENCH_ROUNDS     Timed runs per benchmark (default: 7)
+    BENCH_THRESHOLD  Fail a benchmark whose relative cost exceeds its baseline
+                     by this factor (default: 1.5)
+    BENCH_SAVE       Set to "1" to write this run's results to baselines.json
+                     instead of checking them
+
+Usage:
+    RUN_BENCHMARKS=1 uv run pytest tests/bench -q
+    RUN_BENCHMARKS=1 BENCH_SCALES=all BENCH_SAVE=1 uv run pytest tests/bench -q
+"""
+
+import json
+import math
+import os
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.main import Default
+from tests.conftest import MockEnv, MockQueue, MockVectorize, SqliteD1
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RUN_BENCHMARKS = os.environ.get("RUN_BENCHMARKS") == "1"
+BENCH_SAVE = os.environ.get("BENCH_SAVE") == "1"
+BENCH_ROUNDS = int(os.environ.get("BENCH_ROUNDS", "7"))
+BENCH_THRESHOLD = float(os.environ.get("BENCH_THRESHOLD", "1.5"))
+
+#: Fast synchronous targets are repeated until one timed round lasts this long
+MIN_ROUND_MS = 20.0
+
+#: Planet scales: name -> (feeds, entries)
+SCALES = {
+    "50x10k": (50, 10_000),
+    "500x100k": (500, 100_000),
+    "5000x100k": (5_000, 100_000),
+}
+
+_scales_env = os.environ.get("BENCH_SCALES", "50x10k")
+BENCH_SCALES = list(SCALES) if _scales_env == "all" else _scales_env.split(",")
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+#: Marker applied to every benchmark module
+requires_benchmarks = pytest.mark.skipif(
+    not RUN_BENCHMARKS, reason="Benchmarks are opt-in: set RUN_BENCHMARKS=1"
+)
+
+
+# =============================================================================
+# Synthetic Planets
+# =============================================================================
+
+WORDS = [
+    "cloudflare", "workers", "python", "edge", "compute", "durable", "objects",
+    "storage", "queue", "error", "handling", "latency", "cache", "request",
+    "response", "database", "index", "search", "vector", "embedding", "deploy",
+    "release", "performance", "memory", "isolate", "startup", "template",
+    "render", "feed", "entry", "author", "planet", "blog", "post", "async",
+    "pyodide", "snapshot", "sqlite", "migration", "retention",
+]  # fmt: skip
+
+#: Entries are published evenly over this many days before now
+PUBLISHED_SPAN_DAYS = 120
+
+
+def words(seed: int, count: int) -> list[str]:
+    """Deterministic word sequence (a linear congruential generator): same seed, same words."""
+    state = seed * 2654435761 % 2**32
+    sequence = []
+    for _ in range(count):
+        state = (state * 1103515245 + 12345) % 2**31
+        sequence.append(WORDS[(state >> 16) % len(WORDS)])
+    return sequence
+
+
+def entry_html(seed: int, paragraphs: int = 4) -> str:
+    """Entry HTML with links, inline code and a code block (~3 KB)."""
+    parts = []
+    for p in range(paragraphs):
+        text = words(seed + p, 60)
+        text[5] = f'<a href="https://example.com/{text[5]}/{seed}">{text[5]}</a>'
+        text[20] = f"<code>{text[20]}()</code>"
+        parts.append(f"<p>{' '.join(text)}.</p>")
+    parts.append(f"<pre><code>{' = '.join(words(seed, 4))}</code></pre>")
+    return "\n".join(parts)
+
+
+def build_planet(feeds: int, entries: int) -> SqliteD1:
+    """In-memory planet with the given number of feeds and entries."""
+    db = SqliteD1()
+    now = datetime.now(UTC)
+    recent = now.strftime("%Y-%m-%d %H:%M:%S")
+    db.conn.executemany(
+        "INSERT INTO feeds (id, url, title, site_url, last_success_at, is_active) "
+        "VALUES (?, ?, ?, ?, ?, 1)",
+        [
+            (
+                feed_id,
+                f"https://blog{feed_id}.example.com/feed.xml",
+                f"Blog {feed_id}",
+                f"https://blog{feed_id}.example.com/",
+                recent,
+            )
+            for feed_id in range(1, feeds + 1)
+        ],
+    )
+    step = timedelta(days=PUBLISHED_SPAN_DAYS) / entries
+    rows = []
+    for entry_id in range(1, entries + 1):
+        html = entry_html(entry_id)
+        title = " ".join(words(entry_id, 6)).title()
+        published = (now - step * entry_id).strftime("%Y-%m-%d %H:%M:%S")
+        rows.append(
+            (
+                entry_id,
+                entry_id % feeds + 1,
+                f"guid-{entry_id}",
+                f"https://example.com/posts/{entry_id}",
+                title,
+                f"Author {entry_id % 97}",
+                html,
+                " ".join(words(entry_id, 240)),
+                " ".join(words(entry_id, 40)),
+                published,
+                published,
+            )
+        )
+    db.conn.executemany(
+        "INSERT INTO entries (id, feed_id, guid, url, title, author, content, content_text, "
+        "summary, published_at, first_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    db.conn.execute(
+        "INSERT INTO entries_fts (rowid, title, body) SELECT id, title, content_text FROM entries"
+    )
+    db.conn.execute("INSERT INTO retention_dirty_feeds (feed_id) SELECT id FROM feeds")
+    db.conn.commit()
+    return db
+
+
+@pytest.fixture(scope="session", params=BENCH_SCALES)
+def planet(request: pytest.FixtureRequest) -> Iterator[SqliteD1]:
+    """Synthetic planet for each selected scale; clone it before mutating.
+
+    Session-scoped so pytest groups benchmarks by scale and holds one planet
+    in memory at a time.
+    """
+    scale = request.param
+    if scale not in SCALES:
+        pytest.fail(f"Unknown BENCH_SCALES entry {scale!r}; choose from {', '.join(SCALES)}")
+    db = build_planet(*SCALES[scale])
+    yield db
+    db.conn.close()
+
+
+def make_worker(db: SqliteD1) -> Default:
+    """Worker over db with mock queues and an empty vector index."""
+    worker = Default()
+    worker.env = MockEnv(
+        DB=db,
+        FEED_QUEUE=MockQueue(),
+        DEAD_LETTER_QUEUE=MockQueue(),
+        SEARCH_INDEX=MockVectorize(),
+        AI=None,
+    )
+    return worker
+
+
+# =============================================================================
+# Timing and Regression Gate
+# =============================================================================
+
+
+def _reference_workload() -> None:
+    """Fixed pure-Python work (dicts, strings, sorting, JSON) used to normalize timings."""
+    tokens = [f"w{i % 97}" for i in range(20_000)]
+    counts: dict[str, int] = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    json.dumps(sorted(counts.items()))
+    " ".join(tokens).upper().split()
+
+
+def _median_ms(func: Callable[[], Any], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+_calibration: dict[str, float] = {}
+_results: dict[str, dict[str, float]] = {}
+
+
+def _calibration_ms() -> float:
+    if "ms" not in _calibration:
+        _reference_workload()
+        _calibration["ms"] = _median_ms(_reference_workload, 15)
+    return _calibration["ms"]
+
+
+def _load_baselines() -> dict[str, dict[str, float]]:
+    if not BASELINES_PATH.exists():
+        return {}
+    return json.loads(BASELINES_PATH.read_text())["benchmarks"]
+
+
+class Bench:
+    """Times one benchmark and checks it against its stored baseline."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the benchmark named name (its test id)."""
+        self.name = name
+
+    def __call__(self, func: Callable[[], Any], setup: Callable[[], Any] | None = None) -> Any:
+        """Time func(); setup's return value, if given, is passed to func instead.
+
+        Without setup, func runs enough times per round for the round to last
+        MIN_ROUND_MS, so sub-millisecond targets are not lost in timer noise.
+        """
+        timings = []
+        if setup:
+            for round_number in range(BENCH_ROUNDS + 1):
+                arg = setup()
+                start = time.perf_counter()
+                result = func(arg)
+                if round_number:  # the first run warms caches and is not counted
+                    timings.append((time.perf_counter() - start) * 1000)
+            self._record(statistics.median(timings))
+            return result
+        start = time.perf_counter()
+        result = func()  # warm-up, also sizing the inner loop
+        warmup_ms = (time.perf_counter() - start) * 1000
+        loops = max(1, math.ceil(MIN_ROUND_MS / max(warmup_ms, 0.001)))
+        for _ in range(BENCH_ROUNDS):
+            start = time.perf_counter()
+            for _ in range(loops):
+                result = func()
+            timings.append((time.perf_counter() - start) * 1000 / loops)
+        self._record(statistics.median(timings))
+        return result
+
+    async def run_async(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        setup: Callable[[], Any] | None = None,
+    ) -> Any:
+        """Time await func() as __call__ times func(), without the inner loop."""
+        timings = []
+        result = None
+        for round_number in range(BENCH_ROUNDS + 1):
+            arg = setup() if setup else None
+            start = time.perf_counter()
+            result = await (func(arg) if setup else func())
+            if round_number:  # the first run warms caches and is not counted
+                timings.append((time.perf_counter() - start) * 1000)
+        self._record(statistics.median(timings))
+        return result
+
+    def _record(self, median_ms: float) -> None:
+        relative = median_ms / _calibration_ms()
+        _results[self.name] = {"ms": round(median_ms, 3), "relative": round(relative, 3)}
+        baseline = _load_baselines().get(self.name)
+        if BENCH_SAVE or baseline is None:
+            return
+        ratio = relative / baseline["relative"]
+        if ratio > BENCH_THRESHOLD:
+            pytest.fail(
+                f"{self.name}: {median_ms:.2f} ms is {ratio:.2f}x its baseline "
+                f"(threshold {BENCH_THRESHOLD}x, baseline {baseline['ms']:.2f} ms)"
+            )
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Bench:
+    """Benchmark timer for the current test."""
+    return Bench(request.node.nodeid.split("::", 1)[1])
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """With BENCH_SAVE=1, merge this run's results into baselines.json."""
+    if not (BENCH_SAVE and _results):
+        return
+    benchmarks = _load_baselines()
+    benchmarks.update(_results)
+    data = {
+        "calibration_ms": round(_calibration_ms(), 3),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    BASELINES_PATH.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Print each benchmark's median and its cost relative to the baseline."""
+    if not _results:
+        return
+    baselines = _load_baselines()
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'benchmark':<55} {'median ms':>10} {'vs baseline':>12}")
+    for name, result in sorted(_results.items()):
+        baseline = baselines.get(name)
+        if BENCH_SAVE:
+            versus = "saved"
+        elif baseline:
+            versus = f"{result['relative'] / baseline['relative']:.2f}x"
+        else:
+            versus = "new"
+        terminalreporter.write_line(f"{name:<55} {result['ms']:>10.2f} {versus:>12}")
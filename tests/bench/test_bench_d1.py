@@ -0,0 +1,39 @@
+# tests/bench/test_bench_d1.py
+"""Benchmarks for D1 query paths: keyword search and retention."""
+
+import pytest
+
+from src.search_query import SearchQueryBuilder
+from tests.bench.conftest import make_worker, requires_benchmarks
+
+pytestmark = requires_benchmarks
+
+
+@pytest.mark.parametrize("query", ["cloudflare", "python workers", '"edge compute"'])
+def test_search_fts(bench, planet, query):
+    """FTS5 keyword search (SearchQueryBuilder.build_fts), executed on the planet."""
+    built = SearchQueryBuilder.from_raw_query(query).build_fts()
+
+    rows = bench(lambda: planet.conn.execute(built.sql, built.params).fetchall())
+
+    assert rows
+
+
+@pytest.mark.parametrize("query", ["cloudflare", "python workers"])
+def test_search_like(bench, planet, query):
+    """LIKE fallback search (SearchQueryBuilder.build), used without an FTS index."""
+    built = SearchQueryBuilder.from_raw_query(query).build()
+
+    rows = bench(lambda: planet.conn.execute(built.sql, built.params).fetchall())
+
+    assert rows
+
+
+@pytest.mark.asyncio
+async def test_apply_retention_policy(bench, planet):
+    """Retention over a fresh copy of the planet each round (age cutoff and per-feed cap)."""
+    stats = await bench.run_async(
+        lambda db: make_worker(db)._apply_retention_policy(), setup=planet.clone
+    )
+
+    assert stats["entries_deleted"] > 0
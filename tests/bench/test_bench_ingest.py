@@ -0,0 +1,62 @@
+# tests/bench/test_bench_ingest.py
+"""Benchmarks for feed ingestion: parsing, entry processing and sanitization."""
+
+import feedparser
+import pytest
+
+from src.content_processor import EntryContentProcessor
+from src.models import BleachSanitizer
+from tests.bench.conftest import entry_html, requires_benchmarks, words
+
+pytestmark = requires_benchmarks
+
+
+def atom_feed(entries: int) -> str:
+    """Synthetic Atom document with escaped-HTML entry content."""
+    items = []
+    for i in range(entries):
+        content = entry_html(i).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        items.append(
+            f"""<entry>
+  <id>https://blog.example.com/posts/{i}</id>
+  <title>{" ".join(words(i, 6)).title()}</title>
+  <link href="https://blog.example.com/posts/{i}"/>
+  <author><name>Author {i % 7}</name></author>
+  <updated>2026-01-{i % 28 + 1:02d}T12:00:00Z</updated>
+  <content type="html">{content}</content>
+</entry>"""
+        )
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Blog</title>
+  <link href="https://blog.example.com/"/>
+  <updated>2026-01-31T12:00:00Z</updated>
+  <id>https://blog.example.com/</id>
+  {"".join(items)}
+</feed>"""
+
+
+@pytest.mark.parametrize("entries", [20, 100])
+def test_parse_and_process_feed(bench, entries):
+    """feedparser.parse plus EntryContentProcessor for every entry, as in queue fetches."""
+    document = atom_feed(entries)
+
+    def ingest():
+        parsed = feedparser.parse(document)
+        return [EntryContentProcessor(entry, feed_id=1).process() for entry in parsed.entries]
+
+    processed = bench(ingest)
+
+    assert len(processed) == entries
+    assert processed[0].content
+
+
+@pytest.mark.parametrize("paragraphs", [4, 40])
+def test_sanitize_entry_html(bench, paragraphs):
+    """BleachSanitizer.clean on an ordinary entry and on a long one."""
+    sanitizer = BleachSanitizer()
+    html = entry_html(7, paragraphs=paragraphs) + '<script>alert("x")</script>'
+
+    cleaned = bench(lambda: sanitizer.clean(html))
+
+    assert "<script" not in cleaned
@@ -0,0 +1,33 @@
+# tests/bench/test_bench_render.py
+"""Benchmarks for page and feed rendering over synthetic planets."""
+
+import pytest
+
+from tests.bench.conftest import make_worker, requires_benchmarks
+
+pytestmark = requires_benchmarks
+
+
+@pytest.mark.asyncio
+async def test_generate_html(bench, planet):
+    """Homepage: entry query, grouping by day and index template render."""
+    worker = make_worker(planet)
+
+    html = await bench.run_async(worker._generate_html)
+
+    assert "<html" in html
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["atom", "rss"])
+async def test_generate_feed(bench, planet, fmt):
+    """Feed XML for the 50 most recent entries: _prepare_feed_entries and the feed template."""
+    worker = make_worker(planet)
+    planet_config = worker._get_planet_config()
+    entries = await worker._get_recent_entries(50)
+    generate = worker._generate_atom_feed if fmt == "atom" else worker._generate_rss_feed
+
+    xml = bench(lambda: generate(planet_config, entries))
+
+    assert len(entries) == 50
+    assert "<?xml" in xml
@@ -5,6 +5,7 @@ import base64
 import hashlib
 import hmac
 import json
+import sqlite3
 import sys
 import time
 from dataclasses import dataclass
@@ -20,6 +21,8 @@ import pytest
 
 TEST_SESSION_SECRET = "test-secret-key-for-testing-only-32chars"  # pragma: allowlist secret
 
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
 # Add src directory to path so imports work like in Workers environment
 _src_path = str(Path(__file__).parent.parent / "src")
 if _src_path not in sys.path:
@@ -249,6 +252,9 @@ class MockD1:
             match = re.search(pattern, sql_lower)
             if match:
                 table_name = match.group(1)
+                # Full-text index queries (entries_fts) return their base table's rows
+                if table_name.endswith("_fts") and table_name[:-4] in self._data:
+                    table_name = table_name[:-4]
                 if table_name in self._data:
                     return MockD1Statement(self._data[table_name], sql)
 
@@ -337,6 +343,85 @@ class TrackingD1:
         return stmt
 
 
+class SqliteD1Statement:
+    """Prepared statement for SqliteD1, executed on all()/first()/run()."""
+
+    def __init__(self, conn: sqlite3.Connection, sql: str):
+        self._conn = conn
+        self.sql = sql
+        self.bound_args: tuple = ()
+
+    def bind(self, *args) -> "SqliteD1Statement":
+        self.bound_args = args
+        return self
+
+    def _execute(self) -> list[dict]:
+        cursor = self._conn.execute(self.sql, self.bound_args)
+        rows = [dict(row) for row in cursor.fetchall()]
+        self._conn.commit()
+        return rows
+
+    async def all(self) -> MockD1Result:
+        return MockD1Result(results=self._execute())
+
+    async def first(self) -> dict | None:
+        rows = self._execute()
+        return rows[0] if rows else None
+
+    async def run(self) -> MockD1Result:
+        self._execute()
+        return MockD1Result(results=[])
+
+
+class SqliteD1:
+    """D1 stand-in backed by in-memory SQLite with every migration applied.
+
+    For tests whose SQL has to actually run (WHERE, ORDER BY, RETURNING),
+    which MockD1's table matching cannot model.
+    """
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        for sql_file in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            self.conn.executescript(sql_file.read_text())
+
+    def prepare(self, sql: str) -> SqliteD1Statement:
+        return SqliteD1Statement(self.conn, sql)
+
+    async def exec(self, sql: str) -> None:
+        self.conn.executescript(sql)
+
+    async def batch(self, statements: list[SqliteD1Statement]) -> list[MockD1Result]:
+        """Run bound statements in one transaction, like D1's batch()."""
+        with self.conn:
+            for stmt in statements:
+                self.conn.execute(stmt.sql, stmt.bound_args)
+        return [MockD1Result(results=[]) for _ in statements]
+
+    def insert(self, table: str, **values: Any) -> None:
+        """Insert one row (test setup helper)."""
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        self.conn.execute(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",  # noqa: S608
+            tuple(values.values()),
+        )
+        self.conn.commit()
+
+    def rows(self, sql: str, *args: Any) -> list[dict]:
+        """Run a query directly (test assertion helper)."""
+        return [dict(row) for row in self.conn.execute(sql, args).fetchall()]
+
+    def clone(self) -> "SqliteD1":
+        """Independent copy of this database, for tests that mutate a shared one."""
+        copy = SqliteD1.__new__(SqliteD1)
+        copy.conn = sqlite3.connect(":memory:")
+        copy.conn.row_factory = sqlite3.Row
+        self.conn.backup(copy.conn)
+        return copy
+
+
 class MockQueue:
     """Mock Cloudflare Queue."""
 
@@ -367,6 +452,10 @@ class MockVectorize:
     async def query(self, vector: list[float], options: dict) -> Any:
         # Return a dict structure matching what SafeVectorize.query() returns
         matches = [{"id": id, "score": 0.9} for id in self.vectors]
+        if options.get("returnMetadata"):
+            for match in matches:
+                if match["id"] in self.metadata:
+                    match["metadata"] = self.metadata[match["id"]]
         return {"matches": matches}
 
     async def deleteByIds(self, ids: list[str]) -> None:
@@ -379,9 +468,9 @@ class MockAI:
     """Mock Workers AI."""
 
     async def run(self, model: str, inputs: dict) -> dict:
-        # Return fake 768-dim embedding (inputs ignored for mock)
-        _ = model, inputs  # Acknowledge unused params
-        return {"data": [[0.1] * 768]}
+        # Return one fake 768-dim embedding per input text
+        _ = model  # Acknowledge unused param
+        return {"data": [[0.1] * 768 for _ in inputs.get("text") or [""]]}
 
 
 class MockAssets:
@@ -641,3 +730,13 @@ def reset_factories():
     EntryFactory.reset()
     FeedJobFactory.reset()
     yield
+
+
+@pytest.fixture(autouse=True)
+def reset_query_embedding_cache():
+    """Clear the per-isolate query embedding LRU so tests don't share hits."""
+    yield
+    for name in ("main", "src.main"):
+        module = sys.modules.get(name)
+        if module is not None:
+            module.PlanetCF._query_embedding_lru.clear()
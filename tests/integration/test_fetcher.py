@@ -239,3 +239,137 @@ async def test_fetcher_handles_malformed_feed(mock_env):
     # Should raise ValueError for parse error
     with pytest.raises(ValueError, match="parse error"):
         await worker._process_single_feed(job)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetcher_bumps_content_generation_when_entries_change(mock_env):
+    """New or updated entries advance the generation that keys cached search pages."""
+    feed_xml = """<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>Test Feed</title>
+        <item><title>Post</title><link>https://example.com/p</link><guid>p</guid></item>
+    </channel></rss>"""
+    respx.get("https://example.com/feed.xml").mock(return_value=Response(200, content=feed_xml))
+
+    from src.main import PlanetCF
+    from tests.conftest import TrackingD1
+
+    mock_env.DB = TrackingD1([{"id": 1, "inserted": 1}])
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    result = await worker._process_single_feed(
+        {"feed_id": 1, "url": "https://example.com/feed.xml"}
+    )
+
+    assert result["entries_added"] == 1
+    bumps = [s for s in mock_env.DB.statements if "UPDATE content_generation" in s.sql]
+    assert len(bumps) == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetcher_not_modified_keeps_content_generation(mock_env):
+    """A 304 changes no entries, so cached search pages stay valid."""
+    respx.get("https://example.com/feed.xml").mock(return_value=Response(304))
+
+    from src.main import PlanetCF
+    from tests.conftest import TrackingD1
+
+    mock_env.DB = TrackingD1([])
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    await worker._process_single_feed(
+        {"feed_id": 1, "url": "https://example.com/feed.xml", "etag": '"abc"'}
+    )
+
+    assert not any("content_generation" in s.sql for s in mock_env.DB.statements)
+
+
+UNCHANGED_FEED_XML = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test Feed</title>
+    <item><title>Post</title><link>https://example.com/p</link><guid>p</guid>
+        <description>Body of the post</description></item>
+</channel></rss>"""
+
+
+async def _fetch_twice(mock_env, between=None):
+    """Process the same feed document twice against a real SQLite schema."""
+    from unittest.mock import AsyncMock
+
+    from src.main import PlanetCF
+    from tests.conftest import MockAI, SqliteD1
+
+    respx.get("https://example.com/feed.xml").mock(
+        return_value=Response(200, content=UNCHANGED_FEED_XML)
+    )
+    mock_env.DB = SqliteD1()
+    mock_env.DB.insert("feeds", id=1, url="https://example.com/feed.xml", title="Test Feed")
+    mock_env.AI.run = AsyncMock(side_effect=MockAI().run)
+    worker = PlanetCF()
+    worker.env = mock_env
+    job = {"feed_id": 1, "url": "https://example.com/feed.xml"}
+
+    first = await worker._process_single_feed(job)
+    if between:
+        between(mock_env.DB)
+    second = await worker._process_single_feed(job)
+    return first, second
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_refetching_unchanged_feed_does_not_mark_it_for_retention(mock_env):
+    """Re-upserted entries aren't new: the per-feed cap only ranks feeds that grew."""
+    first, second = await _fetch_twice(
+        mock_env, between=lambda db: db.conn.execute("DELETE FROM retention_dirty_feeds")
+    )
+
+    assert (first["entries_added"], second["entries_added"]) == (1, 0)
+    assert mock_env.DB.rows("SELECT feed_id FROM retention_dirty_feeds") == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_refetching_unchanged_feed_keeps_content_generation(mock_env):
+    """Identical entries aren't rewritten, so cached search pages stay valid."""
+    generations = []
+    first, _ = await _fetch_twice(
+        mock_env,
+        between=lambda db: generations.append(db.rows("SELECT generation FROM content_generation")),
+    )
+
+    assert first["entries_added"] == 1
+    assert mock_env.DB.rows("SELECT generation FROM content_generation") == generations[0]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_refetching_edited_entry_bumps_content_generation(mock_env):
+    """An entry whose text changed is rewritten and advances the generation."""
+    generations = []
+
+    def edit(db):
+        db.conn.execute("UPDATE entries SET content_text = 'Older body'")
+        generations.append(db.rows("SELECT generation FROM content_generation"))
+
+    await _fetch_twice(mock_env, between=edit)
+
+    after = mock_env.DB.rows("SELECT generation FROM content_generation")
+    assert after[0]["generation"] == generations[0][0]["generation"] + 1
+    assert mock_env.DB.rows("SELECT content_text FROM entries") != [{"content_text": "Older body"}]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_refetching_unchanged_feed_does_not_embed_again(mock_env):
+    """Entries already indexed with the current model aren't re-embedded on re-fetch."""
+    from src.main import EMBEDDING_MODEL
+
+    await _fetch_twice(mock_env)
+
+    assert mock_env.AI.run.await_count == 1
+    assert mock_env.DB.rows("SELECT embedding_model FROM entries") == [
+        {"embedding_model": EMBEDDING_MODEL}
+    ]
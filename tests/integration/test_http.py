@@ -492,6 +492,127 @@ async def test_homepage_shows_normal_author(mock_env):
     assert "John Doe" in response.body, "Normal author name should be shown"
 
 
+# =============================================================================
+# Excerpt Mode
+# =============================================================================
+
+
+def _excerpt_mode_db():
+    from tests.conftest import MockD1
+
+    return MockD1(
+        {
+            "feeds": [
+                {
+                    "id": 1,
+                    "url": "https://example.com/feed.xml",
+                    "title": "Example Blog",
+                    "is_active": 1,
+                    "site_url": "https://example.com",
+                    "consecutive_failures": 0,
+                    "last_success_at": "2026-01-15T00:00:00Z",
+                },
+            ],
+            "entries": [
+                {
+                    "id": 7,
+                    "feed_id": 1,
+                    "guid": "entry-7",
+                    "url": "https://example.com/post/7",
+                    "title": "Long Post",
+                    "author": "Jane Doe",
+                    "summary": "<p>A short <em>summary</em> of the post.</p>",
+                    "content": "<p>Full body paragraph that should only load on demand.</p>",
+                    "published_at": "2026-01-15T12:00:00Z",
+                    "feed_title": "Example Blog",
+                    "feed_site_url": "https://example.com",
+                },
+            ],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_homepage_excerpt_mode_omits_full_content(mock_env):
+    """EXCERPT_MODE renders the summary as text and links to the /entry fragment."""
+    from src.main import PlanetCF
+
+    mock_env.DB = _excerpt_mode_db()
+    mock_env.EXCERPT_MODE = "true"
+
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/"))
+
+    assert response.status == 200
+    assert "A short summary of the post." in response.body
+    assert "Full body paragraph" not in response.body
+    assert 'data-entry-content="/entry/7"' in response.body
+
+
+@pytest.mark.asyncio
+async def test_homepage_without_excerpt_mode_renders_full_content(mock_env):
+    """Default theme keeps rendering full content unless EXCERPT_MODE is set."""
+    from src.main import PlanetCF
+
+    mock_env.DB = _excerpt_mode_db()
+
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/"))
+
+    assert response.status == 200
+    assert "Full body paragraph" in response.body
+    assert "data-entry-content" not in response.body
+
+
+@pytest.mark.asyncio
+async def test_entry_route_serves_cacheable_fragment(mock_env):
+    """GET /entry/<id> returns the stored content as a cacheable HTML fragment."""
+    from src.main import PlanetCF
+
+    mock_env.DB = _excerpt_mode_db()
+
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/entry/7"))
+
+    assert response.status == 200
+    assert "text/html" in response.headers.get("Content-Type", "")
+    assert "max-age=3600" in response.headers.get("Cache-Control", "")
+    assert "Full body paragraph" in response.body
+    assert "<html" not in response.body
+
+
+@pytest.mark.asyncio
+async def test_entry_route_rejects_invalid_id(mock_env):
+    """GET /entry/<non-numeric> returns 400."""
+    from src.main import PlanetCF
+
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/entry/abc"))
+
+    assert response.status == 400
+
+
+@pytest.mark.asyncio
+async def test_entry_route_missing_entry_returns_404(mock_env):
+    """GET /entry/<id> for an unknown entry returns 404."""
+    from src.main import PlanetCF
+
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/entry/999"))
+
+    assert response.status == 404
+
+
 # =============================================================================
 # Phase 2: Missing Route Coverage
 # =============================================================================
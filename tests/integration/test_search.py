@@ -130,6 +130,52 @@ async def test_entry_indexing_handles_ai_failure_gracefully(mock_env):
     assert len(mock_env.SEARCH_INDEX.vectors) == 0
 
 
+def _reindex_db(entry_count: int = 2):
+    """SqliteD1 with one feed and entry_count entries (ids 1..entry_count)."""
+    from tests.conftest import SqliteD1
+
+    db = SqliteD1()
+    db.insert("feeds", id=1, url="https://example.com/feed.xml", title="Example")
+    for entry_id in range(1, entry_count + 1):
+        db.insert(
+            "entries",
+            id=entry_id,
+            feed_id=1,
+            guid=f"entry-{entry_id}",
+            title=f"Test Entry {entry_id}",
+            content=f"<p>Content {entry_id}</p>",
+            content_text=f"Content {entry_id}",
+        )
+    return db
+
+
+class _QueueMessage:
+    def __init__(self, body):
+        self.body = body
+        self.id = "msg"
+        self.attempts = 1
+        self.acked = False
+        self.retried = False
+
+    def ack(self):
+        self.acked = True
+
+    def retry(self):
+        self.retried = True
+
+
+async def _drain_queue(worker, env):
+    """Deliver queued messages one at a time until the queue is empty."""
+    from types import SimpleNamespace
+
+    delivered = []
+    while env.FEED_QUEUE.messages:
+        message = _QueueMessage(env.FEED_QUEUE.messages.pop(0))
+        await worker.queue(SimpleNamespace(messages=[message], queue="feed-queue"))
+        delivered.append(message)
+    return delivered
+
+
 @pytest.mark.asyncio
 async def test_reindex_endpoint_indexes_all_entries(mock_env):
     """The /admin/reindex endpoint should index all existing entries.
@@ -137,60 +183,298 @@ async def test_reindex_endpoint_indexes_all_entries(mock_env):
     This tests the fix for the bug - a way to re-index entries
     that were added before Vectorize was working.
     """
-    from src.main import PlanetCF
-    from tests.conftest import MockD1
+    import json
 
-    # Set up a fresh MockD1 with all required data
-    mock_env.DB = MockD1(
-        {
-            "entries": [
-                {
-                    "id": 1,
-                    "feed_id": 1,
-                    "title": "Test Entry 1",
-                    "content": "<p>Content 1</p>",
-                },
-                {
-                    "id": 2,
-                    "feed_id": 1,
-                    "title": "Test Entry 2",
-                    "content": "<p>Content 2</p>",
-                },
-            ],
-            "admins": [
-                {"id": 1, "github_username": "testadmin", "is_active": 1},
-            ],
-            "audit_log": [],
-        }
-    )
+    from src.main import PlanetCF
 
+    mock_env.DB = _reindex_db(2)
     worker = PlanetCF()
     worker.env = mock_env
 
     # Verify index is initially empty
     assert len(mock_env.SEARCH_INDEX.vectors) == 0
 
-    # Create a mock admin session
     admin = {"id": 1, "github_username": "testadmin"}
-
-    # Call the reindex method directly
     response = await worker._reindex_all_entries(admin)
+    result = json.loads(response.body)
 
-    # Parse response
-    import json
-
-    body = response.body if hasattr(response, "body") else str(response)
-    result = json.loads(body)
-
-    # Should have indexed 2 entries
+    # Fewer entries than one batch: the job completes within the request
+    assert response.status == 200
     assert result["success"] is True
+    assert result["status"] == "completed"
     assert result["indexed"] == 2
     assert result["failed"] == 0
+    assert mock_env.FEED_QUEUE.messages == []
 
     # Verify vectors were added to index
     assert len(mock_env.SEARCH_INDEX.vectors) == 2
     assert "1" in mock_env.SEARCH_INDEX.vectors
     assert "2" in mock_env.SEARCH_INDEX.vectors
+    # Reindex backfills the display metadata search renders from
+    assert mock_env.SEARCH_INDEX.metadata["1"]["v"] == 2
+    assert mock_env.SEARCH_INDEX.metadata["1"]["title"] == "Test Entry 1"
+
+
+@pytest.mark.asyncio
+async def test_reindex_runs_remaining_batches_from_queue(mock_env, monkeypatch):
+    """Large planets are reindexed one batch per queue message, in id order."""
+    import json
+
+    import src.main
+    from src.main import PlanetCF
+    from tests.conftest import MockAI
+
+    monkeypatch.setattr(src.main, "REINDEX_BATCH_SIZE", 2)
+    mock_env.DB = _reindex_db(5)
+    mock_env.AI.run = AsyncMock(side_effect=MockAI().run)
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    response = await worker._reindex_all_entries({"id": 1, "github_username": "admin"})
+    result = json.loads(response.body)
+
+    assert response.status == 202
+    assert result["status"] == "running"
+    assert result["indexed"] == 2
+    assert result["total"] == 5
+    assert mock_env.FEED_QUEUE.messages == [{"reindex_job_id": result["job_id"]}]
+
+    delivered = await _drain_queue(worker, mock_env)
+
+    assert len(delivered) == 2
+    assert all(message.acked for message in delivered)
+    # One AI call per batch, never more than REINDEX_BATCH_SIZE texts
+    batch_sizes = [len(call.args[1]["text"]) for call in mock_env.AI.run.call_args_list]
+    assert batch_sizes == [2, 2, 1]
+    assert sorted(mock_env.SEARCH_INDEX.vectors, key=int) == ["1", "2", "3", "4", "5"]
+
+    status = json.loads((await worker._reindex_status()).body)
+    assert status["status"] == "completed"
+    assert status["indexed"] == 5
+    assert status["batches"] == 3
+    assert status["completed_at"]
+
+
+@pytest.mark.asyncio
+async def test_reindex_returns_running_job_instead_of_starting_another(mock_env, monkeypatch):
+    """A second POST while a job is running reports that job's progress."""
+    import json
+
+    import src.main
+    from src.main import PlanetCF
+
+    monkeypatch.setattr(src.main, "REINDEX_BATCH_SIZE", 2)
+    mock_env.DB = _reindex_db(5)
+    worker = PlanetCF()
+    worker.env = mock_env
+    admin = {"id": 1, "github_username": "admin"}
+
+    first = json.loads((await worker._reindex_all_entries(admin)).body)
+    second = await worker._reindex_all_entries(admin)
+
+    assert second.status == 202
+    assert json.loads(second.body)["job_id"] == first["job_id"]
+    assert len(mock_env.DB.rows("SELECT id FROM reindex_jobs")) == 1
+    assert len(mock_env.FEED_QUEUE.messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_reindex_counts_failed_batch_and_moves_on(mock_env):
+    """An AI failure fails that batch only; the job records it and completes."""
+    import json
+
+    from src.main import PlanetCF
+
+    mock_env.DB = _reindex_db(2)
+    mock_env.AI.run = AsyncMock(side_effect=RuntimeError("AI unavailable"))
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    result = json.loads(
+        (await worker._reindex_all_entries({"id": 1, "github_username": "admin"})).body
+    )
+
+    assert result["status"] == "completed"
+    assert result["indexed"] == 0
+    assert result["failed"] == 2
+    assert "AI unavailable" in result["last_error"]
+
+
+@pytest.mark.asyncio
+async def test_reindex_batch_error_retries_message_from_cursor(mock_env, monkeypatch):
+    """A batch that raises is retried by the queue without moving the cursor."""
+    import src.main
+    from src.main import PlanetCF
+
+    monkeypatch.setattr(src.main, "REINDEX_BATCH_SIZE", 2)
+    mock_env.DB = _reindex_db(5)
+    worker = PlanetCF()
+    worker.env = mock_env
+    await worker._reindex_all_entries({"id": 1, "github_username": "admin"})
+
+    worker._index_entries_batch = AsyncMock(side_effect=RuntimeError("isolate evicted"))
+    delivered = await _drain_queue(worker, mock_env)
+
+    assert delivered[0].retried
+    assert not delivered[0].acked
+    job = mock_env.DB.rows("SELECT last_entry_id, status FROM reindex_jobs")[0]
+    assert job == {"last_entry_id": 2, "status": "running"}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_resumes_stalled_reindex_job(mock_env):
+    """Running jobs that stopped advancing are re-enqueued from their cursor."""
+    from src.main import PlanetCF
+
+    mock_env.DB = _reindex_db(0)
+    mock_env.DB.insert(
+        "reindex_jobs", id=1, status="running", last_entry_id=40, updated_at="2026-01-01 00:00:00"
+    )
+    mock_env.DB.insert("reindex_jobs", id=2, status="completed", updated_at="2026-01-01 00:00:00")
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    resumed = await worker._resume_stale_reindex_jobs()
+
+    assert resumed == 1
+    assert mock_env.FEED_QUEUE.messages == [{"reindex_job_id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_reindex_status_without_jobs_is_idle(mock_env):
+    """The status endpoint answers before any reindex has run."""
+    import json
+
+    from src.main import PlanetCF
+
+    mock_env.DB = _reindex_db(0)
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    status = json.loads((await worker._reindex_status()).body)
+
+    assert status["status"] == "idle"
+
+
+@pytest.mark.asyncio
+async def test_indexing_records_embedding_model(mock_env):
+    """Successful upserts stamp entries with the model that produced their vector."""
+    from src.main import EMBEDDING_MODEL, PlanetCF
+
+    mock_env.DB = _reindex_db(2)
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    await worker._reindex_all_entries({"id": 1, "github_username": "admin"})
+
+    rows = mock_env.DB.rows("SELECT embedding_model, indexed_at FROM entries")
+    assert {row["embedding_model"] for row in rows} == {EMBEDDING_MODEL}
+    assert all(row["indexed_at"] for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_index_sweep_embeds_unindexed_and_outdated_entries(mock_env):
+    """The cron sweeper embeds only entries without a current vector, newest first."""
+    from src.main import EMBEDDING_MODEL, PlanetCF
+
+    mock_env.DB = _reindex_db(4)
+    mock_env.DB.conn.execute(
+        "UPDATE entries SET embedding_model = ? WHERE id = 1", (EMBEDDING_MODEL,)
+    )
+    mock_env.DB.conn.execute("UPDATE entries SET embedding_model = 'old-model' WHERE id = 2")
+    mock_env.INDEX_SWEEP_LIMIT = 2
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    first = await worker._sweep_unindexed_entries()
+
+    assert first["candidates"] == 2
+    assert first["indexed"] == 2
+    assert set(mock_env.SEARCH_INDEX.vectors) == {"3", "4"}
+
+    second = await worker._sweep_unindexed_entries()
+
+    assert second["candidates"] == 1
+    assert set(mock_env.SEARCH_INDEX.vectors) == {"2", "3", "4"}
+    assert (await worker._sweep_unindexed_entries())["candidates"] == 0
+
+
+@pytest.mark.asyncio
+async def test_index_sweep_leaves_failed_entries_for_next_run(mock_env):
+    """Entries whose embedding fails stay unmarked so a later sweep retries them."""
+    from src.main import PlanetCF
+
+    mock_env.DB = _reindex_db(2)
+    mock_env.AI.run = AsyncMock(side_effect=RuntimeError("AI unavailable"))
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    stats = await worker._sweep_unindexed_entries()
+
+    assert stats["failed"] == 2
+    assert mock_env.DB.rows("SELECT id FROM entries WHERE embedding_model IS NULL") == [
+        {"id": 1},
+        {"id": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_index_sweep_backs_off_entries_that_keep_failing(mock_env):
+    """A failed entry is skipped until its retry time, then retried on its own."""
+    from src.main import EMBEDDING_MODEL, PlanetCF
+
+    mock_env.DB = _reindex_db(2)
+    mock_env.AI.run = AsyncMock(side_effect=RuntimeError("AI unavailable"))
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    await worker._sweep_unindexed_entries()
+
+    assert mock_env.DB.rows(
+        "SELECT index_attempts, index_retry_after > CURRENT_TIMESTAMP AS waiting FROM entries"
+    ) == [{"index_attempts": 1, "waiting": 1}, {"index_attempts": 1, "waiting": 1}]
+    assert (await worker._sweep_unindexed_entries())["candidates"] == 0
+
+    mock_env.DB.conn.execute("UPDATE entries SET index_retry_after = '2000-01-01 00:00:00'")
+    mock_env.AI.run = AsyncMock(return_value={"data": [[0.1] * 768]})
+
+    retried = await worker._sweep_unindexed_entries()
+
+    assert retried["indexed"] == 2
+    assert mock_env.AI.run.await_count == 2
+    assert mock_env.DB.rows(
+        "SELECT embedding_model, index_attempts, index_retry_after FROM entries"
+    ) == [
+        {"embedding_model": EMBEDDING_MODEL, "index_attempts": 0, "index_retry_after": None},
+        {"embedding_model": EMBEDDING_MODEL, "index_attempts": 0, "index_retry_after": None},
+    ]
+
+
+def test_index_sweep_candidates_come_from_partial_index():
+    """The sweep's candidate query reads index ranges, not a scan of entries."""
+    from tests.conftest import SqliteD1
+
+    plan = (
+        SqliteD1()
+        .conn.execute(
+            "EXPLAIN QUERY PLAN SELECT e.id FROM entries e JOIN feeds f ON e.feed_id = f.id "
+            "WHERE e.id IN ("
+            "SELECT id FROM entries WHERE embedding_model IS NULL "
+            "AND title IS NOT NULL AND canonical_entry_id IS NULL "
+            "UNION ALL SELECT id FROM entries WHERE embedding_model < ? "
+            "AND title IS NOT NULL AND canonical_entry_id IS NULL "
+            "UNION ALL SELECT id FROM entries WHERE embedding_model > ? "
+            "AND title IS NOT NULL AND canonical_entry_id IS NULL) "
+            "AND (e.index_retry_after IS NULL OR e.index_retry_after <= CURRENT_TIMESTAMP) "
+            "ORDER BY e.id DESC LIMIT ?",
+            ("m", "m", 5),
+        )
+        .fetchall()
+    )
+
+    details = [row["detail"] for row in plan]
+    assert "SEARCH entries USING INDEX idx_entries_index_sweep (embedding_model=?)" in details
+    assert not any(detail.startswith("SCAN") for detail in details)
 
 
 @pytest.mark.asyncio
@@ -221,26 +505,13 @@ async def test_vectorize_index_consistency(mock_env):
     Every entry in D1 should have a corresponding vector in Vectorize.
     """
     from src.main import PlanetCF
-    from tests.conftest import MockD1
-
-    # Set up mock D1 with entries
-    entries_data = [
-        {"id": 1, "title": "Test Entry 1", "content": "<p>Content 1</p>"},
-        {"id": 2, "title": "Test Entry 2", "content": "<p>Content 2</p>"},
-    ]
-    mock_env.DB = MockD1(
-        {
-            "entries": entries_data,
-            "admins": [{"id": 1, "github_username": "testadmin", "is_active": 1}],
-            "audit_log": [],
-        }
-    )
 
+    mock_env.DB = _reindex_db(2)
     worker = PlanetCF()
     worker.env = mock_env
 
     # Get all entry IDs from D1
-    d1_entry_ids = {str(e["id"]) for e in entries_data}
+    d1_entry_ids = {str(row["id"]) for row in mock_env.DB.rows("SELECT id FROM entries")}
 
     # Initially, Vectorize is empty - this is the bug condition
     vectorize_ids = set(mock_env.SEARCH_INDEX.vectors.keys())
@@ -721,3 +992,585 @@ async def test_search_phrase_search_in_handler(mock_env_with_entries):
     body = response.body if hasattr(response, "body") else str(response)
     # Should be valid HTML, not a crash
     assert "<html" in body.lower() or "<!doctype" in body.lower() or "search" in body.lower()
+
+
+class _RecordingD1:
+    """Wraps a MockD1, recording SQL; optionally fails entries_fts like a pre-006 database."""
+
+    def __init__(self, db, fts_missing: bool = False):
+        self._db = db
+        self._fts_missing = fts_missing
+        self.sql: list[str] = []
+
+    def prepare(self, sql):
+        self.sql.append(sql)
+        if self._fts_missing and "entries_fts" in sql:
+            raise RuntimeError("D1_ERROR: no such table: entries_fts")
+        return self._db.prepare(sql)
+
+
+@pytest.mark.asyncio
+async def test_search_uses_fts_index(mock_env_with_entries):
+    """Keyword search queries the FTS5 index, not LIKE scans over content."""
+    from src.main import PlanetCF
+
+    mock_env_with_entries.DB = _RecordingD1(mock_env_with_entries.DB)
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/search?q=test"))
+
+    assert response.status == 200
+    assert "Test Entry" in response.body
+    assert any("entries_fts MATCH" in sql for sql in mock_env_with_entries.DB.sql)
+    assert not any("LIKE" in sql for sql in mock_env_with_entries.DB.sql)
+
+
+@pytest.mark.asyncio
+async def test_search_falls_back_to_like_without_fts(mock_env_with_entries):
+    """Databases without the FTS5 table still get keyword results via LIKE."""
+    from src.main import PlanetCF
+
+    mock_env_with_entries.DB = _RecordingD1(mock_env_with_entries.DB, fts_missing=True)
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/search?q=test"))
+
+    assert response.status == 200
+    assert "Test Entry" in response.body
+    assert worker._fts_available is False
+
+    # Later searches in this isolate go straight to LIKE
+    mock_env_with_entries.DB.sql.clear()
+    await worker.fetch(MockRequest("https://www.planetcloudflare.dev/search?q=entry"))
+    assert any("LIKE" in sql for sql in mock_env_with_entries.DB.sql)
+    assert not any("entries_fts" in sql for sql in mock_env_with_entries.DB.sql)
+
+
+@pytest.mark.asyncio
+async def test_upsert_entry_writes_plain_text_to_fts_index(mock_env):
+    """_upsert_entry indexes the title and HTML-stripped content in entries_fts."""
+    from src.main import PlanetCF
+    from tests.conftest import TrackingD1
+
+    mock_env.DB = TrackingD1([{"id": 7}])
+    mock_env.SEARCH_INDEX = None
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    entry = {
+        "id": "https://example.com/post",
+        "link": "https://example.com/post",
+        "title": "Edge Notes",
+        "content": [{"value": "<p>Fish &amp; <b>chips</b></p>"}],
+    }
+    await worker._upsert_entry(feed_id=1, entry=entry)
+
+    fts = [s for s in mock_env.DB.statements if "entries_fts" in s.sql]
+    assert len(fts) == 1
+    assert fts[0].bound_args == [7, "Edge Notes", "Fish & chips"]
+
+
+@pytest.mark.asyncio
+async def test_search_branches_run_concurrently(mock_env_with_entries):
+    """Semantic and keyword branches overlap: latency is the max, not the sum."""
+    import asyncio
+    import time
+
+    from src.main import PlanetCF
+
+    async def slow_embedding(*args, **kwargs):
+        await asyncio.sleep(0.2)
+        return None
+
+    async def slow_keyword(builder, limit):
+        await asyncio.sleep(0.2)
+        return [], builder.build(limit=limit)
+
+    mock_env_with_entries.AI.run = slow_embedding
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+    worker._keyword_search = slow_keyword
+
+    start = time.perf_counter()
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test")
+    )
+    elapsed = time.perf_counter() - start
+
+    assert response.status == 200
+    assert elapsed < 0.35, f"branches ran sequentially ({elapsed:.2f}s)"
+
+
+@pytest.mark.asyncio
+async def test_search_branches_never_overlap_d1_queries(mock_env_with_entries):
+    """The branches run concurrently, but only one D1 statement is in flight at a time."""
+    import asyncio
+
+    from src.main import PlanetCF
+
+    in_flight = []
+    peak = []
+
+    async def d1_call(result):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.05)
+        in_flight.pop()
+        return result
+
+    async def keyword(builder, limit):
+        return await d1_call(([], builder.build(limit=limit)))
+
+    async def load_embedding(key):
+        return await d1_call(None)
+
+    mock_env_with_entries.AI.run = AsyncMock(return_value=None)
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+    worker._keyword_search = keyword
+    worker._load_query_embedding = load_embedding
+
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test")
+    )
+
+    assert response.status == 200
+    assert len(peak) == 2
+    assert max(peak) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_semantic_timeout_degrades_to_keyword(mock_env_with_entries):
+    """A semantic branch over its timeout is abandoned; keyword results still render."""
+    import asyncio
+
+    from src.main import PlanetCF
+    from src.observability import RequestEvent
+
+    async def hung_embedding(*args, **kwargs):
+        await asyncio.sleep(5)
+
+    mock_env_with_entries.AI.run = hung_embedding
+    mock_env_with_entries.SEARCH_SEMANTIC_TIMEOUT_MS = "50"
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+    event = RequestEvent(method="GET", path="/search")
+
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test"), event=event
+    )
+
+    assert response.status == 200
+    assert "Test Entry" in response.body
+    assert event.search_semantic_error == "Timeout after 50ms"
+    assert event.search_keyword_error is None
+    assert event.search_keyword_matches > 0
+
+
+@pytest.mark.asyncio
+async def test_search_keyword_failure_recorded_on_event(mock_env_with_entries):
+    """A failing keyword branch is reported on the event; the page still renders."""
+    from src.main import PlanetCF
+    from src.observability import RequestEvent
+
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+    worker._keyword_search = AsyncMock(side_effect=RuntimeError("D1 overloaded"))
+    event = RequestEvent(method="GET", path="/search")
+
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test"), event=event
+    )
+
+    assert response.status == 200
+    assert event.search_keyword_error == "D1 overloaded"
+    assert event.search_semantic_error is None
+
+
+@pytest.mark.asyncio
+async def test_repeat_query_embedding_served_from_memory(mock_env_with_entries):
+    """A repeated query (in any case/spacing) reuses the in-isolate embedding."""
+    from src.main import PlanetCF
+    from src.observability import RequestEvent
+
+    mock_env_with_entries.AI.run = AsyncMock(return_value={"data": [[0.1] * 768]})
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+
+    first = RequestEvent()
+    await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=Test"), event=first
+    )
+    second = RequestEvent()
+    await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test%20%20"), event=second
+    )
+
+    assert mock_env_with_entries.AI.run.await_count == 1
+    assert mock_env_with_entries.AI.run.await_args.args[1]["text"] == ["test"]
+    assert first.search_embedding_cache == "miss"
+    assert second.search_embedding_cache == "memory"
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_served_from_d1(mock_env_with_entries):
+    """Another isolate's cached embedding in D1 avoids the Workers AI call."""
+    from src.embedding_cache import encode_embedding
+    from src.main import PlanetCF
+    from src.observability import RequestEvent
+
+    mock_env_with_entries.DB._data["query_embeddings"] = [
+        {"embedding": encode_embedding([0.1] * 768)}
+    ]
+    mock_env_with_entries.AI.run = AsyncMock(side_effect=AssertionError("AI called"))
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+    event = RequestEvent()
+
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test"), event=event
+    )
+
+    assert response.status == 200
+    assert event.search_embedding_cache == "d1"
+    assert event.search_semantic_error is None
+    assert worker._query_embedding_lru.get("@cf/baai/bge-base-en-v1.5", "test") is not None
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_miss_written_to_d1(mock_env):
+    """A freshly computed query embedding is persisted for other isolates."""
+    from src.main import PlanetCF
+    from tests.conftest import TrackingD1
+
+    mock_env.DB = TrackingD1([])
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    vector = await worker._get_query_embedding("Edge Compute")
+
+    assert vector == [0.1] * 768
+    writes = [
+        s for s in mock_env.DB.statements if "INSERT OR REPLACE INTO query_embeddings" in s.sql
+    ]
+    assert len(writes) == 1
+    assert writes[0].bound_args[:2] == ["@cf/baai/bge-base-en-v1.5", "edge compute"]
+
+
+def _with_generation(env, generation: int):
+    """Give the mock D1 a content_generation row (migration 008 applied)."""
+    env.DB._data["content_generation"] = [{"id": 1, "generation": generation}]
+    return env
+
+
+@pytest.mark.asyncio
+async def test_search_redirects_to_canonical_generation_url(mock_env_with_entries):
+    """Non-canonical queries redirect to the canonical, generation-stamped URL."""
+    from src.main import PlanetCF
+
+    worker = PlanetCF()
+    worker.env = _with_generation(mock_env_with_entries, 7)
+
+    response = await worker.fetch(
+        MockRequest("https://www.planetcloudflare.dev/search?q=%20Test%20%20Entry")
+    )
+
+    assert response.status == 302
+    assert response.headers["Location"] == "/search?q=test+entry&g=7"
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+
+
+@pytest.mark.asyncio
+async def test_search_stale_generation_redirects(mock_env_with_entries):
+    """A URL from an older generation moves to the current one."""
+    from src.main import PlanetCF
+
+    worker = PlanetCF()
+    worker.env = _with_generation(mock_env_with_entries, 8)
+
+    response = await worker.fetch(
+        MockRequest("https://www.planetcloudflare.dev/search?q=%22exact+phrase%22&g=7")
+    )
+
+    assert response.status == 302
+    assert response.headers["Location"] == "/search?q=%22exact+phrase%22&g=8"
+
+
+@pytest.mark.asyncio
+async def test_search_canonical_url_is_cacheable(mock_env_with_entries):
+    """The canonical URL serves results with a public Cache-Control."""
+    from src.main import PlanetCF
+
+    worker = PlanetCF()
+    worker.env = _with_generation(mock_env_with_entries, 7)
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/search?q=test&g=7"))
+
+    assert response.status == 200
+    assert "Test Entry" in response.body
+    assert response.headers["Cache-Control"].startswith("public, max-age=300,")
+
+
+@pytest.mark.asyncio
+async def test_search_degraded_results_not_cached(mock_env_with_entries):
+    """A page missing a failed branch must not be cached at the edge."""
+    from src.main import PlanetCF
+
+    mock_env_with_entries.AI.run = AsyncMock(side_effect=Exception("AI unavailable"))
+    worker = PlanetCF()
+    worker.env = _with_generation(mock_env_with_entries, 7)
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/search?q=test&g=7"))
+
+    assert response.status == 200
+    assert "max-age=0" in response.headers["Cache-Control"]
+
+
+@pytest.mark.asyncio
+async def test_search_without_generation_table_is_uncached(mock_env_with_entries):
+    """Before migration 008 there is no cache key: no redirect, no caching."""
+    from src.main import PlanetCF
+
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+
+    response = await worker.fetch(MockRequest("https://www.planetcloudflare.dev/search?q=Test"))
+
+    assert response.status == 200
+    assert "max-age=0" in response.headers["Cache-Control"]
+
+
+def _vector_with_metadata(entry_id: int, title: str) -> dict:
+    from src.vector_metadata import build_vector_metadata
+
+    return {
+        "id": str(entry_id),
+        "values": [0.1] * 768,
+        "metadata": build_vector_metadata(
+            entry_id,
+            {
+                "title": title,
+                "url": f"https://example.com/vec/{entry_id}",
+                "feed_title": "Vector Feed",
+                "published_at": "2025-06-01T00:00:00Z",
+            },
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_semantic_results_render_from_vector_metadata(mock_env):
+    """Semantic hits with current metadata render without a D1 hydration query."""
+    from src.main import PlanetCF
+    from src.observability import RequestEvent
+
+    await mock_env.SEARCH_INDEX.upsert([_vector_with_metadata(2, "Only In Vectorize")])
+    mock_env.DB = _RecordingD1(_reindex_db(2))
+    worker = PlanetCF()
+    worker.env = mock_env
+    event = RequestEvent()
+
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test&g=0"), event=event
+    )
+
+    assert "Only In Vectorize" in response.body
+    assert "https://example.com/vec/2" in response.body
+    assert event.search_semantic_hydrated == 0
+    assert not any("WHERE e.id IN" in sql for sql in mock_env.DB.sql)
+
+
+@pytest.mark.asyncio
+async def test_semantic_results_skip_vectors_of_deleted_entries(mock_env):
+    """A vector whose entry is gone from D1 (e.g. a failed vector delete) is not rendered."""
+    from src.main import PlanetCF
+    from src.observability import RequestEvent
+
+    await mock_env.SEARCH_INDEX.upsert(
+        [_vector_with_metadata(2, "Still Here"), _vector_with_metadata(99, "Deleted Entry")]
+    )
+    mock_env.DB = _reindex_db(2)
+    worker = PlanetCF()
+    worker.env = mock_env
+    event = RequestEvent()
+
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test&g=0"), event=event
+    )
+
+    assert "Still Here" in response.body
+    assert "Deleted Entry" not in response.body
+    assert event.search_semantic_matches == 1
+
+
+@pytest.mark.asyncio
+async def test_remove_feed_deletes_its_entries_vectors(mock_env):
+    """Removing a feed deletes its entries' vectors; entries cascade in D1, vectors don't."""
+    from src.main import PlanetCF
+
+    db = _reindex_db(2)
+    db.insert("feeds", id=2, url="https://other.example.com/feed.xml", title="Other")
+    db.insert("entries", id=3, feed_id=2, guid="entry-3", title="Other Entry")
+    await mock_env.SEARCH_INDEX.upsert(
+        [_vector_with_metadata(entry_id, f"Entry {entry_id}") for entry_id in (1, 2, 3)]
+    )
+    mock_env.DB = db
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    response = await worker._remove_feed(1, {"id": 1, "github_username": "admin"})
+
+    assert response.status == 302
+    assert set(mock_env.SEARCH_INDEX.vectors) == {"3"}
+
+
+@pytest.mark.asyncio
+async def test_semantic_results_with_legacy_metadata_hydrate_from_d1(mock_env_with_entries):
+    """Vectors written before rich metadata are hydrated from D1 (display columns only)."""
+    from src.main import PlanetCF
+    from src.observability import RequestEvent
+
+    await mock_env_with_entries.SEARCH_INDEX.upsert(
+        [{"id": "1", "values": [0.1] * 768, "metadata": {"title": "Old", "entry_id": 1}}]
+    )
+    mock_env_with_entries.DB = _RecordingD1(mock_env_with_entries.DB)
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+    event = RequestEvent()
+
+    await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=zzz"), event=event
+    )
+
+    hydration = [sql for sql in mock_env_with_entries.DB.sql if "WHERE e.id IN" in sql]
+    assert event.search_semantic_hydrated == 1
+    assert len(hydration) == 1
+    assert "e.content" not in hydration[0]
+
+
+@pytest.mark.asyncio
+async def test_upsert_entry_stores_display_metadata_on_vector(mock_env):
+    """Indexing stores the D1-returned display fields as vector metadata."""
+    from src.main import PlanetCF
+    from tests.conftest import TrackingD1
+
+    mock_env.DB = TrackingD1(
+        [
+            {
+                "id": 7,
+                "url": "https://example.com/post",
+                "author": "Ada",
+                "published_at": "2026-01-15T12:00:00Z",
+                "feed_title": "Example Blog",
+                "feed_site_url": "https://example.com",
+            }
+        ]
+    )
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    entry = {
+        "id": "https://example.com/post",
+        "link": "https://example.com/post",
+        "title": "Edge Notes",
+        "content": [{"value": "<p>Body</p>"}],
+    }
+    await worker._upsert_entry(feed_id=1, entry=entry)
+
+    metadata = mock_env.SEARCH_INDEX.metadata["7"]
+    assert metadata["title"] == "Edge Notes"
+    assert metadata["feed_title"] == "Example Blog"
+    assert metadata["author"] == "Ada"
+    assert metadata["published_at"] == "2026-01-15T12:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_keyword_results_render_highlighted_snippet(mock_env_with_entries):
+    """Keyword hits show their FTS snippet with matches marked, never raw content."""
+    from src.main import PlanetCF
+
+    entry = mock_env_with_entries.DB._data["entries"][0]
+    entry["snippet"] = "notes on <b> and \x02Test\x03 coverage…"
+    worker = PlanetCF()
+    worker.env = mock_env_with_entries
+
+    response = await worker._search_entries(
+        MockRequest("https://www.planetcloudflare.dev/search?q=test")
+    )
+
+    assert "notes on &lt;b&gt; and <mark>Test</mark> coverage…" in response.body
+
+
+@pytest.mark.asyncio
+async def test_upsert_entry_embeds_and_stores_extracted_text(mock_env):
+    """Ingest extracts the prose once and uses it for storage, FTS and the embedding."""
+    from src.main import PlanetCF
+    from tests.conftest import TrackingD1
+
+    mock_env.DB = TrackingD1([{"id": 7}])
+    mock_env.AI.run = AsyncMock(return_value={"data": [[0.1] * 768]})
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    entry = {
+        "id": "https://example.com/post",
+        "link": "https://example.com/post",
+        "title": "Edge Notes",
+        "content": [{"value": "<p>Edge <b>prose</b>.</p><pre><code>x = 1</code></pre>"}],
+    }
+    await worker._upsert_entry(feed_id=1, entry=entry)
+
+    insert = next(st for st in mock_env.DB.statements if "INSERT INTO entries (" in st.sql)
+    fts = next(st for st in mock_env.DB.statements if "INTO entries_fts" in st.sql)
+    assert insert.bound_args[-4] == "Edge prose."
+    assert fts.bound_args == [7, "Edge Notes", "Edge prose."]
+    embedded = mock_env.AI.run.call_args[0][1]["text"][0]
+    assert embedded == "Edge Notes\n\nEdge prose."
+
+
+@pytest.mark.asyncio
+async def test_reindex_backfills_missing_entry_text(mock_env):
+    """Entries stored before migration 009 get content_text written during reindex."""
+    from src.main import PlanetCF
+
+    db = _reindex_db(2)
+    db.conn.execute(
+        "UPDATE entries SET content_text = NULL, content = '<p>Old <em>body</em></p>' WHERE id = 1"
+    )
+    mock_env.DB = _RecordingD1(db)
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    await worker._reindex_all_entries({"id": 1, "github_username": "admin"})
+
+    backfills = [sql for sql in mock_env.DB.sql if "SET content_text" in sql]
+    assert len(backfills) == 1
+    assert db.rows("SELECT content_text FROM entries WHERE id = 1") == [
+        {"content_text": "Old body"}
+    ]
+    assert len(mock_env.SEARCH_INDEX.vectors) == 2
+
+
+@pytest.mark.asyncio
+async def test_d1_vector_index_serves_sweep_and_semantic_search(mock_env):
+    """With SEARCH_INDEX_BACKEND=d1 the cron sweep fills entry_vectors and search reads it."""
+    from src.main import PlanetCF
+    from vector_index import D1VectorIndex
+
+    db = _reindex_db(2)
+    mock_env.DB = db
+    mock_env.SEARCH_INDEX = D1VectorIndex(db)
+    D1VectorIndex._matrix = None
+    worker = PlanetCF()
+    worker.env = mock_env
+
+    sweep = await worker._sweep_unindexed_entries()
+    matches, entries = await worker._semantic_search("test entry", 5, 0.3, None)
+
+    assert sweep["indexed"] == 2
+    assert len(db.rows("SELECT id FROM entry_vectors")) == 2
+    assert sorted(int(m["id"]) for m in matches) == [1, 2]
+    assert entries[1]["title"] == "Test Entry 1"
+    D1VectorIndex._matrix = None
@@ -16,6 +16,7 @@ Key scenarios tested:
 """
 
 import json
+import re
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -96,7 +97,25 @@ class MockD1Statement:
         """Return results based on the query type."""
         results = []
 
-        if "FROM entries" in self.query and "LIKE" in self.query:
+        if "FROM entries_fts" in self.query and "MATCH" in self.query:
+            # FTS5 keyword search: every quoted prefix phrase must appear
+            terms = [
+                t.replace('""', '"').lower()
+                for t in re.findall(r'"((?:[^"]|"")*)"\*', self._bindings[0])
+            ]
+            for entry in self.db.entries.values():
+                text = f"{entry.get('title') or ''} {entry.get('content') or ''}".lower()
+                if terms and all(term in text for term in terms):
+                    feed = self.db.feeds.get(entry["feed_id"], {})
+                    results.append(
+                        {
+                            **entry,
+                            "feed_title": feed.get("title", "Unknown"),
+                            "feed_site_url": feed.get("site_url", ""),
+                        }
+                    )
+
+        elif "FROM entries" in self.query and "LIKE" in self.query:
             # Keyword search query
             if self._bindings:
                 pattern = self._bindings[0].strip("%").lower()
@@ -115,19 +134,23 @@ class MockD1Statement:
                             }
                         )
 
-        elif "FROM entries" in self.query and "WHERE e.id IN" in self.query:
-            # Fetch entries by ID for semantic results
-            for entry_id in self._bindings:
-                if entry_id in self.db.entries:
-                    entry = self.db.entries[entry_id]
-                    feed = self.db.feeds.get(entry["feed_id"], {})
-                    results.append(
-                        {
-                            **entry,
-                            "feed_title": feed.get("title", "Unknown"),
-                            "feed_site_url": feed.get("site_url", ""),
-                        }
-                    )
+        elif "FROM entries" in self.query and "json_each" in self.query:
+            # Semantic matches by ID: existence check, or hydration with feed info
+            for entry_id in json.loads(self._bindings[0]):
+                if entry_id not in self.db.entries:
+                    continue
+                if "WHERE e.id IN" not in self.query:
+                    results.append({"id": entry_id})
+                    continue
+                entry = self.db.entries[entry_id]
+                feed = self.db.feeds.get(entry["feed_id"], {})
+                results.append(
+                    {
+                        **entry,
+                        "feed_title": feed.get("title", "Unknown"),
+                        "feed_site_url": feed.get("site_url", ""),
+                    }
+                )
 
         return MagicMock(results=results)
 
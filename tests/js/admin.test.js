@@ -319,6 +319,32 @@ describe('rebuildSearchIndex', () => {
     expect(btn.textContent).toBe('Done!');
   });
 
+  it('polls /admin/reindex/status while the job is running', async () => {
+    vi.useFakeTimers();
+    fetchMock.mockImplementationOnce(() => Promise.resolve({
+      ok: true,
+      json: () => Promise.resolve({ success: true, status: 'running', indexed: 50, failed: 0, total: 120 })
+    }));
+    fetchMock.mockImplementationOnce(() => Promise.resolve({
+      ok: true,
+      json: () => Promise.resolve({ success: true, status: 'completed', indexed: 120, failed: 0, total: 120 })
+    }));
+
+    const { rebuildSearchIndex } = await import('../../static/admin.js');
+    const btn = document.getElementById('reindex-btn');
+
+    const done = rebuildSearchIndex();
+    await vi.advanceTimersByTimeAsync(0);
+    expect(btn.textContent).toBe('Reindexing... (50/120)');
+
+    await vi.advanceTimersByTimeAsync(2000);
+    await done;
+
+    expect(fetchMock).toHaveBeenLastCalledWith('/admin/reindex/status');
+    expect(btn.textContent).toBe('Done! (120 indexed)');
+    vi.useRealTimers();
+  });
+
   it('shows Failed on error', async () => {
     fetchMock.mockImplementation(() => Promise.reject(new Error('Network error')));
 
@@ -458,6 +458,24 @@ class TestLiteModeBlocking:
         body = json.loads(response.body)
         assert "lite mode" in body["error"].lower()
 
+    @pytest.mark.asyncio
+    async def test_search_allowed_in_lite_mode_with_d1_index(self):
+        """SEARCH_INDEX_BACKEND=d1 keeps /search available in lite mode."""
+        from unittest.mock import patch
+
+        worker, env, _ = make_authenticated_worker()
+        env.SEARCH_INDEX_BACKEND = "d1"
+
+        request = MockRequest(
+            url="https://www.planetcloudflare.dev/search?q=test",
+            method="GET",
+        )
+
+        with patch("src.main.check_lite_mode", return_value=True):
+            response = await worker.fetch(request)
+
+        assert response.status != 404
+
     @pytest.mark.asyncio
     async def test_admin_blocked_in_lite_mode(self):
         """Admin route returns 404 when lite mode is enabled."""
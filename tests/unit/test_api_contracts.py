@@ -399,9 +399,10 @@ class TestJSONResponseContracts:
 
         The admin JS rebuildSearchIndex() checks data.success and data.indexed.
         """
-        from tests.conftest import make_authenticated_worker
+        from tests.conftest import SqliteD1, make_authenticated_worker
 
         worker, env, _ = make_authenticated_worker()
+        env.DB = SqliteD1()
         admin = {"id": 1, "github_username": "testadmin", "display_name": "Admin", "is_active": 1}
         response = await worker._reindex_all_entries(admin)
         body = json.loads(response.body)
@@ -444,6 +445,9 @@ class TestJSONResponseContracts:
             "entries",  # loadAuditLog response
             "success",  # _update_feed, _reindex_all_entries responses
             "indexed",  # _reindex_all_entries response
+            "status",  # _reindex_all_entries / _reindex_status job state
+            "failed",  # reindex progress
+            "total",  # reindex progress
             "error",  # error responses (json_error)
             "length",  # JavaScript array length check (data.feeds.length)
         }
@@ -486,6 +490,9 @@ class TestRouteHandlerCoverage:
             # Skip prefix routes like /admin (they need sub-path dispatching)
             if route.prefix:
                 continue
+            # Pattern routes like /entry/:entry_id are matched with a sample value
+            if route.pattern:
+                path = re.sub(r":\w+", "1", route.pattern)
             match = router.match(path)
             assert match is not None, (
                 f"Route '{path}' is registered in _create_router() but "
@@ -2,25 +2,44 @@
 """Tests for config module."""
 
 from src.config import (
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    DEFAULT_ARCHIVE_LIMIT,
+    DEFAULT_CONTENT_COMPRESSION_LIMIT,
+    DEFAULT_EMBEDDING_CACHE_TTL_SECONDS,
     DEFAULT_EMBEDDING_MAX_CHARS,
+    DEFAULT_EXCERPT_LENGTH,
     DEFAULT_FEED_AUTO_DEACTIVATE_THRESHOLD,
     DEFAULT_FEED_FAILURE_THRESHOLD,
+    DEFAULT_INDEX_SWEEP_LIMIT,
     DEFAULT_MAX_ENTRIES_PER_FEED,
     DEFAULT_RETENTION_DAYS,
+    DEFAULT_RETENTION_TIME_BUDGET_MS,
+    DEFAULT_SEARCH_KEYWORD_TIMEOUT_MS,
     DEFAULT_SEARCH_SCORE_THRESHOLD,
+    DEFAULT_SEARCH_SEMANTIC_TIMEOUT_MS,
     DEFAULT_SEARCH_TOP_K,
     FEED_TIMEOUT_SECONDS,
     HTTP_TIMEOUT_SECONDS,
+    get_archive_after_days,
+    get_archive_limit,
     get_config_value,
+    get_content_compression_enabled,
+    get_content_compression_limit,
+    get_embedding_cache_ttl_seconds,
     get_embedding_max_chars,
+    get_excerpt_length,
     get_feed_auto_deactivate_threshold,
     get_feed_failure_threshold,
     get_feed_timeout,
     get_http_timeout,
+    get_index_sweep_limit,
     get_max_entries_per_feed,
     get_planet_config,
     get_retention_days,
+    get_retention_time_budget_ms,
+    get_search_keyword_timeout_ms,
     get_search_score_threshold,
+    get_search_semantic_timeout_ms,
     get_search_top_k,
 )
 
@@ -94,6 +113,10 @@ class TestConfigGetterDefaults:
         env = MockEnv()
         assert get_embedding_max_chars(env) == DEFAULT_EMBEDDING_MAX_CHARS
 
+    def test_get_embedding_cache_ttl_default(self):
+        env = MockEnv()
+        assert get_embedding_cache_ttl_seconds(env) == DEFAULT_EMBEDDING_CACHE_TTL_SECONDS
+
     def test_get_search_score_threshold_default(self):
         env = MockEnv()
         result = get_search_score_threshold(env)
@@ -120,6 +143,33 @@ class TestConfigGetterDefaults:
         env = MockEnv()
         assert get_http_timeout(env) == HTTP_TIMEOUT_SECONDS
 
+    def test_get_excerpt_length_default(self):
+        env = MockEnv()
+        assert get_excerpt_length(env) == DEFAULT_EXCERPT_LENGTH
+
+    def test_get_index_sweep_limit_default(self):
+        env = MockEnv()
+        assert get_index_sweep_limit(env) == DEFAULT_INDEX_SWEEP_LIMIT
+
+    def test_get_retention_time_budget_default(self):
+        env = MockEnv()
+        assert get_retention_time_budget_ms(env) == DEFAULT_RETENTION_TIME_BUDGET_MS
+
+    def test_get_archive_settings_default(self):
+        env = MockEnv()
+        assert get_archive_after_days(env) == DEFAULT_ARCHIVE_AFTER_DAYS
+        assert get_archive_limit(env) == DEFAULT_ARCHIVE_LIMIT
+
+    def test_get_content_compression_default(self):
+        env = MockEnv()
+        assert get_content_compression_enabled(env) is False
+        assert get_content_compression_limit(env) == DEFAULT_CONTENT_COMPRESSION_LIMIT
+
+    def test_get_search_branch_timeouts_default(self):
+        env = MockEnv()
+        assert get_search_semantic_timeout_ms(env) == DEFAULT_SEARCH_SEMANTIC_TIMEOUT_MS
+        assert get_search_keyword_timeout_ms(env) == DEFAULT_SEARCH_KEYWORD_TIMEOUT_MS
+
 
 class TestConfigGetterOverrides:
     """Tests that config getters properly read env overrides."""
@@ -138,6 +188,33 @@ class TestConfigGetterOverrides:
         env = MockEnv(RETENTION_MAX_ENTRIES_PER_FEED="200")
         assert get_max_entries_per_feed(env) == 200
 
+    def test_get_excerpt_length_override(self):
+        env = MockEnv(EXCERPT_LENGTH="150")
+        assert get_excerpt_length(env) == 150
+
+    def test_get_index_sweep_limit_override(self):
+        env = MockEnv(INDEX_SWEEP_LIMIT="0")
+        assert get_index_sweep_limit(env) == 0
+
+    def test_get_retention_time_budget_override(self):
+        env = MockEnv(RETENTION_TIME_BUDGET_MS="2500")
+        assert get_retention_time_budget_ms(env) == 2500
+
+    def test_get_archive_settings_override(self):
+        env = MockEnv(ARCHIVE_AFTER_DAYS="90", ARCHIVE_LIMIT="50")
+        assert get_archive_after_days(env) == 90
+        assert get_archive_limit(env) == 50
+
+    def test_get_content_compression_override(self):
+        env = MockEnv(CONTENT_COMPRESSION="true", CONTENT_COMPRESSION_LIMIT="100")
+        assert get_content_compression_enabled(env) is True
+        assert get_content_compression_limit(env) == 100
+
+    def test_get_search_branch_timeouts_override(self):
+        env = MockEnv(SEARCH_SEMANTIC_TIMEOUT_MS="1500", SEARCH_KEYWORD_TIMEOUT_MS="800")
+        assert get_search_semantic_timeout_ms(env) == 1500
+        assert get_search_keyword_timeout_ms(env) == 800
+
 
 class TestGetPlanetConfig:
     """Tests for get_planet_config()."""
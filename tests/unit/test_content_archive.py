@@ -0,0 +1,181 @@
+# tests/unit/test_content_archive.py
+"""Tests for the content archive tier (src/content_archive.py)."""
+
+import pytest
+
+from src.content_archive import (
+    FileArchiveStore,
+    archive_key,
+    compress_content,
+    decompress_content,
+)
+from src.main import Default
+from src.wrappers import SafeR2
+from tests.conftest import MockEnv, MockQueue, MockVectorize, SqliteD1
+
+HTML = "<p>" + "Archived prose with <em>markup</em>. " * 200 + "</p>"
+
+
+def _archive_env(tmp_path, **env_vars) -> MockEnv:
+    """SqliteD1 with one feed, an old entry (id 1) and a recent one (id 2)."""
+    db = SqliteD1()
+    db.insert("feeds", id=1, url="https://example.com/feed.xml", title="Example")
+    db.insert(
+        "entries",
+        id=1,
+        feed_id=1,
+        guid="old",
+        title="Old",
+        content=HTML,
+        content_text="Archived prose",
+        published_at="2000-01-01 00:00:00",
+    )
+    db.insert(
+        "entries",
+        id=2,
+        feed_id=1,
+        guid="new",
+        title="New",
+        content="<p>Fresh</p>",
+        content_text="Fresh",
+        published_at="2099-01-01 00:00:00",
+    )
+    env = MockEnv(
+        DB=db,
+        FEED_QUEUE=MockQueue(),
+        DEAD_LETTER_QUEUE=MockQueue(),
+        SEARCH_INDEX=MockVectorize(),
+        AI=None,
+    )
+    env.ARCHIVE = FileArchiveStore(tmp_path)
+    for key, value in env_vars.items():
+        setattr(env, key, value)
+    return env
+
+
+def _worker(env: MockEnv) -> Default:
+    worker = Default()
+    worker.env = env
+    return worker
+
+
+class TestCompression:
+    def test_round_trip(self):
+        blob = compress_content(HTML)
+
+        assert decompress_content(blob) == HTML
+        assert len(blob) < len(HTML.encode()) // 10
+
+    def test_round_trip_non_ascii(self):
+        assert decompress_content(compress_content("<p>Café – 日本</p>")) == "<p>Café – 日本</p>"
+
+
+class TestFileArchiveStore:
+    @pytest.mark.asyncio
+    async def test_put_get_delete(self, tmp_path):
+        store = FileArchiveStore(tmp_path)
+
+        await store.put(archive_key(7), b"data")
+        assert await (await store.get(archive_key(7))).arrayBuffer() == b"data"
+
+        await store.delete([archive_key(7), archive_key(8)])
+        assert await store.get(archive_key(7)) is None
+
+    @pytest.mark.asyncio
+    async def test_safe_r2_returns_bytes(self, tmp_path):
+        bucket = SafeR2(FileArchiveStore(tmp_path))
+
+        await bucket.put(archive_key(7), b"data")
+
+        assert await bucket.get(archive_key(7)) == b"data"
+        assert await bucket.get(archive_key(8)) is None
+
+
+class TestArchiveOldContent:
+    @pytest.mark.asyncio
+    async def test_moves_old_content_out_of_d1(self, tmp_path):
+        env = _archive_env(tmp_path)
+
+        worker = _worker(env)
+        stats = await worker._archive_old_content()
+
+        assert stats["candidates"] == 1
+        assert stats["archived"] == 1
+        rows = env.DB.rows("SELECT id, content, content_text, content_archived_at FROM entries")
+        old, new = rows
+        assert old["content"] is None
+        assert old["content_text"] == "Archived prose"
+        assert old["content_archived_at"] is not None
+        assert new["content"] == "<p>Fresh</p>"
+        assert decompress_content(await worker.env.ARCHIVE.get(archive_key(1))) == HTML
+
+    @pytest.mark.asyncio
+    async def test_failed_put_keeps_content_in_d1(self, tmp_path):
+        env = _archive_env(tmp_path)
+
+        async def failing_put(key, data):
+            raise RuntimeError("bucket unavailable")
+
+        env.ARCHIVE.put = failing_put
+
+        stats = await _worker(env)._archive_old_content()
+
+        assert stats["failed"] == 1
+        assert stats["archived"] == 0
+        assert env.DB.rows("SELECT content FROM entries WHERE id = 1") == [{"content": HTML}]
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_bucket_or_age(self, tmp_path):
+        env = _archive_env(tmp_path, ARCHIVE_AFTER_DAYS="0")
+        assert (await _worker(env)._archive_old_content())["candidates"] == 0
+
+        env = _archive_env(tmp_path)
+        env.ARCHIVE = None
+        assert (await _worker(env)._archive_old_content())["candidates"] == 0
+
+
+class TestArchivedReads:
+    @pytest.mark.asyncio
+    async def test_entry_fragment_reads_from_archive(self, tmp_path):
+        env = _archive_env(tmp_path)
+        worker = _worker(env)
+        await worker._archive_old_content()
+
+        response = await worker._serve_entry_content("1")
+
+        assert "Archived prose with" in response.body
+
+    @pytest.mark.asyncio
+    async def test_missing_object_leaves_content_empty(self, tmp_path):
+        env = _archive_env(tmp_path)
+        worker = _worker(env)
+        await worker._archive_old_content()
+        await env.ARCHIVE.delete([archive_key(1)])
+
+        entries = await worker._get_recent_entries(10)
+
+        assert {e["id"]: e["content"] for e in entries} == {2: "<p>Fresh</p>", 1: ""}
+
+    @pytest.mark.asyncio
+    async def test_refetch_restores_content_to_d1(self, tmp_path):
+        env = _archive_env(tmp_path)
+        worker = _worker(env)
+        await worker._archive_old_content()
+
+        await worker._upsert_entry(
+            1, {"id": "old", "title": "Old", "content": [{"value": "<p>Updated</p>"}]}
+        )
+
+        row = env.DB.rows("SELECT content, content_archived_at FROM entries WHERE id = 1")[0]
+        assert row == {"content": "<p>Updated</p>", "content_archived_at": None}
+
+    @pytest.mark.asyncio
+    async def test_retention_deletes_archived_objects(self, tmp_path):
+        env = _archive_env(tmp_path)
+        worker = _worker(env)
+        await worker._archive_old_content()
+
+        await worker._apply_retention_policy()
+
+        assert env.DB.rows("SELECT id FROM entries") == [{"id": 2}]
+        assert await env.ARCHIVE.get(archive_key(1)) is None
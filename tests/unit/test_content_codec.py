@@ -0,0 +1,220 @@
+# tests/unit/test_content_codec.py
+"""Tests for compressed entry content in D1 (src/content_codec.py)."""
+
+import base64
+import hashlib
+from datetime import UTC, datetime
+
+import pytest
+
+from src.content_codec import (
+    CONTENT_CODEC_MARKER,
+    CONTENT_COMPRESSION_MIN_CHARS,
+    EntryRow,
+    decode_content,
+    encode_content,
+    is_compressed,
+)
+from src.main import Default
+from src.wrappers import entry_row_from_js
+from tests.conftest import MockEnv, MockQueue, MockVectorize, SqliteD1
+
+HTML = "<p>" + "Compressible prose with <em>markup</em>. " * 100 + "</p>"
+
+
+def _noise() -> str:
+    """Text of over 1 KB that zlib can't shrink."""
+    digests = b"".join(hashlib.sha256(bytes([i])).digest() for i in range(128))
+    return base64.b85encode(digests).decode("ascii")
+
+
+class TestCodec:
+    def test_round_trip(self):
+        stored = encode_content(HTML)
+
+        assert stored.startswith(CONTENT_CODEC_MARKER)
+        assert len(stored) < len(HTML) // 4
+        assert decode_content(stored) == HTML
+
+    def test_round_trip_non_ascii(self):
+        html = "<p>Café – 日本語のテキスト</p>" * 100
+
+        assert decode_content(encode_content(html)) == html
+
+    def test_short_content_stays_plain(self):
+        html = "<p>Short</p>"
+        assert len(html) < CONTENT_COMPRESSION_MIN_CHARS
+
+        assert encode_content(html) == html
+
+    def test_disabled_stays_plain(self):
+        assert encode_content(HTML, compress=False) == HTML
+
+    def test_incompressible_content_stays_plain(self):
+        noise = _noise()
+
+        assert encode_content(noise) == noise
+
+    def test_marker_lookalike_is_always_encoded(self):
+        html = f"{CONTENT_CODEC_MARKER} not actually compressed"
+
+        stored = encode_content(html, compress=False)
+
+        assert stored != html
+        assert decode_content(stored) == html
+
+    def test_plain_and_empty_values_decode_unchanged(self):
+        assert decode_content("<p>Plain</p>") == "<p>Plain</p>"
+        assert decode_content("") == ""
+        assert decode_content(None) is None
+        assert not is_compressed(None)
+
+
+class TestEntryRow:
+    def test_content_decoded_on_first_access(self):
+        row = EntryRow({"id": 1, "content": encode_content(HTML)})
+
+        assert is_compressed(dict.__getitem__(row, "content"))
+        assert row["content"] == HTML
+        assert dict.__getitem__(row, "content") == HTML
+
+    def test_get_decodes_and_honours_default(self):
+        row = EntryRow({"content": encode_content(HTML)})
+
+        assert row.get("content") == HTML
+        assert row.get("missing", "fallback") == "fallback"
+
+    def test_entry_row_from_js_reads_compressed_rows(self):
+        row = entry_row_from_js({"id": 3, "title": "T", "content": encode_content(HTML)})
+
+        assert row["content"] == HTML
+
+
+def _worker(db: SqliteD1, **env_vars) -> Default:
+    env = MockEnv(
+        DB=db,
+        FEED_QUEUE=MockQueue(),
+        DEAD_LETTER_QUEUE=MockQueue(),
+        SEARCH_INDEX=MockVectorize(),
+        AI=None,
+    )
+    for key, value in env_vars.items():
+        setattr(env, key, value)
+    worker = Default()
+    worker.env = env
+    return worker
+
+
+def _db_with_feed() -> SqliteD1:
+    db = SqliteD1()
+    db.insert("feeds", id=1, url="https://example.com/feed.xml", title="Example")
+    return db
+
+
+class TestCompressedIngest:
+    @pytest.mark.asyncio
+    async def test_upsert_stores_compressed_content_when_enabled(self):
+        db = _db_with_feed()
+        worker = _worker(db, CONTENT_COMPRESSION="true")
+
+        await worker._upsert_entry(1, {"id": "a", "title": "A", "content": [{"value": HTML}]})
+
+        row = db.rows("SELECT id, content, content_text FROM entries")[0]
+        assert is_compressed(row["content"])
+        assert "Compressible prose" in row["content_text"]
+        response = await worker._serve_entry_content(str(row["id"]))
+        assert "Compressible prose with <em>markup</em>" in response.body
+
+    @pytest.mark.asyncio
+    async def test_upsert_stores_plain_content_by_default(self):
+        db = _db_with_feed()
+
+        await _worker(db)._upsert_entry(1, {"id": "a", "title": "A", "content": [{"value": HTML}]})
+
+        assert not is_compressed(db.rows("SELECT content FROM entries")[0]["content"])
+
+    @pytest.mark.asyncio
+    async def test_excerpt_of_compressed_row_comes_from_content_text(self):
+        db = _db_with_feed()
+        db.insert(
+            "entries",
+            id=1,
+            feed_id=1,
+            guid="a",
+            title="Compressed",
+            content=encode_content(HTML),
+            content_text="Plain text excerpt source",
+            published_at=datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+        html = await _worker(db, EXCERPT_MODE="true")._generate_html()
+
+        assert "Plain text excerpt source" in html
+        assert CONTENT_CODEC_MARKER not in html
+
+
+class TestCompressStoredContent:
+    def _backlog_db(self, count: int) -> SqliteD1:
+        db = _db_with_feed()
+        for entry_id in range(1, count + 1):
+            db.insert("entries", id=entry_id, feed_id=1, guid=f"g{entry_id}", content=HTML)
+        db.insert("entries", id=count + 1, feed_id=1, guid="short", content="<p>Short</p>")
+        return db
+
+    @pytest.mark.asyncio
+    async def test_compresses_backlog_in_chunks(self):
+        db = self._backlog_db(3)
+        worker = _worker(db, CONTENT_COMPRESSION="true", CONTENT_COMPRESSION_LIMIT="2")
+
+        first = await worker._compress_stored_content()
+        second = await worker._compress_stored_content()
+        third = await worker._compress_stored_content()
+
+        assert (first["candidates"], first["compressed"]) == (2, 2)
+        assert (second["candidates"], second["compressed"]) == (1, 1)
+        assert third["candidates"] == 0
+        assert first["bytes_saved"] > len(HTML)
+        contents = [r["content"] for r in db.rows("SELECT content FROM entries ORDER BY id")]
+        assert all(is_compressed(c) for c in contents[:3])
+        assert contents[3] == "<p>Short</p>"
+        assert decode_content(contents[0]) == HTML
+
+    @pytest.mark.asyncio
+    async def test_incompressible_rows_do_not_stall_the_backlog(self):
+        db = _db_with_feed()
+        for entry_id in (1, 2):
+            db.insert("entries", id=entry_id, feed_id=1, guid=f"n{entry_id}", content=_noise())
+        db.insert("entries", id=3, feed_id=1, guid="g3", content=HTML)
+        worker = _worker(db, CONTENT_COMPRESSION="true", CONTENT_COMPRESSION_LIMIT="2")
+
+        first = await worker._compress_stored_content()
+        second = await worker._compress_stored_content()
+
+        assert (first["candidates"], first["compressed"]) == (2, 0)
+        assert (second["candidates"], second["compressed"]) == (1, 1)
+        assert db.rows("SELECT id, content_encoding FROM entries ORDER BY id") == [
+            {"id": 1, "content_encoding": "identity"},
+            {"id": 2, "content_encoding": "identity"},
+            {"id": 3, "content_encoding": None},
+        ]
+        assert (await worker._compress_stored_content())["candidates"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        db = self._backlog_db(1)
+
+        stats = await _worker(db)._compress_stored_content()
+
+        assert stats["candidates"] == 0
+        assert not is_compressed(db.rows("SELECT content FROM entries WHERE id = 1")[0]["content"])
+
+    def test_backlog_query_uses_partial_index(self):
+        db = self._backlog_db(1)
+
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id, content FROM entries "
+            "WHERE length(content) >= 1024 AND substr(content, 1, 3) <> 'z1:' "
+            "AND content_encoding IS NULL ORDER BY id LIMIT 5"
+        ).fetchall()
+
+        assert "idx_entries_uncompressed" in str([tuple(row) for row in plan])
@@ -0,0 +1,74 @@
+# tests/unit/test_embedding_cache.py
+"""Tests for the query embedding cache helpers."""
+
+import pytest
+
+from src.embedding_cache import (
+    EmbeddingLRU,
+    decode_embedding,
+    encode_embedding,
+    normalize_query_key,
+)
+
+MODEL = "@cf/test/model"
+
+
+class TestNormalizeQueryKey:
+    """Case and whitespace variants of a query share one key."""
+
+    def test_lowercases_and_collapses_whitespace(self):
+        assert normalize_query_key("  Cloudflare\tWorkers \n") == "cloudflare workers"
+
+    def test_preserves_quotes(self):
+        assert normalize_query_key('"Error  Handling"') == '"error handling"'
+
+
+class TestEmbeddingEncoding:
+    """Embeddings round-trip through D1 storage at float32 precision."""
+
+    def test_round_trip(self):
+        vector = [0.5, -0.25, 0.125, 1.0]
+        assert decode_embedding(encode_embedding(vector)) == vector
+
+    def test_float32_precision(self):
+        decoded = decode_embedding(encode_embedding([0.1] * 768))
+        assert len(decoded) == 768
+        assert decoded[0] == pytest.approx(0.1, abs=1e-7)
+
+    def test_encoded_size(self):
+        # 768 float32 values = 3072 bytes = 4096 base64 characters
+        assert len(encode_embedding([0.1] * 768)) == 4096
+
+
+class TestEmbeddingLRU:
+    """Bounded LRU keyed by (model, query key)."""
+
+    def test_get_missing_returns_none(self):
+        assert EmbeddingLRU(2).get(MODEL, "absent") is None
+
+    def test_put_then_get(self):
+        cache = EmbeddingLRU(2)
+        cache.put(MODEL, "python", [0.5, 0.25])
+        assert cache.get(MODEL, "python") == [0.5, 0.25]
+
+    def test_keyed_by_model(self):
+        cache = EmbeddingLRU(2)
+        cache.put(MODEL, "python", [0.5])
+        assert cache.get("@cf/other/model", "python") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = EmbeddingLRU(2)
+        cache.put(MODEL, "a", [1.0])
+        cache.put(MODEL, "b", [2.0])
+        cache.get(MODEL, "a")  # "b" is now least recently used
+        cache.put(MODEL, "c", [3.0])
+        assert len(cache) == 2
+        assert cache.get(MODEL, "b") is None
+        assert cache.get(MODEL, "a") == [1.0]
+        assert cache.get(MODEL, "c") == [3.0]
+
+    def test_clear(self):
+        cache = EmbeddingLRU(2)
+        cache.put(MODEL, "a", [1.0])
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,336 @@
+# tests/unit/test_entry_fingerprint.py
+"""Tests for cross-feed duplicate detection (src/entry_fingerprint.py)."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.content_archive import FileArchiveStore, archive_key, compress_content
+from src.entry_fingerprint import (
+    DUPLICATE_MIN_TEXT_CHARS,
+    content_hash,
+    normalize_entry_url,
+    url_hash,
+)
+from src.main import Default
+from src.search_query import SearchQueryBuilder
+from src.wrappers import SafeR2, entry_row_from_js
+from tests.conftest import MockEnv, MockQueue, MockVectorize, SqliteD1
+
+TEXT = "A long post about running Python on the edge. " * 10
+HTML = f"<p>{TEXT}</p>"
+NOW = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class TestNormalizeEntryUrl:
+    def test_scheme_www_and_trailing_slash_ignored(self):
+        assert (
+            normalize_entry_url("http://www.Example.com/post/")
+            == normalize_entry_url("https://example.com/post")
+            == "example.com/post"
+        )
+
+    def test_tracking_params_and_fragment_dropped(self):
+        assert (
+            normalize_entry_url("https://example.com/post?utm_source=rss&b=2&a=1&fbclid=x#top")
+            == "example.com/post?a=1&b=2"
+        )
+
+    def test_non_default_port_kept(self):
+        assert normalize_entry_url("https://example.com:8443/post") == "example.com:8443/post"
+
+    def test_non_http_links_rejected(self):
+        assert normalize_entry_url(None) is None
+        assert normalize_entry_url("") is None
+        assert normalize_entry_url("mailto:someone@example.com") is None
+        assert normalize_entry_url("tag:example.com,2026:post-1") is None
+
+
+class TestHashes:
+    def test_url_hash_matches_variants(self):
+        assert url_hash("https://example.com/post?utm_medium=feed") == url_hash(
+            "http://www.example.com/post/"
+        )
+        assert url_hash("https://example.com/a") != url_hash("https://example.com/b")
+        assert url_hash(None) is None
+
+    def test_content_hash_ignores_case_and_whitespace(self):
+        assert content_hash(TEXT) == content_hash("  " + TEXT.upper().replace(" ", "\n  "))
+
+    def test_short_text_has_no_content_hash(self):
+        assert content_hash("x" * (DUPLICATE_MIN_TEXT_CHARS - 1)) is None
+        assert content_hash(None) is None
+
+
+def _worker(db: SqliteD1, search_index: MockVectorize | None = None) -> Default:
+    worker = Default()
+    worker.env = MockEnv(
+        DB=db,
+        FEED_QUEUE=MockQueue(),
+        DEAD_LETTER_QUEUE=MockQueue(),
+        SEARCH_INDEX=search_index or MockVectorize(),
+        AI=None,
+    )
+    return worker
+
+
+def _db_with_feeds() -> SqliteD1:
+    db = SqliteD1()
+    db.insert("feeds", id=1, url="https://alice.example/feed", title="Alice", is_active=1)
+    db.insert("feeds", id=2, url="https://planet.example/feed", title="Aggregator", is_active=1)
+    return db
+
+
+def _entry(guid: str, link: str, html: str = HTML) -> dict:
+    return {"id": guid, "title": "Edge Python", "link": link, "content": [{"value": html}]}
+
+
+class TestDuplicateIngest:
+    @pytest.mark.asyncio
+    async def test_second_feed_links_to_first(self):
+        db = _db_with_feeds()
+        worker = _worker(db)
+
+        first = await worker._upsert_entry(1, _entry("a", "https://alice.example/edge/"))
+        second = await worker._upsert_entry(
+            2, _entry("b", "http://www.alice.example/edge?utm_source=planet")
+        )
+
+        assert "duplicate_of" not in first
+        assert second["duplicate_of"] == first["entry_id"]
+        dup = db.rows(
+            "SELECT content, content_text, canonical_entry_id FROM entries WHERE feed_id = 2"
+        )[0]
+        assert dup == {
+            "content": None,
+            "content_text": None,
+            "canonical_entry_id": first["entry_id"],
+        }
+        fts_ids = [r["rowid"] for r in db.rows("SELECT rowid FROM entries_fts")]
+        assert fts_ids == [first["entry_id"]]
+
+    @pytest.mark.asyncio
+    async def test_same_text_under_another_link_is_a_duplicate(self):
+        db = _db_with_feeds()
+        worker = _worker(db)
+
+        first = await worker._upsert_entry(1, _entry("a", "https://alice.example/edge"))
+        second = await worker._upsert_entry(2, _entry("b", "https://planet.example/p/123"))
+
+        assert second["duplicate_of"] == first["entry_id"]
+
+    @pytest.mark.asyncio
+    async def test_different_posts_are_both_canonical(self):
+        db = _db_with_feeds()
+        worker = _worker(db)
+
+        await worker._upsert_entry(1, _entry("a", "https://alice.example/one"))
+        other = await worker._upsert_entry(
+            2, _entry("b", "https://planet.example/two", html="<p>" + "Other. " * 50 + "</p>")
+        )
+
+        assert "duplicate_of" not in other
+        assert db.rows("SELECT COUNT(*) AS n FROM entries WHERE canonical_entry_id IS NULL") == [
+            {"n": 2}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_refetched_legacy_entry_is_demoted(self):
+        db = _db_with_feeds()
+        search_index = MockVectorize()
+        worker = _worker(db, search_index)
+        canonical = await worker._upsert_entry(1, _entry("a", "https://alice.example/edge"))
+        # Stored before migration 016: canonical, with no hashes, indexed
+        db.insert(
+            "entries",
+            id=50,
+            feed_id=2,
+            guid="b",
+            title="Edge Python",
+            content=HTML,
+            content_text=TEXT,
+            embedding_model="bge",
+        )
+        db.insert("entries", id=51, feed_id=2, guid="c", canonical_entry_id=50)
+        search_index.vectors["50"] = [0.1]
+
+        result = await worker._upsert_entry(2, _entry("b", "https://alice.example/edge"))
+
+        assert result["duplicate_of"] == canonical["entry_id"]
+        rows = db.rows(
+            "SELECT id, content, embedding_model, canonical_entry_id FROM entries "
+            "WHERE id IN (50, 51) ORDER BY id"
+        )
+        assert rows == [
+            {
+                "id": 50,
+                "content": None,
+                "embedding_model": None,
+                "canonical_entry_id": canonical["entry_id"],
+            },
+            {
+                "id": 51,
+                "content": None,
+                "embedding_model": None,
+                "canonical_entry_id": canonical["entry_id"],
+            },
+        ]
+        assert "50" not in search_index.vectors
+
+    @pytest.mark.asyncio
+    async def test_demotion_deletes_vector_of_unmarked_entry(self):
+        db = _db_with_feeds()
+        search_index = MockVectorize()
+        worker = _worker(db, search_index)
+        await worker._upsert_entry(1, _entry("a", "https://alice.example/edge"))
+        # Upserted to the index, but marking embedding_model failed
+        db.insert("entries", id=50, feed_id=2, guid="b", content=HTML, content_text=TEXT)
+        search_index.vectors["50"] = [0.1]
+
+        await worker._upsert_entry(2, _entry("b", "https://alice.example/edge"))
+
+        assert "50" not in search_index.vectors
+
+    def test_lookup_uses_partial_indexes(self):
+        plan = (
+            _db_with_feeds()
+            .conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM entries "
+                "WHERE canonical_entry_id IS NULL AND feed_id != ? "
+                "AND (url_hash = ? OR content_hash = ?) ORDER BY id LIMIT 1",
+                (1, "a", "b"),
+            )
+            .fetchall()
+        )
+
+        details = str([tuple(row) for row in plan])
+        assert "idx_entries_url_hash" in details
+        assert "idx_entries_content_hash" in details
+
+
+class TestPromoteTrigger:
+    def test_deleting_canonical_promotes_oldest_duplicate(self):
+        db = _db_with_feeds()
+        db.insert("feeds", id=3, url="https://third.example/feed", title="Third")
+        db.insert("entries", id=1, feed_id=1, guid="a", content=HTML, content_text=TEXT)
+        db.insert("entries", id=2, feed_id=2, guid="b", canonical_entry_id=1)
+        db.insert("entries", id=3, feed_id=3, guid="c", canonical_entry_id=1)
+
+        db.conn.execute("DELETE FROM entries WHERE id = 1")
+
+        rows = db.rows("SELECT id, content, content_text, canonical_entry_id FROM entries")
+        assert rows == [
+            {"id": 2, "content": HTML, "content_text": TEXT, "canonical_entry_id": None},
+            {"id": 3, "content": None, "content_text": None, "canonical_entry_id": 2},
+        ]
+
+    def test_promoted_duplicate_is_keyword_indexed_and_left_for_embedding(self):
+        db = _db_with_feeds()
+        db.insert(
+            "entries",
+            id=1,
+            feed_id=1,
+            guid="a",
+            title="Edge",
+            content_text=TEXT,
+            embedding_model="m",
+        )
+        db.insert(
+            "entries",
+            id=2,
+            feed_id=2,
+            guid="b",
+            title="Edge",
+            canonical_entry_id=1,
+            embedding_model="m",
+            index_attempts=3,
+        )
+
+        db.conn.execute("DELETE FROM entries WHERE id = 1")
+
+        assert db.rows("SELECT rowid, title, body FROM entries_fts") == [
+            {"rowid": 2, "title": "Edge", "body": TEXT}
+        ]
+        assert db.rows("SELECT embedding_model, index_attempts FROM entries") == [
+            {"embedding_model": None, "index_attempts": 0}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_retention_hands_archived_content_to_promoted_duplicate(self, tmp_path):
+        db = _db_with_feeds()
+        db.insert(
+            "entries",
+            id=1,
+            feed_id=1,
+            guid="a",
+            content_text=TEXT,
+            content_archived_at="2000-02-01 00:00:00",
+            published_at="2000-01-01 00:00:00",
+        )
+        db.insert("entries", id=2, feed_id=2, guid="b", canonical_entry_id=1, published_at=NOW)
+        worker = _worker(db)
+        worker.env.ARCHIVE = SafeR2(FileArchiveStore(tmp_path))
+        await worker.env.ARCHIVE.put(archive_key(1), compress_content(HTML))
+
+        stats = await worker._apply_retention_policy()
+
+        assert stats["entries_deleted"] == 1
+        assert db.rows("SELECT id, content_archived_at FROM entries") == [
+            {"id": 2, "content_archived_at": "2000-02-01 00:00:00"}
+        ]
+        assert await worker.env.ARCHIVE.get(archive_key(1)) is None
+        assert await worker.env.ARCHIVE.get(archive_key(2)) == compress_content(HTML)
+
+
+class TestDuplicateRendering:
+    @pytest.mark.asyncio
+    async def test_homepage_shows_post_once_with_also_in(self):
+        db = _db_with_feeds()
+        db.insert(
+            "entries",
+            id=1,
+            feed_id=1,
+            guid="a",
+            title="Edge Python",
+            url="https://alice.example/edge",
+            content=HTML,
+            published_at=NOW,
+        )
+        db.insert(
+            "entries",
+            id=2,
+            feed_id=2,
+            guid="b",
+            title="Edge Python",
+            url="https://planet.example/p/1",
+            canonical_entry_id=1,
+            published_at=NOW,
+        )
+
+        html = await _worker(db)._generate_html()
+
+        assert html.count(">Edge Python<") == 1
+        assert "also in" in html
+        assert "https://planet.example/p/1" in html
+
+    def test_entry_row_parses_also_in(self):
+        row = entry_row_from_js(
+            {
+                "id": 1,
+                "also_in": '[{"feed_title": "Aggregator", "feed_site_url": null, "url": "u"}]',
+            }
+        )
+
+        assert row["also_in"] == [{"feed_title": "Aggregator", "feed_site_url": "", "url": "u"}]
+        assert entry_row_from_js({"id": 1})["also_in"] == []
+
+    def test_keyword_fallback_skips_duplicates(self):
+        db = _db_with_feeds()
+        db.insert("entries", id=1, feed_id=1, guid="a", title="Edge Python", content_text=TEXT)
+        db.insert("entries", id=2, feed_id=2, guid="b", title="Edge Python", canonical_entry_id=1)
+
+        for query in ("edge", "edge python"):
+            built = SearchQueryBuilder(query=query).build()
+            rows = db.conn.execute(built.sql, built.params).fetchall()
+
+            assert [row["id"] for row in rows] == [1]
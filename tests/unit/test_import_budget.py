@@ -0,0 +1,95 @@
+# tests/unit/test_import_budget.py
+"""Import-time budget for the Worker entry module.
+
+Every cold start pays for `import main` before the first request is served,
+so template sources and compiled template modules must stay out of that path
+and load only when a page is actually rendered.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Generous ceiling for CI noise; `import main` is ~150-200ms locally.
+IMPORT_BUDGET_MS = 1000
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import tests.conftest  # installs the mock workers module and src/ on sys.path
+start = time.perf_counter()
+{statement}
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed_ms, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _probe(statement: str) -> tuple[float, set[str]]:
+    """Run `statement` in a fresh interpreter; return (elapsed ms, loaded modules)."""
+    code = _PROBE.format(root=str(PROJECT_ROOT), statement=statement)
+    result = subprocess.run(  # noqa: S603 - fixed probe run with this interpreter
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    return data["ms"], set(data["modules"])
+
+
+def _template_modules(modules: set[str]) -> set[str]:
+    return {m for m in modules if m.startswith("templates_") or m.startswith("compiled_templates.")}
+
+
+class TestImportBudget:
+    """`import main` stays within budget and loads no template bodies."""
+
+    def test_import_main_within_budget(self):
+        elapsed_ms, _ = _probe("import main")
+        assert elapsed_ms < IMPORT_BUDGET_MS, (
+            f"import main took {elapsed_ms:.0f}ms (budget {IMPORT_BUDGET_MS}ms)"
+        )
+
+    def test_import_main_loads_no_template_sources(self):
+        _, modules = _probe("import main")
+        assert _template_modules(modules) == set()
+
+    def test_theme_render_loads_only_that_theme(self):
+        _, modules = _probe(
+            "from templates import get_jinja_env; get_jinja_env('planet-python').get_template('index.html')"
+        )
+        loaded = _template_modules(modules)
+        # Compiled modules execute in a fresh namespace, so only the package
+        # shows up in sys.modules; the source module must not be imported.
+        assert "compiled_templates.planet_python" in loaded
+        assert "templates_planet_python" not in loaded
+        assert not any("planet_mozilla" in m for m in loaded)
+        assert "templates_admin" not in loaded
+        assert not any(m.startswith("compiled_templates._admin") for m in loaded)
+
+    def test_admin_templates_load_lazily(self):
+        _, modules = _probe(
+            "from templates import EmbeddedLoader\n"
+            "from jinja2 import Environment\n"
+            "Environment(loader=EmbeddedLoader('default'), autoescape=True)"
+            ".get_template('admin/dashboard.html')"
+        )
+        loaded = _template_modules(modules)
+        assert "templates_admin" in loaded
+        assert "templates_planet_python" not in loaded
+
+    def test_import_main_defers_ingest_dependencies(self):
+        """Parsing, sanitization and HTTP client libraries load on ingest only."""
+        _, modules = _probe("import main")
+        for heavy in ("feedparser", "bleach", "httpx"):
+            assert heavy not in modules, f"{heavy} imported by `import main`"
+
+    def test_ingest_dependencies_load_on_use(self):
+        _, modules = _probe(
+            "from models import BleachSanitizer; BleachSanitizer().clean('<p>x</p>')"
+        )
+        assert "bleach" in modules
@@ -0,0 +1,85 @@
+# tests/unit/test_import_timing.py
+"""Tests for per-module startup import timing."""
+
+import builtins
+import sys
+
+import pytest
+
+from src.import_timing import ImportTimer
+from tests.conftest import MockRequest
+
+
+@pytest.fixture
+def module_dir(tmp_path, monkeypatch):
+    """Directory on sys.path with throwaway modules; unloaded afterwards."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in [m for m in sys.modules if m.startswith("_timing_probe")]:
+        del sys.modules[name]
+
+
+class TestImportTimer:
+    def test_records_newly_imported_modules(self, module_dir):
+        (module_dir / "_timing_probe_a.py").write_text("import _timing_probe_b\nVALUE = 1\n")
+        (module_dir / "_timing_probe_b.py").write_text("VALUE = 2\n")
+
+        timer = ImportTimer()
+        timer.start()
+        import _timing_probe_a  # noqa: F401
+
+        timer.stop()
+
+        assert set(timer.timings) >= {"_timing_probe_a", "_timing_probe_b"}
+        assert all(ms >= 0 for ms in timer.timings.values())
+        assert timer.total_ms >= sum(timer.timings.values()) - 0.01
+
+    def test_already_loaded_modules_not_recorded(self):
+        timer = ImportTimer()
+        timer.start()
+        import json  # noqa: F401
+
+        timer.stop()
+
+        assert "json" not in timer.timings
+
+    def test_stop_restores_builtin_import(self):
+        original = builtins.__import__
+        timer = ImportTimer()
+        timer.start()
+        assert builtins.__import__ is not original
+        timer.stop()
+        assert builtins.__import__ is original
+
+    def test_consume_returns_slowest_once(self):
+        timer = ImportTimer()
+        timer.timings = {"fast": 1.0, "slow": 9.0, "medium": 4.0}
+
+        assert timer.consume(limit=2) == {"slow": 9.0, "medium": 4.0}
+        assert timer.consume() is None
+
+
+class TestStartupImportsOnRequestEvent:
+    async def test_first_request_reports_startup_imports(self, mock_env, monkeypatch):
+        import src.main as main_module
+
+        timer = ImportTimer()
+        timer.timings = {"jinja2": 12.5}
+        timer.total_ms = 40.0
+        monkeypatch.setattr(main_module, "_import_timer", timer)
+        emitted = []
+        monkeypatch.setattr(
+            main_module, "emit_event", lambda event, **kwargs: emitted.append((event, kwargs))
+        )
+
+        worker = main_module.Default()
+        worker.env = mock_env
+        await worker.fetch(MockRequest("https://example.com/health"))
+        await worker.fetch(MockRequest("https://example.com/health"))
+
+        first, second = emitted
+        assert first[0].startup_import_ms == 40.0
+        assert first[0].startup_imports == {"jinja2": 12.5}
+        assert first[1] == {"force": True}
+        assert second[0].startup_imports is None
+        assert second[1] == {"force": False}
@@ -116,8 +116,10 @@ class TestInactiveFeedTemplates:
         assert "feed-inactive" in template
 
     def test_compiled_templates_have_feed_inactive(self):
-        """Compiled templates.py should contain feed-inactive for all themes."""
-        templates = (PROJECT_ROOT / "src" / "templates.py").read_text()
+        """Generated template sources should contain feed-inactive for all themes."""
+        templates = "".join(
+            path.read_text() for path in sorted((PROJECT_ROOT / "src").glob("templates_*.py"))
+        )
         # Should appear at least 3 times (once per theme)
         count = templates.count("feed-inactive")
         assert count >= 3, f"Expected feed-inactive in at least 3 themes, found {count} occurrences"
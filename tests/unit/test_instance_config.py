@@ -1,7 +1,7 @@
 # tests/unit/test_instance_config.py
 """Tests for instance_config module."""
 
-from src.instance_config import DEFAULTS, _get_env, is_lite_mode
+from src.instance_config import DEFAULTS, _get_env, has_d1_search_index, is_lite_mode
 
 
 class MockEnv:
@@ -91,3 +91,15 @@ class TestGetEnv:
         env = MockEnv(PLANET_NAME="From Env")
         result = _get_env(env, "PLANET_NAME", "From Default")
         assert result == "From Env"
+
+
+class TestHasD1SearchIndex:
+    """Tests for has_d1_search_index()."""
+
+    def test_true_for_d1_backend(self):
+        env = MockEnv(SEARCH_INDEX_BACKEND="D1")
+        assert has_d1_search_index(env) is True
+
+    def test_false_by_default(self):
+        env = MockEnv()
+        assert has_d1_search_index(env) is False
@@ -0,0 +1,106 @@
+# tests/unit/test_isolate.py
+"""Tests for isolate lifecycle telemetry (src/isolate.py)."""
+
+import pytest
+
+from src.isolate import ISOLATE_SUMMARY_INTERVAL_SECONDS, IsolateLifecycle
+from tests.conftest import MockEnv, MockQueue, MockRequest, MockVectorize, SqliteD1
+
+T0 = 1_760_000_000.0
+
+
+class TestIsolateLifecycle:
+    def test_nothing_started_before_first_invocation(self):
+        isolate = IsolateLifecycle()
+
+        assert isolate.isolate_id == ""
+        assert isolate.age_s() == 0.0
+        assert isolate.summary_due(now=T0 + 3600) is None
+
+    def test_first_invocation_starts_the_isolate(self):
+        isolate = IsolateLifecycle()
+
+        assert isolate.invoke("scheduled", now=T0) == 1
+        assert isolate.cold
+        assert len(isolate.isolate_id) == 16
+        assert isolate.started_at.startswith("2025-10-09T")
+
+        assert isolate.invoke("request", now=T0 + 2) == 1
+        assert not isolate.cold
+        assert isolate.invoke("request", now=T0 + 3) == 2
+        assert isolate.age_s(now=T0 + 3) == 3.0
+
+    def test_isolates_get_distinct_ids(self):
+        first, second = IsolateLifecycle(), IsolateLifecycle()
+        first.invoke("request")
+        second.invoke("request")
+
+        assert first.isolate_id != second.isolate_id
+
+    def test_summary_due_once_per_interval(self):
+        isolate = IsolateLifecycle()
+        isolate.invoke("request", now=T0)
+        isolate.invoke("queue", now=T0 + 1)
+        isolate.record_init("db_init_ms", 12.345)
+
+        assert isolate.summary_due(now=T0 + 10) is None
+        summary = isolate.summary_due(now=T0 + ISOLATE_SUMMARY_INTERVAL_SECONDS)
+
+        assert summary["event_type"] == "isolate_summary"
+        assert summary["isolate_id"] == isolate.isolate_id
+        assert summary["isolate_age_s"] == ISOLATE_SUMMARY_INTERVAL_SECONDS
+        assert (summary["isolate_requests"], summary["isolate_queue_batches"]) == (1, 1)
+        assert summary["isolate_init_ms"] == {"db_init_ms": 12.35}
+        assert isolate.summary_due(now=T0 + ISOLATE_SUMMARY_INTERVAL_SECONDS + 1) is None
+
+
+class TestIsolateFieldsOnRequestEvent:
+    @pytest.mark.asyncio
+    async def test_requests_carry_lifecycle_and_init_timings(self, monkeypatch):
+        import src.main as main_module
+
+        monkeypatch.setattr(main_module, "_isolate", IsolateLifecycle())
+        emitted = []
+        monkeypatch.setattr(
+            main_module, "emit_event", lambda event, **kwargs: emitted.append((event, kwargs))
+        )
+
+        worker = main_module.Default()
+        worker.env = MockEnv(
+            DB=SqliteD1(),
+            FEED_QUEUE=MockQueue(),
+            DEAD_LETTER_QUEUE=MockQueue(),
+            SEARCH_INDEX=MockVectorize(),
+            AI=None,
+        )
+        await worker.fetch(MockRequest("https://example.com/health"))
+        await worker.fetch(MockRequest("https://example.com/health"))
+
+        (first, first_kwargs), (second, second_kwargs) = emitted
+        assert first.isolate_cold and first_kwargs == {"force": True}
+        assert (first.isolate_request_ordinal, second.isolate_request_ordinal) == (1, 2)
+        assert first.isolate_id == second.isolate_id != ""
+        assert first.isolate_started_at == second.isolate_started_at
+        assert first.startup_db_init_ms >= first.startup_schema_drift_ms > 0
+        assert not second.isolate_cold and second_kwargs == {"force": False}
+        assert second.startup_db_init_ms is None
+
+    @pytest.mark.asyncio
+    async def test_summary_emitted_when_due(self, mock_env, monkeypatch):
+        import src.main as main_module
+
+        isolate = IsolateLifecycle()
+        isolate.invoke("request", now=T0)
+        monkeypatch.setattr(main_module, "_isolate", isolate)
+        emitted = []
+        monkeypatch.setattr(
+            main_module, "emit_event", lambda event, **kwargs: emitted.append(event)
+        )
+
+        worker = main_module.Default()
+        worker.env = mock_env
+        await worker.fetch(MockRequest("https://example.com/health"))
+
+        summary = emitted[-1]
+        assert summary["event_type"] == "isolate_summary"
+        assert summary["isolate_requests"] == 2
@@ -0,0 +1,134 @@
+# tests/unit/test_latency.py
+"""Tests for rolling latency histograms (src/latency.py)."""
+
+from src.latency import (
+    BUCKET_COUNT,
+    MAX_KEYS,
+    MAX_MS,
+    SUMMARY_INTERVAL_SECONDS,
+    THRESHOLD_REFRESH_RECORDS,
+    WINDOW_SECONDS,
+    LatencyHistogram,
+    LatencyHistograms,
+    bucket_index,
+    bucket_upper_ms,
+)
+
+T0 = 1_000_000.0
+
+
+class TestBuckets:
+    def test_bucket_bounds_contain_latency(self):
+        for ms in (0.5, 1.0, 7.3, 120.0, 999.9, 45_000.0):
+            index = bucket_index(ms)
+            assert bucket_upper_ms(index - 1) <= ms <= bucket_upper_ms(index)
+
+    def test_out_of_range_latencies_are_clamped(self):
+        assert bucket_index(0) == 0
+        assert bucket_index(-5) == 0
+        assert bucket_index(MAX_MS * 10) == BUCKET_COUNT - 1
+
+
+class TestLatencyHistogram:
+    def test_empty_histogram_has_no_quantiles(self):
+        histogram = LatencyHistogram(now=T0)
+
+        assert histogram.count() == 0
+        assert histogram.quantile(0.99) is None
+
+    def test_quantiles_within_bucket_precision(self):
+        histogram = LatencyHistogram(now=T0)
+        for ms in range(1, 1001):
+            histogram.record(float(ms), now=T0)
+
+        assert histogram.count() == 1000
+        assert 500 <= histogram.quantile(0.50) <= 500 * 1.1
+        assert 950 <= histogram.quantile(0.95) <= 950 * 1.1
+        assert histogram.quantile(0.99) <= histogram.max_ms() == 1000.0
+
+    def test_windows_roll_and_expire(self):
+        histogram = LatencyHistogram(now=T0)
+        histogram.record(10.0, now=T0)
+
+        histogram.record(20.0, now=T0 + WINDOW_SECONDS)
+        assert histogram.count() == 2
+
+        histogram.record(30.0, now=T0 + 2 * WINDOW_SECONDS)
+        assert histogram.count() == 2
+        assert histogram.max_ms() == 30.0
+
+        histogram.record(40.0, now=T0 + 5 * WINDOW_SECONDS)
+        assert histogram.count() == 1
+        assert histogram.quantile(0.5) == 40.0
+
+    def test_tail_thresholds_refresh_after_records(self):
+        histogram = LatencyHistogram(now=T0)
+        assert histogram.tail_thresholds() is None
+        for _ in range(100):
+            histogram.record(10.0, now=T0)
+        assert histogram.tail_thresholds() == (10.0, 10.0)
+
+        for _ in range(THRESHOLD_REFRESH_RECORDS - 1):
+            histogram.record(1000.0, now=T0)
+        assert histogram.tail_thresholds() == (10.0, 10.0)
+        histogram.record(1000.0, now=T0)
+        assert histogram.tail_thresholds()[1] > 10.0
+
+    def test_snapshot_lists_non_empty_buckets(self):
+        histogram = LatencyHistogram(now=T0)
+        for ms in (5.0, 5.0, 80.0):
+            histogram.record(ms, now=T0)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 3
+        assert snapshot["max_ms"] == 80.0
+        assert [count for _, count in snapshot["buckets"]] == [2, 1]
+
+
+class TestLatencyHistograms:
+    def test_records_route_and_event_type(self):
+        histograms = LatencyHistograms()
+        histograms.record({"event_type": "request", "route": "/search", "wall_time_ms": 40})
+        histograms.record({"event_type": "request", "route": "/", "wall_time_ms": 5})
+
+        search = histograms.get({"event_type": "request", "route": "/search"})
+        assert search.count() == 1
+        unseen = histograms.get({"event_type": "request", "route": "/feed.xml"})
+        assert unseen.count() == 2
+
+    def test_get_falls_back_to_event_type_below_min_count(self):
+        histograms = LatencyHistograms()
+        histograms.record({"event_type": "request", "route": "/", "wall_time_ms": 5})
+        for _ in range(3):
+            histograms.record({"event_type": "request", "route": "/search", "wall_time_ms": 40})
+
+        home = {"event_type": "request", "route": "/"}
+        assert histograms.get(home, min_count=3).count() == 4
+        assert histograms.get(home, min_count=5) is None
+
+    def test_ignores_events_without_latency(self):
+        histograms = LatencyHistograms()
+        histograms.record({"event_type": "test"})
+        histograms.record({"event_type": "test", "wall_time_ms": "slow"})
+
+        assert histograms.get({"event_type": "test"}) is None
+
+    def test_route_histograms_are_bounded(self):
+        histograms = LatencyHistograms()
+        for n in range(MAX_KEYS * 2):
+            histograms.record({"event_type": "request", "route": f"/r{n}", "wall_time_ms": 1})
+
+        assert len(histograms._histograms) == MAX_KEYS
+        assert histograms.get({"event_type": "request"}).count() == MAX_KEYS * 2
+
+    def test_summary_due_once_per_interval(self):
+        histograms = LatencyHistograms()
+        histograms.record({"event_type": "feed_fetch", "wall_time_ms": 250})
+        start = histograms._last_summary
+
+        assert histograms.summary_due(now=start + 1) is None
+        summary = histograms.summary_due(now=start + SUMMARY_INTERVAL_SECONDS)
+        assert summary["event_type"] == "latency_summary"
+        assert summary["histograms"]["feed_fetch"]["count"] == 1
+        assert histograms.summary_due(now=start + SUMMARY_INTERVAL_SECONDS + 1) is None
@@ -10,6 +10,8 @@ the resulting schema matches what _ensure_database_initialized() would produce.
 import sqlite3
 from pathlib import Path
 
+import pytest
+
 MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "migrations"
 
 
@@ -125,3 +127,92 @@ class TestMigrationSchemaMatchesCode:
                 f"_EXPECTED_COLUMNS but NOT after running migrations. "
                 f"A new migration is needed."
             )
+
+
+class TestEntriesFtsMigration:
+    """Migration 006 creates the FTS5 keyword index and keeps deletes in sync."""
+
+    def _insert_entry(self, conn: sqlite3.Connection, entry_id: int) -> None:
+        conn.execute("INSERT OR IGNORE INTO feeds (id, url) VALUES (1, 'https://a.test/feed')")
+        conn.execute(
+            "INSERT INTO entries (id, feed_id, guid, title, content) VALUES (?, 1, ?, ?, ?)",
+            (entry_id, f"g{entry_id}", f"Title {entry_id}", "<p>Body</p>"),
+        )
+
+    def test_backfills_existing_entries(self):
+        conn = sqlite3.connect(":memory:")
+        _run_migrations(conn)
+        self._insert_entry(conn, 1)
+        # Re-running migrations backfills entries not yet in the index, exactly once
+        _run_migrations(conn)
+        _run_migrations(conn)
+        rows = conn.execute("SELECT rowid, title FROM entries_fts").fetchall()
+        assert rows == [(1, "Title 1")]
+
+    def test_delete_trigger_removes_index_rows(self):
+        conn = sqlite3.connect(":memory:")
+        _run_migrations(conn)
+        self._insert_entry(conn, 1)
+        self._insert_entry(conn, 2)
+        _run_migrations(conn)
+        conn.execute("DELETE FROM entries WHERE id = 1")
+        rows = conn.execute("SELECT rowid FROM entries_fts").fetchall()
+        assert rows == [(2,)]
+
+    def test_inline_fts_schema_matches_migration(self):
+        """_ENTRIES_FTS_SCHEMA (fresh databases) creates the same objects as 006."""
+        from main import PlanetCF
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE entries (id INTEGER PRIMARY KEY)")
+        for statement in PlanetCF._ENTRIES_FTS_SCHEMA:
+            conn.execute(statement)
+        names = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE name LIKE 'entries_fts%'"
+            ).fetchall()
+        }
+        assert {"entries_fts", "entries_fts_delete"} <= names
+
+
+class TestQueryEmbeddingsMigration:
+    """Migration 007 creates the persistent query embedding cache."""
+
+    def test_creates_query_embeddings_table(self):
+        conn = sqlite3.connect(":memory:")
+        _run_migrations(conn)
+        assert _get_table_columns(conn, "query_embeddings") == {
+            "model",
+            "query_key",
+            "embedding",
+            "created_at",
+        }
+
+    def test_replace_refreshes_row(self):
+        conn = sqlite3.connect(":memory:")
+        _run_migrations(conn)
+        sql = (
+            "INSERT OR REPLACE INTO query_embeddings (model, query_key, embedding) VALUES (?, ?, ?)"
+        )
+        conn.execute(sql, ("m", "python", "old"))
+        conn.execute(sql, ("m", "python", "new"))
+        rows = conn.execute("SELECT embedding FROM query_embeddings").fetchall()
+        assert rows == [("new",)]
+
+
+class TestContentGenerationMigration:
+    """Migration 008 seeds the single-row content generation counter."""
+
+    def test_seeds_generation_zero_once(self):
+        conn = sqlite3.connect(":memory:")
+        _run_migrations(conn)
+        _run_migrations(conn)
+        rows = conn.execute("SELECT id, generation FROM content_generation").fetchall()
+        assert rows == [(1, 0)]
+
+    def test_rejects_second_row(self):
+        conn = sqlite3.connect(":memory:")
+        _run_migrations(conn)
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO content_generation (id, generation) VALUES (2, 0)")
@@ -41,17 +41,33 @@ class TestMigrationFiles:
         assert "migration_name" in content
 
     def test_migration_005_seeds_all_migrations(self):
-        """Migration 005 should seed entries for all existing migrations."""
+        """Migration 005 should seed entries for all migrations up to and including itself."""
         migration = PROJECT_ROOT / "migrations" / "005_create_applied_migrations.sql"
         content = migration.read_text()
 
         # Check each migration file is seeded
         migrations_dir = PROJECT_ROOT / "migrations"
         for sql_file in sorted(migrations_dir.glob("*.sql")):
+            if int(sql_file.name.split("_")[0]) > 5:
+                continue
             assert sql_file.name in content, (
                 f"Migration 005 should seed '{sql_file.name}' into applied_migrations"
             )
 
+    def test_later_migrations_record_themselves(self):
+        """Migrations after 005 must insert their own name into applied_migrations."""
+        migrations_dir = PROJECT_ROOT / "migrations"
+        for sql_file in sorted(migrations_dir.glob("*.sql")):
+            if int(sql_file.name.split("_")[0]) <= 5:
+                continue
+            content = sql_file.read_text()
+            assert "INSERT INTO applied_migrations" in content, (
+                f"{sql_file.name} should record itself in applied_migrations"
+            )
+            assert f"'{sql_file.name}'" in content, (
+                f"{sql_file.name} should insert its own name into applied_migrations"
+            )
+
 
 class TestEnsureDbInitIncludesTracking:
     """Verify _ensure_database_initialized creates the tracking table."""
@@ -6,15 +6,24 @@ import json
 import pytest
 from freezegun import freeze_time
 
+from src.latency import LatencyHistograms
 from src.observability import (
+    ADAPTIVE_MIN_SAMPLES,
+    D1_SLOWEST_STATEMENTS,
+    MAX_SPAN_NODES,
     AdminActionEvent,
+    D1Stats,
     FeedFetchEvent,
     RequestEvent,
     SchedulerEvent,
     Timer,
+    Trace,
+    d1_fingerprint,
     emit_event,
+    event_to_dict,
     generate_request_id,
     should_sample,
+    trace_span,
 )
 
 
@@ -343,6 +352,47 @@ class TestShouldSample:
         assert all(r is False for r in results)
 
 
+class TestAdaptiveSampling:
+    def _histograms(self, count: int = ADAPTIVE_MIN_SAMPLES) -> LatencyHistograms:
+        histograms = LatencyHistograms()
+        for n in range(count):
+            histograms.record(
+                {"event_type": "request", "route": "/search", "wall_time_ms": 100 + n}
+            )
+        return histograms
+
+    def test_keeps_events_above_live_p99(self):
+        event = {"event_type": "request", "route": "/search", "wall_time_ms": 500}
+
+        assert should_sample(event, sample_rate=0.0, histograms=self._histograms()) is True
+
+    def test_drops_typical_events(self):
+        event = {"event_type": "request", "route": "/search", "wall_time_ms": 150}
+
+        assert should_sample(event, sample_rate=0.0, histograms=self._histograms()) is False
+
+    def test_live_quantiles_replace_static_thresholds(self):
+        histograms = LatencyHistograms()
+        for _ in range(ADAPTIVE_MIN_SAMPLES):
+            histograms.record({"event_type": "request", "route": "/", "wall_time_ms": 3000})
+        event = {"event_type": "request", "route": "/", "wall_time_ms": 1500}
+
+        assert should_sample(event, sample_rate=0.0, histograms=histograms) is False
+
+    def test_static_thresholds_until_enough_samples(self):
+        histograms = self._histograms(ADAPTIVE_MIN_SAMPLES - 1)
+        fast = {"event_type": "request", "route": "/search", "wall_time_ms": 500}
+        slow = {"event_type": "request", "route": "/search", "wall_time_ms": 1500}
+
+        assert should_sample(fast, sample_rate=0.0, histograms=histograms) is False
+        assert should_sample(slow, sample_rate=0.0, histograms=histograms) is True
+
+    def test_errors_always_kept(self):
+        event = {"event_type": "request", "outcome": "error", "wall_time_ms": 1}
+
+        assert should_sample(event, sample_rate=0.0, histograms=self._histograms()) is True
+
+
 class TestEmitEvent:
     def _enable_propagation(self):
         """Helper to enable logging propagation for tests."""
@@ -471,6 +521,188 @@ class TestTimer:
         assert t.elapsed_ms > mid_elapsed
 
 
+@pytest.fixture
+def tick_clock():
+    """perf_counter that advances 1 ms per call, so span timings are exact."""
+    from unittest.mock import patch
+
+    ticks = iter(range(10_000))
+    with patch("src.observability.time.perf_counter", side_effect=lambda: next(ticks) / 1000):
+        yield
+
+
+class TestTrace:
+    def test_nested_spans_form_a_tree(self, tick_clock):
+        trace = Trace()
+
+        with trace.span("upsert"):
+            with trace.span("sanitize", chars=120):
+                pass
+            with trace.span("write") as write:
+                write.set(rows=1)
+
+        assert trace.to_list() == [
+            {
+                "name": "upsert",
+                "ms": 5.0,
+                "children": [
+                    {"name": "sanitize", "ms": 1.0, "attrs": {"chars": 120}},
+                    {"name": "write", "ms": 1.0, "attrs": {"rows": 1}},
+                ],
+            }
+        ]
+
+    def test_repeated_spans_are_merged(self, tick_clock):
+        trace = Trace()
+
+        for cache in ("miss", "hit"):
+            with trace.span("embed", entries=2, cache=cache):
+                pass
+
+        assert trace.to_list() == [
+            {"name": "embed", "ms": 2.0, "count": 2, "attrs": {"entries": 4, "cache": "hit"}}
+        ]
+
+    def test_exception_is_recorded_and_nesting_restored(self, tick_clock):
+        trace = Trace()
+
+        with pytest.raises(ValueError), trace.span("parse"):
+            raise ValueError("bad feed")
+        with trace.span("upsert"):
+            pass
+
+        assert [(n["name"], n.get("attrs")) for n in trace.to_list()] == [
+            ("parse", {"error": "ValueError"}),
+            ("upsert", None),
+        ]
+
+    def test_node_count_is_capped(self):
+        trace = Trace()
+
+        for i in range(MAX_SPAN_NODES + 5):
+            with trace.span(f"stage_{i}"):
+                pass
+
+        assert len(trace.to_list()) == MAX_SPAN_NODES
+        assert trace.dropped == 5
+
+    def test_trace_span_without_event_is_a_noop(self):
+        with trace_span(None, "render") as span:
+            span.set(entries=3)
+
+    def test_spans_emitted_with_event(self):
+        event = RequestEvent(path="/")
+        assert "spans" not in event_to_dict(event)
+
+        with trace_span(event, "render"):
+            pass
+
+        event_dict = event_to_dict(event)
+        assert "trace" not in event_dict
+        assert [span["name"] for span in event_dict["spans"]] == ["render"]
+        json.dumps(event_dict)
+
+    @pytest.mark.asyncio
+    async def test_upsert_traces_its_stages(self):
+        from src.main import Default
+        from tests.conftest import MockEnv, MockQueue, MockVectorize, SqliteD1
+
+        db = SqliteD1()
+        db.insert("feeds", id=1, url="https://example.com/feed.xml", title="Example")
+        worker = Default()
+        worker.env = MockEnv(
+            DB=db,
+            FEED_QUEUE=MockQueue(),
+            DEAD_LETTER_QUEUE=MockQueue(),
+            SEARCH_INDEX=MockVectorize(),
+            AI=None,
+        )
+        event = FeedFetchEvent(feed_id=1)
+
+        with event.trace.span("upsert"):
+            await worker._upsert_entry(
+                1, {"id": "a", "title": "A", "content": [{"value": "<p>Hi</p>"}]}, event
+            )
+
+        (upsert,) = event.trace.to_list()
+        stages = [child["name"] for child in upsert["children"]]
+        assert stages == ["sanitize", "dedupe", "write", "fts", "embed"]
+
+
+class TestD1Stats:
+    def test_fingerprint_normalizes_literals_and_lists(self):
+        assert (
+            d1_fingerprint("SELECT *\n  FROM entries -- recent\n WHERE id IN (?, ?,?) AND x = 'a'")
+            == "SELECT * FROM entries WHERE id IN (?) AND x = ?"
+        )
+        assert d1_fingerprint("DELETE FROM entries WHERE id < 500") == (
+            "DELETE FROM entries WHERE id < ?"
+        )
+        assert d1_fingerprint("SELECT idx_2 FROM t") == "SELECT idx_2 FROM t"
+
+    def test_fingerprint_is_truncated(self):
+        assert len(d1_fingerprint("SELECT " + "a, " * 200 + "b FROM t")) == 160
+
+    def test_totals_and_slowest(self):
+        stats = D1Stats()
+        for i in range(D1_SLOWEST_STATEMENTS + 2):
+            stats.record(f"SELECT * FROM t{'x' * i}", float(i), None)  # noqa: S608
+        stats.record("SELECT * FROM t", 1.0, {"duration": 0.8, "rows_read": 12})
+
+        fields = stats.to_fields()
+
+        assert fields["d1_statements"] == D1_SLOWEST_STATEMENTS + 3
+        assert fields["d1_ms"] == sum(range(D1_SLOWEST_STATEMENTS + 2)) + 1.0
+        assert fields["d1_rows_read"] == 12
+        slowest = fields["d1_slowest"]
+        assert len(slowest) == D1_SLOWEST_STATEMENTS
+        assert [s["ms"] for s in slowest] == sorted((s["ms"] for s in slowest), reverse=True)
+
+    def test_emitted_only_when_statements_ran(self):
+        event = SchedulerEvent()
+        assert not any(key.startswith("d1_") for key in event_to_dict(event))
+
+        event.d1.record("SELECT 1", 2.0, None)
+
+        event_dict = event_to_dict(event)
+        assert event_dict["d1_statements"] == 1
+        assert "d1" not in event_dict
+        json.dumps(event_dict)
+
+
+class TestCompactEmission:
+    def test_none_fields_omitted(self):
+        event = RequestEvent(path="/", search_results_total=0)
+
+        event_dict = event_to_dict(event)
+
+        assert event_dict["search_results_total"] == 0
+        assert event_dict["wall_time_ms"] == 0
+        assert "search_query" not in event_dict
+        assert "error_type" not in event_dict
+
+    def test_events_use_slots(self):
+        event = FeedFetchEvent()
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.feed_idd = 1
+
+    def test_dropped_events_are_not_serialized(self, monkeypatch):
+        import src.observability as observability_module
+
+        flattened = []
+        monkeypatch.setattr(
+            observability_module, "event_to_dict", lambda event: flattened.append(event) or {}
+        )
+        event = FeedFetchEvent(feed_id=1, wall_time_ms=5)
+
+        assert emit_event(event, sample_rate=0.0) is False
+        assert flattened == []
+        assert emit_event(event, force=True) is True
+        assert flattened == [event]
+
+
 # =============================================================================
 # Edge Case Tests
 # =============================================================================
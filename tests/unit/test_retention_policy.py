@@ -6,6 +6,7 @@ from dataclasses import dataclass
 import pytest
 
 from src.main import Default
+from tests.conftest import SqliteD1
 
 # =============================================================================
 # Mock infrastructure for retention policy tests
@@ -54,7 +55,7 @@ class MockD1ForRetention:
 
     def prepare(self, sql: str) -> MockD1Statement:
         sql_lower = sql.lower()
-        if "select id from entries_to_delete" in sql_lower or "ranked_entries" in sql_lower:
+        if "published_at < ?" in sql_lower:
             stmt = MockD1Statement(self._entries_to_delete)
         else:
             stmt = MockD1Statement([])
@@ -125,9 +126,10 @@ class TestApplyRetentionPolicy:
         assert stats["entries_scanned"] == 3
         assert stats["entries_deleted"] == 3
         assert stats["vectors_deleted"] == 3
-        # Verify the cutoff date was passed via bind params
+        # Verify the cutoff date was passed via bind params (once per range scan)
         select_stmt = env.DB.statements[0]
-        assert len(select_stmt.bound_args) == 2  # max_per_feed, cutoff_date
+        assert len(select_stmt.bound_args) == 2
+        assert select_stmt.bound_args[0] == select_stmt.bound_args[1]
 
     @pytest.mark.asyncio
     async def test_empty_database_no_deletions(self):
@@ -213,3 +215,168 @@ class TestApplyRetentionPolicy:
 
         assert stats["entries_deleted"] == 1
         assert stats["vectors_deleted"] == 0
+
+
+# =============================================================================
+# Incremental Retention Tests (real SQL)
+# =============================================================================
+
+
+def _retention_db(entries_per_feed: int, feed_ids: tuple[int, ...] = (1, 2)) -> SqliteD1:
+    """SqliteD1 with recent entries for each feed and an empty dirty-feed set."""
+    db = SqliteD1()
+    for feed_id in feed_ids:
+        db.insert("feeds", id=feed_id, url=f"https://feed{feed_id}.test/rss")
+        for n in range(entries_per_feed):
+            db.insert(
+                "entries",
+                feed_id=feed_id,
+                guid=f"{feed_id}-{n}",
+                published_at=f"2099-01-01 00:00:{n:02d}",
+            )
+    db.conn.execute("DELETE FROM retention_dirty_feeds")
+    db.conn.commit()
+    return db
+
+
+def _retention_worker(db: SqliteD1, max_entries_per_feed: str = "3") -> Default:
+    env = MockRetentionEnv(max_entries_per_feed=max_entries_per_feed)
+    env.DB = db
+    worker = Default()
+    worker.env = env
+    return worker
+
+
+class TestIncrementalRetention:
+    """Age cutoff over the whole table; per-feed cap only for dirty feeds."""
+
+    @pytest.mark.asyncio
+    async def test_cap_only_applies_to_dirty_feeds(self):
+        db = _retention_db(5)
+        db.insert("retention_dirty_feeds", feed_id=1, marked_at="2000-01-01 00:00:00")
+        worker = _retention_worker(db)
+
+        stats = await worker._apply_retention_policy()
+
+        counts = {
+            row["feed_id"]: row["n"]
+            for row in db.rows("SELECT feed_id, COUNT(*) AS n FROM entries GROUP BY feed_id")
+        }
+        assert counts == {1: 3, 2: 5}
+        assert stats["feeds_capped"] == 1
+        assert stats["entries_deleted"] == 2
+        # The oldest entries of the dirty feed went
+        assert db.rows("SELECT guid FROM entries WHERE feed_id = 1 ORDER BY guid") == [
+            {"guid": "1-2"},
+            {"guid": "1-3"},
+            {"guid": "1-4"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_clears_marks_made_before_the_run(self):
+        db = _retention_db(1)
+        db.insert("retention_dirty_feeds", feed_id=1, marked_at="2000-01-01 00:00:00")
+        db.insert("retention_dirty_feeds", feed_id=2, marked_at="2999-01-01 00:00:00")
+        worker = _retention_worker(db)
+
+        await worker._apply_retention_policy()
+
+        # A feed marked while the run was in progress is checked again next time
+        assert db.rows("SELECT feed_id FROM retention_dirty_feeds") == [{"feed_id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_mark_cutoff_uses_d1_clock(self, monkeypatch):
+        from datetime import UTC, datetime
+
+        class IsolateAhead(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2990, 1, 1, tzinfo=UTC)
+
+        monkeypatch.setattr("src.main.datetime", IsolateAhead)
+        db = _retention_db(1)
+        db.insert("retention_dirty_feeds", feed_id=1, marked_at="2000-01-01 00:00:00")
+        db.insert("retention_dirty_feeds", feed_id=2, marked_at="2100-01-01 00:00:00")
+        worker = _retention_worker(db)
+
+        await worker._apply_retention_policy()
+
+        # Ahead of D1's clock, not of the isolate's: the mark is kept
+        assert db.rows("SELECT feed_id FROM retention_dirty_feeds") == [{"feed_id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_age_cutoff_applies_to_every_feed(self):
+        db = _retention_db(2)
+        db.insert("entries", feed_id=2, guid="old", published_at="2000-01-01 00:00:00")
+        db.insert("entries", feed_id=2, guid="legacy", first_seen="2000-01-01 00:00:00")
+        worker = _retention_worker(db)
+
+        stats = await worker._apply_retention_policy()
+
+        assert stats["feeds_capped"] == 0
+        assert stats["entries_deleted"] == 2
+        assert db.rows("SELECT guid FROM entries WHERE guid IN ('old', 'legacy')") == []
+
+    @pytest.mark.asyncio
+    async def test_quiet_run_ranks_nothing(self):
+        db = _retention_db(5)
+        worker = _retention_worker(db)
+
+        stats = await worker._apply_retention_policy()
+
+        assert stats["entries_deleted"] == 0
+        assert db.rows("SELECT COUNT(*) AS n FROM entries") == [{"n": 10}]
+
+    @pytest.mark.asyncio
+    async def test_feed_with_new_entries_is_marked(self):
+        db = _retention_db(1)
+        worker = _retention_worker(db)
+
+        await worker._mark_feed_for_retention(2)
+        await worker._mark_feed_for_retention(2)
+
+        assert db.rows("SELECT feed_id FROM retention_dirty_feeds") == [{"feed_id": 2}]
+
+
+class TestChunkedDeletion:
+    """Deletes go out in chunks and stop at the per-run time budget."""
+
+    @pytest.mark.asyncio
+    async def test_vector_and_d1_deletes_are_chunked(self, monkeypatch):
+        monkeypatch.setattr("src.main.RETENTION_DELETE_CHUNK_SIZE", 2)
+        db = _retention_db(5, feed_ids=(1,))
+        db.conn.execute("UPDATE entries SET published_at = '2000-01-01 00:00:00'")
+        db.conn.commit()
+        vectorize = MockVectorize()
+        worker = _retention_worker(db)
+        worker.env.SEARCH_INDEX = vectorize
+
+        stats = await worker._apply_retention_policy()
+
+        assert [len(ids) for ids in vectorize.deleted_ids] == [2, 2, 1]
+        assert stats["entries_deleted"] == 5
+        assert stats["vectors_deleted"] == 5
+        assert stats["backlog"] == 0
+        assert db.rows("SELECT COUNT(*) AS n FROM entries") == [{"n": 0}]
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_leaves_backlog_and_marks(self, monkeypatch):
+        monkeypatch.setattr("src.main.RETENTION_DELETE_CHUNK_SIZE", 2)
+        db = _retention_db(5, feed_ids=(1,))
+        db.insert("retention_dirty_feeds", feed_id=1, marked_at="2000-01-01 00:00:00")
+        worker = _retention_worker(db, max_entries_per_feed="0")
+        worker.env.RETENTION_TIME_BUDGET_MS = "0"
+
+        stats = await worker._apply_retention_policy()
+
+        # The first chunk always runs; the rest waits for the next cron run
+        assert stats["entries_deleted"] == 2
+        assert stats["backlog"] == 3
+        assert db.rows("SELECT feed_id FROM retention_dirty_feeds") == [{"feed_id": 1}]
+
+        worker.env.RETENTION_TIME_BUDGET_MS = "60000"
+        stats = await worker._apply_retention_policy()
+
+        assert stats["entries_deleted"] == 3
+        assert stats["backlog"] == 0
+        assert db.rows("SELECT feed_id FROM retention_dirty_feeds") == []
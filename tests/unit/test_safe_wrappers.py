@@ -1,8 +1,12 @@
 # tests/unit/test_safe_wrappers.py
 """Unit tests for Safe wrapper classes that handle JS/Python boundary."""
 
+import asyncio
+
 import pytest
 
+from observability import bind_event  # the module instance src/wrappers.py reports to
+from src.observability import FeedFetchEvent
 from src.wrappers import (
     SafeAI,
     SafeD1,
@@ -187,6 +191,64 @@ class TestSafeD1:
         stmt = db.prepare("SELECT * FROM test")
         assert isinstance(stmt, SafeD1Statement)
 
+    @pytest.mark.asyncio
+    async def test_statements_recorded_on_bound_event(self):
+        """Executions are timed and their D1 meta added to the bound event."""
+
+        class MetaStatement(MockD1Statement):
+            async def run(self):
+                return {"success": True, "meta": {"duration": 1.5, "rows_written": 2}}
+
+            async def all(self):
+                result = await super().all()
+                result.meta = {"duration": 0.5, "rows_read": 40}
+                return result
+
+        event = FeedFetchEvent()
+
+        async def unit_of_work():
+            bind_event(event)
+            db = SafeD1(MockD1(MetaStatement([{"id": 1}])))
+            await db.prepare("SELECT id FROM entries WHERE feed_id = 1").all()
+            await db.prepare("SELECT id FROM entries WHERE feed_id = 2").all()
+            await db.prepare("UPDATE feeds SET title = 'x' WHERE id = 3").run()
+            await db.prepare("SELECT id FROM feeds").first()
+
+        await asyncio.create_task(unit_of_work())
+
+        fields = event.d1.to_fields()
+        assert fields["d1_statements"] == 4
+        assert fields["d1_duration_ms"] == 2.5
+        assert fields["d1_rows_read"] == 80
+        assert fields["d1_rows_written"] == 2
+        by_sql = {s["sql"]: s for s in fields["d1_slowest"]}
+        assert by_sql["SELECT id FROM entries WHERE feed_id = ?"]["count"] == 2
+        assert by_sql["UPDATE feeds SET title = ? WHERE id = ?"]["rows_written"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_record_to_their_own_event(self):
+        """Each task's statements go to the event it bound, not another task's."""
+        events = [FeedFetchEvent(), FeedFetchEvent()]
+
+        async def unit_of_work(event, statements):
+            bind_event(event)
+            db = SafeD1(MockD1())
+            for _ in range(statements):
+                await db.prepare("SELECT 1").first()
+                await asyncio.sleep(0)
+
+        await asyncio.gather(unit_of_work(events[0], 3), unit_of_work(events[1], 1))
+
+        assert [e.d1.to_fields()["d1_statements"] for e in events] == [3, 1]
+
+    @pytest.mark.asyncio
+    async def test_unbound_statements_are_not_recorded(self):
+        event = FeedFetchEvent()
+
+        await SafeD1(MockD1()).prepare("SELECT 1").first()
+
+        assert event.d1.to_fields() == {}
+
 
 # =============================================================================
 # SafeAI Tests
@@ -3,7 +3,7 @@
 
 import pytest
 
-from src.search_query import SearchQueryBuilder, SearchQueryResult
+from src.search_query import SearchQueryBuilder, SearchQueryResult, snippet_to_html
 
 
 class TestSearchQueryBuilderEscaping:
@@ -39,7 +39,7 @@ class TestSearchQueryBuilderPhraseSearch:
         result = builder.build(limit=50)
 
         assert "e.title LIKE ? ESCAPE" in result.sql
-        assert "e.content LIKE ? ESCAPE" in result.sql
+        assert "COALESCE(e.content_text, e.content) LIKE ? ESCAPE" in result.sql
         assert "LIMIT ?" in result.sql
         assert result.params[0] == "%error handling%"
         assert result.params[1] == "%error handling%"
@@ -63,7 +63,7 @@ class TestSearchQueryBuilderSingleWord:
         result = builder.build(limit=50)
 
         assert "e.title LIKE ? ESCAPE" in result.sql
-        assert "e.content LIKE ? ESCAPE" in result.sql
+        assert "COALESCE(e.content_text, e.content) LIKE ? ESCAPE" in result.sql
         assert result.params[0] == "%python%"
         assert result.params[1] == "%python%"
         assert result.params[2] == 50
@@ -86,7 +86,7 @@ class TestSearchQueryBuilderMultiWord:
 
         # Should have title conditions AND content conditions
         assert "e.title LIKE ? ESCAPE" in result.sql
-        assert "e.content LIKE ? ESCAPE" in result.sql
+        assert "COALESCE(e.content_text, e.content) LIKE ? ESCAPE" in result.sql
         # Should have 3 words x 2 (title + content) = 6 like patterns + 1 limit
         assert len(result.params) == 7
         assert result.params[0] == "%python%"
@@ -161,6 +161,30 @@ class TestSearchQueryBuilderFromRawQuery:
         assert builder.max_words == 2
 
 
+class TestSearchQueryBuilderCanonicalQuery:
+    """Tests for the canonical query used as the search cache key."""
+
+    def test_lowercases_and_collapses_whitespace(self):
+        builder = SearchQueryBuilder.from_raw_query("  Cloudflare   WORKERS ")
+        assert builder.canonical_query == "cloudflare workers"
+
+    def test_phrase_requoted_with_double_quotes(self):
+        assert SearchQueryBuilder.from_raw_query("'Error  Handling'").canonical_query == (
+            '"error handling"'
+        )
+        assert SearchQueryBuilder.from_raw_query('"error handling"').canonical_query == (
+            '"error handling"'
+        )
+
+    @pytest.mark.parametrize("raw", ["Python", '"Edge Compute"', "'a  b'", '"unbalanced', '"'])
+    def test_canonical_form_is_stable(self, raw):
+        """Re-parsing the canonical form gives the same search and key (no redirect loop)."""
+        builder = SearchQueryBuilder.from_raw_query(raw)
+        again = SearchQueryBuilder.from_raw_query(builder.canonical_query)
+        assert again.canonical_query == builder.canonical_query
+        assert again.is_phrase_search == builder.is_phrase_search
+
+
 class TestSearchQueryBuilderValidation:
     """Tests for query validation."""
 
@@ -623,3 +647,130 @@ class TestSearchQueryNegativeCases:
 
         # Should not be a 500 error
         assert response.status != 500
+
+
+# =============================================================================
+# FTS5 Query Building
+# =============================================================================
+
+
+def _fts_db():
+    """In-memory SQLite with all migrations applied and a few entries indexed."""
+    import sqlite3
+    from pathlib import Path
+
+    conn = sqlite3.connect(":memory:")
+    for sql_file in sorted((Path(__file__).parent.parent.parent / "migrations").glob("*.sql")):
+        conn.executescript(sql_file.read_text())
+    conn.execute("INSERT INTO feeds (id, url, title) VALUES (1, 'https://a.test/feed', 'A')")
+    rows = [
+        (1, "Cloudflare Workers guide", "Error handling at the edge"),
+        (2, "Python tips", "Handling errors gracefully in Python"),
+        (3, 'Say "hello"', "Quoted titles"),
+    ]
+    for entry_id, title, body in rows:
+        conn.execute(
+            "INSERT INTO entries (id, feed_id, guid, title, content, published_at) "
+            "VALUES (?, 1, ?, ?, ?, ?)",
+            (entry_id, f"g{entry_id}", title, f"<p>{body}</p>", f"2026-01-0{entry_id}"),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO entries_fts (rowid, title, body) VALUES (?, ?, ?)",
+            (entry_id, title, body),
+        )
+    return conn
+
+
+def _fts_ids(conn, builder: SearchQueryBuilder) -> list[int]:
+    result = builder.build_fts(limit=50)
+    return [row[0] for row in conn.execute(result.sql, result.params).fetchall()]
+
+
+class TestSearchQueryBuilderFts:
+    """Tests for FTS5 MATCH query building."""
+
+    def test_phrase_becomes_single_prefix_phrase(self):
+        builder = SearchQueryBuilder(query="error handling", is_phrase_search=True)
+        result = builder.build_fts(limit=20)
+        assert "entries_fts MATCH ?" in result.sql
+        assert result.params == ('"error handling"*', 80, 20)
+
+    def test_words_become_one_prefix_phrase_each(self):
+        builder = SearchQueryBuilder(query="error handling")
+        assert builder.build_fts(limit=5).params == ('"error"* "handling"*', 20, 5)
+
+    def test_embedded_quotes_are_doubled(self):
+        assert SearchQueryBuilder.fts_prefix_phrase('say "hi"') == '"say ""hi"""*'
+
+    def test_fts_operators_are_quoted(self):
+        builder = SearchQueryBuilder(query="title: NEAR OR")
+        assert builder.build_fts().params[0] == '"title:"* "NEAR"* "OR"*'
+
+    def test_untokenizable_query_has_no_fts_terms(self):
+        builder = SearchQueryBuilder(query="-- ++")
+        assert builder.has_fts_terms is False
+        with pytest.raises(ValueError):
+            builder.build_fts()
+
+    def test_punctuation_words_skipped_in_match(self):
+        builder = SearchQueryBuilder(query="rust -- async")
+        assert builder.build_fts().params[0] == '"rust"* "async"*'
+
+    def test_words_truncated_propagates(self):
+        builder = SearchQueryBuilder(query="a b c d", max_words=2)
+        assert builder.build_fts().words_truncated is True
+
+    def test_phrase_matches_token_sequence(self):
+        conn = _fts_db()
+        assert _fts_ids(conn, SearchQueryBuilder("error handling", is_phrase_search=True)) == [1]
+
+    def test_words_match_in_any_order(self):
+        conn = _fts_db()
+        assert _fts_ids(conn, SearchQueryBuilder("handling error")) == [2, 1]
+
+    def test_prefix_matches_partial_word(self):
+        conn = _fts_db()
+        assert _fts_ids(conn, SearchQueryBuilder("cloud")) == [1]
+
+    def test_quotes_in_query_do_not_break_syntax(self):
+        conn = _fts_db()
+        assert _fts_ids(conn, SearchQueryBuilder('say "hello"', is_phrase_search=True)) == [3]
+
+    def test_selects_snippet_not_content(self):
+        sql = SearchQueryBuilder("edge").build_fts().sql
+        assert "snippet(entries_fts, 1" in sql
+        assert "e.content" not in sql
+        assert "e.summary" not in sql
+
+    def test_snippet_marks_matched_terms(self):
+        conn = _fts_db()
+        result = SearchQueryBuilder("edge").build_fts(limit=50)
+        row = conn.execute(result.sql, result.params).fetchone()
+        assert row[-1] == "Error handling at the \x02edge\x03"
+
+
+class TestSearchQueryBuilderDisplayColumns:
+    """The LIKE fallback filters on content but only returns display columns."""
+
+    @pytest.mark.parametrize("query", ["edge", "edge compute"])
+    def test_like_query_does_not_select_content(self, query):
+        sql = SearchQueryBuilder(query).build().sql
+        select_clause = sql.split("FROM")[0]
+        assert "e.content" not in select_clause
+        assert "NULL AS snippet" in select_clause
+        assert "COALESCE(e.content_text, e.content) LIKE" in sql
+
+
+class TestSnippetToHtml:
+    """snippet_to_html() escapes snippet text and highlights matches."""
+
+    def test_marks_become_mark_elements(self):
+        assert snippet_to_html("at the \x02edge\x03…") == "at the <mark>edge</mark>…"
+
+    def test_text_is_escaped(self):
+        html = snippet_to_html("<script>\x02x\x03</script>")
+        assert html == "&lt;script&gt;<mark>x</mark>&lt;/script&gt;"
+
+    @pytest.mark.parametrize("snippet", [None, "", "   "])
+    def test_empty_snippet_is_none(self, snippet):
+        assert snippet_to_html(snippet) is None
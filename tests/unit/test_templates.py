@@ -1,9 +1,13 @@
 # tests/unit/test_templates.py
 """Unit tests for template loading and rendering."""
 
+from pathlib import Path
+
 import pytest
 
+import src.templates as templates_module
 from src.templates import (
+    _EMBEDDED_TEMPLATES,
     TEMPLATE_ADMIN_DASHBOARD,
     TEMPLATE_ADMIN_ERROR,
     TEMPLATE_ADMIN_LOGIN,
@@ -13,6 +17,9 @@ from src.templates import (
     TEMPLATE_FEEDS_OPML,
     TEMPLATE_INDEX,
     TEMPLATE_SEARCH,
+    EmbeddedLoader,
+    PrecompiledLoader,
+    get_jinja_env,
     render_template,
 )
 
@@ -266,3 +273,112 @@ class TestTemplateConstants:
         assert TEMPLATE_FEED_RSS.endswith(".xml")
         assert TEMPLATE_FEED_RSS10.endswith(".xml")
         assert TEMPLATE_FEEDS_OPML.endswith(".opml")
+
+
+# =============================================================================
+# Precompiled Template Tests
+# =============================================================================
+
+COMPILED_DIR = Path(__file__).parent.parent.parent / "src" / "compiled_templates"
+
+_SAMPLE_CONTEXT = {
+    "planet": {"name": "Test Planet", "description": "A test planet", "link": "https://x.test"},
+    "entries_by_date": {
+        "January 15, 2026": [
+            {
+                "id": 1,
+                "title": "Hello <World>",
+                "url": "https://x.test/1",
+                "content": "<p>Body</p>",
+                "display_author": "Alice",
+                "published_at": "2026-01-15T12:00:00Z",
+                "published_at_display": "12:00",
+            }
+        ]
+    },
+    "date_labels": {"January 15, 2026": "January 15, 2026"},
+    "feeds": [],
+    "feed_links": {"atom": "/feed.atom", "rss": "/feed.rss", "opml": "/feeds.opml"},
+    "generated_at": "2026-01-15 12:00 UTC",
+    "logo": None,
+}
+
+
+class TestPrecompiledTemplates:
+    """Tests for build-time precompiled templates (src/compiled_templates/)."""
+
+    def test_compiled_package_matches_installed_jinja(self):
+        """Compiled templates were built with the Jinja2 version in use."""
+        import jinja2
+
+        from compiled_templates import JINJA2_VERSION
+
+        assert jinja2.__version__ == JINJA2_VERSION
+
+    def test_every_embedded_template_has_compiled_module(self):
+        """Each embedded template source has a matching precompiled module."""
+        import re
+
+        for theme, sources in _EMBEDDED_TEMPLATES.items():
+            package = COMPILED_DIR / theme.replace("-", "_")
+            for name in sources:
+                module = package / f"{re.sub(r'[^0-9A-Za-z_]', '_', name)}.py"
+                assert module.exists(), f"Missing precompiled module for {theme}/{name}"
+
+    def test_compiled_modules_are_up_to_date(self):
+        """Precompiled code matches a fresh compile of the embedded source."""
+        import re
+
+        from jinja2 import Environment
+
+        env = Environment(autoescape=True)
+        for theme, sources in _EMBEDDED_TEMPLATES.items():
+            package = COMPILED_DIR / theme.replace("-", "_")
+            for name, source in sources.items():
+                module = package / f"{re.sub(r'[^0-9A-Za-z_]', '_', name)}.py"
+                expected = env.compile(source, name, f"{theme}/{name}", raw=True, defer_init=True)
+                assert expected in module.read_text(), (
+                    f"{module.name} is stale. Run: python scripts/build_templates.py"
+                )
+
+    @pytest.mark.parametrize("theme", ["default", "planet-python", "planet-mozilla"])
+    def test_env_loads_precompiled_modules(self, theme):
+        """get_jinja_env() builds templates from compiled modules, not source."""
+        env = get_jinja_env(theme)
+        for name in (TEMPLATE_INDEX, TEMPLATE_FEED_ATOM):
+            template = env.get_template(name)
+            assert "compiled_templates" in template.filename
+
+    @pytest.mark.parametrize("theme", ["default", "planet-python", "planet-mozilla"])
+    @pytest.mark.parametrize("name", [TEMPLATE_INDEX, TEMPLATE_FEED_ATOM, TEMPLATE_FEEDS_OPML])
+    def test_precompiled_output_matches_source(self, theme, name):
+        """Rendering via PrecompiledLoader and EmbeddedLoader yields identical output."""
+        from jinja2 import Environment
+
+        source_env = Environment(loader=EmbeddedLoader(theme), autoescape=True)
+        compiled_env = Environment(loader=PrecompiledLoader(theme), autoescape=True)
+
+        expected = source_env.get_template(name).render(**_SAMPLE_CONTEXT)
+        assert compiled_env.get_template(name).render(**_SAMPLE_CONTEXT) == expected
+
+    def test_falls_back_to_source_on_jinja_version_mismatch(self, monkeypatch):
+        """A compiled package from another Jinja2 version is ignored."""
+        import compiled_templates
+
+        monkeypatch.setattr(compiled_templates, "JINJA2_VERSION", "0.0.0")
+        monkeypatch.setattr(templates_module, "_jinja_envs", {})
+
+        template = get_jinja_env("default").get_template(TEMPLATE_INDEX)
+        assert template.filename == "default/index.html"
+
+    def test_missing_compiled_module_falls_back_to_source(self):
+        """Templates without a compiled module still load from embedded source."""
+        from jinja2 import ChoiceLoader, DictLoader, Environment, TemplateNotFound
+
+        env = Environment(
+            loader=ChoiceLoader([PrecompiledLoader("default"), DictLoader({"x.html": "hi"})]),
+            autoescape=True,
+        )
+        assert env.get_template("x.html").render() == "hi"
+        with pytest.raises(TemplateNotFound):
+            Environment(loader=PrecompiledLoader("default"), autoescape=True).get_template("x.html")
@@ -10,13 +10,16 @@ from datetime import UTC, datetime
 
 from src.utils import (
     ERROR_MESSAGE_MAX_LENGTH,
+    extract_entry_text,
     feed_response,
     get_display_author,
     html_response,
+    html_to_text,
     json_error,
     json_response,
     log_error,
     log_op,
+    make_excerpt,
     normalize_entry_content,
     parse_iso_datetime,
     redirect_response,
@@ -311,6 +314,111 @@ class TestNormalizeEntryContent:
         assert "<p>Content</p>" in result
 
 
+# =============================================================================
+# html_to_text
+# =============================================================================
+
+
+class TestHtmlToText:
+    """Tests for html_to_text()."""
+
+    def test_strips_tags_and_decodes_entities(self):
+        assert html_to_text("<p>Fish &amp; <b>chips</b></p>") == "Fish & chips"
+
+    def test_drops_script_and_style_bodies(self):
+        html = "<style>p{}</style><p>Text</p><script>alert(1)</script>"
+        assert html_to_text(html) == "Text"
+
+    def test_collapses_whitespace_without_truncating(self):
+        text = "word " * 500
+        assert html_to_text(f"<div>{text}</div>") == text.strip()
+
+    def test_empty_input(self):
+        assert html_to_text(None) == ""
+
+
+# =============================================================================
+# extract_entry_text
+# =============================================================================
+
+
+class TestExtractEntryText:
+    """Tests for extract_entry_text()."""
+
+    def test_strips_markup_like_html_to_text(self):
+        assert extract_entry_text("<p>Fish &amp; <b>chips</b></p>") == "Fish & chips"
+
+    def test_drops_code_blocks(self):
+        html = "<p>Set it up:</p><pre><code>x = 1\ny = 2</code></pre><p>Done.</p>"
+        assert extract_entry_text(html) == "Set it up: Done."
+
+    def test_inline_tags_do_not_split_words(self):
+        assert extract_entry_text("<p><b>Edge</b>, <em>fast</em>.</p>") == "Edge, fast."
+
+    def test_keeps_inline_code(self):
+        assert extract_entry_text("<p>Call <code>fetch()</code> once</p>") == "Call fetch() once"
+
+    def test_drops_wordpress_footer(self):
+        html = (
+            "<p>Body text.</p>"
+            '<p>The post <a href="https://b.test/p">Post</a> appeared first on '
+            '<a href="https://b.test">Blog</a>.</p>'
+        )
+        assert extract_entry_text(html) == "Body text."
+
+    def test_drops_continue_reading_link(self):
+        html = '<p>Intro. <a href="https://b.test/p">Continue reading <span>→</span></a></p>'
+        assert extract_entry_text(html) == "Intro."
+
+    def test_keeps_prose_mentioning_boilerplate_words(self):
+        html = "<p>I read more books this year.</p>"
+        assert extract_entry_text(html) == "I read more books this year."
+
+    def test_empty_input(self):
+        assert extract_entry_text(None) == ""
+
+
+# =============================================================================
+# make_excerpt
+# =============================================================================
+
+
+class TestMakeExcerpt:
+    """Tests for make_excerpt()."""
+
+    def test_strips_tags_and_decodes_entities(self):
+        """Markup is removed and entities decoded into plain text."""
+        result = make_excerpt("<p>Fish &amp; <b>chips</b></p>", 100)
+        assert result == "Fish & chips"
+
+    def test_short_text_not_truncated(self):
+        """Text within the limit is returned without an ellipsis."""
+        assert make_excerpt("Hello world", 100) == "Hello world"
+
+    def test_truncates_at_word_boundary(self):
+        """Long text is cut on a word boundary and marked with an ellipsis."""
+        result = make_excerpt("alpha beta gamma delta epsilon", 14)
+        assert result == "alpha beta…"
+
+    def test_drops_script_and_style_bodies(self):
+        """Script and style contents never leak into the excerpt."""
+        html = "<style>p { color: red }</style><p>Visible</p><script>alert(1)</script>"
+        assert make_excerpt(html, 100) == "Visible"
+
+    def test_discards_dangling_tag_from_truncated_prefix(self):
+        """A prefix cut mid-tag (e.g. by SQL substr) leaves no markup behind."""
+        assert make_excerpt('<p>Body text</p><img src="https://exa', 100) == "Body text"
+
+    def test_collapses_whitespace(self):
+        """Runs of whitespace and newlines collapse to single spaces."""
+        assert make_excerpt("<p>one</p>\n\n<p>two\tthree</p>", 100) == "one two three"
+
+    def test_empty_input(self):
+        """None or empty input returns an empty string."""
+        assert make_excerpt(None, 100) == ""
+        assert make_excerpt("", 100) == ""
+
+
 # =============================================================================
 # parse_iso_datetime
 # =============================================================================
@@ -479,6 +587,16 @@ class TestRedirectResponse:
         resp = redirect_response("https://example.com")
         assert resp.headers["Location"] == "https://example.com"
 
+    def test_uncached_by_default(self):
+        """No Cache-Control unless requested."""
+        resp = redirect_response("https://example.com")
+        assert "Cache-Control" not in resp.headers
+
+    def test_cacheable_redirect(self):
+        """cache_max_age makes the redirect cacheable at the edge."""
+        resp = redirect_response("/search?q=x&g=1", cache_max_age=60)
+        assert resp.headers["Cache-Control"] == "public, max-age=60"
+
 
 # =============================================================================
 # feed_response
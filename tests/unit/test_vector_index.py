@@ -0,0 +1,226 @@
+# tests/unit/test_vector_index.py
+"""Tests for the D1-backed vector index (SEARCH_INDEX_BACKEND=d1)."""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+import vector_index as runtime_vector_index
+from src import vector_index
+from src.vector_index import (
+    D1VectorIndex,
+    VectorMatrix,
+    decode_quantized,
+    encode_quantized,
+    quantize_vector,
+)
+from src.wrappers import SafeEnv, SafeVectorize
+from tests.conftest import MockVectorize, SqliteD1
+
+
+def _unit(index: int, dimensions: int = 8) -> list[float]:
+    """One-hot vector along the given axis."""
+    return [1.0 if i == index else 0.0 for i in range(dimensions)]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b, strict=True))
+    return dot / (math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b)))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_matrix():
+    """The matrix cache is per isolate; give each test an empty one.
+
+    SafeEnv imports the module as the Workers runtime does (vector_index,
+    not src.vector_index), so both copies are reset.
+    """
+    for module in (vector_index, runtime_vector_index):
+        module.D1VectorIndex._matrix = None
+    yield
+    for module in (vector_index, runtime_vector_index):
+        module.D1VectorIndex._matrix = None
+
+
+class TestQuantization:
+    """int8 quantization keeps cosine similarity within a small error."""
+
+    def test_round_trip_preserves_direction(self):
+        values = [0.3, -1.2, 0.05, 2.0, -0.7, 0.0, 1.1, -0.4]
+        components, scale = quantize_vector(values)
+        restored = [c * scale for c in decode_quantized(encode_quantized(components))]
+
+        assert len(components) == len(values)
+        assert max(abs(c) for c in components) == 127
+        assert _cosine(values, restored) > 0.999
+
+    def test_restored_vector_is_unit_length(self):
+        components, scale = quantize_vector([3.0, 4.0])
+        norm = math.sqrt(sum((c * scale) ** 2 for c in components))
+
+        assert norm == pytest.approx(1.0, abs=0.01)
+
+    def test_zero_vector(self):
+        components, scale = quantize_vector([0.0, 0.0, 0.0])
+
+        assert list(components) == [0, 0, 0]
+        assert scale == 0.0
+
+
+class TestVectorMatrix:
+    """Bulk scoring over the in-memory matrix."""
+
+    def _rows(self, vectors: dict[str, list[float]]) -> list[dict]:
+        rows = []
+        for vector_id, values in vectors.items():
+            components, scale = quantize_vector(values)
+            rows.append({"id": vector_id, "scale": scale, "vector": encode_quantized(components)})
+        return rows
+
+    def test_scores_match_float_cosine(self):
+        vectors = {
+            "1": [0.2, 0.9, -0.1, 0.4],
+            "2": [-0.5, 0.1, 0.8, 0.0],
+            "3": [0.7, 0.7, 0.1, -0.2],
+        }
+        query = [0.3, 0.8, 0.0, 0.3]
+        matrix = VectorMatrix(self._rows(vectors), (3, 3))
+
+        for score, values in zip(matrix.scores(query), vectors.values(), strict=True):
+            assert score == pytest.approx(_cosine(query, values), abs=0.01)
+
+    def test_top_k_orders_by_score_then_row(self):
+        matrix = VectorMatrix(self._rows({"a": _unit(0), "b": _unit(1), "c": _unit(0)}), (3, 3))
+
+        ranked = matrix.top_k(_unit(0), 2)
+
+        assert [matrix.ids[row] for row, _ in ranked] == ["a", "c"]
+
+    def test_skips_rows_with_other_dimensions(self):
+        rows = self._rows({"1": _unit(0, 4)}) + self._rows({"2": _unit(0, 8)})
+        matrix = VectorMatrix(rows, (2, 2))
+
+        assert matrix.ids == ["1"]
+        assert matrix.scores(_unit(0, 8)) == []
+
+    def test_pure_python_fallback_without_numpy(self, monkeypatch):
+        monkeypatch.setattr(vector_index, "_numpy", False)
+        matrix = VectorMatrix(self._rows({"1": _unit(2)}), (1, 1))
+
+        assert matrix.scores(_unit(2)) == [pytest.approx(1.0)]
+
+
+class TestD1VectorIndex:
+    """Vectorize-compatible query/upsert/deleteByIds over entry_vectors."""
+
+    @pytest.mark.asyncio
+    async def test_query_returns_nearest_first_with_metadata(self):
+        index = D1VectorIndex(SqliteD1())
+        await index.upsert(
+            [
+                {"id": "1", "values": _unit(0), "metadata": {"title": "First"}},
+                {"id": "2", "values": _unit(1), "metadata": {"title": "Second"}},
+                {"id": "3", "values": [0.9, 0.1, 0, 0, 0, 0, 0, 0]},
+            ]
+        )
+
+        result = await index.query(_unit(0), {"topK": 2, "returnMetadata": True})
+
+        assert [m["id"] for m in result["matches"]] == ["1", "3"]
+        assert result["matches"][0]["metadata"] == {"title": "First"}
+        assert result["matches"][0]["score"] == pytest.approx(1.0, abs=0.01)
+        assert "metadata" not in result["matches"][1]
+
+    @pytest.mark.asyncio
+    async def test_query_omits_metadata_unless_requested(self):
+        index = D1VectorIndex(SqliteD1())
+        await index.upsert([{"id": "1", "values": _unit(0), "metadata": {"title": "First"}}])
+
+        result = await index.query(_unit(0), {"topK": 5})
+
+        assert result["matches"] == [{"id": "1", "score": pytest.approx(1.0, abs=0.01)}]
+
+    @pytest.mark.asyncio
+    async def test_upsert_replaces_and_delete_removes(self):
+        db = SqliteD1()
+        index = D1VectorIndex(db)
+        await index.upsert([{"id": "1", "values": _unit(0)}, {"id": "2", "values": _unit(1)}])
+        await index.upsert([{"id": "1", "values": _unit(1)}])
+
+        result = await index.query(_unit(1), {"topK": 5})
+        assert {m["id"] for m in result["matches"]} == {"1", "2"}
+
+        await index.deleteByIds(["2"])
+        result = await index.query(_unit(1), {"topK": 5})
+        assert [m["id"] for m in result["matches"]] == ["1"]
+        assert len(db.rows("SELECT id FROM entry_vectors")) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_writes_stay_within_d1_bound_parameter_limit(self):
+        """Upserts go out as one batch; deletes bind one JSON array, not one ? per id."""
+        db = SqliteD1()
+        index = D1VectorIndex(db)
+        batches = []
+        run_batch = db.batch
+
+        async def recording_batch(statements):
+            batches.append(len(statements))
+            return await run_batch(statements)
+
+        db.batch = recording_batch
+        ids = [str(i) for i in range(500)]
+        await index.upsert([{"id": i, "values": _unit(0)} for i in ids])
+        assert batches == [500]
+
+        prepared = []
+        prepare = db.prepare
+        db.prepare = lambda sql: prepared.append(prepare(sql)) or prepared[-1]
+        await index.deleteByIds(ids)
+
+        assert [len(stmt.bound_args) for stmt in prepared] == [1]
+        assert db.rows("SELECT id FROM entry_vectors") == []
+
+    @pytest.mark.asyncio
+    async def test_matrix_cached_until_table_changes(self):
+        db = SqliteD1()
+        index = D1VectorIndex(db)
+        await index.upsert([{"id": "1", "values": _unit(0)}])
+
+        await index.query(_unit(0), {"topK": 1})
+        cached = D1VectorIndex._matrix
+        await index.query(_unit(0), {"topK": 1})
+        assert D1VectorIndex._matrix is cached
+
+        # A write from another isolate is seen through the (count, max seq) stamp
+        await D1VectorIndex(db).upsert([{"id": "2", "values": _unit(0)}])
+        result = await index.query(_unit(0), {"topK": 5})
+        assert D1VectorIndex._matrix is not cached
+        assert {m["id"] for m in result["matches"]} == {"1", "2"}
+
+    @pytest.mark.asyncio
+    async def test_empty_index_returns_no_matches(self):
+        index = D1VectorIndex(SqliteD1())
+
+        assert await index.query(_unit(0), {"topK": 5}) == {"matches": []}
+
+
+class TestSafeEnvBackend:
+    """SEARCH_INDEX_BACKEND=d1 only applies when there is no Vectorize binding."""
+
+    def test_d1_backend_without_vectorize_binding(self):
+        env = SafeEnv(SimpleNamespace(DB=SqliteD1(), SEARCH_INDEX_BACKEND="d1"))
+
+        assert isinstance(env.SEARCH_INDEX, runtime_vector_index.D1VectorIndex)
+
+    def test_vectorize_binding_takes_precedence(self):
+        env = SafeEnv(
+            SimpleNamespace(DB=SqliteD1(), SEARCH_INDEX=MockVectorize(), SEARCH_INDEX_BACKEND="d1")
+        )
+
+        assert isinstance(env.SEARCH_INDEX, SafeVectorize)
+
+    def test_no_index_by_default(self):
+        env = SafeEnv(SimpleNamespace(DB=SqliteD1()))
+
+        assert env.SEARCH_INDEX is None
@@ -0,0 +1,60 @@
+# tests/unit/test_vector_metadata.py
+"""Tests for the Vectorize metadata layout used by semantic search."""
+
+from src.vector_metadata import (
+    VECTOR_METADATA_VERSION,
+    build_vector_metadata,
+    entry_from_vector_metadata,
+)
+
+FIELDS = {
+    "title": "Edge Notes",
+    "url": "https://example.com/post",
+    "author": "Ada",
+    "published_at": "2026-01-15T12:00:00Z",
+    "feed_title": "Example Blog",
+    "feed_site_url": "https://example.com",
+}
+
+
+class TestBuildVectorMetadata:
+    """build_vector_metadata() stores versioned display fields."""
+
+    def test_includes_version_id_and_display_fields(self):
+        metadata = build_vector_metadata(7, FIELDS)
+        assert metadata["v"] == VECTOR_METADATA_VERSION
+        assert metadata["entry_id"] == 7
+        for name, value in FIELDS.items():
+            assert metadata[name] == value
+
+    def test_ignores_non_display_fields(self):
+        metadata = build_vector_metadata(7, {**FIELDS, "content": "<p>long body</p>"})
+        assert "content" not in metadata
+
+    def test_omits_empty_fields(self):
+        metadata = build_vector_metadata(7, {"title": "T", "author": None, "url": ""})
+        assert "author" not in metadata
+        assert "url" not in metadata
+
+    def test_truncates_long_title(self):
+        metadata = build_vector_metadata(7, {"title": "x" * 500})
+        assert len(metadata["title"]) == 200
+
+
+class TestEntryFromVectorMetadata:
+    """entry_from_vector_metadata() rebuilds result entries or signals staleness."""
+
+    def test_round_trip(self):
+        entry = entry_from_vector_metadata(7, build_vector_metadata(7, FIELDS))
+        assert entry == {"id": 7, **FIELDS}
+
+    def test_missing_fields_are_none(self):
+        entry = entry_from_vector_metadata(7, build_vector_metadata(7, {"title": "T"}))
+        assert entry["title"] == "T"
+        assert entry["author"] is None
+
+    def test_legacy_metadata_is_stale(self):
+        assert entry_from_vector_metadata(7, {"title": "T", "entry_id": 7}) is None
+
+    def test_missing_metadata_is_stale(self):
+        assert entry_from_vector_metadata(7, None) is None
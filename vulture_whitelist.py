@@ -185,15 +185,25 @@ from search_query import SearchQueryBuilder
 
 SearchQueryBuilder.from_raw_query  # unused method (used in tests)
 
+# =============================================================================
+# content_archive.py - local ArchiveStore for tests and benchmarks
+# =============================================================================
+from content_archive import FileArchiveStore
+
+FileArchiveStore  # unused class (used in tests)
+
 # =============================================================================
 # templates.py - Jinja2 loader method (called by Jinja2 framework)
 # =============================================================================
 from templates import (
     THEME_LOGOS,
     EmbeddedLoader,
+    PrecompiledLoader,
 )
 
 EmbeddedLoader.get_source  # unused method (called by Jinja2 Environment)
+PrecompiledLoader.load  # unused method (called by Jinja2 Environment)
+PrecompiledLoader.has_source_access  # Jinja2 loader interface attribute
 _.environment  # Jinja2 loader interface parameter
 
 # Theme/template constants (generated by build_templates.py, used externally)
@@ -211,6 +221,7 @@ from observability import (
     RequestEvent,
     SchedulerEvent,
     Timer,
+    Trace,
 )
 
 # RequestEvent fields
@@ -229,6 +240,9 @@ RequestEvent.search_title_in_query_matches
 RequestEvent.search_query_in_title_matches
 RequestEvent.search_semantic_error
 RequestEvent.search_keyword_error
+RequestEvent.search_embedding_cache
+RequestEvent.search_redirected
+RequestEvent.search_semantic_hydrated
 RequestEvent.generation_d1_ms
 RequestEvent.generation_render_ms
 RequestEvent.generation_entries_total
@@ -239,6 +253,11 @@ RequestEvent.oauth_stage
 RequestEvent.oauth_provider
 RequestEvent.oauth_success
 RequestEvent.oauth_username
+RequestEvent.startup_import_ms
+RequestEvent.startup_db_init_ms
+RequestEvent.startup_schema_drift_ms
+RequestEvent.isolate_started_at
+RequestEvent.isolate_request_ordinal
 RequestEvent.outcome
 
 # FeedFetchEvent fields
@@ -255,6 +274,7 @@ FeedFetchEvent.etag_present
 FeedFetchEvent.last_modified_present
 FeedFetchEvent.parse_errors
 FeedFetchEvent.upsert_failures
+FeedFetchEvent.entries_duplicate
 FeedFetchEvent.content_fetched_count
 FeedFetchEvent.indexing_attempted
 FeedFetchEvent.indexing_succeeded
@@ -283,11 +303,25 @@ SchedulerEvent.error_cluster_top
 SchedulerEvent.dlq_depth
 SchedulerEvent.retention_d1_ms
 SchedulerEvent.retention_vectorize_ms
+SchedulerEvent.retention_feeds_capped
+SchedulerEvent.retention_backlog
 SchedulerEvent.retention_entries_scanned
 SchedulerEvent.retention_entries_deleted
 SchedulerEvent.retention_vectors_deleted
 SchedulerEvent.retention_errors
 SchedulerEvent.retention_max_per_feed
+SchedulerEvent.index_sweep_ms
+SchedulerEvent.index_sweep_candidates
+SchedulerEvent.index_sweep_indexed
+SchedulerEvent.index_sweep_failed
+SchedulerEvent.content_compress_ms
+SchedulerEvent.content_compress_candidates
+SchedulerEvent.content_compress_rewritten
+SchedulerEvent.content_compress_bytes_saved
+SchedulerEvent.archive_ms
+SchedulerEvent.archive_candidates
+SchedulerEvent.archive_moved
+SchedulerEvent.archive_failed
 SchedulerEvent.outcome
 SchedulerEvent.deployment_environment
 
@@ -311,6 +345,11 @@ AdminActionEvent.admin_username
 # Timer.__exit__ parameters (required by context manager protocol)
 Timer.__exit__  # exc_type, exc_val, exc_tb are required by __exit__ signature
 
+# Span tracing: no-op span signature and the dropped-span counter read by tests
+_.attrs  # unused variable (_NoopSpan.set mirrors Span.set)
+_.exc  # unused variable (_NoopSpan.__exit__ signature)
+Trace.dropped  # unused attribute (spans past MAX_SPAN_NODES, for debugging)
+
 # =============================================================================
 # main.py - runtime attribute assignments and aliases
 # =============================================================================